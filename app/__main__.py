@@ -8,6 +8,11 @@
 # nuitka-project: --nofollow-import-to=numpy
 # nuitka-project: --noinclude-data-files=*qtwebengine_devtools_resources.pak
 # nuitka-project: --include-package=steamworks
+# Modules bound with app.utils.lazy_import are not followed by Nuitka
+# nuitka-project: --include-module=networkx
+# nuitka-project: --include-module=bs4
+# nuitka-project: --include-module=github
+# nuitka-project: --include-module=app.utils.steam.steambrowser.browser
 # nuitka-project: --user-package-configuration-file={MAIN_DIRECTORY}/../rimsort.nuitka-package.config.yml
 # nuitka-project: --include-data-file={MAIN_DIRECTORY}/../steam_appid.txt=steam_appid.txt
 # nuitka-project: --windows-icon-from-ico={MAIN_DIRECTORY}/../themes/default-icons/AppIcon_alt.ico
@@ -105,6 +110,12 @@ if "--disable-updater" in sys.argv:
         sys.argv.remove("--disable-updater")
     # Note: logger not yet configured, so can't log here
 
+# Process --startup-report flag if present (before any other initialization)
+if "--startup-report" in sys.argv:
+    os.environ["RIMSORT_STARTUP_REPORT"] = "1"
+    while "--startup-report" in sys.argv:
+        sys.argv.remove("--startup-report")
+
 
 def main_thread() -> None:
     app_controller = None
@@ -39,6 +39,25 @@ from app.utils.db_builder_core import DBBuilderCore
     show_default=True,
     help="Update existing database (merge) or overwrite completely.",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, 32),
+    default=1,
+    show_default=True,
+    help="Number of Steam WebAPI detail requests sent at the same time.",
+)
+@click.option(
+    "--checkpoint/--no-checkpoint",
+    default=True,
+    show_default=True,
+    help="Record progress in OUTPUT.checkpoint.sqlite3 so the build can be resumed.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue from the checkpoint of an interrupted build. After a completed "
+    "build, only request new mods and mods updated since.",
+)
 @click.option(
     "--quiet",
     is_flag=True,
@@ -49,6 +68,9 @@ def build_db(
     output: Path,
     dlc_data: bool,
     update: bool,
+    concurrency: int,
+    checkpoint: bool,
+    resume: bool,
     quiet: bool,
 ) -> None:
     """Build Steam Workshop metadata database.
@@ -82,6 +104,14 @@ def build_db(
     \b
       # Skip DLC data for faster builds
       rimsort build-db --output workshop.json --no-dlc-data --quiet
+
+    \b
+      # Fetch mod details with 4 concurrent requests
+      rimsort build-db --output workshop.json --concurrency 4
+
+    \b
+      # Continue an interrupted build, or refresh a completed one
+      rimsort build-db --output workshop.json --resume
     """
     # API key resolution (priority order)
     if not api_key:
@@ -171,6 +201,9 @@ def build_db(
             get_appid_deps=dlc_data,
             update=update,
             progress_callback=progress_callback,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            resume=resume,
         )
 
         success = core.run()
@@ -192,6 +225,8 @@ def build_db(
 
     except KeyboardInterrupt:
         click.echo("\n\nInterrupted by user.", err=True)
+        if checkpoint or resume:
+            click.echo("Run again with --resume to continue the build.", err=True)
         sys.exit(2)
     except Exception as e:  # noqa: BLE001
         click.secho(
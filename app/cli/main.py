@@ -19,6 +19,7 @@ def cli() -> None:
 
     Global flags (processed before CLI):
       --disable-updater    Disable automatic update checks (same as RIMSORT_DISABLE_UPDATER env var)
+      --startup-report     Print the wall time of each startup stage (same as RIMSORT_STARTUP_REPORT env var)
     """
 
 
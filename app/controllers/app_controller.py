@@ -1,7 +1,7 @@
 import os
 import sys
 
-from PySide6.QtCore import QCoreApplication, QLibraryInfo, QObject, QTranslator
+from PySide6.QtCore import QCoreApplication, QLibraryInfo, QObject, QTranslator, Slot
 from PySide6.QtWidgets import QApplication
 
 import app.utils.globals as app_globals
@@ -14,10 +14,11 @@ from app.models.settings import Settings
 from app.services.instance_service import InstanceService
 from app.utils.app_info import AppInfo
 from app.utils.dds_utility import DDSUtility
+from app.utils.event_bus import EventBus
 from app.utils.gui_info import GUIInfo
+from app.utils.startup import StartupTimer, run_in_background
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.views.main_window import MainWindow
-from app.views.settings_dialog import SettingsDialog
 
 app_translator = QTranslator()
 qt_translator = QTranslator()
@@ -27,28 +28,34 @@ class AppController(QObject):
     def __init__(self) -> None:
         super().__init__()
 
-        self.app = QApplication(sys.argv)
-        self.app.setDesktopFileName("io.github.rimsort.RimSort")
-        self.app.setWindowIcon(GUIInfo().app_icon)
+        self.startup_timer = StartupTimer.instance()
+        with self.startup_timer.stage("Create QApplication"):
+            self.app = QApplication(sys.argv)
+            self.app.setDesktopFileName("io.github.rimsort.RimSort")
+            self.app.setWindowIcon(GUIInfo().app_icon)
 
         # Initialize the application settings.
-        self.initialize_settings()
+        with self.startup_timer.stage("Load settings"):
+            self.initialize_settings()
         # set the language of the application.
-        self.set_language()
+        with self.startup_timer.stage("Set language"):
+            self.set_language()
         # Initialize the theme controller
-        self.initialize_theme_controller()
-        # Set the theme of the application.
-        self.set_theme()
+        with self.startup_timer.stage("Apply theme"):
+            self.initialize_theme_controller()
+            # Set the theme of the application.
+            self.set_theme()
         # Initialize the Steamcmd interface
-        self.initialize_steamcmd_interface()
-        # Perform cleanup of orphaned DDS files if the setting is enabled
-        self.do_dds_cleanup()
+        with self.startup_timer.stage("Initialize SteamCMD interface"):
+            self.initialize_steamcmd_interface()
         # Initialize the new MetadataController
-        self.initialize_metadata_controller()
+        with self.startup_timer.stage("Initialize metadata controller"):
+            self.initialize_metadata_controller()
         # Initialize the instance service (self-subscribes to EventBus)
         self.initialize_instance_service()
         # Initialize the main window controller
-        self.initialize_main_window()
+        with self.startup_timer.stage("Build main window"):
+            self.initialize_main_window()
 
     def set_language(self) -> None:
         """Sets the language of the application on initial setup."""
@@ -77,10 +84,8 @@ class AppController(QObject):
         self.settings = Settings()
         self.settings.load()
         self.initialize_translator(self.settings.language)
-        self.settings_dialog = SettingsDialog()
-        self.settings_controller = SettingsController(
-            model=self.settings, view=self.settings_dialog
-        )
+        # The settings dialog is built when it is first opened
+        self.settings_controller = SettingsController(model=self.settings)
         app_globals.SETTINGS = self.settings
 
     def initialize_theme_controller(self) -> None:
@@ -115,10 +120,29 @@ class AppController(QObject):
         )
 
     def do_dds_cleanup(self) -> None:
-        """Performs cleanup of orphaned DDS files if the setting is enabled."""
+        """
+        Performs cleanup of orphaned DDS files in the background
+        if the setting is enabled.
+        """
         if self.settings.auto_delete_orphaned_dds:
             dds_utility = DDSUtility(self.settings_controller.settings)
-            dds_utility.delete_dds_files_without_png()
+            EventBus().do_show_status_message.emit(
+                self.tr("Deleting orphaned DDS files...")
+            )
+            run_in_background(
+                "Delete orphaned DDS files",
+                dds_utility.delete_dds_files_without_png,
+                self._on_dds_cleanup_finished,
+            )
+
+    @Slot(object)
+    def _on_dds_cleanup_finished(self, deleted_count: int | None) -> None:
+        if deleted_count is not None:
+            EventBus().do_show_status_message.emit(
+                self.tr("Deleted {count} orphaned DDS files").format(
+                    count=deleted_count
+                )
+            )
 
     def initialize_metadata_controller(self) -> None:
         """Initializes the MetadataController."""
@@ -151,8 +175,12 @@ class AppController(QObject):
 
     def run(self) -> int:
         """Runs the main application loop after initializing the main window."""
-        self.main_window.show()
+        with self.startup_timer.stage("Show main window"):
+            self.main_window.show()
+        # Perform cleanup of orphaned DDS files if the setting is enabled
+        self.do_dds_cleanup()
         self.main_window.initialize_content(is_initial=True)
+        self.startup_timer.finish()
         # If the window was closed during initialization (e.g. user closed during
         # mod scanning), skip the main event loop — Qt resets the quit flag in exec()
         # so a prior quit() from quitOnLastWindowClosed would have no effect and the
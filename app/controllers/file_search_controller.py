@@ -1,10 +1,7 @@
 import os
 import re
-import xml.etree.ElementTree as ET
-from typing import Any, Optional
-from xml.dom import minidom
+from typing import Any
 
-from charset_normalizer import from_bytes
 from loguru import logger
 from psutil import Process
 from PySide6.QtCore import QObject, QThread, QTimer, Signal
@@ -13,8 +10,17 @@ from app.controllers.metadata_controller import MetadataController
 from app.models.divider import is_divider_uuid
 from app.models.search_result import SearchResult
 from app.models.settings import Settings
+from app.utils.app_info import AppInfo
 from app.utils.file_search import FileSearch
-from app.utils.generic import format_file_size
+from app.utils.file_search_engine import (
+    SearchQuery,
+    build_preview,
+    read_preview_content,
+)
+from app.utils.file_search_index import (
+    FILE_SEARCH_INDEX_FILENAME,
+    FileSearchIndex,
+)
 from app.utils.ignore_extensions import IGNORE_EXTENSIONS
 from app.utils.mod_utils import get_mod_paths
 from app.views.dialogue import show_warning
@@ -25,7 +31,8 @@ from app.views.mods_panel import ModsPanel
 class SearchWorker(QThread):
     """worker thread for file searching"""
 
-    result_found = Signal(str, str, str, str)  # mod_name, file_name, path, preview
+    # list of (mod_name, file_name, path, preview)
+    results_found = Signal(list)
     progress = Signal(int, int)  # current, total
     stats = Signal(str)  # statistics text
     finished = Signal()
@@ -38,6 +45,7 @@ class SearchWorker(QThread):
         options: dict[str, Any],
         active_mod_ids: set[str] | None = None,
         scope: str = "all mods",
+        index: FileSearchIndex | None = None,
     ) -> None:
         """
         Initialize search worker
@@ -50,6 +58,7 @@ class SearchWorker(QThread):
           For active mods search, this should be active mod IDs
           For inactive mods search, this should be inactive mod IDs
         - scope: Search scope ("active mods", "inactive mods", "all mods", etc.)
+        - index: Full-text index to answer the search from, if any
         """
         super().__init__()
         self.root_paths = root_paths
@@ -57,7 +66,7 @@ class SearchWorker(QThread):
         self.options = options
         self.active_mod_ids = active_mod_ids
         self.scope = scope
-        self.searcher = FileSearch()
+        self.searcher = FileSearch(index=index)
         self.processed_files = 0
         self.found_files = 0
 
@@ -141,355 +150,16 @@ class SearchWorker(QThread):
             logger.error(f"Error checking memory usage: {e}")
             return True
 
-    # jscpd:ignore-start
-    def _read_file_with_fallback(self, file_path: str) -> str:
-        """
-        Read file content with multiple encoding attempts and improved error handling.
-
-        Args:
-            file_path: Path to the file to read.
-
-        Returns:
-            The file content as a string, or empty string on failure.
-        """
-        # jscpd:ignore-end
-        # Check if file exists and is accessible
-        if not os.path.exists(file_path):
-            logger.warning(f"File does not exist: {file_path}")
-            return ""
-
-        # Check file size before attempting to read
-        try:
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                logger.debug(f"Skipping empty file: {file_path}")
-                return ""
-
-            # Skip very large files to prevent memory issues
-            max_size = 20 * 1024 * 1024  # 20MB
-            if file_size > max_size:
-                logger.warning(
-                    f"File too large to read fully: {file_path} ({format_file_size(file_size)})"
-                )
-                # For large files, read only the first part
-                try:
-                    with open(file_path, "rb") as f:
-                        binary_content = f.read(1024 * 1024)  # Read first 1MB
-                        return (
-                            binary_content.decode("utf-8", errors="replace")
-                            + "\n\n[File truncated due to size...]"
-                        )
-                except Exception as e:  # noqa: BLE001
-                    logger.warning(f"Failed to read large file {file_path}: {e}")
-                    return ""
-        except OSError as e:
-            logger.warning(f"Error checking file size for {file_path}: {e}")
-            return ""
-
-        try:  # Try to detect encoding with charset_normalizer for better accuracy
-            with open(file_path, "rb") as f:
-                raw_data = f.read(min(4096, file_size))
-                # Use charset_normalizer for encoding detection
-                results = from_bytes(raw_data).best()
-                if results is not None and results.encoding:
-                    # charset_normalizer uses confidence property
-                    try:
-                        detected_encoding = results.encoding
-                        # Use explicit text mode with detected encoding
-                        content = ""
-                        with open(
-                            file_path, "r", encoding=detected_encoding
-                        ) as text_file:
-                            content = text_file.read()
-                            return content
-                    except UnicodeDecodeError:
-                        # If detected encoding fails, continue with fallbacks
-                        pass
-        except ImportError:
-            # charset_normalizer not available, continue with fallbacks
-            pass
-        except Exception as e:  # noqa: BLE001
-            logger.debug(f"Error detecting encoding: {e}")
-
-        # Try common encodings
-        encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
-
-        for encoding in encodings:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    content = f.read()
-                    logger.debug(f"Successfully read file with encoding: {encoding}")
-                    return content
-            except UnicodeDecodeError:
-                # Try the next encoding
-                continue
-            except OSError as e:
-                logger.warning(f"Error reading file {file_path}: {e}")
-                return ""
-
-        # If all encodings fail, try binary mode and decode with errors='replace'
-        try:
-            with open(file_path, "rb") as f:
-                binary_content = f.read()
-                # Try to decode with 'replace' option to substitute invalid chars
-                return binary_content.decode("utf-8", errors="replace")
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Failed to read file {file_path} after all attempts: {e}")
-            return ""
-
     def _get_file_preview(self, file_path: str, content: str = "") -> str:
-        """Get preview of the matched content with improved context and highlighting"""
-        try:
-            # If content wasn't provided, read it from file
-            if not content:
-                content = self._read_file_with_fallback(file_path)
-
-            # If content is still empty, return early
-            if not content:
-                return "Error: Could not read file content"
-
-            # Check file type for special handling
-            _, ext = os.path.splitext(file_path.lower())
-
-            # Special handling for XML files
-            if ext == ".xml" and not self.options.get("use_regex", False):
-                xml_preview = self._get_xml_preview(file_path, content)
-                if xml_preview:
-                    return xml_preview
-
-            # Find the position of the search term
-            search_term = (
-                self.pattern.lower()
-                if not self.options.get("case_sensitive")
-                else self.pattern
-            )
-            content_to_search = (
-                content.lower() if not self.options.get("case_sensitive") else content
-            )
+        """Get preview of the matched content with context and highlighting"""
+        if not content:
+            content = read_preview_content(file_path)
+        query = SearchQuery.from_options(self.pattern, self.options)
+        return build_preview(query, file_path, content)
 
-            # For regex patterns, we need to find all matches
-            if self.options.get("use_regex", False):
-                try:
-                    # Compile the regex pattern
-                    flags = 0 if self.options.get("case_sensitive") else re.IGNORECASE
-                    regex = re.compile(self.pattern, flags)
-
-                    # Find all matches in the content
-                    matches = list(regex.finditer(content))
-                    if not matches:
-                        return ""
-
-                    # Use the first match for preview
-                    match = matches[0]
-                    pos = match.start()
-                    # We can calculate match length directly when needed using match.end() - match.start()
-                except re.error as e:
-                    logger.warning(f"Invalid regex pattern: {e}")
-                    return f"Error: Invalid regex pattern: {e}"
-            else:
-                # For simple text search
-                pos = content_to_search.find(search_term)
-                if pos == -1:
-                    return ""
-                # We don't need to store the match length for simple text search
-                # as we can use len(search_term) directly when needed
-
-            # Split content into lines for better context
-            lines = content.split("\n")
-
-            # Find which line contains the match
-            current_pos = 0
-            match_line_index = 0
-            for i, line in enumerate(lines):
-                line_length = len(line) + 1  # +1 for the newline character
-                if current_pos <= pos < current_pos + line_length:
-                    match_line_index = i
-                    # Calculate position within the line (useful for debugging)
-                    # line_pos = pos - current_pos
-                    break
-                current_pos += line_length
-
-            # Get context lines (3 lines before and after the match)
-            start_line = max(0, match_line_index - 3)
-            end_line = min(len(lines), match_line_index + 4)
-
-            # Format the preview with line numbers and highlight the match
-            preview_lines = []
-            for i in range(start_line, end_line):
-                # Highlight the matched line with a different prefix and formatting
-                if i == match_line_index:
-                    line_prefix = f"→ {i + 1}: "
-
-                    # Try to highlight the matched text within the line
-                    line = lines[i]
-                    if self.options.get("use_regex", False):
-                        # For regex search, we need to find the match in this specific line
-                        try:
-                            flags = (
-                                0
-                                if self.options.get("case_sensitive")
-                                else re.IGNORECASE
-                            )
-                            regex = re.compile(self.pattern, flags)
-                            line_match = regex.search(line)
-                            if line_match:
-                                match_pos = line_match.start()
-                                match_end = line_match.end()
-                                # Highlight with ** around the match
-                                line = (
-                                    line[:match_pos]
-                                    + "**"
-                                    + line[match_pos:match_end]
-                                    + "**"
-                                    + line[match_end:]
-                                )
-                        except re.error:
-                            # If regex fails, just show the line without highlighting
-                            pass
-                    else:
-                        # For simple text search, we can highlight the exact match
-                        if self.options.get("case_sensitive"):
-                            # Case-sensitive: find exact match
-                            # jscpd:ignore-start
-                            match_pos = line.find(self.pattern)
-                            if match_pos >= 0:
-                                # Highlight with ** around the match
-                                line = (
-                                    line[:match_pos]
-                                    + "**"
-                                    + line[match_pos : match_pos + len(self.pattern)]
-                                    + "**"
-                                    + line[match_pos + len(self.pattern) :]
-                                )
-                        else:
-                            # jscpd:ignore-end
-                            # Case-insensitive: find match ignoring case
-                            match_pos = line.lower().find(self.pattern.lower())
-                            if match_pos >= 0:
-                                # Highlight with ** around the match
-                                line = (
-                                    line[:match_pos]
-                                    + "**"
-                                    + line[match_pos : match_pos + len(self.pattern)]
-                                    + "**"
-                                    + line[match_pos + len(self.pattern) :]
-                                )
-                else:
-                    line_prefix = f"  {i + 1}  "
-                    line = lines[i]
-
-                preview_lines.append(f"{line_prefix}{line}")
-
-            # Add ellipsis if needed
-            prefix = "...\n" if start_line > 0 else ""
-            suffix = "\n..." if end_line < len(lines) else ""
-
-            # Add a header with file info
-            file_size = os.path.getsize(file_path)
-            file_size_str = format_file_size(file_size)
-
-            header = f"File: {os.path.basename(file_path)} ({file_size_str})\n"
-            header += f"Path: {os.path.dirname(file_path)}\n"
-            header += f"Match at line {match_line_index + 1}:\n"
-
-            joined_preview = "\n".join(preview_lines)
-            return f"{header}\n{prefix}{joined_preview}{suffix}"
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Failed to get preview for {file_path}: {e}")
-            return f"Error generating preview: {e}"
-
-    def _get_xml_preview(self, file_path: str, content: str) -> str:
-        """Generate a more structured preview for XML files with better formatting"""
-        try:  # Find the position of the search term
-            search_term = (
-                self.pattern.lower()
-                if not self.options.get("case_sensitive")
-                else self.pattern
-            )
-
-            # Try to parse the XML
-            try:
-                # Parse the XML
-                root = ET.fromstring(content)
-
-                def find_element_with_text(
-                    element: "ET.Element", search_text: str, case_sensitive: bool = True
-                ) -> Optional["ET.Element"]:
-                    # Check element text
-                    element_text = element.text or ""
-                    if not case_sensitive:
-                        element_text = element_text.lower()
-                        search_text = search_text.lower()
-
-                    if search_text in element_text:
-                        return element
-
-                    # Check attributes
-                    for value in element.attrib.values():
-                        if not case_sensitive:
-                            value = value.lower()
-                        if search_text in value:
-                            return element
-
-                    # Check children
-                    for child in element:
-                        result = find_element_with_text(
-                            child, search_text, case_sensitive
-                        )
-                        if result is not None:
-                            return result
-
-                    return None
-
-                # Find the element containing the search term
-                element = find_element_with_text(
-                    root, search_term, self.options.get("case_sensitive", False)
-                )
-
-                if element is not None:
-                    # Convert element to string with nice formatting
-                    element_str = ET.tostring(element, encoding="unicode")
-
-                    # Pretty print the XML
-                    pretty_xml = minidom.parseString(element_str).toprettyxml(
-                        indent="  "
-                    )
-
-                    # Remove XML declaration
-                    if pretty_xml.startswith("<?xml"):
-                        pretty_xml = pretty_xml.split("\n", 1)[1]
-
-                    # Highlight the search term
-                    if not self.options.get("case_sensitive"):
-                        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-                        pretty_xml = pattern.sub("**\\g<0>**", pretty_xml)
-                    else:
-                        pretty_xml = pretty_xml.replace(
-                            search_term, f"**{search_term}**"
-                        )
-
-                    # Create the preview
-                    file_name = os.path.basename(file_path)
-                    preview = [
-                        f"File: {file_name} (XML)",
-                        "─" * 40,  # Separator line
-                        "Matched XML Element:",
-                        pretty_xml,
-                    ]
-
-                    return "\n".join(preview)
-
-            except ET.ParseError:
-                # If XML parsing fails, return empty string to fall back to standard preview
-                return ""
-
-            # If element not found, return empty string to fall back to standard preview
-            return ""
-
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Error generating XML preview for {file_path}: {e}")
-            # Return empty string to fall back to standard preview
-            return ""
+    def stop(self) -> None:
+        """Ask the search to stop. Queued work is dropped, so it stops promptly."""
+        self.searcher.stop_search()
 
     def _should_process_mod(self, mod_path: str) -> bool:
         """
@@ -542,36 +212,29 @@ class SearchWorker(QThread):
                 algorithm = "pattern search"
                 logger.info("Using regex pattern - switching to pattern search")
 
-            # Map algorithm display names to method names
-            algorithm_map = {
-                "xml search": "xml_search",
-                "standard search": "standard_search",
-                "pattern search": "pattern_search",
+            # Map algorithm display names to search types
+            search_types = {
+                "xml search": "xml",
+                "standard search": "standard",
+                "pattern search": "pattern",
             }
+            search_type = search_types.get(algorithm, "standard")
+            logger.info(f"Using search method: {algorithm} ({search_type})")
 
-            # Get method name from the map or convert from display name
-            method_name = algorithm_map.get(algorithm, algorithm.replace(" ", "_"))
-
-            # Check if the method exists
-            if not hasattr(self.searcher, method_name):
-                logger.warning(
-                    f"Search method {method_name} not found, falling back to simple_search"
+            # Perform the search, streaming results to the dialog in batches
+            self.stats.emit(
+                self.tr("Searching in {count} folders...").format(
+                    count=len(self.root_paths)
                 )
-                method_name = "simple_search"
-
-            search_method = getattr(self.searcher, method_name)
-            logger.info(f"Using search method: {algorithm} ({method_name})")
-
-            # Perform the search
-            for root_path in self.root_paths:
-                self.stats.emit(
-                    self.tr("Searching in: {root_path}").format(root_path=root_path)
-                )
-                for result in search_method(self.pattern, [root_path], self.options):
-                    mod_name, file_name, path = result
-                    preview = self._get_file_preview(path)
-                    self.result_found.emit(mod_name, file_name, path, preview)
+            )
+            for batch in self.searcher.batched_search(
+                search_type, self.pattern, self.root_paths, self.options
+            ):
+                self.found_files += len(batch)
+                self.results_found.emit(batch)
 
+            if self.searcher.stop_requested:
+                return
             self.finished.emit()
             self.stats.emit(self.tr("Search complete"))
 
@@ -623,7 +286,9 @@ class FileSearchController(QObject):
         )  # This is used for the controller, not the worker
         self.search_results: list[SearchResult] = []
         self.search_worker: SearchWorker | None = None
-        self.searcher = FileSearch(metadata_controller=metadata_controller)
+        self.search_index = FileSearchIndex.get_or_create_cached_instance(
+            AppInfo().app_storage_folder / FILE_SEARCH_INDEX_FILENAME
+        )
 
         # connect signals
         self.dialog.search_button.clicked.connect(self._on_search_clicked)
@@ -695,6 +360,7 @@ class FileSearchController(QObject):
         if self.search_worker is not None:
             # Properly clean up the previous worker
             try:
+                self.search_worker.stop()
                 self.search_worker.quit()
                 if not self.search_worker.wait(1000):  # Wait up to 1 second
                     self.search_worker.terminate()
@@ -707,10 +373,13 @@ class FileSearchController(QObject):
         logger.info(f"Search scope: {scope}")
 
         # Create and configure the worker
-        worker = SearchWorker(root_paths, pattern, options, active_mod_ids, scope)
+        index = self.search_index if options.get("use_index", True) else None
+        worker = SearchWorker(
+            root_paths, pattern, options, active_mod_ids, scope, index
+        )
 
         # Connect signals
-        worker.result_found.connect(self.dialog.add_result)
+        worker.results_found.connect(self.dialog.add_results)
         worker.progress.connect(self.dialog.update_progress)
         worker.stats.connect(self.dialog.update_stats)
         worker.finished.connect(self._on_search_finished)
@@ -859,8 +528,6 @@ class FileSearchController(QObject):
             mod_ids (Optional[Set[str]]): Set of mod IDs for filtering.
             scope (str): Search scope ("active mods", "inactive mods", "all mods", etc.).
         """
-        self.searcher = FileSearch(metadata_controller=self.metadata_controller)
-
         # Update the dialog's search paths
         self.dialog.set_search_paths(root_paths)
         self.dialog.clear_results()
@@ -996,11 +663,10 @@ class FileSearchController(QObject):
             # Update the UI to show search is stopping
             self.dialog.update_stats(self.tr("Stopping search..."))
 
-            # Set the stop flag in the searcher
-            self.searcher.stop_search()
-
-            # Terminate the worker thread immediately
-            self.search_worker.terminate()
+            # Cancel the search and give the worker a moment to wind down
+            self.search_worker.stop()
+            if not self.search_worker.wait(2000):
+                self.search_worker.terminate()
 
             # Update the UI to show search has stopped
             self.dialog.update_stats(self.tr("Search stopped by user"))
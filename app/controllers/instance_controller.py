@@ -17,6 +17,12 @@ from app.utils.constants import (
     INSTANCE_FOLDER_NAME,
     STEAMCMD_FOLDER_NAME,
 )
+from app.utils.directory_backup import (
+    DEFAULT_COMPRESSION_LEVEL,
+    MANIFEST_NAME,
+    backup_members,
+    create_directory_backup,
+)
 from app.views.dialogue import (
     show_fatal_error,
     show_warning,
@@ -166,73 +172,80 @@ class InstanceController(QObject):
             instance_folder_override=instance_folder_override,
         )
 
-    def compress_to_archive(self, output_path: str) -> None:
-        """Compress instance folder to ZIP archive, skipping symlinks and junctions."""
+    def compress_to_archive(
+        self,
+        output_path: str,
+        base_archive: str | None = None,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """
+        Compress instance folder to ZIP archive, skipping symlinks and junctions.
+
+        :param output_path: Path of the archive to write
+        :param base_archive: Previous backup of the instance. Only the files
+            changed since are stored, and restoring the archive also reads
+            the files from it
+        :param compression_level: Deflate level from 0, which stores all
+            files, to 9
+        :param progress_callback: Called with the number of files written and
+            the number of files to write
+        """
         if not output_path.endswith(".zip"):
             output_path += ".zip"
 
         try:
             logger.info(f"Compressing instance folder to archive: {output_path}")
-            with ZipFile(output_path, "w") as archive:
-                self._add_instance_folder_to_archive(archive)
-                archive.writestr("instance.json", self.to_bytes())
-                logger.debug(f"Added instance data to archive: {self.instance}")
+            if base_archive:
+                logger.info(f"Only storing files changed since: {base_archive}")
+            create_directory_backup(
+                self.instance_folder_path,
+                output_path,
+                extra_members={"instance.json": self.to_bytes()},
+                base_archive=base_archive,
+                compression_level=compression_level,
+                progress_callback=progress_callback,
+            )
+            logger.debug(f"Added instance data to archive: {self.instance}")
         except Exception as e:
             logger.error(f"An error occurred while compressing instance folder: {e}")
             raise
 
-    def _add_instance_folder_to_archive(self, archive: ZipFile) -> None:
-        """Add instance folder contents to archive, skipping symlinks and junctions."""
-        for root, dirs, files in os.walk(
-            self.instance_folder_path, topdown=True, followlinks=False
-        ):
-            # Detect and skip symlinks by comparing resolved vs absolute paths
-            if Path(root).absolute() != Path(root).resolve():
-                logger.debug(f"Skipping symlinked directory: {root}")
-                dirs.clear()
-                files.clear()
-                continue
-
-            for _dir in dirs:
-                dir_path = os.path.join(root, _dir)
-                archive.write(
-                    dir_path,
-                    os.path.relpath(dir_path, self.instance_folder_path),
-                )
-                logger.debug(f"Added directory to archive: {dir_path}")
-
-            for file in files:
-                file_path = os.path.join(root, file)
-                archive.write(
-                    file_path,
-                    os.path.relpath(file_path, self.instance_folder_path),
-                )
-                logger.debug(f"Added file to archive: {file_path}")
-
     def extract_from_archive(self, archive_path: str, delete_old: bool = True) -> None:
-        """Extract instance folder from ZIP archive, optionally deleting existing folder."""
+        """Extract instance folder from ZIP archive, optionally deleting existing folder.
+        Backups that only store changes are extracted over their base backups."""
         logger.info(f"Extracting instance folder from archive: {archive_path}")
+        # Find base backups before deleting anything
+        chain = backup_members(archive_path)
 
         if os.path.exists(self.instance_folder_path) and delete_old:
             self._delete_instance_folder()
 
         try:
             logger.info(f"Extracting to: {self.instance_folder_path}")
-            with ZipFile(archive_path, "r") as archive:
-                real_target = os.path.realpath(self.instance_folder_path)
-                for info in archive.infolist():
-                    if info.filename == "instance.json":
-                        continue
-                    dst = os.path.realpath(
-                        os.path.join(self.instance_folder_path, info.filename)
+            real_target = os.path.realpath(self.instance_folder_path)
+            for path, names in chain:
+                with ZipFile(path, "r") as archive:
+                    members = (
+                        archive.infolist()
+                        if names is None
+                        else [archive.getinfo(name) for name in names]
                     )
-                    if not (dst.startswith(real_target + os.sep) or dst == real_target):
-                        logger.warning(
-                            f"Zip slip detected, skipping entry: {info.filename}"
+                    for info in members:
+                        if info.filename in ("instance.json", MANIFEST_NAME):
+                            continue
+                        dst = os.path.realpath(
+                            os.path.join(self.instance_folder_path, info.filename)
                         )
-                        continue
-                    logger.debug(f"Extracting file: {info.filename}")
-                    archive.extract(info, path=self.instance_folder_path)
+                        if not (
+                            dst.startswith(real_target + os.sep) or dst == real_target
+                        ):
+                            logger.warning(
+                                f"Zip slip detected, skipping entry: {info.filename}"
+                            )
+                            continue
+                        archive.extract(info, path=self.instance_folder_path)
+                logger.debug(f"Extracted {len(members)} members of {path}")
         except Exception as e:
             logger.error(f"An error occurred while extracting instance folder: {e}")
             raise
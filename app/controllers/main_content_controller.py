@@ -7,7 +7,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-from github import Github, Repository
 from loguru import logger
 from PySide6.QtCore import QObject, QThreadPool, Slot
 from PySide6.QtWidgets import QInputDialog, QMessageBox
@@ -57,6 +56,8 @@ from app.utils.http_downloader import (
     DownloadResult,
     HttpDownloadWorker,
 )
+from app.utils.lazy_import import lazy_import
+from app.utils.startup import run_in_background
 from app.views.dialogue import (
     BinaryChoiceDialog,
     InformationBox,
@@ -65,10 +66,14 @@ from app.views.dialogue import (
 from app.views.main_content_panel import MainContent
 
 if TYPE_CHECKING:
+    import github
     from sqlalchemy.orm import Session
 
     from app.utils.github.updater import UpdateAvailable
     from app.windows.github_mods_panel import GitHubModsPanel
+else:
+    # PyGitHub is only needed to upload databases
+    github = lazy_import("github")
 
 
 class MainContentController(QObject):
@@ -745,7 +750,17 @@ class MainContentController(QObject):
             logger.info("Update databases on startup is disabled.")
             return
 
-        if not check_internet_connection():
+        # Checking the connection can take seconds, so it must not block the UI
+        run_in_background(
+            "Check for database updates",
+            check_internet_connection,
+            self._on_startup_internet_connection_checked,
+        )
+
+    @Slot(object)
+    def _on_startup_internet_connection_checked(self, connected: bool | None) -> None:
+        """Start the silent startup database updates once a connection is confirmed."""
+        if not connected:
             return
 
         settings = self.settings
@@ -909,6 +924,8 @@ class MainContentController(QObject):
         ]
         failed = [name for name, r in results.items() if r == DownloadResult.FAILED]
         # jscpd:ignore-end
+        if updated:
+            self.metadata_controller.invalidate_external_dbs()
         notify(updated, up_to_date, failed)
         self._cleanup_http_download_worker()
 
@@ -997,6 +1014,7 @@ class MainContentController(QObject):
             f"Git clone finished: success={success}, message={message}, path={path}"
         )
         if success:
+            self.metadata_controller.invalidate_external_dbs()
             InformationBox(
                 title=self.tr("Repo retrieved"),
                 text=self.tr("The configured repository was cloned!"),
@@ -1507,7 +1525,7 @@ class MainContentController(QObject):
         )
         # Initialize GitHub API
         try:
-            g = Github(github_username, github_token)
+            g = github.Github(github_username, github_token)
             original_repo = g.get_repo(f"{repo_user_or_org}/{repo_folder_name}")
         except Exception as e:  # noqa: BLE001
             logger.error(f"Failed to initialize GitHub API: {e}")
@@ -1577,8 +1595,8 @@ class MainContentController(QObject):
         fork_url: str,
         database_version: int,
         database_version_human_readable: str,
-        original_repo: Repository.Repository,
-        fork_repo: Repository.Repository,
+        original_repo: github.Repository.Repository,
+        fork_repo: github.Repository.Repository,
         github_username: str,
         github_token: str,
     ) -> None:
@@ -1988,11 +2006,13 @@ class MainContentController(QObject):
                             logger.warning(f"Failed to switch to main branch: {e}")
             except Exception as e:  # noqa: BLE001
                 logger.warning(f"Failed to switch back to main branch: {e}")
+            # Branch checkouts rewrite the DB files in the working tree
+            self.metadata_controller.invalidate_external_dbs()
 
     def _create_pull_request(
         self,
-        original_repo: Repository.Repository,
-        fork_repo: Repository.Repository,
+        original_repo: github.Repository.Repository,
+        fork_repo: github.Repository.Repository,
         branch_name: str,
         database_version: int,
         database_version_human_readable: str,
@@ -2120,6 +2140,7 @@ class MainContentController(QObject):
             logger.info(
                 f"Silently updated {len(successful)} database repositories successfully"
             )
+            self.metadata_controller.invalidate_external_dbs()
 
         if failed:
             logger.warning(
@@ -12,6 +12,12 @@ from natsort import natsorted
 from PySide6.QtCore import QMutex, QObject, Signal, Slot
 
 from app.controllers.metadata_db_controller import AuxMetadataController
+from app.models.metadata.metadata_cache import PARSE_CACHE_FILENAME
+from app.models.metadata.metadata_compact_db import (
+    compact_db_path,
+    compact_enc_hook,
+    write_compact_db,
+)
 from app.models.metadata.metadata_mediator import MetadataMediator
 from app.models.metadata.metadata_structure import (
     SOURCE_PRIORITY_DEFAULT,
@@ -32,6 +38,8 @@ from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.xml import json_to_xml_write, xml_path_to_json
 
 if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
     from app.models.metadata.metadata_db import AuxMetadataEntry
     from app.models.metadata.metadata_structure import (
         ExternalRulesSchema,
@@ -44,11 +52,10 @@ class MetadataController(QObject):
 
     _instance: MetadataController | None = None
 
-    mod_created_signal = Signal(str)
     mod_deleted_signal = Signal(str)
-    mod_metadata_updated_signal = Signal(str)
     show_warning_signal = Signal(str, str, str, str)
     metadata_refreshed = Signal()
+    metadata_changed = Signal(list, list, list)  # added, removed, changed
     steam_db_updated = Signal()
 
     # ---- Lifecycle ----
@@ -75,10 +82,22 @@ class MetadataController(QObject):
 
         self._steamdb_packageid_to_name_cache: dict[str, str] | None = None
         self._packageid_to_paths_cache: dict[str, set[str]] | None = None
+        self._packageid_index_cache: dict[str, list[str]] | None = None
+        # Dependency graph of the last compile(), patched per mod while the
+        # metadata dict and the compile options stay the same
+        self._compiled: CompiledDependencyData | None = None
+        self._compiled_source: dict[str, ListedMod] | None = None
+        self._compiled_options: tuple[bool, bool] | None = None
         self.workshop_acf_data: dict[str, Any] = {}
         self.steamcmd_acf_data: dict[str, Any] = {}
 
         self.metadata_db_controller = metadata_db_controller
+        # Keep the parse cache next to the aux metadata DB of this instance
+        aux_db_file = metadata_db_controller.engine.url.database
+        if isinstance(aux_db_file, str) and aux_db_file:
+            self.metadata_mediator.parse_cache_path = Path(aux_db_file).with_name(
+                PARSE_CACHE_FILENAME
+            )
         self.steamcmd_wrapper = SteamcmdInterface.instance()
 
         self.reset_paths()
@@ -116,45 +135,67 @@ class MetadataController(QObject):
         self.reset_paths()
         prefer_versioned = self.settings.prefer_versioned_about_tags
         case_insensitive = self.settings.case_insensitive_about_xml_lookup
+        self.metadata_mediator.parser_backend = self.settings.metadata_parser_backend
         self.metadata_mediator.refresh_metadata(
             prefer_versioned=prefer_versioned,
             case_insensitive_about_xml=case_insensitive,
         )
+        self._finish_full_refresh()
 
-        with self.metadata_db_controller.Session() as session:
-            for path, mod_data in self.metadata_mediator.mods_metadata.items():
-                try:
-                    entry = self.metadata_db_controller.get_or_create(session, path)
-                    entry.type = str(mod_data.mod_type)
-                    entry.published_file_id = mod_data.published_file_id
-                except Exception:  # noqa: BLE001
-                    session.rollback()
-                    logger.exception(f"Failed to update aux metadata for mod at {path}")
+    @Slot()
+    def refresh_metadata_incremental(self) -> None:
+        """Refresh only the mods whose folders changed since the last refresh.
 
-            self.metadata_db_controller.update_from_acf(
+        Emits ``metadata_changed`` with the added, removed and changed mod
+        paths so views can patch their rows. Falls back to a full refresh,
+        emitting ``metadata_refreshed``, when the mediator has nothing to diff
+        against or a change affects every mod.
+        """
+        self.reset_paths()
+        prefer_versioned = self.settings.prefer_versioned_about_tags
+        case_insensitive = self.settings.case_insensitive_about_xml_lookup
+        self.metadata_mediator.parser_backend = self.settings.metadata_parser_backend
+        changes = self.metadata_mediator.refresh_metadata_incremental(
+            prefer_versioned=prefer_versioned,
+            case_insensitive_about_xml=case_insensitive,
+        )
+        if changes is None:
+            self._finish_full_refresh()
+            return
+        if not changes:
+            return
+
+        mods_metadata = self.metadata_mediator.mods_metadata
+        with self.metadata_db_controller.Session() as session:
+            self._sync_aux_entries(
                 session,
-                Path(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path),
-                ModType.STEAM_CMD,
+                {
+                    path: mods_metadata[path]
+                    for path in changes.added + changes.changed
+                    if path in mods_metadata
+                },
             )
-            if self.workshop_acf_path is not None:
-                self.metadata_db_controller.update_from_acf(
-                    session,
-                    self.workshop_acf_path,
-                    ModType.STEAM_WORKSHOP,
+            self._patch_compiled(
+                *changes.added, *changes.changed, *changes.removed, reinserted=True
+            )
+            self._update_aux_from_acf(session)
+            session.commit()
+            if changes.removed:
+                self.metadata_db_controller.delete(
+                    session, *(Path(path) for path in changes.removed)
                 )
 
-            session.commit()
+        self._reload_acf_data()
+        self._invalidate_caches()
+        self.metadata_changed.emit(changes.added, changes.removed, changes.changed)
 
-        self.steamcmd_acf_data = load_acf_from_path(
-            self.steamcmd_wrapper.steamcmd_appworkshop_acf_path
-        )
-        if self.workshop_acf_path is not None:
-            self.workshop_acf_data = load_acf_from_path(self.workshop_acf_path)
-        else:
-            self.workshop_acf_data = {}
+    @Slot()
+    def invalidate_external_dbs(self) -> None:
+        """Make the next refresh re-read all external DBs from disk.
 
-        self._invalidate_caches()
-        self.metadata_refreshed.emit()
+        Call after DB files were replaced by a download or upload.
+        """
+        self.metadata_mediator.invalidate_external_dbs()
 
     @Slot()
     def reset_paths(self) -> None:
@@ -236,13 +277,21 @@ class MetadataController(QObject):
     def packageid_to_paths(self) -> dict[str, set[str]]:
         """Build a mapping from package IDs to sets of mod paths (cached)."""
         if self._packageid_to_paths_cache is None:
-            result: dict[str, set[str]] = {}
+            self._packageid_to_paths_cache = {
+                pid: set(paths) for pid, paths in self._packageid_index.items()
+            }
+        return self._packageid_to_paths_cache
+
+    @property
+    def _packageid_index(self) -> dict[str, list[str]]:
+        """Map lowercased package IDs to mod paths in ``mods_metadata`` order (cached)."""
+        if self._packageid_index_cache is None:
+            index: dict[str, list[str]] = {}
             for path, mod in self.mods_metadata.items():
                 if isinstance(mod, AboutXmlMod):
-                    pid = str(mod.package_id)
-                    result.setdefault(pid, set()).add(path)
-            self._packageid_to_paths_cache = result
-        return self._packageid_to_paths_cache
+                    index.setdefault(str(mod.package_id), []).append(path)
+            self._packageid_index_cache = index
+        return self._packageid_index_cache
 
     @property
     def steamdb_packageid_to_name(self) -> dict[str, str]:
@@ -410,15 +459,25 @@ class MetadataController(QObject):
     ) -> CompiledDependencyData:
         """Compile dependency data from current metadata state.
 
+        The result is cached and patched as single mods are created, updated
+        or deleted, so it is only rebuilt after a full metadata refresh or
+        when the options change. Treat it as read-only.
+
         :param use_moddependencies_as_loadTheseBefore: Treat modDependencies as loadAfter
         :param use_alternative_package_ids: Fall back to alternative package IDs for deps
         :return: Compiled dependency data
         """
-        return CompiledDependencyData.build(
-            self.metadata_mediator.mods_metadata,
-            use_moddependencies_as_loadTheseBefore,
-            use_alternative_package_ids,
-        )
+        mods_metadata = self.metadata_mediator.mods_metadata
+        options = (use_moddependencies_as_loadTheseBefore, use_alternative_package_ids)
+        if (
+            self._compiled is None
+            or self._compiled_source is not mods_metadata
+            or self._compiled_options != options
+        ):
+            self._compiled = CompiledDependencyData.build(mods_metadata, *options)
+            self._compiled_source = mods_metadata
+            self._compiled_options = options
+        return self._compiled
 
     def get_missing_dependencies(
         self, active_mod_paths: set[str]
@@ -504,21 +563,19 @@ class MetadataController(QObject):
         :return: (active_mod_paths, inactive_mod_paths, duplicate_mods, missing_mods)
         """
         all_mods = self.mods_metadata
+        packageid_index = self._packageid_index
         active_mod_paths: list[str] = []
         inactive_mod_paths: list[str] = []
-        duplicate_mods: dict[str, list[str]] = {}
-        duplicates_processed: list[str] = []
+        duplicates_processed: set[str] = set()
         missing_mods: list[str] = []
-        populated_mods: list[str] = []
+        populated_mods: set[str] = set()
         to_populate: list[str] = []
 
         logger.debug("Started generating active and inactive mods")
 
-        for path, mod_data in all_mods.items():
-            if isinstance(mod_data, AboutXmlMod):
-                pid = str(mod_data.package_id)
-                duplicate_mods.setdefault(pid, []).append(path)
-        duplicate_mods = {k: v for k, v in duplicate_mods.items() if len(v) > 1}
+        duplicate_mods: dict[str, list[str]] = {
+            pid: list(paths) for pid, paths in packageid_index.items() if len(paths) > 1
+        }
 
         if isinstance(mod_list, str):
             if not os.path.exists(mod_list):
@@ -551,51 +608,47 @@ class MetadataController(QObject):
             sources_order = (
                 SOURCE_PRIORITY_STEAM if is_steam else SOURCE_PRIORITY_DEFAULT
             )
-            for path, mod in all_mods.items():
-                if not isinstance(mod, AboutXmlMod):
-                    continue
-                metadata_package_id = str(mod.package_id)
-                if metadata_package_id in [
-                    package_id_normalized,
-                    package_id_normalized_stripped,
-                ]:
-                    if target_id not in duplicate_mods:
-                        populated_mods.append(target_id)
-                        active_mod_paths.append(path)
-                    else:
-                        if target_id in duplicates_processed:
-                            continue
-                        logger.info(
-                            f"Found duplicate mod present in active mods list: {target_id}"
-                        )
-                        for source_type in sources_order:
-                            logger.debug(
-                                f"Checking for duplicate with source: {source_type.value}"
-                            )
-                            matching_paths: list[str] = []
-                            for dup_path in duplicate_mods[target_id]:
-                                dup_mod = all_mods.get(dup_path)
-                                if (
-                                    isinstance(dup_mod, AboutXmlMod)
-                                    and dup_mod.mod_type == source_type
-                                ):
-                                    matching_paths.append(dup_path)
-                            source_paths_sorted = natsorted(matching_paths)
-                            if source_paths_sorted:
-                                calculated_dup = source_paths_sorted[0]
-                                logger.debug(
-                                    f"Using duplicate {source_type.value} mod for {target_id}: {calculated_dup}"
-                                )
-                                populated_mods.append(target_id)
-                                duplicates_processed.append(target_id)
-                                active_mod_paths.append(calculated_dup)
-                                break
-
-        missing_mods = list(set(to_populate) - set(populated_mods))
+            matched_paths = self._paths_for_packageids(
+                packageid_index, package_id_normalized, package_id_normalized_stripped
+            )
+            if not matched_paths:
+                continue
+            if target_id not in duplicate_mods:
+                populated_mods.add(target_id)
+                active_mod_paths.extend(matched_paths)
+                continue
+            if target_id in duplicates_processed:
+                continue
+            logger.info(f"Found duplicate mod present in active mods list: {target_id}")
+            for source_type in sources_order:
+                logger.debug(f"Checking for duplicate with source: {source_type.value}")
+                matching_paths: list[str] = []
+                for dup_path in duplicate_mods[target_id]:
+                    dup_mod = all_mods.get(dup_path)
+                    if (
+                        isinstance(dup_mod, AboutXmlMod)
+                        and dup_mod.mod_type == source_type
+                    ):
+                        matching_paths.append(dup_path)
+                source_paths_sorted = natsorted(matching_paths)
+                if source_paths_sorted:
+                    calculated_dup = source_paths_sorted[0]
+                    logger.debug(
+                        f"Using duplicate {source_type.value} mod for {target_id}: {calculated_dup}"
+                    )
+                    populated_mods.add(target_id)
+                    duplicates_processed.add(target_id)
+                    active_mod_paths.append(calculated_dup)
+                    break
+
+        missing_mods = list(set(to_populate) - populated_mods)
         logger.debug(f"Generated active mods with {len(active_mod_paths)} mods")
 
         logger.info("Generating inactive mod list")
-        inactive_mod_paths = [path for path in all_mods if path not in active_mod_paths]
+        active_mod_path_set = set(active_mod_paths)
+        inactive_mod_paths = [
+            path for path in all_mods if path not in active_mod_path_set
+        ]
         logger.info(f"# active mods: {len(active_mod_paths)}")
         logger.info(f"# inactive mods: {len(inactive_mod_paths)}")
         logger.info(f"# duplicate mods: {len(duplicate_mods)}")
@@ -604,26 +657,27 @@ class MetadataController(QObject):
 
     # ---- Mutations ----
 
-    def _parse_single_mod(self, mod_path: str) -> bool:
-        """Parse a single mod directory and merge the result into metadata.
+    def _parse_mods(self, mod_paths: list[str]) -> list[str]:
+        """Parse mod directories in one pass and merge the results into metadata.
 
-        :param mod_path: Filesystem path to the mod directory
-        :return: True if the mod was successfully parsed and is present in metadata
+        :param mod_paths: Filesystem paths to the mod directories
+        :return: The paths that were successfully parsed and are present in metadata
         """
-        path = Path(mod_path)
-        if not path.is_dir():
-            return False
+        existing = [mod_path for mod_path in mod_paths if Path(mod_path).is_dir()]
+        if not existing:
+            return []
         if (
             self.metadata_mediator.local_mods_path is None
             or self.metadata_mediator.game_path is None
         ):
-            return False
+            return []
         if self.metadata_mediator._mods_metadata is None:
-            return False
+            return []
 
+        paths = [Path(mod_path) for mod_path in existing]
         prefer_versioned = self.settings.prefer_versioned_about_tags
         worker = self.metadata_mediator._ParserWorker(
-            [path],
+            paths,
             self.metadata_mediator.game_version,
             self.metadata_mediator.local_mods_path,
             self.metadata_mediator.game_path,
@@ -636,33 +690,41 @@ class MetadataController(QObject):
             prefer_versioned,
         )
         worker.run()
+        self.metadata_mediator.sync_folder_snapshot(*paths)
 
-        return mod_path in self.mods_metadata
+        return [mod_path for mod_path in existing if mod_path in self.mods_metadata]
 
-    @Slot(str, str)
-    def process_creation(self, data_source: str, mod_path: str) -> None:
-        """Parse a single mod and add it to metadata. Emits mod_created_signal."""
-        if self._parse_single_mod(mod_path):
-            self._invalidate_caches()
-            self.mod_created_signal.emit(mod_path)
+    @Slot(list, list, list)
+    def process_changes(
+        self, created: list[str], deleted: list[str], updated: list[str]
+    ) -> None:
+        """Apply a batch of mod folder changes in one pass. Emits metadata_changed.
 
-    @Slot(str, str)
-    def process_deletion(self, data_source: str, mod_path: str) -> None:
-        """Remove a mod from metadata and aux DB. Emits mod_deleted_signal."""
-        if mod_path not in self.mods_metadata:
+        New and modified mods are parsed by one worker, deleted mods are
+        removed from the aux DB in one session, and views are notified once.
+
+        :param created: Paths of mod folders that appeared
+        :param deleted: Paths of mod folders that disappeared
+        :param updated: Paths of mods whose About.xml changed
+        """
+        mods_metadata = self.metadata_mediator.mods_metadata
+        removed = [mod_path for mod_path in deleted if mod_path in mods_metadata]
+        for mod_path in removed:
+            mods_metadata.pop(mod_path, None)
+        if removed:
+            self.metadata_mediator.sync_folder_snapshot(*removed)
+            with self.metadata_db_controller.Session() as session:
+                self.metadata_db_controller.delete(
+                    session, *(Path(mod_path) for mod_path in removed)
+                )
+        parsed = set(self._parse_mods([*created, *updated]))
+        added = [mod_path for mod_path in created if mod_path in parsed]
+        changed = [mod_path for mod_path in updated if mod_path in parsed]
+        if not (added or removed or changed):
             return
-        self.metadata_mediator.mods_metadata.pop(mod_path, None)
-        with self.metadata_db_controller.Session() as session:
-            self.metadata_db_controller.delete(session, Path(mod_path))
+        self._patch_compiled(*removed, *added, *changed)
         self._invalidate_caches()
-        self.mod_deleted_signal.emit(mod_path)
-
-    @Slot(str, str)
-    def process_update(self, data_source: str, mod_path: str) -> None:
-        """Re-parse a single mod and update metadata. Emits mod_metadata_updated_signal."""
-        if self._parse_single_mod(mod_path):
-            self._invalidate_caches()
-            self.mod_metadata_updated_signal.emit(mod_path)
+        self.metadata_changed.emit(added, removed, changed)
 
     def delete_mod(self, *path: Path) -> None:
         """Delete one or more mods from metadata and aux DB by path.
@@ -679,6 +741,7 @@ class MetadataController(QObject):
             self.metadata_mediator.mods_metadata.pop(str(p), None)
             self.mod_deleted_signal.emit(str(p))
 
+        self._patch_compiled(*(str(p) for p in path))
         self._invalidate_caches()
 
     def notify_files_deleted(self, mod_path: str) -> None:
@@ -691,6 +754,8 @@ class MetadataController(QObject):
         :param mod_path: The mod path key to remove from metadata
         """
         self.metadata_mediator.mods_metadata.pop(mod_path, None)
+        self.metadata_mediator.sync_folder_snapshot(mod_path)
+        self._patch_compiled(mod_path)
         self._invalidate_caches()
         self.mod_deleted_signal.emit(mod_path)
 
@@ -731,10 +796,111 @@ class MetadataController(QObject):
 
     # ---- Private helpers ----
 
+    def _finish_full_refresh(self) -> None:
+        """Sync the aux DB and ACF data with freshly refreshed metadata."""
+        with self.metadata_db_controller.Session() as session:
+            self._sync_aux_entries(session, self.metadata_mediator.mods_metadata)
+            self._update_aux_from_acf(session)
+            session.commit()
+
+        self._reload_acf_data()
+        # A full refresh replaces every mod, so rebuild on the next compile()
+        self._compiled = self._compiled_source = None
+        self._invalidate_caches()
+        self.metadata_refreshed.emit()
+
+    def _sync_aux_entries(self, session: Session, mods: dict[str, ListedMod]) -> None:
+        """Create or update the aux DB entries of the given mods.
+
+        :param session: The aux DB session. Not committed.
+        :param mods: The mods keyed by path.
+        """
+        try:
+            self.metadata_db_controller.bulk_upsert(
+                session,
+                {
+                    path: {
+                        "type": str(mod_data.mod_type),
+                        "published_file_id": mod_data.published_file_id,
+                    }
+                    for path, mod_data in mods.items()
+                },
+            )
+        except Exception:  # noqa: BLE001
+            session.rollback()
+            logger.exception(f"Failed to update aux metadata for {len(mods)} mods")
+
+    def _update_aux_from_acf(self, session: Session) -> None:
+        """Update aux DB entries from the SteamCMD and Workshop ACF files."""
+        self.metadata_db_controller.update_from_acf(
+            session,
+            Path(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path),
+            ModType.STEAM_CMD,
+        )
+        if self.workshop_acf_path is not None:
+            self.metadata_db_controller.update_from_acf(
+                session,
+                self.workshop_acf_path,
+                ModType.STEAM_WORKSHOP,
+            )
+
+    def _reload_acf_data(self) -> None:
+        """Reload the cached SteamCMD and Workshop ACF data."""
+        self.steamcmd_acf_data = load_acf_from_path(
+            self.steamcmd_wrapper.steamcmd_appworkshop_acf_path
+        )
+        if self.workshop_acf_path is not None:
+            self.workshop_acf_data = load_acf_from_path(self.workshop_acf_path)
+        else:
+            self.workshop_acf_data = {}
+
     def _invalidate_caches(self) -> None:
         self._packageid_to_paths_cache = None
+        self._packageid_index_cache = None
         self._steamdb_packageid_to_name_cache = None
 
+    def _patch_compiled(self, *paths: str, reinserted: bool = False) -> None:
+        """Bring the cached dependency graph in line with the given mod paths.
+
+        :param paths: Mod paths that were added, changed or removed
+        :param reinserted: The mods were popped and re-added to the metadata,
+            moving them to its end, rather than replaced in place
+        """
+        mods_metadata = self.metadata_mediator.mods_metadata
+        if self._compiled is None or self._compiled_source is not mods_metadata:
+            return
+        if not reinserted:
+            for path in paths:
+                mod = mods_metadata.get(path)
+                if mod is None:
+                    self._compiled.remove_mod(path)
+                else:
+                    self._compiled.update_mod(path, mod)
+            return
+        # Metadata order decides conflicting inferred dependencies, so re-add
+        # the mods in the order they now have in the metadata
+        for path in paths:
+            self._compiled.remove_mod(path)
+        wanted = set(paths)
+        for path, mod in mods_metadata.items():
+            if path in wanted:
+                self._compiled.add_mod(path, mod)
+
+    def _paths_for_packageids(
+        self, packageid_index: dict[str, list[str]], *package_ids: str
+    ) -> list[str]:
+        """Paths of all mods with any of the given package IDs, in metadata order."""
+        found = [
+            packageid_index[pid]
+            for pid in dict.fromkeys(package_ids)
+            if pid in packageid_index
+        ]
+        if len(found) <= 1:
+            return found[0] if found else []
+        # Only reachable for package IDs that themselves contain "_steam"
+        wanted = {path for paths in found for path in paths}
+        return [path for path in self.mods_metadata if path in wanted]
+
     @staticmethod
     def _resolve_db_path(
         source: str, file_path: str, repo_url: str, file_name: str
@@ -767,7 +933,10 @@ class MetadataController(QObject):
             return False
 
         steam_db.version = int(time.time() + self.settings.database_expiry)
-        encoded = msgspec.json.encode(steam_db)
+        encoded = msgspec.json.encode(steam_db, enc_hook=compact_enc_hook)
         formatted = msgspec.json.format(encoded, indent=4)
         steam_db_path.write_bytes(formatted)
+        # Keep the sidecar in step so the next refresh stays on the fast path
+        if compact_db_path(steam_db_path).exists():
+            write_compact_db(steam_db_path, steam_db)
         return True
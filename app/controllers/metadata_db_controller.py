@@ -1,11 +1,14 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from sqlite3 import Connection as SQLiteConnection
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, event, func, or_, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from app.models.metadata.metadata_db import AuxMetadataEntry, Base
 from app.models.metadata.metadata_structure import ModType
@@ -25,9 +28,20 @@ class MetadataDbController:
             )
 
         self.engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
 
+def _set_sqlite_pragmas(
+    dbapi_connection: SQLiteConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Use write-ahead logging, which does not sync the database on every commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class AuxMetadataController(MetadataDbController):
     _instances: dict[
         Path, "AuxMetadataController"
@@ -207,6 +221,43 @@ class AuxMetadataController(MetadataDbController):
 
         return entry
 
+    @staticmethod
+    def bulk_upsert(session: Session, entries: Mapping[str, Mapping[str, Any]]) -> None:
+        """Create or update many aux metadata entries in one statement.
+
+        Existing entries only have the given fields and their touch time
+        updated, and are left untouched if none of the fields changed. The
+        session is not committed.
+
+        :param session: The database session.
+        :type session: Session
+        :param entries: The fields to set, keyed by path. Every entry must
+            set the same fields.
+        :type entries: Mapping[str, Mapping[str, Any]]
+        """
+        if not entries:
+            return
+
+        rows = [{**fields, "path": path} for path, fields in entries.items()]
+        fields = [key for key in rows[0] if key != "path"]
+        stmt = sqlite_insert(AuxMetadataEntry)
+        if fields:
+            table = AuxMetadataEntry.__table__.c
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.path],
+                # Column.onupdate only applies to ORM and update() statements
+                set_={
+                    "db_time_touched": func.now(),
+                    **{key: stmt.excluded[key] for key in fields},
+                },
+                where=or_(
+                    *(table[key].is_distinct_from(stmt.excluded[key]) for key in fields)
+                ),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["path"])
+        session.execute(stmt, rows)
+
     @staticmethod
     def get_value_equals(
         session: Session, key: str, value: str
@@ -304,21 +355,31 @@ class AuxMetadataController(MetadataDbController):
             .items()
         }
 
-        entries = (
-            session.query(AuxMetadataEntry)
-            .filter(
-                AuxMetadataEntry.published_file_id.in_(workshop_items.keys()),
-                AuxMetadataEntry.type == str(mod_type),
+        table = AuxMetadataEntry.__table__.c
+        stmt = (
+            update(AuxMetadataEntry)
+            .where(
+                table.published_file_id == bindparam("item_id"),
+                table.type == str(mod_type),
+                or_(
+                    table.acf_time_updated.is_distinct_from(bindparam("updated")),
+                    table.acf_time_touched.is_distinct_from(bindparam("touched")),
+                ),
+            )
+            .values(
+                acf_time_updated=bindparam("updated"),
+                acf_time_touched=bindparam("touched"),
             )
-            .all()
         )
-
-        for entry in entries:
-            data = workshop_items.get(str(entry.published_file_id), None)
-            if data is None:
-                continue
-
-            entry.acf_time_updated = data.get("timeupdated", -1)
-            entry.acf_time_touched = data.get("timetouched", -1)
+        rows = [
+            {
+                "item_id": str(published_file_id),
+                "updated": data.get("timeupdated", -1),
+                "touched": data.get("timetouched", -1),
+            }
+            for published_file_id, data in workshop_items.items()
+        ]
+        if rows:
+            session.connection().execute(stmt, rows)
 
         session.commit()
@@ -48,7 +48,8 @@ class SettingsController(QObject):
 
     Attributes:
         settings (Settings): The underlying settings model managed by this controller.
-        settings_dialog (SettingsDialog): The settings dialog managed by this controller.
+        settings_dialog (SettingsDialog): The settings dialog managed by this controller,
+            built the first time it is needed.
 
     Examples:
         >>> settings_model = Settings()
@@ -56,22 +57,23 @@ class SettingsController(QObject):
         >>> controller.settings.some_property
     """
 
-    def __init__(self, model: Settings, view: SettingsDialog) -> None:
+    def __init__(self, model: Settings, view: SettingsDialog | None = None) -> None:
         """
         Initialize the `SettingsController` with the given `Settings` model and `SettingsDialog` view.
 
         Upon initialization, the provided settings model's `load` method is called to ensure
-        that the settings are loaded and available for use. The view is also initialized with values
-        from the settings model.
+        that the settings are loaded and available for use. The view is initialized with values
+        from the settings model when it is first needed.
 
         Args:
             model (Settings): The settings model to be managed by this controller.
-            view (SettingsDialog): The settings dialog to be managed by this controller.
+            view (SettingsDialog | None): The settings dialog to be managed by this controller.
+                If None, the dialog is built the first time it is opened.
         """
         super().__init__()
 
         self.settings = model
-        self.settings_dialog = view
+        self._settings_dialog: SettingsDialog | None = None
 
         self._last_file_dialog_path = str(Path.home())
 
@@ -83,17 +85,40 @@ class SettingsController(QObject):
 
         self._http_download_service = HttpDownloadService()
 
+        self._tab_controllers: dict[str, BaseTabController] = {}
+        if view is not None:
+            self._setup_settings_dialog(view)
+
+        # Connect signals from dialogs
+        EventBus().reset_settings_file.connect(self._do_reset_settings_file)
+
+        self._load_settings()
+
+    @property
+    def settings_dialog(self) -> SettingsDialog:
+        """The settings dialog, built the first time it is needed."""
+        if self._settings_dialog is None:
+            logger.debug("Building the settings dialog")
+            view = SettingsDialog()
+            self._setup_settings_dialog(view)
+            return view
+        return self._settings_dialog
+
+    def _setup_settings_dialog(self, view: SettingsDialog) -> None:
+        """Create the tab controllers of the settings dialog and wire it up."""
+        self._settings_dialog = view
+
         # Initialize per-tab controllers (registry pattern)
-        self._tab_controllers: dict[str, BaseTabController] = {
-            "sorting": SortingTabController(self.settings, self.settings_dialog),
+        self._tab_controllers = {
+            "sorting": SortingTabController(self.settings, view),
             "databases": DatabasesTabController(
                 self.settings,
-                self.settings_dialog,
+                view,
                 self._http_download_service.start_download,
             ),
             "locations": LocationsTabController(
                 self.settings,
-                self.settings_dialog,
+                view,
                 validate_game_location=self._validate_game_location,
                 validate_config_folder_location=self._validate_config_folder_location,
                 validate_local_mods_location=self._validate_local_mods_location,
@@ -102,25 +127,25 @@ class SettingsController(QObject):
                 on_instance_folder_choose=self._on_instance_folder_location_choose_button_clicked,
                 on_instance_folder_clear=self._on_instance_folder_location_clear_button_clicked,
             ),
-            "appearance": AppearanceTabController(self.settings, self.settings_dialog),
-            "game_launch": GameLaunchTabController(self.settings, self.settings_dialog),
+            "appearance": AppearanceTabController(self.settings, view),
+            "game_launch": GameLaunchTabController(self.settings, view),
             "internal_tools": InternalToolsTabController(
                 self.settings,
-                self.settings_dialog,
+                view,
                 last_file_dialog_path=str(self._last_file_dialog_path),
                 on_path_selected=self._on_locations_path_selected,
             ),
             "external_tools": ExternalToolsTabController(
                 self.settings,
-                self.settings_dialog,
+                view,
                 last_file_dialog_path=str(self._last_file_dialog_path),
                 on_path_selected=self._on_locations_path_selected,
             ),
             "db_builder": DatabaseBuilderTabController(
                 self.settings,
-                self.settings_dialog,
+                view,
             ),
-            "advanced": AdvancedTabController(self.settings, self.settings_dialog),
+            "advanced": AdvancedTabController(self.settings, view),
         }
 
         for tc in self._tab_controllers.values():
@@ -130,22 +155,13 @@ class SettingsController(QObject):
 
         # Wire up the settings dialog's global buttons
 
-        self.settings_dialog.global_reset_to_defaults_button.clicked.connect(
+        view.global_reset_to_defaults_button.clicked.connect(
             self._on_global_reset_to_defaults_button_clicked
         )
 
-        self.settings_dialog.global_cancel_button.clicked.connect(
-            self._on_global_cancel_button_clicked
-        )
-
-        self.settings_dialog.global_ok_button.clicked.connect(
-            self._on_global_ok_button_clicked
-        )
+        view.global_cancel_button.clicked.connect(self._on_global_cancel_button_clicked)
 
-        # Connect signals from dialogs
-        EventBus().reset_settings_file.connect(self._do_reset_settings_file)
-
-        self._load_settings()
+        view.global_ok_button.clicked.connect(self._on_global_ok_button_clicked)
 
     def _load_settings(self) -> None:
         logger.info("Attempting to load settings from settings file")
@@ -168,14 +184,15 @@ class SettingsController(QObject):
         """
         Update the view from the model and show the settings dialog.
         """
+        settings_dialog = self.settings_dialog
         self._update_view_from_model()
         # Apply custom size for settings window
         custom_width = self.settings.settings_window_custom_width
         custom_height = self.settings.settings_window_custom_height
-        self.settings_dialog.resize(custom_width, custom_height)
+        settings_dialog.resize(custom_width, custom_height)
         if tab_name:
-            self.settings_dialog.switch_to_tab(tab_name)
-        self.settings_dialog.show()
+            settings_dialog.switch_to_tab(tab_name)
+        settings_dialog.show()
         self._show_steam_integration_warnings()
 
     def set_instance(self, instance: Instance) -> None:
@@ -2,7 +2,7 @@ from PySide6.QtCore import Slot
 
 from app.controllers.settings_tabs.base_tab_controller import BaseTabController
 from app.models.settings import Settings
-from app.utils.constants import SortMethod
+from app.utils.constants import MetadataParserBackend, SortMethod
 from app.utils.event_bus import EventBus
 from app.views.settings_dialog import SettingsDialog
 
@@ -55,6 +55,10 @@ class SortingTabController(BaseTabController):
         self.dialog.case_insensitive_about_xml_checkbox.setChecked(
             self.settings.case_insensitive_about_xml_lookup
         )
+        if self.settings.metadata_parser_backend == MetadataParserBackend.PROCESSES:
+            self.dialog.metadata_parser_processes_radio.setChecked(True)
+        else:
+            self.dialog.metadata_parser_threads_radio.setChecked(True)
         self.dialog.render_unity_rich_text_checkbox.setChecked(
             self.settings.render_unity_rich_text
         )
@@ -79,6 +83,9 @@ class SortingTabController(BaseTabController):
         self.dialog.mod_list_startup_impact_checkbox.setChecked(
             self.settings.mod_list_startup_impact
         )
+        self.dialog.mod_list_paint_rows_checkbox.setChecked(
+            self.settings.mod_list_paint_rows
+        )
         self.dialog.hide_invalid_mods_when_filtering_checkbox.setChecked(
             self.settings.hide_invalid_mods_when_filtering
         )
@@ -105,6 +112,11 @@ class SortingTabController(BaseTabController):
         self.settings.case_insensitive_about_xml_lookup = (
             self.dialog.case_insensitive_about_xml_checkbox.isChecked()
         )
+        self.settings.metadata_parser_backend = (
+            MetadataParserBackend.PROCESSES
+            if self.dialog.metadata_parser_processes_radio.isChecked()
+            else MetadataParserBackend.THREADS
+        )
         self.settings.render_unity_rich_text = (
             self.dialog.render_unity_rich_text_checkbox.isChecked()
         )
@@ -126,6 +138,9 @@ class SortingTabController(BaseTabController):
         self.settings.mod_list_startup_impact = (
             self.dialog.mod_list_startup_impact_checkbox.isChecked()
         )
+        self.settings.mod_list_paint_rows = (
+            self.dialog.mod_list_paint_rows_checkbox.isChecked()
+        )
         self.settings.hide_invalid_mods_when_filtering = (
             self.dialog.hide_invalid_mods_when_filtering_checkbox.isChecked()
         )
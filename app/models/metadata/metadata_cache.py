@@ -0,0 +1,471 @@
+"""Persistent parse cache for mod metadata.
+
+Parsing every About.xml (and pygit2 repository discovery for local mods) is
+the dominant cost of ``MetadataMediator.refresh_metadata`` on large
+instances. This module stores the parsed result of each mod folder in a
+small SQLite database next to the aux metadata DB, keyed by the mod path and
+a stat signature of the files the parse depends on. Unchanged mods are
+rehydrated into ``AboutXmlMod``/``ScenarioMod`` objects without touching the
+XML parser; only changed folders go through the regular factory.
+
+Only data derived from the mod folder itself is cached. User and community
+rules are applied on top of the rehydrated mod by the parser worker on every
+refresh, exactly like freshly parsed mods, so edits to either rules DB are
+always reflected without a re-parse.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import msgspec
+from loguru import logger
+from sqlalchemy import (
+    Engine,
+    Integer,
+    LargeBinary,
+    String,
+    create_engine,
+    delete,
+    select,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    sessionmaker,
+)
+
+from app.models.metadata.metadata_factory import _find_about_xml
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    BaseRules,
+    CaseInsensitiveSet,
+    CaseInsensitiveStr,
+    DependencyMod,
+    ListedMod,
+    ModType,
+    ScenarioMod,
+)
+
+# Bump whenever the cached payload layout or the parser output changes in a
+# way that makes previously cached entries wrong.
+PARSE_CACHE_FORMAT_VERSION = 1
+
+PARSE_CACHE_FILENAME = "metadata_cache.db"
+
+
+class ParseCacheBase(DeclarativeBase):
+    """Separate base for the parsed metadata cache DB."""
+
+
+class ParsedModCacheEntry(ParseCacheBase):
+    __tablename__ = "parsed_mods"
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    signature: Mapped[str] = mapped_column(String)
+    target_version: Mapped[str] = mapped_column(String)
+    fingerprint: Mapped[str] = mapped_column(String)
+    format_version: Mapped[int] = mapped_column(Integer)
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+
+
+class CachedDependency(msgspec.Struct, omit_defaults=True):
+    package_id: str
+    name: str
+    workshop_url: str = ""
+    alternative_package_ids: list[str] = msgspec.field(default_factory=list)
+
+
+class CachedMod(msgspec.Struct, omit_defaults=True):
+    """Serializable snapshot of the parser output for one mod folder."""
+
+    kind: str
+    mod_type: str
+    valid: bool = True
+    name: str = ""
+    description: str = ""
+    supported_versions: list[str] = msgspec.field(default_factory=list)
+    summary: str = ""
+    package_id: str = ""
+    authors: list[str] = msgspec.field(default_factory=list)
+    mod_version: str = ""
+    mod_icon_path: str | None = None
+    steam_app_id: int = -1
+    url: str = ""
+    load_after: list[str] = msgspec.field(default_factory=list)
+    load_before: list[str] = msgspec.field(default_factory=list)
+    incompatible_with: list[str] = msgspec.field(default_factory=list)
+    dependencies: list[CachedDependency] = msgspec.field(default_factory=list)
+
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder(CachedMod)
+
+
+def parse_cache_fingerprint(prefer_versioned: bool, case_insensitive: bool) -> str:
+    """Fingerprint of the parser options that affect the parsed output.
+
+    :param prefer_versioned: The ``prefer_versioned_about_tags`` setting.
+    :param case_insensitive: The ``case_insensitive_about_xml_lookup`` setting.
+    :return: A string that changes whenever cached entries must be discarded.
+    """
+    return f"v{PARSE_CACHE_FORMAT_VERSION}|pv={int(prefer_versioned)}|ci={int(case_insensitive)}"
+
+
+def mod_source_signature(mod_path: Path, case_insensitive: bool) -> str | None:
+    """Compute the stat signature a cached parse of ``mod_path`` depends on.
+
+    The signature covers the About.xml (or single scenario ``.rsc``) size and
+    mtime, plus the mtimes of the mod folder and the folder containing the
+    definition file. The folder mtimes catch changes that alter the mod type
+    (a ``.git`` folder or ``PublishedFileId.txt`` appearing).
+
+    :param mod_path: The mod's root directory.
+    :param case_insensitive: Whether About.xml lookup is case-insensitive.
+    :return: The signature, or None if the folder has nothing cacheable.
+    """
+    try:
+        if case_insensitive:
+            source = _find_about_xml(mod_path)
+        else:
+            candidate = mod_path / "About" / "About.xml"
+            source = candidate if candidate.exists() else None
+        if source is None:
+            rsc_files = list(mod_path.glob("*.rsc"))
+            if len(rsc_files) != 1:
+                return None
+            source = rsc_files[0]
+        source_stat = source.stat()
+        folder_mtime = os.stat(mod_path).st_mtime_ns
+        parent_mtime = os.stat(source.parent).st_mtime_ns
+    except OSError:
+        return None
+    return (
+        f"{source.relative_to(mod_path).as_posix()}:{source_stat.st_size}:"
+        f"{source_stat.st_mtime_ns}:{folder_mtime}:{parent_mtime}"
+    )
+
+
+def snapshot_mod(mod: ListedMod) -> CachedMod | None:
+    """Convert a freshly parsed mod into its cacheable snapshot.
+
+    :param mod: The parsed mod. Rules from user/community DBs are ignored.
+    :return: The snapshot, or None for mods that are not worth caching.
+    """
+    if not all(isinstance(v, str) for v in mod.supported_versions):
+        return None
+    if isinstance(mod, AboutXmlMod):
+        rules = mod.about_rules
+        return CachedMod(
+            kind="about",
+            mod_type=mod.mod_type.value,
+            valid=mod.valid,
+            name=str(mod.name),
+            description=str(mod.description),
+            supported_versions=sorted(mod.supported_versions),
+            package_id=str(mod.package_id),
+            authors=[str(a) for a in mod.authors],
+            mod_version=mod.mod_version,
+            mod_icon_path=str(mod.mod_icon_path) if mod.mod_icon_path else None,
+            steam_app_id=mod.steam_app_id,
+            url=mod.url,
+            load_after=sorted(str(pid) for pid in rules.load_after),
+            load_before=sorted(str(pid) for pid in rules.load_before),
+            incompatible_with=sorted(str(pid) for pid in rules.incompatible_with),
+            dependencies=[
+                CachedDependency(
+                    package_id=str(dep.package_id),
+                    name=str(dep.name),
+                    workshop_url=dep.workshop_url,
+                    alternative_package_ids=sorted(
+                        str(pid) for pid in dep.alternative_package_ids
+                    ),
+                )
+                for dep in rules.dependencies.values()
+            ],
+        )
+    if isinstance(mod, ScenarioMod):
+        return CachedMod(
+            kind="scenario",
+            mod_type=mod.mod_type.value,
+            valid=mod.valid,
+            name=str(mod.name),
+            description=str(mod.description),
+            supported_versions=sorted(mod.supported_versions),
+            summary=str(mod.summary),
+        )
+    return None
+
+
+def hydrate_mod(cached: CachedMod, mod_path: Path) -> ListedMod:
+    """Rebuild a mod object from its cached snapshot.
+
+    :param cached: The cached snapshot.
+    :param mod_path: The mod's root directory.
+    :return: An ``AboutXmlMod`` or ``ScenarioMod`` equivalent to a fresh parse.
+    """
+    if cached.kind == "scenario":
+        return ScenarioMod(
+            name=cached.name,
+            valid=cached.valid,
+            description=cached.description,
+            supported_versions=set(cached.supported_versions),
+            summary=cached.summary,
+            _mod_path=mod_path,
+            _mod_type=ModType(cached.mod_type),
+        )
+
+    dependencies: dict[CaseInsensitiveStr, DependencyMod] = {}
+    for dep in cached.dependencies:
+        dep_mod = DependencyMod(
+            name=dep.name,
+            package_id=CaseInsensitiveStr(dep.package_id),
+            workshop_url=dep.workshop_url,
+            alternative_package_ids={
+                CaseInsensitiveStr(a) for a in dep.alternative_package_ids
+            },
+        )
+        dependencies[dep_mod.package_id] = dep_mod
+
+    return AboutXmlMod(
+        name=cached.name,
+        package_id=CaseInsensitiveStr(cached.package_id),
+        valid=cached.valid,
+        description=cached.description,
+        supported_versions=set(cached.supported_versions),
+        authors=list(cached.authors),
+        mod_version=cached.mod_version,
+        mod_icon_path=Path(cached.mod_icon_path) if cached.mod_icon_path else None,
+        steam_app_id=cached.steam_app_id,
+        url=cached.url,
+        about_rules=BaseRules(
+            load_after=CaseInsensitiveSet(cached.load_after),
+            load_before=CaseInsensitiveSet(cached.load_before),
+            incompatible_with=CaseInsensitiveSet(cached.incompatible_with),
+            dependencies=dependencies,
+        ),
+        _mod_path=mod_path,
+        _mod_type=ModType(cached.mod_type),
+    )
+
+
+def encode_mod(mod: ListedMod) -> bytes | None:
+    """Encode a parsed mod as msgpack, e.g. to ship it across processes.
+
+    :param mod: The parsed mod. Rules from user/community DBs are dropped.
+    :return: The encoded snapshot, or None if the mod has no snapshot.
+    """
+    snapshot = snapshot_mod(mod)
+    if snapshot is None:
+        return None
+    return _ENCODER.encode(snapshot)
+
+
+def decode_mod(payload: bytes, mod_path: Path) -> ListedMod:
+    """Decode a mod encoded with :func:`encode_mod`.
+
+    :param payload: The msgpack payload.
+    :param mod_path: The mod's root directory.
+    :return: The rehydrated mod.
+    """
+    return hydrate_mod(_DECODER.decode(payload), mod_path)
+
+
+class MetadataParseCache:
+    """On-disk cache of parsed mod metadata.
+
+    Usage per refresh: :meth:`begin` loads all entries valid for the current
+    game version and parser options into memory, parser workers call
+    :meth:`lookup`/:meth:`store` concurrently, and :meth:`commit` persists new
+    entries in one transaction and prunes entries for folders that no longer
+    exist.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._engine: Engine | None = None
+        self._session_factory: sessionmaker[Session] | None = None
+
+        self._target_version = ""
+        self._fingerprint = ""
+        self._case_insensitive = True
+        self._entries: dict[str, tuple[str, CachedMod]] = {}
+        self._pending: dict[str, tuple[str, CachedMod]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _session(self) -> sessionmaker[Session]:
+        if self._session_factory is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._engine = create_engine(f"sqlite+pysqlite:///{self.db_path}")
+            ParseCacheBase.metadata.create_all(self._engine)
+            self._session_factory = sessionmaker(bind=self._engine)
+        return self._session_factory
+
+    def begin(
+        self,
+        target_version: str,
+        prefer_versioned: bool,
+        case_insensitive: bool,
+    ) -> None:
+        """Load the cache entries usable for this refresh into memory.
+
+        :param target_version: The game version mods are parsed against.
+        :param prefer_versioned: The ``prefer_versioned_about_tags`` setting.
+        :param case_insensitive: The ``case_insensitive_about_xml_lookup`` setting.
+        """
+        self._target_version = target_version
+        self._fingerprint = parse_cache_fingerprint(prefer_versioned, case_insensitive)
+        self._case_insensitive = case_insensitive
+        self._entries = {}
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with self._session()() as session:
+                rows = session.execute(
+                    select(
+                        ParsedModCacheEntry.path,
+                        ParsedModCacheEntry.signature,
+                        ParsedModCacheEntry.payload,
+                    ).where(
+                        ParsedModCacheEntry.target_version == target_version,
+                        ParsedModCacheEntry.fingerprint == self._fingerprint,
+                        ParsedModCacheEntry.format_version
+                        == PARSE_CACHE_FORMAT_VERSION,
+                    )
+                ).all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Unable to read metadata parse cache {self.db_path}: {e}")
+            return
+
+        for path, signature, payload in rows:
+            try:
+                self._entries[path] = (signature, _DECODER.decode(payload))
+            except msgspec.DecodeError:
+                continue
+        logger.debug(f"Loaded {len(self._entries)} entries from metadata parse cache")
+
+    def lookup(self, mod_path: Path) -> tuple[str | None, ListedMod | None]:
+        """Return a rehydrated mod if the cached parse is still current.
+
+        Thread-safe: only reads the in-memory snapshot taken by :meth:`begin`.
+
+        :param mod_path: The mod's root directory.
+        :return: ``(signature, mod)``. ``mod`` is None on a cache miss; the
+            signature can be passed to :meth:`store` to avoid a second stat.
+        """
+        signature = mod_source_signature(mod_path, self._case_insensitive)
+        if signature is None:
+            return None, None
+        entry = self._entries.get(str(mod_path))
+        if entry is None or entry[0] != signature:
+            with self._lock:
+                self.misses += 1
+            return signature, None
+        with self._lock:
+            self.hits += 1
+        try:
+            return signature, hydrate_mod(entry[1], mod_path)
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Discarding unusable cache entry for {mod_path}: {e}")
+            return signature, None
+
+    def store(self, mod_path: Path, signature: str | None, mod: ListedMod) -> None:
+        """Record a freshly parsed mod to be written on :meth:`commit`.
+
+        :param mod_path: The mod's root directory.
+        :param signature: The signature returned by :meth:`lookup`.
+        :param mod: The parsed mod, before user/community rules are applied.
+        """
+        # Failed parses come back without a mod path; never cache those
+        if signature is None or mod.mod_path != mod_path:
+            return
+        snapshot = snapshot_mod(mod)
+        if snapshot is None:
+            return
+        with self._lock:
+            self._pending[str(mod_path)] = (signature, snapshot)
+
+    def commit(self, present_paths: set[str] | None = None) -> None:
+        """Persist new entries and prune entries for mods that disappeared.
+
+        :param present_paths: All mod paths seen by this refresh. When given,
+            cached rows for any other path are deleted.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        self._entries.update(pending)
+
+        try:
+            with self._session()() as session:
+                if pending:
+                    stmt = sqlite_insert(ParsedModCacheEntry)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[ParsedModCacheEntry.path],
+                        set_={
+                            "signature": stmt.excluded.signature,
+                            "target_version": stmt.excluded.target_version,
+                            "fingerprint": stmt.excluded.fingerprint,
+                            "format_version": stmt.excluded.format_version,
+                            "payload": stmt.excluded.payload,
+                        },
+                    )
+                    session.execute(
+                        stmt,
+                        [
+                            {
+                                "path": path,
+                                "signature": signature,
+                                "target_version": self._target_version,
+                                "fingerprint": self._fingerprint,
+                                "format_version": PARSE_CACHE_FORMAT_VERSION,
+                                "payload": _ENCODER.encode(snapshot),
+                            }
+                            for path, (signature, snapshot) in pending.items()
+                        ],
+                    )
+                if present_paths is not None:
+                    stale = (
+                        set(session.scalars(select(ParsedModCacheEntry.path)).all())
+                        - present_paths
+                    )
+                    if stale:
+                        session.execute(
+                            delete(ParsedModCacheEntry).where(
+                                ParsedModCacheEntry.path.in_(stale)
+                            )
+                        )
+                        for path in stale:
+                            self._entries.pop(path, None)
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Unable to write metadata parse cache {self.db_path}: {e}")
+            return
+
+        logger.info(
+            f"Metadata parse cache: {self.hits} reused, {self.misses} re-parsed, "
+            f"{len(pending)} written"
+        )
+
+    def clear(self) -> None:
+        """Drop every cached entry, forcing a full re-parse on next refresh."""
+        self._entries = {}
+        with self._lock:
+            self._pending = {}
+        try:
+            with self._session()() as session:
+                session.execute(delete(ParsedModCacheEntry))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Unable to clear metadata parse cache {self.db_path}: {e}")
@@ -0,0 +1,312 @@
+"""Compact, lazily decoded on-disk format for SteamDB and rules databases.
+
+``read_steam_db``/``read_rules_db`` decode the whole multi-megabyte JSON file
+into structs on every metadata refresh, even though only the entries for the
+installed mods are ever looked at. This module writes a sidecar next to such
+a JSON file (``steamDB.json`` -> ``steamDB.rsdb``) that stores every entry as
+an individually encoded msgpack blob, followed by an index of
+``(key, offset)`` pairs:
+
+.. code-block:: text
+
+    [magic: 8 bytes][index offset: u64 LE][entry blobs...][msgpack index]
+
+Reading a sidecar only decodes the index. The file is memory-mapped and each
+entry is decoded on first access by :class:`LazyEntryMap`, which stands in
+for the ``database``/``rules`` dict of the schema.
+
+Sidecars record the size and mtime of the JSON they were built from and are
+ignored once the JSON changes, so the JSON file stays the source of truth.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any, Literal
+
+import msgspec
+from loguru import logger
+
+from app.models.metadata.metadata_structure import (
+    ExternalRule,
+    ExternalRulesSchema,
+    SteamDbEntry,
+    SteamDbSchema,
+)
+
+COMPACT_DB_SUFFIX = ".rsdb"
+
+# Bump whenever the sidecar layout changes; older sidecars are then ignored.
+_MAGIC = b"RSCDB\x00\x00\x01"
+_HEADER = struct.Struct("<8sQ")
+
+CompactDbKind = Literal["steam_db", "rules"]
+
+
+class _CompactIndex(msgspec.Struct):
+    kind: str
+    version: int
+    source_size: int
+    source_mtime_ns: int
+    keys: list[str]
+    offsets: list[int]
+
+
+class _CompactDbProbe(msgspec.Struct):
+    """Top-level keys used to tell SteamDB and rules JSON files apart."""
+
+    database: msgspec.Raw = msgspec.field(default_factory=msgspec.Raw)
+    rules: msgspec.Raw = msgspec.field(default_factory=msgspec.Raw)
+
+
+class LazyEntryMap[T](MutableMapping[str, T]):
+    """Mapping over the entries of a compact DB, decoded on first access.
+
+    Decoded entries are kept, so in-place edits of a returned entry stick
+    like they would on a plain dict. Assigned and deleted keys only live in
+    memory; the sidecar itself is never modified.
+
+    Lookups are safe to run from several parser threads at once: two threads
+    racing on the same key decode it twice and the first result wins.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | mmap.mmap,
+        keys: list[str],
+        offsets: list[int],
+        entry_type: type[T],
+    ) -> None:
+        self._buffer = buffer
+        self._offsets = offsets
+        # Slot -1 marks keys that were assigned in memory only
+        self._slots: dict[str, int] = {key: i for i, key in enumerate(keys)}
+        self._decoded: dict[str, T] = {}
+        self._decoder = msgspec.msgpack.Decoder(entry_type)
+
+    @property
+    def decoded_count(self) -> int:
+        """Number of entries that have been decoded or assigned so far."""
+        return len(self._decoded)
+
+    def __getitem__(self, key: str) -> T:
+        entry = self._decoded.get(key)
+        if entry is not None:
+            return entry
+        slot = self._slots[key]
+        entry = self._decoder.decode(
+            self._buffer[self._offsets[slot] : self._offsets[slot + 1]]
+        )
+        return self._decoded.setdefault(key, entry)
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._decoded[key] = value
+        self._slots.setdefault(key, -1)
+
+    def __delitem__(self, key: str) -> None:
+        del self._slots[key]
+        self._decoded.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def to_dict(self) -> dict[str, T]:
+        """Decode every entry into a plain dict."""
+        return {key: self[key] for key in self._slots}
+
+
+def compact_enc_hook(obj: Any) -> Any:
+    """msgspec ``enc_hook`` that encodes a :class:`LazyEntryMap` as a dict.
+
+    Pass this to ``msgspec.json.encode``/``msgspec.to_builtins`` for any
+    schema that may have been loaded from a compact sidecar.
+    """
+    if isinstance(obj, LazyEntryMap):
+        return obj.to_dict()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+def compact_db_path(path: Path) -> Path:
+    """Return the sidecar path for the JSON database at ``path``."""
+    return path.with_suffix(COMPACT_DB_SUFFIX)
+
+
+def write_compact_db(
+    path: Path, schema: SteamDbSchema | ExternalRulesSchema | None = None
+) -> Path | None:
+    """Write the compact sidecar for the JSON database at ``path``.
+
+    :param path: Path to the SteamDB or rules JSON file the sidecar mirrors.
+    :type path: Path
+    :param schema: Already decoded contents of ``path``. When None, the JSON
+        is decoded here and files that are neither a SteamDB nor a rules DB
+        are skipped.
+    :type schema: SteamDbSchema | ExternalRulesSchema | None
+    :return: The sidecar path, or None if nothing was written.
+    :rtype: Path | None
+    """
+    try:
+        if schema is None:
+            schema = _decode_json_db(path)
+            if schema is None:
+                return None
+        source = path.stat()
+    except (OSError, msgspec.DecodeError) as e:
+        logger.warning(f"Could not read {path} to build compact DB: {e}")
+        return None
+
+    kind: CompactDbKind
+    entries: MutableMapping[str, SteamDbEntry] | MutableMapping[str, ExternalRule]
+    if isinstance(schema, SteamDbSchema):
+        kind, version, entries = "steam_db", schema.version, schema.database
+    else:
+        kind, version, entries = "rules", schema.timestamp, schema.rules
+
+    target = compact_db_path(path)
+    temp = target.with_name(f".{target.name}.tmp")
+    encoder = msgspec.msgpack.Encoder()
+    # Lowercase like read_steam_db/read_rules_db; later duplicates win
+    blobs = {key.lower(): encoder.encode(entry) for key, entry in entries.items()}
+    offsets = [_HEADER.size]
+    try:
+        with open(temp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 0))
+            for blob in blobs.values():
+                f.write(blob)
+                offsets.append(offsets[-1] + len(blob))
+            f.write(
+                encoder.encode(
+                    _CompactIndex(
+                        kind=kind,
+                        version=version,
+                        source_size=source.st_size,
+                        source_mtime_ns=source.st_mtime_ns,
+                        keys=list(blobs),
+                        offsets=offsets,
+                    )
+                )
+            )
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, offsets[-1]))
+        os.replace(temp, target)
+    except OSError as e:
+        logger.warning(f"Could not write compact DB {target}: {e}")
+        temp.unlink(missing_ok=True)
+        return None
+
+    logger.info(f"Wrote compact {kind} DB with {len(blobs)} entries to {target}")
+    return target
+
+
+def generate_compact_dbs(directory: Path) -> list[Path]:
+    """Write compact sidecars for every SteamDB/rules JSON file in ``directory``.
+
+    :param directory: Directory to scan, non-recursively.
+    :type directory: Path
+    :return: Paths of the sidecars that were written.
+    :rtype: list[Path]
+    """
+    written: list[Path] = []
+    for path in sorted(directory.glob("*.json")):
+        target = write_compact_db(path)
+        if target is not None:
+            written.append(target)
+    return written
+
+
+def read_compact_steam_db(path: Path) -> SteamDbSchema | None:
+    """Load the compact sidecar of the SteamDB JSON at ``path``.
+
+    :param path: Path to the SteamDB JSON file.
+    :type path: Path
+    :return: A schema whose ``database`` decodes entries lazily, or None if
+        there is no up-to-date sidecar.
+    :rtype: SteamDbSchema | None
+    """
+    loaded = _open_compact_db(path, "steam_db", SteamDbEntry)
+    if loaded is None:
+        return None
+    version, database = loaded
+    return SteamDbSchema(version=version, database=database)
+
+
+def read_compact_rules_db(path: Path) -> ExternalRulesSchema | None:
+    """Load the compact sidecar of the rules DB JSON at ``path``.
+
+    :param path: Path to the rules DB JSON file.
+    :type path: Path
+    :return: A schema whose ``rules`` decodes entries lazily, or None if
+        there is no up-to-date sidecar.
+    :rtype: ExternalRulesSchema | None
+    """
+    loaded = _open_compact_db(path, "rules", ExternalRule)
+    if loaded is None:
+        return None
+    timestamp, rules = loaded
+    return ExternalRulesSchema(timestamp=timestamp, rules=rules)
+
+
+def _decode_json_db(path: Path) -> SteamDbSchema | ExternalRulesSchema | None:
+    raw = path.read_bytes()
+    probe = msgspec.json.decode(raw, type=_CompactDbProbe)
+    if probe.database:
+        return msgspec.json.decode(raw, type=SteamDbSchema)
+    if probe.rules:
+        return msgspec.json.decode(raw, type=ExternalRulesSchema)
+    return None
+
+
+def _map_file(path: Path) -> bytes | mmap.mmap:
+    if sys.platform == "win32":
+        # A live mapping would block the downloader from replacing the
+        # database folder, so read the (already compact) file instead
+        return path.read_bytes()
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _open_compact_db[T](
+    path: Path, kind: CompactDbKind, entry_type: type[T]
+) -> tuple[int, LazyEntryMap[T]] | None:
+    target = compact_db_path(path)
+    try:
+        source = path.stat()
+        if not target.exists():
+            return None
+        buffer = _map_file(target)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not open compact DB {target}: {e}")
+        return None
+
+    try:
+        magic, index_offset = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            logger.debug(f"Ignoring compact DB {target} with unknown format")
+            return None
+        index = msgspec.msgpack.decode(buffer[index_offset:], type=_CompactIndex)
+    except (struct.error, msgspec.DecodeError) as e:
+        logger.warning(f"Compact DB {target} is corrupt, ignoring it: {e}")
+        return None
+
+    if index.kind != kind:
+        logger.debug(f"Compact DB {target} holds a {index.kind}, not a {kind}")
+        return None
+    if (index.source_size, index.source_mtime_ns) != (
+        source.st_size,
+        source.st_mtime_ns,
+    ):
+        logger.info(f"Compact DB {target} is out of date, ignoring it")
+        return None
+
+    return index.version, LazyEntryMap(buffer, index.keys, index.offsets, entry_type)
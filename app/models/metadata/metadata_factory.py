@@ -2,6 +2,7 @@ import itertools
 import os
 import re
 import traceback
+import xml.etree.ElementTree as ET
 from collections.abc import Sequence
 from functools import cache
 from pathlib import Path
@@ -10,6 +11,11 @@ from typing import Any
 import msgspec
 from loguru import logger
 
+from app.models.metadata.metadata_compact_db import (
+    compact_enc_hook,
+    read_compact_rules_db,
+    read_compact_steam_db,
+)
 from app.models.metadata.metadata_structure import (
     AboutXmlMod,
     BaseRules,
@@ -664,12 +670,354 @@ def create_mod_dependency(input_dict: dict[str, str]) -> DependencyMod:
     return mod
 
 
+# ── Streaming About.xml reader ────────────────────────────────────────
+#
+# ``_create_about_mod_from_xml`` used to always go through ``xml_path_to_json``,
+# which converts the whole document into nested dicts before ``_parse_basic``
+# and ``_parse_optional`` pick out a handful of fields. The reader below pulls
+# the document with ``XMLPullParser``, rejects non-ModMetaData roots as soon as
+# the root tag is seen, and reads the known fields straight off the elements.
+# It mirrors the dict path's semantics for the shapes real About.xml files use
+# (plain text fields, ``<li>`` lists, dependency lists and ``*ByVersion``
+# blocks) and raises ``_UnsupportedAboutXml`` for anything else, in which case
+# the dict path is used instead.
+
+_ABOUT_XML_CHUNK_SIZE = 64 * 1024
+
+
+class _UnsupportedAboutXml(Exception):
+    """The About.xml has a shape only the generic dict parser handles."""
+
+
+def _about_leaf_text(element: ET.Element) -> str | None:
+    """Stripped text of a childless, attribute-less element.
+
+    Returns None where the dict path would produce an empty dict.
+    """
+    if len(element) or element.attrib:
+        raise _UnsupportedAboutXml(element.tag)
+    return element.text.strip() if element.text is not None else None
+
+
+def _about_scalar(element: ET.Element | None) -> str | None:
+    """Value of a plain text field, or None if it is missing or not a string."""
+    if element is None:
+        return None
+    if element.attrib and not len(element):
+        text = (element.text or "").strip()
+        if element.attrib.keys() == {"IgnoreIfNoMatchingField"} and text:
+            return text
+        raise _UnsupportedAboutXml(element.tag)
+    return _about_leaf_text(element)
+
+
+def _about_list(element: ET.Element) -> str | None | list[str | None]:
+    """Value of an ``<li>`` list field as ``value_extractor`` would return it.
+
+    A single ``<li>`` collapses to its text, several become a list, and a
+    field without children is read as plain text.
+    """
+    if not len(element):
+        return _about_leaf_text(element)
+    if element.attrib or (element.text and element.text.strip()):
+        raise _UnsupportedAboutXml(element.tag)
+    values: list[str | None] = []
+    for child in element:
+        if child.tag != "li":
+            raise _UnsupportedAboutXml(element.tag)
+        values.append(_about_leaf_text(child))
+    return values[0] if len(values) == 1 else values
+
+
+def _about_string_list(element: ET.Element | None) -> list[str]:
+    """The string entries of an ``<li>`` list field, for load order rules."""
+    if element is None:
+        return []
+    value = _about_list(element)
+    items = value if isinstance(value, list) else [value]
+    return [item for item in items if isinstance(item, str)]
+
+
+def _about_by_version(
+    fields: dict[str, ET.Element], key: str, target_version: str
+) -> tuple[bool, ET.Element | None]:
+    """Find the ``*ByVersion`` entry matching the target version.
+
+    :return: ``(matched, element)`` like ``_match_byversion_raw``.
+    """
+    container = _about_field(fields, key)
+    if container is None or not len(container):
+        return False, None
+    by_version: dict[str, ET.Element] = {}
+    for child in container:
+        if child.tag in by_version:
+            raise _UnsupportedAboutXml(key)
+        by_version[child.tag] = child
+    return _match_byversion_raw(by_version, target_version)
+
+
+def _about_versioned_list(element: ET.Element | None) -> list[str]:
+    """The string entries of a matched ``*ByVersion`` list entry."""
+    if element is None:
+        return []
+    if not len(element) and not element.attrib and not (element.text or "").strip():
+        return []
+    return _about_string_list(element)
+
+
+def _about_dependencies(element: ET.Element | None) -> list[DependencyMod]:
+    """Parse a ``modDependencies`` (or matched ByVersion) element."""
+    if element is None or not len(element):
+        return []
+    if element.attrib or (element.text and element.text.strip()):
+        raise _UnsupportedAboutXml(element.tag)
+
+    dependencies: list[DependencyMod] = []
+    for li in element:
+        if li.tag != "li" or li.attrib or (len(li) and (li.text or "").strip()):
+            raise _UnsupportedAboutXml(element.tag)
+        tags = [child.tag for child in li]
+        if len(set(tags)) != len(tags):
+            raise _UnsupportedAboutXml(element.tag)
+        if len(tags) < 2:
+            # The dict path collapses these into a bare value and skips them
+            if any(len(child) for child in li):
+                raise _UnsupportedAboutXml(element.tag)
+            continue
+
+        dependency: dict[str, Any] = {}
+        for child in li:
+            if child.tag == "alternativePackageIds" and len(child):
+                alternatives = _about_alternative_ids(child)
+                if alternatives:
+                    dependency["alternativePackageIds"] = alternatives
+                continue
+            text = _about_leaf_text(child)
+            if text is not None:
+                dependency[str(child.tag)] = text
+        dependencies.append(create_mod_dependency(dependency))
+    return dependencies
+
+
+def _about_alternative_ids(element: ET.Element) -> list[str]:
+    """Parse the ``<li>`` entries of an ``alternativePackageIds`` element."""
+    entries: list[ET.Element] = []
+    for li in element:
+        if li.tag != "li" or len(li):
+            raise _UnsupportedAboutXml(element.tag)
+        entries.append(li)
+    if len(entries) == 1:
+        li = entries[0]
+        # A lone entry with attributes is not a string in the dict path
+        if li.attrib or li.text is None:
+            return []
+        return [li.text.strip()]
+    return [li.text.strip() for li in entries if li.text and li.text.strip()]
+
+
+def read_about_xml(
+    path: Path, target_version: str, prefer_versioned: bool = True
+) -> AboutXmlMod | None:
+    """Read an About.xml directly into an ``AboutXmlMod``.
+
+    Produces the same result as ``xml_path_to_json`` followed by
+    ``create_about_mod`` without building a dict of the whole document.
+
+    :param path: Path to the About.xml file.
+    :param target_version: The version of RimWorld to target.
+    :param prefer_versioned: When True, ByVersion keys override base values
+        (non-additive). When False, ByVersion keys are ignored.
+    :return: The parsed mod (without mod path), or None if the file is
+        malformed or uses a shape that needs the generic dict parser.
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start",))
+    root: ET.Element | None = None
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_ABOUT_XML_CHUNK_SIZE):
+                parser.feed(chunk)
+                if root is None:
+                    # The first start event is the root; bail before reading on
+                    event = next(iter(parser.read_events()), None)
+                    if event is not None and isinstance(event[-1], ET.Element):
+                        root = event[-1]
+                        if str(root.tag).lower() != "modmetadata":
+                            return None
+        parser.close()
+    except (OSError, ET.ParseError):
+        return None
+    if root is None or not len(root):
+        return None
+
+    fields: dict[str, ET.Element] = {}
+    for child in root:
+        if child.tag in fields:
+            fields[str(child.tag)] = _DUPLICATE_FIELD
+        else:
+            fields[str(child.tag)] = child
+
+    try:
+        return _about_mod_from_fields(fields, target_version, prefer_versioned)
+    except _UnsupportedAboutXml as e:
+        logger.debug(f"Falling back to the dict parser for {path}: <{e}>")
+        return None
+
+
+# Placeholder for fields that appear more than once; the dict path turns those
+# into lists, which the reader only needs to support where it never happens.
+_DUPLICATE_FIELD = ET.Element("duplicate")
+
+
+def _about_field(fields: dict[str, ET.Element], key: str) -> ET.Element | None:
+    element = fields.get(key)
+    if element is _DUPLICATE_FIELD:
+        raise _UnsupportedAboutXml(key)
+    return element
+
+
+def _about_mod_from_fields(
+    fields: dict[str, ET.Element], target_version: str, prefer_versioned: bool
+) -> AboutXmlMod:
+    """Build the mod from the top-level ModMetaData elements.
+
+    Follows ``_parse_basic``, ``_parse_optional`` and ``create_base_rules``.
+    """
+    mod = AboutXmlMod()
+
+    package_id = _about_scalar(_about_field(fields, "packageId"))
+    if package_id:
+        mod.package_id = CaseInsensitiveStr(package_id)
+    else:
+        mod.package_id = CaseInsensitiveStr(DEFAULT_MISSING_PACKAGEID)
+        logger.warning(
+            f"packageId missing or invalid: {package_id}. Assigned sentinel '{DEFAULT_MISSING_PACKAGEID}'."
+        )
+
+    steam_app_id = _about_scalar(_about_field(fields, "steamAppId"))
+    if steam_app_id is not None and steam_app_id.isdigit():
+        mod.steam_app_id = int(steam_app_id)
+    elif mod.package_id in get_dlc_packageid_appid_map():
+        mod.steam_app_id = int(get_dlc_packageid_appid_map()[mod.package_id])
+
+    dlc_appid = get_dlc_packageid_appid_map().get(mod.package_id)
+    dlc_meta = RIMWORLD_DLC_METADATA.get(dlc_appid, {}) if dlc_appid else {}
+
+    name = _about_scalar(_about_field(fields, "name"))
+    if name is not None:
+        mod.name = name
+    elif dlc_meta:
+        mod.name = dlc_meta["name"]
+    else:
+        mod.name = mod.package_id
+
+    description = _about_scalar(_about_field(fields, "description"))
+    if description is not None:
+        mod.description = description
+    elif dlc_meta:
+        mod.description = dlc_meta["description"]
+
+    author = _about_scalar(_about_field(fields, "author"))
+    if author is not None:
+        mod.authors.append(author)
+    authors_element = _about_field(fields, "authors")
+    if authors_element is not None:
+        authors = _about_list(authors_element)
+        if isinstance(authors, list):
+            mod.authors.extend(a for a in authors if a)
+        elif authors is not None:
+            mod.authors.append(authors)
+
+    versions_element = _about_field(fields, "supportedVersions")
+    if versions_element is not None:
+        versions = _about_list(versions_element)
+        if isinstance(versions, list):
+            if None in versions:
+                raise _UnsupportedAboutXml("supportedVersions")
+            mod.supported_versions = {v for v in versions if v is not None}
+        elif versions is not None:
+            mod.supported_versions = {versions}
+
+    mod_version = _about_scalar(_about_field(fields, "modVersion"))
+    if mod_version:
+        mod.mod_version = mod_version
+    mod_icon_path = _about_scalar(_about_field(fields, "modIconPath"))
+    if mod_icon_path:
+        mod.mod_icon_path = Path(mod_icon_path)
+    url = _about_scalar(_about_field(fields, "url"))
+    if url:
+        mod.url = url
+
+    mod.about_rules = _about_rules_from_fields(fields, target_version, prefer_versioned)
+
+    if (descriptions := _about_field(fields, "descriptionsByVersion")) is not None:
+        by_version: dict[str, str | None] = {}
+        for child in descriptions:
+            if child.tag in by_version:
+                raise _UnsupportedAboutXml("descriptionsByVersion")
+            by_version[str(child.tag)] = _about_leaf_text(child)
+        _, versioned_description = match_version(by_version, target_version)  # type: ignore[arg-type]
+        if versioned_description and isinstance(versioned_description, str):
+            mod.description = versioned_description
+
+    return mod
+
+
+def _about_rules_from_fields(
+    fields: dict[str, ET.Element], target_version: str, prefer_versioned: bool
+) -> BaseRules:
+    """Build the About.xml load order rules, like ``create_base_rules``."""
+    rules = BaseRules()
+
+    matched = False
+    dependencies: list[DependencyMod] = []
+    if prefer_versioned:
+        matched, versioned = _about_by_version(
+            fields, "modDependenciesByVersion", target_version
+        )
+        if matched:
+            dependencies = _about_dependencies(versioned)
+    if not matched:
+        dependencies = _about_dependencies(_about_field(fields, "modDependencies"))
+    for dependency in dependencies:
+        if dependency.package_id in rules.dependencies:
+            logger.warning(
+                f"Duplicate dependency found: {dependency.package_id}. Skipping."
+            )
+        else:
+            rules.dependencies[dependency.package_id] = dependency
+
+    def rule_list(key: str, force_key: str | None = None) -> CaseInsensitiveSet:
+        matched = False
+        items: list[str] = []
+        if prefer_versioned:
+            matched, versioned = _about_by_version(
+                fields, f"{key}ByVersion", target_version
+            )
+            if matched:
+                items = _about_versioned_list(versioned)
+        if not matched:
+            items = _about_string_list(_about_field(fields, key))
+        if force_key is not None:
+            items.extend(_about_string_list(_about_field(fields, force_key)))
+        return CaseInsensitiveSet(items)
+
+    rules.load_before = rule_list("loadBefore", "forceLoadBefore")
+    rules.load_after = rule_list("loadAfter", "forceLoadAfter")
+    rules.incompatible_with = rule_list("incompatibleWith")
+    return rules
+
+
 def _create_about_mod_from_xml(
     base_path: Path,
     mod_xml_path: Path,
     target_version: str,
     prefer_versioned: bool = True,
 ) -> tuple[bool, AboutXmlMod]:
+    about_mod = read_about_xml(mod_xml_path, target_version, prefer_versioned)
+    if about_mod is not None:
+        about_mod.mod_path = base_path
+        return about_mod.valid, about_mod
+
     try:
         mod_data = xml_path_to_json(str(mod_xml_path))
     except Exception:  # noqa: BLE001
@@ -834,6 +1182,10 @@ def read_rules_db(
         logger.info(
             "DB exists!",
         )
+        compact_rules = read_compact_rules_db(path)
+        if compact_rules is not None:
+            logger.info(f"Loaded {len(compact_rules.rules)} additional rules (compact)")
+            return compact_rules
         try:
             with open(path, encoding="utf-8") as f:
                 json_string = f.read()
@@ -866,7 +1218,7 @@ def write_rules_db(path: Path, external_rules: ExternalRulesSchema) -> None:
     logger.info(f"Writing Rules DB to: {path}")
     try:
         with open(path, "wb") as f:
-            json_string = msgspec.json.encode(external_rules)
+            json_string = msgspec.json.encode(external_rules, enc_hook=compact_enc_hook)
             f.write(json_string)
             logger.info("Rules DB written successfully")
     except OSError as e:
@@ -877,6 +1229,9 @@ def write_rules_db(path: Path, external_rules: ExternalRulesSchema) -> None:
 def read_steam_db(path: Path) -> SteamDbSchema | None:
     """Reads the SteamDbSchema from the json file at the given path.
 
+    If an up-to-date compact sidecar exists next to the file, it is used
+    instead and entries are decoded on first access.
+
     :param path: Path to the SteamDB file.
     :type path: Path
     :return: The SteamDbSchema object if successful, otherwise None.
@@ -887,6 +1242,12 @@ def read_steam_db(path: Path) -> SteamDbSchema | None:
         logger.info(
             "DB exists!",
         )
+        compact_db = read_compact_steam_db(path)
+        if compact_db is not None:
+            logger.info(
+                f"Loaded {len(compact_db.database)} mods from compact SteamDB version: {compact_db.version}"
+            )
+            return compact_db
         try:
             with open(path, encoding="utf-8") as f:
                 json_string = f.read()
@@ -921,7 +1282,7 @@ def write_steam_db(path: Path, steam_db: SteamDbSchema) -> None:
     logger.info(f"Writing SteamDB to: {path}")
     try:
         with open(path, "wb") as f:
-            json_string = msgspec.json.encode(steam_db)
+            json_string = msgspec.json.encode(steam_db, enc_hook=compact_enc_hook)
             f.write(json_string)
             logger.info("SteamDB written successfully")
     except OSError as e:
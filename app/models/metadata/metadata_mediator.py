@@ -1,12 +1,23 @@
 import gzip
 import json
+import math
+import multiprocessing
 import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 from PySide6.QtCore import QMutex, QRunnable, QThread, QThreadPool
 
+from app.models.metadata.metadata_cache import (
+    MetadataParseCache,
+    decode_mod,
+    encode_mod,
+    mod_source_signature,
+)
 from app.models.metadata.metadata_factory import (
     create_listed_mod_from_path,
     create_rules_from_external_rules,
@@ -17,10 +28,133 @@ from app.models.metadata.metadata_structure import (
     AboutXmlMod,
     ExternalRulesSchema,
     ListedMod,
+    MetadataChangeSet,
     SteamDbSchema,
 )
+from app.utils.constants import MetadataParserBackend
 from app.utils.xml import xml_path_to_json
 
+# Per mod folder: (inode, folder mtime, metadata source signature)
+ModFolderState = tuple[int, int, str | None]
+# Per external DB file: (path, size, mtime); size and mtime are -1 if missing
+FileState = tuple[str, int, int]
+
+# Below this many mods to parse, spawning processes costs more than it saves
+PROCESS_PARSER_MIN_MODS = 64
+# Batches per worker process, so slow mods do not leave other workers idle
+PROCESS_PARSER_BATCHES_PER_WORKER = 4
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter runs with a GIL (always, before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _file_state(path: Path | None) -> FileState | None:
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (str(path), -1, -1)
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _read_no_version_warning(path: Path) -> list[str] | None:
+    """Read the package ids listed in a No Version Warning DB (ModIdsToFix.xml)."""
+    try:
+        data = xml_path_to_json(str(path))
+        mod_ids = data.get("ModIdsToFix", {}).get("li", [])
+        if isinstance(mod_ids, str):
+            mod_ids = [mod_ids]
+        no_version_warning = [str(mid).lower() for mid in mod_ids]
+        logger.info(f"Loaded {len(no_version_warning)} No Version Warning entries")
+        return no_version_warning
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Failed to load No Version Warning DB: {e}")
+        return None
+
+
+def _read_use_this_instead(path: Path) -> dict[str, Any] | None:
+    """Read a Use This Instead replacements DB (JSON, possibly gzip).
+
+    The raw file is ``{"version": "...", "rules": [...]}``.  We index the
+    rules list into a dict keyed by ``oldWorkshopId`` for O(1) lookup.
+    """
+    try:
+        if str(path).endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8-sig") as f:
+                raw = json.load(f)
+        else:
+            with open(path, encoding="utf-8-sig") as f:
+                raw = json.load(f)
+
+        rules = raw.get("rules", []) if isinstance(raw, dict) else []
+        use_this_instead = {
+            str(r["oldWorkshopId"]): r
+            for r in rules
+            if isinstance(r, dict) and "oldWorkshopId" in r
+        }
+        logger.info(f"Loaded {len(use_this_instead)} Use This Instead entries")
+        return use_this_instead
+    except (OSError, ValueError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load Use This Instead DB: {e}")
+        return None
+
+
+def _apply_external_rules(
+    mod: ListedMod,
+    user_rules: ExternalRulesSchema | None,
+    community_rules: ExternalRulesSchema | None,
+) -> None:
+    """Attach the user and community rules for a parsed mod, if any."""
+    if not isinstance(mod, AboutXmlMod):
+        return
+    if user_rules is not None and mod.package_id in user_rules.rules:
+        mod.user_rules = create_rules_from_external_rules(
+            external_rule=user_rules.rules[mod.package_id]
+        )
+    if community_rules is not None and mod.package_id in community_rules.rules:
+        mod.community_rules = create_rules_from_external_rules(
+            external_rule=community_rules.rules[mod.package_id]
+        )
+
+
+def _parse_mods_in_process(
+    mod_paths: list[str],
+    target_version: str,
+    local_path: str,
+    rimworld_path: str,
+    workshop_path: str | None,
+    prefer_versioned: bool,
+    case_insensitive_about_xml: bool,
+) -> list[tuple[str, bytes | None]]:
+    """Parse a batch of mods inside a parser worker process.
+
+    :return: ``(mod_path, payload)`` pairs with msgpack payloads from
+        :func:`encode_mod`. The payload is None for mods that could not be
+        parsed or encoded; the parent parses those itself.
+    """
+    results: list[tuple[str, bytes | None]] = []
+    for mod_path in mod_paths:
+        path = Path(mod_path)
+        try:
+            _, mod = create_listed_mod_from_path(
+                path,
+                target_version,
+                Path(local_path),
+                Path(rimworld_path),
+                Path(workshop_path) if workshop_path is not None else None,
+                prefer_versioned,
+                case_insensitive_about_xml,
+            )
+            payload = encode_mod(mod) if mod.mod_path == path else None
+        except Exception:  # noqa: BLE001
+            payload = None
+        results.append((mod_path, payload))
+    return results
+
 
 class MetadataMediator:
     "Mediator class for metadata."
@@ -35,6 +169,8 @@ class MetadataMediator:
         game_path: Path | None,
         no_version_warning_path: Path | None = None,
         use_this_instead_path: Path | None = None,
+        parse_cache_path: Path | None = None,
+        parser_backend: MetadataParserBackend = MetadataParserBackend.THREADS,
     ):
         self.user_rules_path = user_rules_path
         self.community_rules_path = community_rules_path
@@ -44,6 +180,8 @@ class MetadataMediator:
         self.game_path = game_path
         self.no_version_warning_path = no_version_warning_path
         self.use_this_instead_path = use_this_instead_path
+        self.parse_cache_path = parse_cache_path
+        self.parser_backend = parser_backend
 
         self._user_rules: ExternalRulesSchema | None = None
         self._community_rules: ExternalRulesSchema | None = None
@@ -52,6 +190,11 @@ class MetadataMediator:
         self._game_version: str = "Unknown"
         self._no_version_warning: list[str] | None = None
         self._use_this_instead: dict[str, Any] | None = None
+        self._parse_cache: MetadataParseCache | None = None
+        self._folder_snapshot: dict[str, ModFolderState] | None = None
+        self._refresh_key: tuple[Any, ...] | None = None
+        self._snapshot_case_insensitive = True
+        self._external_db_cache: dict[str, tuple[FileState | None, Any]] = {}
 
         self.parser_threadpool = QThreadPool.globalInstance()
 
@@ -90,6 +233,18 @@ class MetadataMediator:
     def game_version(self) -> str:
         return self._game_version
 
+    @property
+    def parse_cache(self) -> MetadataParseCache | None:
+        """The persistent parse cache, or None when no cache path is configured."""
+        if self.parse_cache_path is None:
+            self._parse_cache = None
+        elif (
+            self._parse_cache is None
+            or self._parse_cache.db_path != self.parse_cache_path
+        ):
+            self._parse_cache = MetadataParseCache(self.parse_cache_path)
+        return self._parse_cache
+
     @property
     def no_version_warning(self) -> list[str] | None:
         return self._no_version_warning
@@ -98,12 +253,10 @@ class MetadataMediator:
     def use_this_instead(self) -> dict[str, Any] | None:
         return self._use_this_instead
 
-    def _load_no_version_warning(self) -> None:
-        """Load No Version Warning DB (ModIdsToFix.xml)."""
+    def _resolve_no_version_warning_path(self) -> None:
+        """Use the No Version Warning DB of the game version if there is no other."""
         if self.no_version_warning_path is None:
-            self._no_version_warning = None
             return
-
         if not self.no_version_warning_path.exists() and self.game_version != "Unknown":
             game_major_minor = ".".join(self.game_version.split(".")[:2])
             versioned = (
@@ -114,28 +267,24 @@ class MetadataMediator:
             if versioned.exists():
                 self.no_version_warning_path = versioned
 
-        if not self.no_version_warning_path.exists():
+    def _load_no_version_warning(self) -> None:
+        """Load No Version Warning DB (ModIdsToFix.xml)."""
+        self._resolve_no_version_warning_path()
+        if self.no_version_warning_path is None:
             self._no_version_warning = None
             return
-        try:
-            data = xml_path_to_json(str(self.no_version_warning_path))
-            mod_ids = data.get("ModIdsToFix", {}).get("li", [])
-            if isinstance(mod_ids, str):
-                mod_ids = [mod_ids]
-            self._no_version_warning = [str(mid).lower() for mid in mod_ids]
-            logger.info(
-                f"Loaded {len(self._no_version_warning)} No Version Warning entries"
-            )
-        except (OSError, ValueError, KeyError) as e:
-            logger.error(f"Failed to load No Version Warning DB: {e}")
+
+        if not self.no_version_warning_path.exists():
             self._no_version_warning = None
+            return
+        self._no_version_warning = self._load_external_db(
+            "no_version_warning",
+            self.no_version_warning_path,
+            _read_no_version_warning,
+        )
 
     def _load_use_this_instead(self) -> None:
-        """Load Use This Instead replacements DB (JSON, possibly gzip).
-
-        The raw file is ``{"version": "...", "rules": [...]}``.  We index the
-        rules list into a dict keyed by ``oldWorkshopId`` for O(1) lookup.
-        """
+        """Load Use This Instead replacements DB (JSON, possibly gzip)."""
         if self.use_this_instead_path is None:
             logger.debug("Use This Instead path not configured")
             self._use_this_instead = None
@@ -146,27 +295,50 @@ class MetadataMediator:
             )
             self._use_this_instead = None
             return
-        try:
-            path = self.use_this_instead_path
-            if str(path).endswith(".gz"):
-                with gzip.open(path, "rt", encoding="utf-8-sig") as f:
-                    raw = json.load(f)
-            else:
-                with open(path, encoding="utf-8-sig") as f:
-                    raw = json.load(f)
-
-            rules = raw.get("rules", []) if isinstance(raw, dict) else []
-            self._use_this_instead = {
-                str(r["oldWorkshopId"]): r
-                for r in rules
-                if isinstance(r, dict) and "oldWorkshopId" in r
-            }
-            logger.info(
-                f"Loaded {len(self._use_this_instead)} Use This Instead entries"
-            )
-        except (OSError, ValueError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to load Use This Instead DB: {e}")
-            self._use_this_instead = None
+        self._use_this_instead = self._load_external_db(
+            "use_this_instead", self.use_this_instead_path, _read_use_this_instead
+        )
+
+    def _load_external_db[T](
+        self, name: str, path: Path | None, load: Callable[[Path], T | None]
+    ) -> T | None:
+        """Load an external DB file, reusing the last result if the file is unchanged.
+
+        :param name: Cache slot of the DB, also accepted by
+            :meth:`invalidate_external_dbs`.
+        :param path: Path of the DB file, or None if it is not configured.
+        :param load: Reads and decodes the file at ``path``.
+        :return: The loaded DB, or None if not configured or not loadable.
+        """
+        if path is None:
+            self._external_db_cache.pop(name, None)
+            return None
+        state = _file_state(path)
+        cached = self._external_db_cache.get(name)
+        if cached is not None and cached[0] == state:
+            logger.debug(f"Reusing unchanged {name} DB from {path}")
+            return cached[1]
+        loaded = load(path)
+        self._external_db_cache[name] = (state, loaded)
+        return loaded
+
+    def invalidate_external_dbs(self, *names: str) -> None:
+        """Force external DBs to be re-read on the next refresh.
+
+        Use this after the DB files were replaced by a download or upload,
+        where a size/mtime check alone might not notice the change.
+
+        :param names: Cache slots to drop (``user_rules``, ``community_rules``,
+            ``steam_db``, ``no_version_warning``, ``use_this_instead``). Drops
+            all of them when empty.
+        """
+        if names:
+            for name in names:
+                self._external_db_cache.pop(name, None)
+        else:
+            self._external_db_cache.clear()
+        # The loaded DBs feed into every parsed mod, so skip the incremental path
+        self._refresh_key = None
 
     def refresh_metadata(
         self,
@@ -191,25 +363,144 @@ class MetadataMediator:
                 return
 
         self._refresh_game_version()
+        # Keyed on the path the No Version Warning DB is loaded from, and taken
+        # before loading, so changes made while loading show up next time
+        self._resolve_no_version_warning_path()
+        refresh_key = self._incremental_refresh_key(
+            prefer_versioned, case_insensitive_about_xml
+        )
 
-        self._user_rules = read_rules_db(self.user_rules_path)
-
-        self._community_rules = (
-            read_rules_db(self.community_rules_path)
-            if self.community_rules_path is not None
-            else None
+        self._user_rules = self._load_external_db(
+            "user_rules", self.user_rules_path, read_rules_db
         )
-        self._steam_db = (
-            read_steam_db(self.steam_db_path)
-            if self.steam_db_path is not None
-            else None
+        self._community_rules = self._load_external_db(
+            "community_rules", self.community_rules_path, read_rules_db
+        )
+        self._steam_db = self._load_external_db(
+            "steam_db", self.steam_db_path, read_steam_db
         )
 
         # Load additional external metadata
         self._load_no_version_warning()
         self._load_use_this_instead()
 
-        # Get all folders in the workshop and local mods paths
+        mod_paths = self._list_mod_paths()
+        # Snapshot before parsing so changes made mid-refresh show up next time
+        self._folder_snapshot = self._snapshot_mod_folders(
+            mod_paths, case_insensitive_about_xml
+        )
+        self._snapshot_case_insensitive = case_insensitive_about_xml
+        self._refresh_key = refresh_key
+
+        parse_cache = self.parse_cache
+        if parse_cache is not None:
+            parse_cache.begin(
+                self.game_version, prefer_versioned, case_insensitive_about_xml
+            )
+
+        self._mods_metadata = {}
+        self._parse_mod_paths(
+            mod_paths, prefer_versioned, case_insensitive_about_xml, parse_cache
+        )
+        if parse_cache is not None:
+            parse_cache.commit({str(p) for p in mod_paths})
+        logger.info(f"Metadata refresh complete, found {len(self._mods_metadata)} mods")
+        return
+
+    def refresh_metadata_incremental(
+        self,
+        prefer_versioned: bool = True,
+        case_insensitive_about_xml: bool = True,
+    ) -> MetadataChangeSet | None:
+        """Re-parse only the mod folders that changed since the last refresh.
+
+        The mod search paths are listed and compared against the folder
+        snapshot taken by the previous refresh. Added and changed folders are
+        re-parsed, removed folders are dropped, everything else is kept as is.
+        Falls back to :meth:`refresh_metadata` when there is nothing to diff
+        against, or when something that affects every mod changed (game
+        version, parser options, search paths or the rules/Steam databases).
+
+        :param prefer_versioned: See :meth:`refresh_metadata`.
+        :param case_insensitive_about_xml: See :meth:`refresh_metadata`.
+        :return: The added, removed and changed mod paths, or None if a full
+            refresh was performed instead.
+        """
+        refresh_key = self._incremental_refresh_key(
+            prefer_versioned, case_insensitive_about_xml
+        )
+        if (
+            self._mods_metadata is None
+            or self._folder_snapshot is None
+            or refresh_key != self._refresh_key
+        ):
+            logger.info("Incremental metadata refresh not possible, refreshing fully")
+            self.refresh_metadata(prefer_versioned, case_insensitive_about_xml)
+            return None
+
+        mod_paths = self._list_mod_paths()
+        snapshot = self._snapshot_mod_folders(mod_paths, case_insensitive_about_xml)
+        previous = self._folder_snapshot
+        changes = MetadataChangeSet(
+            added=[path for path in snapshot if path not in previous],
+            removed=[path for path in previous if path not in snapshot],
+            changed=[
+                path
+                for path, state in snapshot.items()
+                if path in previous and previous[path] != state
+            ],
+        )
+        self._folder_snapshot = snapshot
+        if not changes:
+            logger.info("Incremental metadata refresh complete, no mods changed")
+            return changes
+
+        for path in changes.removed + changes.changed:
+            self._mods_metadata.pop(path, None)
+
+        parse_cache = self.parse_cache
+        self._parse_mod_paths(
+            [Path(path) for path in changes.added + changes.changed],
+            prefer_versioned,
+            case_insensitive_about_xml,
+            parse_cache,
+        )
+        if parse_cache is not None:
+            parse_cache.commit(set(snapshot))
+
+        # Folders that could not be parsed at all are gone as far as views care
+        metadata = self._mods_metadata
+        changes.removed.extend(p for p in changes.changed if p not in metadata)
+        changes.added = [p for p in changes.added if p in metadata]
+        changes.changed = [p for p in changes.changed if p in metadata]
+        logger.info(
+            f"Incremental metadata refresh complete: {len(changes.added)} added, "
+            f"{len(changes.removed)} removed, {len(changes.changed)} changed"
+        )
+        return changes
+
+    def sync_folder_snapshot(self, *mod_paths: str | Path) -> None:
+        """Re-record the folder state of mods handled outside of a refresh.
+
+        Keeps single-mod updates (e.g. from the file watcher) from being
+        reported again by the next incremental refresh.
+
+        :param mod_paths: The mod folders to re-snapshot. Folders that no
+            longer exist are dropped from the snapshot.
+        """
+        if self._folder_snapshot is None:
+            return
+        paths = [Path(p) for p in mod_paths]
+        for path in paths:
+            self._folder_snapshot.pop(str(path), None)
+        self._folder_snapshot.update(
+            self._snapshot_mod_folders(
+                [p for p in paths if p.is_dir()], self._snapshot_case_insensitive
+            )
+        )
+
+    def _list_mod_paths(self) -> list[Path]:
+        """List all folders in the workshop, local and game modules paths."""
         mod_paths: list[Path] = []
         for search_path in (
             self.workshop_mods_path,
@@ -222,6 +513,91 @@ class MetadataMediator:
                 logger.warning(f"Mod search path does not exist: {search_path}")
                 continue
             mod_paths.extend(p for p in search_path.iterdir() if p.is_dir())
+        return mod_paths
+
+    @staticmethod
+    def _snapshot_mod_folders(
+        mod_paths: list[Path], case_insensitive_about_xml: bool
+    ) -> dict[str, ModFolderState]:
+        """Record the state used to detect changed mod folders.
+
+        :param mod_paths: The mod folders to snapshot.
+        :param case_insensitive_about_xml: Whether About.xml lookup is
+            case-insensitive.
+        :return: The folder state keyed by mod path.
+        """
+        snapshot: dict[str, ModFolderState] = {}
+        for mod_path in mod_paths:
+            try:
+                folder_stat = os.stat(mod_path)
+            except OSError:
+                continue
+            snapshot[str(mod_path)] = (
+                folder_stat.st_ino,
+                folder_stat.st_mtime_ns,
+                mod_source_signature(mod_path, case_insensitive_about_xml),
+            )
+        return snapshot
+
+    def _incremental_refresh_key(
+        self, prefer_versioned: bool, case_insensitive_about_xml: bool
+    ) -> tuple[Any, ...]:
+        """Everything that invalidates all parsed mods at once when it changes."""
+        return (
+            prefer_versioned,
+            case_insensitive_about_xml,
+            self.workshop_mods_path,
+            self.local_mods_path,
+            self.game_path,
+            self.parse_cache_path,
+            _file_state(self.game_path / "Version.txt" if self.game_path else None),
+            _file_state(self.user_rules_path),
+            _file_state(self.community_rules_path),
+            _file_state(self.steam_db_path),
+            _file_state(self.no_version_warning_path),
+            _file_state(self.use_this_instead_path),
+        )
+
+    def _parse_mod_paths(
+        self,
+        mod_paths: list[Path],
+        prefer_versioned: bool,
+        case_insensitive_about_xml: bool,
+        parse_cache: MetadataParseCache | None,
+    ) -> None:
+        """Parse mod folders into the metadata dict using the configured backend.
+
+        :param mod_paths: The mod folders to parse.
+        :param prefer_versioned: See :meth:`refresh_metadata`.
+        :param case_insensitive_about_xml: See :meth:`refresh_metadata`.
+        :param parse_cache: The parse cache to use, if any.
+        """
+        if self.parser_backend == MetadataParserBackend.PROCESSES:
+            if not _gil_enabled():
+                logger.debug("Free-threaded interpreter, parsing metadata on threads")
+            else:
+                self._parse_mod_paths_in_processes(
+                    mod_paths, prefer_versioned, case_insensitive_about_xml, parse_cache
+                )
+                return
+        self._parse_mod_paths_in_threads(
+            mod_paths, prefer_versioned, case_insensitive_about_xml, parse_cache
+        )
+
+    def _parse_mod_paths_in_threads(
+        self,
+        mod_paths: list[Path],
+        prefer_versioned: bool,
+        case_insensitive_about_xml: bool,
+        parse_cache: MetadataParseCache | None,
+    ) -> None:
+        """Parse mod folders on the Qt thread pool into the metadata dict.
+
+        See :meth:`_parse_mod_paths` for the parameters.
+        """
+        assert self.local_mods_path is not None
+        assert self.game_path is not None
+        assert self._mods_metadata is not None
 
         # Create equal sized batches of mod_paths for threadpool processing
         threads = QThread.idealThreadCount()
@@ -234,11 +610,7 @@ class MetadataMediator:
             mod_paths[i : i + batch_size] for i in range(0, len(mod_paths), batch_size)
         ]
 
-        assert self.local_mods_path is not None
-        assert self.game_path is not None
-
         metadata_mutex = QMutex()
-        self._mods_metadata = {}
         parsers = [
             self._ParserWorker(
                 mod_path_batch,
@@ -253,6 +625,7 @@ class MetadataMediator:
                 self._mods_metadata,
                 prefer_versioned,
                 case_insensitive_about_xml,
+                parse_cache,
             )
             for mod_path_batch in mod_paths_batches
         ]
@@ -262,8 +635,116 @@ class MetadataMediator:
 
         logger.debug(f"Started {self.parser_threadpool.activeThreadCount()} threads")
         self.parser_threadpool.waitForDone()
-        logger.info(f"Metadata refresh complete, found {len(self._mods_metadata)} mods")
-        return
+
+    def _parse_mod_paths_in_processes(
+        self,
+        mod_paths: list[Path],
+        prefer_versioned: bool,
+        case_insensitive_about_xml: bool,
+        parse_cache: MetadataParseCache | None,
+    ) -> None:
+        """Parse mod folders in worker processes into the metadata dict.
+
+        Parse cache hits are resolved up front in this process. The remaining
+        folders are parsed by a spawned process pool that returns msgpack
+        payloads, which are decoded and merged here by a single thread, so no
+        mutex is needed. Mods a worker could not parse or encode (e.g. invalid
+        folders) are parsed on the thread pool afterwards.
+
+        See :meth:`_parse_mod_paths` for the parameters.
+        """
+        assert self.local_mods_path is not None
+        assert self.game_path is not None
+        assert self._mods_metadata is not None
+
+        pending: list[Path] = []
+        signatures: dict[str, str | None] = {}
+        for path in mod_paths:
+            signature, mod = (
+                parse_cache.lookup(path) if parse_cache is not None else (None, None)
+            )
+            if mod is None:
+                pending.append(path)
+                signatures[str(path)] = signature
+            else:
+                self._merge_parsed_mod(mod)
+
+        if len(pending) < PROCESS_PARSER_MIN_MODS:
+            logger.debug(
+                f"Only {len(pending)} mods to parse, not worth spawning processes"
+            )
+            self._parse_mod_paths_in_threads(
+                pending, prefer_versioned, case_insensitive_about_xml, None
+            )
+            if parse_cache is not None:
+                for path in pending:
+                    mod = self._mods_metadata.get(str(path))
+                    if mod is not None:
+                        parse_cache.store(path, signatures[str(path)], mod)
+            return
+
+        workers = max(1, min(os.cpu_count() or 1, len(pending) // 16))
+        batch_size = math.ceil(
+            len(pending) / (workers * PROCESS_PARSER_BATCHES_PER_WORKER)
+        )
+        batches = [
+            [str(p) for p in pending[i : i + batch_size]]
+            for i in range(0, len(pending), batch_size)
+        ]
+        logger.debug(
+            f"Parsing {len(pending)} mods in {workers} processes "
+            f"with batch size of {batch_size}"
+        )
+
+        unparsed: list[Path] = []
+        workshop_path = (
+            str(self.workshop_mods_path) if self.workshop_mods_path else None
+        )
+        # Never fork: the parent runs Qt and other threads holding locks
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {
+                executor.submit(
+                    _parse_mods_in_process,
+                    batch,
+                    self.game_version,
+                    str(self.local_mods_path),
+                    str(self.game_path),
+                    workshop_path,
+                    prefer_versioned,
+                    case_insensitive_about_xml,
+                ): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                try:
+                    parsed = future.result()
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"Metadata parser process failed: {e}")
+                    unparsed.extend(Path(p) for p in futures[future])
+                    continue
+                for mod_path, payload in parsed:
+                    path = Path(mod_path)
+                    if payload is None:
+                        unparsed.append(path)
+                        continue
+                    mod = decode_mod(payload, path)
+                    if parse_cache is not None:
+                        parse_cache.store(path, signatures[mod_path], mod)
+                    self._merge_parsed_mod(mod)
+
+        if unparsed:
+            self._parse_mod_paths_in_threads(
+                unparsed, prefer_versioned, case_insensitive_about_xml, None
+            )
+
+    def _merge_parsed_mod(self, mod: ListedMod) -> None:
+        """Apply external rules to a parsed mod and add it to the metadata."""
+        assert self._mods_metadata is not None
+        if not mod.valid:
+            logger.warning(f"Mod at path {mod.mod_path} is not valid")
+        _apply_external_rules(mod, self.user_rules, self.community_rules)
+        self._mods_metadata[mod.uuid] = mod
 
     def _refresh_game_version(self) -> bool:
         # Get & set Rimworld version string
@@ -308,6 +789,7 @@ class MetadataMediator:
             mods_metadata: dict[str, ListedMod],
             prefer_versioned: bool = True,
             case_insensitive_about_xml: bool = True,
+            parse_cache: MetadataParseCache | None = None,
         ):
             """Creates a worker to parse mods in a separate thread. Mutates the mods_metadata dict.
 
@@ -337,6 +819,9 @@ class MetadataMediator:
             :param case_insensitive_about_xml: When True, use case-insensitive
                 About.xml lookup. When False, require exact "About/About.xml" path.
             :type case_insensitive_about_xml: bool
+            :param parse_cache: Persistent parse cache to reuse unchanged mods
+                from and record freshly parsed mods into, if used
+            :type parse_cache: MetadataParseCache | None
             """
             super().__init__()
             self.mod_path = mod_path
@@ -353,6 +838,7 @@ class MetadataMediator:
             self.mods_metadata = mods_metadata
             self.prefer_versioned = prefer_versioned
             self.case_insensitive_about_xml = case_insensitive_about_xml
+            self.parse_cache = parse_cache
 
         def run(self) -> None:
             paths = (
@@ -364,35 +850,30 @@ class MetadataMediator:
                 try:
                     if isinstance(path, str):
                         path = Path(path)
-                    valid, mod = create_listed_mod_from_path(
-                        path,
-                        self.target_version,
-                        self.local_path,
-                        self.rimworld_path,
-                        self.workshop_path,
-                        self.prefer_versioned,
-                        self.case_insensitive_about_xml,
+                    signature, mod = (
+                        self.parse_cache.lookup(path)
+                        if self.parse_cache is not None
+                        else (None, None)
                     )
+                    if mod is not None:
+                        valid = mod.valid
+                    else:
+                        valid, mod = create_listed_mod_from_path(
+                            path,
+                            self.target_version,
+                            self.local_path,
+                            self.rimworld_path,
+                            self.workshop_path,
+                            self.prefer_versioned,
+                            self.case_insensitive_about_xml,
+                        )
+                        if self.parse_cache is not None:
+                            self.parse_cache.store(path, signature, mod)
 
                     if not valid:
                         logger.warning(f"Mod at path {path} is not valid")
 
-                    if isinstance(mod, AboutXmlMod):
-                        if (
-                            self.user_rules is not None
-                            and mod.package_id in self.user_rules.rules
-                        ):
-                            mod.user_rules = create_rules_from_external_rules(
-                                external_rule=self.user_rules.rules[mod.package_id]
-                            )
-
-                        if (
-                            self.community_rules is not None
-                            and mod.package_id in self.community_rules.rules
-                        ):
-                            mod.community_rules = create_rules_from_external_rules(
-                                external_rule=self.community_rules.rules[mod.package_id]
-                            )
+                    _apply_external_rules(mod, self.user_rules, self.community_rules)
 
                     results[mod.uuid] = mod
                 except Exception as e:  # noqa: BLE001
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import functools
 import os
-from collections.abc import Iterable, Iterator, Mapping, MutableSet
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSet
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -543,9 +544,78 @@ class AboutXmlMod(ListedMod, PackageIdMod):
             pass
 
 
+def _pair(a: str, b: str) -> tuple[str, str]:
+    """Order-independent key for the pair of package IDs ``a`` and ``b``."""
+    return (a, b) if a <= b else (b, a)
+
+
+def _set_member(graph: dict[str, set[str]], key: str, value: str, member: bool) -> None:
+    """Add or remove ``value`` in ``graph[key]``, dropping keys that become empty."""
+    if member:
+        graph.setdefault(key, set()).add(value)
+    elif key in graph:
+        graph[key].discard(value)
+        if not graph[key]:
+            del graph[key]
+
+
+def _decrement[K](counter: Counter[K], key: K) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+@dataclass(frozen=True)
+class _DependencyContribution:
+    """The rules of a single mod that feed into :class:`CompiledDependencyData`."""
+
+    package_id: str
+    order: int
+    load_after: tuple[str, ...]
+    load_before: tuple[str, ...]
+    incompatible_with: tuple[str, ...]
+    # (package ID, alternative package IDs) for every modDependency
+    dependencies: tuple[tuple[str, tuple[str, ...]], ...]
+    load_first: bool
+    load_last: bool
+
+    @classmethod
+    def from_mod(cls, mod: AboutXmlMod, order: int) -> _DependencyContribution:
+        rules = mod.overall_rules
+        return cls(
+            package_id=str(mod.package_id),
+            order=order,
+            load_after=tuple(str(pid) for pid in rules.load_after),
+            load_before=tuple(str(pid) for pid in rules.load_before),
+            incompatible_with=tuple(str(pid) for pid in rules.incompatible_with),
+            dependencies=tuple(
+                (
+                    str(dep_mod.package_id),
+                    tuple(str(alt) for alt in dep_mod.alternative_package_ids),
+                )
+                for dep_mod in rules.dependencies.values()
+            ),
+            load_first=rules.load_first,
+            load_last=rules.load_last,
+        )
+
+    def explicit_edges(self) -> Iterator[tuple[str, str]]:
+        """Yield ``(mod, dependency)`` pairs from loadAfter and loadBefore rules."""
+        for dep in self.load_after:
+            yield self.package_id, dep
+        for target in self.load_before:
+            yield target, self.package_id
+
+
 @dataclass
 class CompiledDependencyData:
-    """Standalone compiled dependency data."""
+    """Standalone compiled dependency data.
+
+    Instances returned by :meth:`build` can be patched with :meth:`add_mod`,
+    :meth:`update_mod` and :meth:`remove_mod`. These only recompute the edges
+    between the package IDs the changed mod touches, and leave the data
+    exactly as a fresh :meth:`build` of the changed metadata would.
+    """
 
     deps_graph: dict[str, set[str]] = field(default_factory=dict)
     rev_deps_graph: dict[str, set[str]] = field(default_factory=dict)
@@ -555,6 +625,50 @@ class CompiledDependencyData:
     incompatibilities: dict[str, set[str]] = field(default_factory=dict)
     declared_incompatibilities: dict[str, set[str]] = field(default_factory=dict)
 
+    # Bookkeeping for incremental updates
+    _use_inferred: bool = field(default=False, init=False, repr=False, compare=False)
+    _use_alternatives: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    _base_tier_one_mods: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _contributions: dict[str, _DependencyContribution] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _paths_by_pid: dict[str, set[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Package IDs that share at least one rule, counted in both directions
+    _partners: dict[str, Counter[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Raw (mod, dependency) edge and (declarer, target) counts, before the
+    # presence of either package ID is taken into account
+    _explicit_counts: Counter[tuple[str, str]] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _declared_counts: Counter[tuple[str, str]] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _load_first_counts: Counter[str] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _load_last_counts: Counter[str] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    # Package ID -> paths of mods whose modDependencies name it
+    _dependency_mentions: dict[str, set[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Path -> package IDs its modDependencies currently resolve to
+    _resolved: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _next_order: int = field(default=0, init=False, repr=False, compare=False)
+    # build() leaves the counters above empty until the first update
+    _indexed: bool = field(default=False, init=False, repr=False, compare=False)
+
     @classmethod
     def build(
         cls,
@@ -579,72 +693,48 @@ class CompiledDependencyData:
 
         compiled.tier_zero_mods = KNOWN_TIER_ZERO_MODS.copy()
         compiled.tier_one_mods = KNOWN_TIER_ONE_MODS.copy()
+        compiled._base_tier_one_mods = KNOWN_TIER_ONE_MODS.copy()
+        compiled._use_inferred = use_moddependencies_as_loadTheseBefore
+        compiled._use_alternatives = use_alternative_package_ids
 
-        all_package_ids: set[str] = set()
-
-        for mod in mods_metadata.values():
-            if not isinstance(mod, AboutXmlMod):
-                continue
-            all_package_ids.add(str(mod.package_id))
-
-        for mod in mods_metadata.values():
+        for path, mod in mods_metadata.items():
             if not isinstance(mod, AboutXmlMod):
                 continue
+            contribution = _DependencyContribution.from_mod(mod, compiled._next_order)
+            compiled._next_order += 1
+            compiled._contributions[path] = contribution
+            compiled._paths_by_pid.setdefault(contribution.package_id, set()).add(path)
 
-            pid = str(mod.package_id)
-            rules = mod.overall_rules
-
-            for dep_ci in rules.load_after:
-                dep = str(dep_ci)
-                if dep not in all_package_ids:
-                    continue
-                compiled.deps_graph.setdefault(pid, set()).add(dep)
-                compiled.rev_deps_graph.setdefault(dep, set()).add(pid)
+        for contribution in compiled._contributions.values():
+            pid = contribution.package_id
 
-            for target_ci in rules.load_before:
-                target = str(target_ci)
-                if target not in all_package_ids:
+            for mod_pid, dep in contribution.explicit_edges():
+                if not compiled._is_present(mod_pid) or not compiled._is_present(dep):
                     continue
-                compiled.deps_graph.setdefault(target, set()).add(pid)
-                compiled.rev_deps_graph.setdefault(pid, set()).add(target)
+                compiled.deps_graph.setdefault(mod_pid, set()).add(dep)
+                compiled.rev_deps_graph.setdefault(dep, set()).add(mod_pid)
 
-            for incompat_ci in rules.incompatible_with:
-                incompat = str(incompat_ci)
-                if incompat not in all_package_ids:
+            for incompat in contribution.incompatible_with:
+                if not compiled._is_present(incompat):
                     continue
                 compiled.incompatibilities.setdefault(pid, set()).add(incompat)
                 compiled.incompatibilities.setdefault(incompat, set()).add(pid)
                 compiled.declared_incompatibilities.setdefault(pid, set()).add(incompat)
 
-            if rules.load_first and pid not in compiled.tier_zero_mods:
+            if contribution.load_first and pid not in compiled.tier_zero_mods:
                 compiled.tier_one_mods.add(pid)
 
-            if rules.load_last:
+            if contribution.load_last:
                 compiled.tier_three_mods.add(pid)
 
         if use_moddependencies_as_loadTheseBefore:
             excluded_tiers = compiled.tier_one_mods | compiled.tier_three_mods
             conflicts_ignored = 0
-            for mod in mods_metadata.values():
-                if not isinstance(mod, AboutXmlMod):
-                    continue
-                pid = str(mod.package_id)
+            for contribution in compiled._contributions.values():
+                pid = contribution.package_id
                 if pid in excluded_tiers:
                     continue
-                for dep_mod in mod.overall_rules.dependencies.values():
-                    dep = str(dep_mod.package_id)
-                    if dep not in all_package_ids:
-                        if not use_alternative_package_ids:
-                            continue
-                        resolved = None
-                        for alt in dep_mod.alternative_package_ids:
-                            alt_str = str(alt)
-                            if alt_str in all_package_ids:
-                                resolved = alt_str
-                                break
-                        if resolved is None:
-                            continue
-                        dep = resolved
+                for dep in compiled._resolve(contribution):
                     if dep in excluded_tiers:
                         continue
                     if pid in compiled.deps_graph.get(dep, set()):
@@ -665,6 +755,285 @@ class CompiledDependencyData:
 
         return compiled
 
+    def add_mod(self, path: str, mod: ListedMod) -> None:
+        """Add the mod at ``path`` to the compiled data.
+
+        Mods without an About.xml are ignored. Adding a path that is already
+        known behaves like :meth:`update_mod`.
+
+        :param path: Mod-path string, as used as key in the metadata.
+        :param mod: The parsed mod.
+        """
+        self._replace(path, mod)
+
+    def update_mod(self, path: str, mod: ListedMod) -> None:
+        """Replace the rules of the mod at ``path`` with those of ``mod``.
+
+        The mod keeps its position in the metadata order, which decides
+        which of two conflicting inferred dependencies is kept.
+
+        :param path: Mod-path string, as used as key in the metadata.
+        :param mod: The re-parsed mod.
+        """
+        self._replace(path, mod)
+
+    def remove_mod(self, path: str) -> None:
+        """Remove the mod at ``path`` from the compiled data.
+
+        :param path: Mod-path string, as used as key in the metadata.
+        """
+        self._replace(path, None)
+
+    def _replace(self, path: str, mod: ListedMod | None) -> None:
+        if not self._indexed:
+            self._index_all()
+        old = self._contributions.get(path)
+        new = mod if isinstance(mod, AboutXmlMod) else None
+        if old is None and new is None:
+            return
+
+        package_ids = {c.package_id for c in (old,) if c is not None}
+        if new is not None:
+            package_ids.add(str(new.package_id))
+        before = {
+            pid: (self._is_present(pid), self._is_excluded(pid)) for pid in package_ids
+        }
+
+        pairs: set[tuple[str, str]] = set()
+        if old is not None:
+            pairs |= self._retract(path)
+        if new is not None:
+            pairs |= self._contribute(path, new, old.order if old is not None else None)
+            if self._use_inferred:
+                pairs |= self._resolve_dependencies(path)
+
+        # A package ID appearing or disappearing changes which modDependencies
+        # (and alternatives) resolve to it
+        appeared_or_gone = [
+            pid
+            for pid, (present, _) in before.items()
+            if self._is_present(pid) != present
+        ]
+        if self._use_inferred:
+            for pid in appeared_or_gone:
+                for dependent in list(self._dependency_mentions.get(pid, ())):
+                    pairs |= self._resolve_dependencies(dependent)
+        for pid, (_, excluded) in before.items():
+            if pid in appeared_or_gone or self._is_excluded(pid) != excluded:
+                pairs.update(_pair(pid, other) for other in self._partners.get(pid, ()))
+
+        for pair in pairs:
+            self._refresh_pair(*pair)
+
+    def _is_present(self, pid: str) -> bool:
+        return pid in self._paths_by_pid
+
+    def _is_excluded(self, pid: str) -> bool:
+        """Whether inferred dependencies are skipped for ``pid``."""
+        return pid in self.tier_one_mods or pid in self.tier_three_mods
+
+    def _link(self, a: str, b: str) -> None:
+        for pid, other in ((a, b), (b, a)):
+            partners = self._partners.get(pid)
+            if partners is None:
+                partners = self._partners[pid] = Counter()
+            partners[other] += 1
+
+    def _unlink(self, a: str, b: str) -> None:
+        for pid, other in ((a, b), (b, a)):
+            partners = self._partners[pid]
+            _decrement(partners, other)
+            if not partners:
+                del self._partners[pid]
+
+    def _mentioned_ids(self, contribution: _DependencyContribution) -> set[str]:
+        mentioned: set[str] = set()
+        for dep, alternatives in contribution.dependencies:
+            mentioned.add(dep)
+            if self._use_alternatives:
+                mentioned.update(alternatives)
+        return mentioned
+
+    def _update_tiers(self, pid: str) -> None:
+        in_tier_one = pid in self._base_tier_one_mods or (
+            self._load_first_counts[pid] > 0 and pid not in self.tier_zero_mods
+        )
+        if in_tier_one:
+            self.tier_one_mods.add(pid)
+        else:
+            self.tier_one_mods.discard(pid)
+        if self._load_last_counts[pid] > 0:
+            self.tier_three_mods.add(pid)
+        else:
+            self.tier_three_mods.discard(pid)
+
+    def _index_all(self) -> None:
+        """Fill the bookkeeping for the mods recorded by :meth:`build`."""
+        for path, contribution in self._contributions.items():
+            self._index(path, contribution)
+        if self._use_inferred:
+            for path in self._contributions:
+                self._resolve_dependencies(path)
+        self._indexed = True
+
+    def _contribute(
+        self, path: str, mod: AboutXmlMod, order: int | None = None
+    ) -> set[tuple[str, str]]:
+        """Record the raw rules of ``mod``; returns the package ID pairs touched."""
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        contribution = _DependencyContribution.from_mod(mod, order)
+        self._contributions[path] = contribution
+        self._paths_by_pid.setdefault(contribution.package_id, set()).add(path)
+        return self._index(path, contribution)
+
+    def _index(
+        self, path: str, contribution: _DependencyContribution
+    ) -> set[tuple[str, str]]:
+        """Count the rules of ``contribution``; returns the pairs touched."""
+        pid = contribution.package_id
+        pairs: set[tuple[str, str]] = set()
+        for edge in contribution.explicit_edges():
+            self._explicit_counts[edge] += 1
+            self._link(*edge)
+            pairs.add(_pair(*edge))
+        for incompat in contribution.incompatible_with:
+            self._declared_counts[(pid, incompat)] += 1
+            self._link(pid, incompat)
+            pairs.add(_pair(pid, incompat))
+        if contribution.load_first:
+            self._load_first_counts[pid] += 1
+        if contribution.load_last:
+            self._load_last_counts[pid] += 1
+        self._update_tiers(pid)
+        if self._use_inferred:
+            for mentioned in self._mentioned_ids(contribution):
+                self._dependency_mentions.setdefault(mentioned, set()).add(path)
+        return pairs
+
+    def _retract(self, path: str) -> set[tuple[str, str]]:
+        """Undo :meth:`_contribute` for ``path``; returns the pairs touched."""
+        contribution = self._contributions.pop(path)
+        pid = contribution.package_id
+        paths = self._paths_by_pid[pid]
+        paths.discard(path)
+        if not paths:
+            del self._paths_by_pid[pid]
+
+        pairs: set[tuple[str, str]] = set()
+        for edge in contribution.explicit_edges():
+            _decrement(self._explicit_counts, edge)
+            self._unlink(*edge)
+            pairs.add(_pair(*edge))
+        for incompat in contribution.incompatible_with:
+            _decrement(self._declared_counts, (pid, incompat))
+            self._unlink(pid, incompat)
+            pairs.add(_pair(pid, incompat))
+        if contribution.load_first:
+            _decrement(self._load_first_counts, pid)
+        if contribution.load_last:
+            _decrement(self._load_last_counts, pid)
+        self._update_tiers(pid)
+        if self._use_inferred:
+            for mentioned in self._mentioned_ids(contribution):
+                dependents = self._dependency_mentions[mentioned]
+                dependents.discard(path)
+                if not dependents:
+                    del self._dependency_mentions[mentioned]
+        for target in self._resolved.pop(path, ()):
+            self._unlink(pid, target)
+            pairs.add(_pair(pid, target))
+        return pairs
+
+    def _resolve_dependencies(self, path: str) -> set[tuple[str, str]]:
+        """Resolve the modDependencies of ``path`` against the present mods.
+
+        :return: The package ID pairs whose inferred edges may have changed.
+        """
+        contribution = self._contributions[path]
+        pid = contribution.package_id
+        pairs: set[tuple[str, str]] = set()
+        for target in self._resolved.pop(path, ()):
+            self._unlink(pid, target)
+            pairs.add(_pair(pid, target))
+
+        resolved = self._resolve(contribution)
+        for target in resolved:
+            self._link(pid, target)
+            pairs.add(_pair(pid, target))
+        if resolved:
+            self._resolved[path] = resolved
+        return pairs
+
+    def _resolve(self, contribution: _DependencyContribution) -> tuple[str, ...]:
+        """Package IDs the modDependencies of ``contribution`` resolve to."""
+        resolved: list[str] = []
+        for dep, alternatives in contribution.dependencies:
+            if self._is_present(dep):
+                resolved.append(dep)
+            elif self._use_alternatives:
+                alt = next((a for a in alternatives if self._is_present(a)), None)
+                if alt is not None:
+                    resolved.append(alt)
+        return tuple(resolved)
+
+    def _refresh_pair(self, a: str, b: str) -> int:
+        """Recompute every edge between package IDs ``a`` and ``b``.
+
+        Edges between two package IDs only ever depend on the rules of the
+        mods with one of these package IDs, so this is all that needs to
+        be redone after such a mod changes.
+
+        :return: The number of inferred dependencies dropped for conflicting
+            with an explicit or earlier inferred one.
+        """
+        present = self._is_present(a) and self._is_present(b)
+        directions = ((a, b),) if a == b else ((a, b), (b, a))
+        edges = {edge for edge in directions if present and self._explicit_counts[edge]}
+
+        conflicts_ignored = 0
+        if (
+            present
+            and self._use_inferred
+            and not (self._is_excluded(a) or self._is_excluded(b))
+        ):
+            # Replay the inferred edges in metadata order, like a full build
+            candidates = sorted(
+                self._paths_by_pid[a] | self._paths_by_pid[b],
+                key=lambda path: self._contributions[path].order,
+            )
+            for path in candidates:
+                pid = self._contributions[path].package_id
+                dep = b if pid == a else a
+                for target in self._resolved.get(path, ()):
+                    if target != dep:
+                        continue
+                    if (dep, pid) in edges:
+                        logger.warning(
+                            f"Ignoring inferred dependency {pid} -> {dep}: "
+                            f"conflicts with explicit rule {dep} -> {pid}"
+                        )
+                        conflicts_ignored += 1
+                        continue
+                    edges.add((pid, dep))
+
+        for pid, dep in directions:
+            _set_member(self.deps_graph, pid, dep, (pid, dep) in edges)
+            _set_member(self.rev_deps_graph, dep, pid, (pid, dep) in edges)
+            _set_member(
+                self.declared_incompatibilities,
+                pid,
+                dep,
+                present and self._declared_counts[(pid, dep)] > 0,
+            )
+        incompatible = present and (
+            self._declared_counts[(a, b)] > 0 or self._declared_counts[(b, a)] > 0
+        )
+        _set_member(self.incompatibilities, a, b, incompatible)
+        _set_member(self.incompatibilities, b, a, incompatible)
+        return conflicts_ignored
+
 
 class SubExternalRule(msgspec.Struct, omit_defaults=True):
     name: list[str] | str = msgspec.field(default_factory=str)
@@ -685,7 +1054,7 @@ class ExternalRule(msgspec.Struct, omit_defaults=True):
 
 class ExternalRulesSchema(msgspec.Struct, omit_defaults=True):
     timestamp: int = 0
-    rules: dict[str, ExternalRule] = msgspec.field(default_factory=dict)
+    rules: MutableMapping[str, ExternalRule] = msgspec.field(default_factory=dict)
 
 
 class SteamDbEntryDependency(msgspec.Struct, omit_defaults=True):
@@ -717,7 +1086,7 @@ class SteamDbEntry(msgspec.Struct, omit_defaults=True):
 
 class SteamDbSchema(msgspec.Struct):
     version: int = 0
-    database: dict[str, SteamDbEntry] = msgspec.field(default_factory=dict)
+    database: MutableMapping[str, SteamDbEntry] = msgspec.field(default_factory=dict)
 
 
 # TODO: Someday, it is probably worth typing out the keys
@@ -765,3 +1134,20 @@ class WorkshopUpdateResult:
 
 
 # jscpd:ignore-end
+
+
+@dataclass
+class MetadataChangeSet:
+    """Mod folders touched by an incremental metadata refresh.
+
+    :param added: Paths of mod folders that appeared since the last refresh
+    :param removed: Paths of mod folders that disappeared since the last refresh
+    :param changed: Paths of mod folders whose metadata source changed
+    """
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
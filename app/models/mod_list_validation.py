@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Hashable, Mapping, Sequence
+
+from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod, Rules
+from app.utils.constants import KNOWN_MOD_REPLACEMENTS
+
+
+def rule_targets(mod: ListedMod | None) -> frozenset[str]:
+    """
+    Return the package ids whose presence or position in a mod list can
+    change the errors and warnings of a mod.
+
+    These are the targets of its load before/after rules, incompatibilities
+    and dependencies, including alternative and known replacement package
+    ids of the dependencies.
+
+    :param mod: Metadata of the mod
+    :return: Package ids the mod's rules point at
+    """
+    if not isinstance(mod, AboutXmlMod):
+        return frozenset()
+    rules = mod.overall_rules
+    targets = {str(pid) for pid in rules.load_before}
+    targets.update(str(pid) for pid in rules.load_after)
+    targets.update(str(pid) for pid in rules.incompatible_with)
+    for dep_id, dep_mod in rules.dependencies.items():
+        targets.add(str(dep_id))
+        targets.update(str(alt) for alt in dep_mod.alternative_package_ids)
+        targets.update(KNOWN_MOD_REPLACEMENTS.get(str(dep_id), ()))
+    return frozenset(targets)
+
+
+def longest_increasing_run(values: Sequence[int]) -> set[int]:
+    """
+    Return the indexes of a longest strictly increasing subsequence of values.
+
+    Applied to the previous positions of the mods still in a list, in their
+    new order, the indexes left out are a smallest set of mods that moved.
+
+    :param values: Distinct integers
+    :return: Indexes into values of the subsequence
+    """
+    tails: list[int] = []
+    tail_indexes: list[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_indexes.append(i)
+        else:
+            tails[k] = value
+            tail_indexes[k] = i
+        previous[i] = tail_indexes[k - 1] if k else -1
+    run: set[int] = set()
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        run.add(i)
+        i = previous[i]
+    return run
+
+
+class ModListValidationIndex:
+    """
+    Positions, package ids and rule edges of the mods in one mod list.
+
+    Each update compares the list with the previous one and returns the mods
+    whose errors and warnings may have changed: added mods, mods that moved
+    relative to the others, mods whose metadata changed, and every mod whose
+    rules point at the package id of any of those or of a removed mod.
+    Dragging one mod therefore only rechecks that mod and the mods with a
+    rule about it, instead of the whole list.
+    """
+
+    def __init__(self) -> None:
+        self.positions: dict[str, int] = {}
+        self.packageid_to_uuid: dict[str, str] = {}
+        self._order: list[str] = []
+        self._snapshots: dict[str, tuple[ListedMod | None, Rules | None]] = {}
+        self._package_ids: dict[str, str] = {}
+        self._uuids_by_package_id: dict[str, set[str]] = {}
+        self._targets: dict[str, frozenset[str]] = {}
+        self._referrers: dict[str, set[str]] = {}
+        self._context: Hashable = None
+        self._marked: set[str] = set()
+        self._valid = False
+
+    def package_id(self, uuid: str) -> str:
+        """
+        :param uuid: Path of the mod
+        :return: The mod's package id, or an empty string if it has none
+        """
+        return self._package_ids.get(uuid, "")
+
+    def invalidate(self) -> None:
+        """Make the next update recheck every mod."""
+        self._valid = False
+
+    def mark_dirty(self, uuid: str) -> None:
+        """
+        Make the next update recheck a mod and the mods with rules about it,
+        e.g. after its metadata was edited in place.
+
+        :param uuid: Path of the mod
+        """
+        self._marked.add(uuid)
+
+    def update(
+        self,
+        order: Sequence[str],
+        mods: Mapping[str, ListedMod],
+        context: Hashable,
+    ) -> set[str]:
+        """
+        Bring the index up to date with the list and return the mods to recheck.
+
+        :param order: Paths of the list's items, in list order
+        :param mods: Metadata of all mods, by path
+        :param context: Everything outside the list the checks depend on, like
+            settings and the game version. When it differs from the previous
+            update, every mod is rechecked.
+        :return: Paths of the mods whose errors and warnings may have changed
+        """
+        positions = {uuid: i for i, uuid in enumerate(order)}
+        if not self._valid or context != self._context:
+            self._rebuild(order, positions, mods)
+            self._context = context
+            return set(order)
+
+        previous = self.positions
+        added = [uuid for uuid in order if uuid not in previous]
+        removed = [uuid for uuid in self._order if uuid not in positions]
+        kept = [uuid for uuid in order if uuid in previous]
+        in_place = longest_increasing_run([previous[uuid] for uuid in kept])
+        moved = {uuid for i, uuid in enumerate(kept) if i not in in_place}
+        changed = {
+            uuid
+            for uuid in kept
+            if uuid in self._marked
+            or self._snapshot(mods.get(uuid)) != self._snapshots[uuid]
+        }
+
+        touched: set[str] = set()
+        for uuid in removed:
+            touched.add(self._forget(uuid))
+        for uuid in changed:
+            touched.add(self._forget(uuid))
+            touched.add(self._learn(uuid, mods.get(uuid)))
+        for uuid in added:
+            touched.add(self._learn(uuid, mods.get(uuid)))
+        touched.update(self._package_ids.get(uuid, "") for uuid in moved)
+        touched.discard("")
+
+        self.positions = positions
+        self._order = list(order)
+        self._marked.clear()
+        dirty = set(added) | moved | changed
+        for package_id in touched:
+            dirty.update(self._referrers.get(package_id, ()))
+            uuids = self._uuids_by_package_id.get(package_id)
+            if uuids:
+                # Like the full rebuild, the last mod in the list wins
+                self.packageid_to_uuid[package_id] = max(
+                    uuids, key=positions.__getitem__
+                )
+            else:
+                self.packageid_to_uuid.pop(package_id, None)
+        return dirty
+
+    def _rebuild(
+        self,
+        order: Sequence[str],
+        positions: dict[str, int],
+        mods: Mapping[str, ListedMod],
+    ) -> None:
+        self._snapshots.clear()
+        self._package_ids.clear()
+        self._uuids_by_package_id.clear()
+        self._targets.clear()
+        self._referrers.clear()
+        self.packageid_to_uuid = {}
+        for uuid in order:
+            package_id = self._learn(uuid, mods.get(uuid))
+            if package_id:
+                self.packageid_to_uuid[package_id] = uuid
+        self.positions = positions
+        self._order = list(order)
+        self._marked.clear()
+        self._valid = True
+
+    @staticmethod
+    def _snapshot(mod: ListedMod | None) -> tuple[ListedMod | None, Rules | None]:
+        # Rules edited by the user replace the cached overall rules of the mod
+        rules = mod.overall_rules if isinstance(mod, AboutXmlMod) else None
+        return mod, rules
+
+    def _learn(self, uuid: str, mod: ListedMod | None) -> str:
+        """Record a mod's package id and rule edges. Returns its package id."""
+        self._snapshots[uuid] = self._snapshot(mod)
+        targets = rule_targets(mod)
+        self._targets[uuid] = targets
+        for target in targets:
+            self._referrers.setdefault(target, set()).add(uuid)
+        if not isinstance(mod, AboutXmlMod):
+            return ""
+        package_id = str(mod.package_id)
+        self._package_ids[uuid] = package_id
+        self._uuids_by_package_id.setdefault(package_id, set()).add(uuid)
+        return package_id
+
+    def _forget(self, uuid: str) -> str:
+        """Drop a mod's package id and rule edges. Returns its package id."""
+        self._snapshots.pop(uuid, None)
+        for target in self._targets.pop(uuid, frozenset()):
+            referrers = self._referrers.get(target)
+            if referrers is not None:
+                referrers.discard(uuid)
+                if not referrers:
+                    del self._referrers[target]
+        package_id = self._package_ids.pop(uuid, "")
+        if package_id:
+            uuids = self._uuids_by_package_id[package_id]
+            uuids.discard(uuid)
+            if not uuids:
+                del self._uuids_by_package_id[package_id]
+        return package_id
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from rapidfuzz import fuzz
+
+from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod, ModType
+
+# Fields the search bar can match a substring in
+SUBSTRING_FIELDS = (
+    "name",
+    "packageid",
+    "authors",
+    "publishedfileid",
+    "version",
+    "tags",
+)
+
+# Separates the values of multi-valued fields. The search bar is a single
+# line, so a pattern can never match across two values.
+_VALUE_SEPARATOR = "\n"
+
+# Minimum rapidfuzz partial ratio of a notes match. Patterns of up to
+# SHORT_NOTES_PATTERN_LENGTH characters match with the lower threshold.
+NOTES_FUZZY_THRESHOLD = 80
+SHORT_NOTES_FUZZY_THRESHOLD = 70
+SHORT_NOTES_PATTERN_LENGTH = 5
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(frozen=True, slots=True)
+class ModSearchEntry:
+    """
+    Lowercased, searchable snapshot of a single mod in a mod list.
+
+    :param name: Lowercased mod name
+    :param packageid: Lowercased package id, or None for mods without an About.xml
+    :param authors: Lowercased authors, one per line
+    :param publishedfileid: Steam Workshop published file id, or an empty string
+    :param version: Lowercased supported versions, one per line
+    :param tags: Lowercased user tags, one per line
+    :param notes: Lowercased user notes
+    :param mod_type: Source type of the mod, for the source filter
+    :param c_sharp_mod: Whether the mod ships assemblies, for the type filter
+    :param tag_set: User tags as stored, for the tag filter
+    """
+
+    name: str
+    packageid: str | None
+    authors: str
+    publishedfileid: str
+    version: str
+    tags: str
+    notes: str
+    mod_type: ModType
+    c_sharp_mod: bool
+    tag_set: frozenset[str]
+
+    @classmethod
+    def from_mod(
+        cls, mod: ListedMod, tags: list[str], notes: str | None
+    ) -> ModSearchEntry:
+        """
+        Build the entry of a mod from its metadata and its list item data.
+
+        :param mod: Metadata of the mod
+        :param tags: User tags of the mod
+        :param notes: User notes of the mod
+        :return: The search entry
+        """
+        packageid = None
+        authors = ""
+        if isinstance(mod, AboutXmlMod):
+            packageid = str(mod.package_id).lower()
+            authors = _VALUE_SEPARATOR.join(mod.authors).lower()
+        return cls(
+            name=(mod.name or "").lower(),
+            packageid=packageid,
+            authors=authors,
+            publishedfileid=str(mod.published_file_id or ""),
+            version=_VALUE_SEPARATOR.join(sorted(mod.supported_versions)).lower(),
+            tags=_VALUE_SEPARATOR.join(tags).lower(),
+            notes=(notes or "").lower(),
+            mod_type=mod.mod_type,
+            c_sharp_mod=bool(mod.c_sharp_mod),
+            tag_set=frozenset(tags),
+        )
+
+
+class ModSearchIndex:
+    """
+    Search index over the mods of one mod list, keyed by mod path.
+
+    Substring searches look up the trigram postings of the pattern and only
+    verify the candidates they share, so a keystroke no longer rescans every
+    mod. Short patterns scan the precomputed lowercased strings instead. The
+    result of the last search per field is kept, and a pattern that extends
+    it (the user typing on) only rechecks the previous matches.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, ModSearchEntry] = {}
+        self._postings: dict[str, dict[str, set[str]]] = {
+            field: {} for field in SUBSTRING_FIELDS
+        }
+        self._noted: set[str] = set()
+        self._last_search: dict[str, tuple[str, set[str]]] = {}
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str) -> ModSearchEntry | None:
+        return self._entries.get(path)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._noted.clear()
+        self._last_search.clear()
+
+    def add(self, path: str, entry: ModSearchEntry) -> None:
+        """
+        Add the entry of a mod, replacing any previous one.
+
+        :param path: Path of the mod
+        :param entry: The mod's search entry
+        """
+        old = self._entries.get(path)
+        if old == entry:
+            return
+        if old is not None:
+            self.discard(path)
+        self._entries[path] = entry
+        for field, postings in self._postings.items():
+            for gram in _trigrams(getattr(entry, field) or ""):
+                postings.setdefault(gram, set()).add(path)
+        if entry.notes:
+            self._noted.add(path)
+        self._last_search.clear()
+
+    def discard(self, path: str) -> None:
+        """
+        Remove the entry of a mod, if there is one.
+
+        :param path: Path of the mod
+        """
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        for field, postings in self._postings.items():
+            for gram in _trigrams(getattr(entry, field) or ""):
+                paths = postings.get(gram)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del postings[gram]
+        self._noted.discard(path)
+        self._last_search.clear()
+
+    def substring_matches(self, field: str, pattern: str) -> set[str]:
+        """
+        Return the paths of the mods whose field contains pattern.
+
+        Matching is case-insensitive. Mods without a value for the field,
+        like a package id for mods without an About.xml, never match.
+
+        :param field: One of SUBSTRING_FIELDS
+        :param pattern: The text to look for
+        :return: Paths of the matching mods
+        """
+        pattern = pattern.lower()
+        last = self._last_search.get(field)
+        candidates: set[str] | dict[str, ModSearchEntry]
+        if last is not None and last[0] in pattern:
+            candidates = last[1]
+        elif len(pattern) >= 3:
+            postings = self._postings[field]
+            grams = sorted(
+                (postings.get(gram, set()) for gram in _trigrams(pattern)), key=len
+            )
+            candidates = set(grams[0]).intersection(*grams[1:])
+        else:
+            candidates = self._entries
+        matches = set()
+        for path in candidates:
+            value = getattr(self._entries[path], field)
+            if value is not None and pattern in value:
+                matches.add(path)
+        self._last_search[field] = (pattern, matches)
+        return matches
+
+    def notes_matches(self, pattern: str) -> set[str]:
+        """
+        Return the paths of the mods whose notes fuzzily match pattern.
+
+        :param pattern: The text to look for
+        :return: Paths of the matching mods
+        """
+        pattern = pattern.strip().lower()
+        if not pattern:
+            return set()
+        fuzz_threshold = (
+            NOTES_FUZZY_THRESHOLD
+            if len(pattern) > SHORT_NOTES_PATTERN_LENGTH
+            else SHORT_NOTES_FUZZY_THRESHOLD
+        )
+        return {
+            path
+            for path in self._noted
+            if fuzz.partial_ratio(pattern, self._entries[path].notes) >= fuzz_threshold
+        }
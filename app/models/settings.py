@@ -24,6 +24,7 @@ from app.utils.constants import (
     INSTANCE_FOLDER_NAME,
     STEAM_FOLDER_NAME,
     STEAMCMD_FOLDER_NAME,
+    MetadataParserBackend,
     SortMethod,
 )
 from app.utils.event_bus import EventBus
@@ -127,6 +128,10 @@ class Settings(QObject):
         self.render_unity_rich_text: bool = True
         self.color_background_instead_of_text_toggle: bool = True
         self.case_insensitive_about_xml_lookup: bool = sys.platform == "linux"
+        # Whether About.xml files are parsed on threads or in worker processes
+        self.metadata_parser_backend: MetadataParserBackend = (
+            MetadataParserBackend.THREADS
+        )
 
         # Whether to notify user about missing mods
         self.try_download_missing_mods: bool = True
@@ -138,6 +143,8 @@ class Settings(QObject):
         self.mod_list_updated_threshold_days: int = 3
         # Whether to show per-mod startup load time from the Loading Progress mod
         self.mod_list_startup_impact: bool = False
+        # Whether mod list rows are painted by a delegate instead of per-row widgets
+        self.mod_list_paint_rows: bool = False
         # Whether to enable Mod type filter
         self.mod_type_filter: bool = True
         # Whether to hide invalid mods
@@ -269,12 +269,15 @@ class InstanceService:
         )
         logger.info(f"Selected path: {output_path}")
         if output_path:
+            base_archive = self._select_base_backup()
             try:
                 EventBus().do_threaded_loading_animation.emit(
                     str(AppInfo().theme_data_folder / "default-icons" / "rimsort.gif"),
                     partial(
                         instance_controller.compress_to_archive,
                         output_path,
+                        base_archive=base_archive,
+                        progress_callback=self._report_backup_progress,
                     ),
                     QCoreApplication.translate(
                         "InstanceService",
@@ -300,6 +303,44 @@ class InstanceService:
             logger.warning("Backup cancelled: User cancelled selection...")
             return
 
+    @staticmethod
+    def _select_base_backup() -> str | None:
+        """Ask for a previous backup to only store the changes since.
+
+        :return: Path of the previous backup, or None for a full backup
+        """
+        answer = show_dialogue_conditional(
+            title=QCoreApplication.translate("InstanceService", "Backup type"),
+            text=QCoreApplication.translate(
+                "InstanceService",
+                "Only store the files changed since a previous backup?",
+            ),
+            information=QCoreApplication.translate(
+                "InstanceService",
+                "Restoring such a backup also reads the previous backup,"
+                " which must not be moved relative to the new one.",
+            ),
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return None
+        base_archive = show_dialogue_file(
+            mode="open",
+            caption="Select the previous backup of the instance",
+            _dir=str(AppInfo().app_storage_folder),
+            _filter="Zip files (*.zip)",
+        )
+        return base_archive or None
+
+    @staticmethod
+    def _report_backup_progress(current: int, total: int) -> None:
+        """Show the progress of a backup in the status bar, once per percent."""
+        if current == total or current * 100 // total != (current - 1) * 100 // total:
+            EventBus().do_show_status_message.emit(
+                QCoreApplication.translate(
+                    "InstanceService", "Backing up files: {current} / {total}"
+                ).format(current=current, total=total)
+            )
+
     def restore_instance_from_archive(self) -> None:
         """Restore an instance from a ZIP archive."""
         input_path = show_dialogue_file(
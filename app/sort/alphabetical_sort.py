@@ -1,3 +1,4 @@
+import heapq
 from collections.abc import Mapping
 
 from loguru import logger
@@ -12,6 +13,13 @@ def do_alphabetical_sort(
 ) -> list[str]:
     """Sort mods alphabetically, inserting dependencies before dependents.
 
+    Mods are taken in alphabetical order, and the dependencies of each mod
+    that are not placed yet are hoisted right in front of it. This is
+    Kahn's algorithm with a heap keyed on the position of the mod that
+    pulled a dependency in first, then on the lowercase name, so it runs in
+    O((V + E) log V). Mods in a dependency cycle are placed in the same
+    order once nothing else is left.
+
     # jscpd:ignore-start
         :param dependency_graph: package_id -> set of dependency package_ids
         :param active_mod_paths: Set of mod paths (identifiers) to sort
@@ -30,79 +38,66 @@ def do_alphabetical_sort(
             continue
         pid = str(mod.package_id)
         packageid_to_name[pid] = (
-            mod.name if isinstance(mod.name, str) else "name error in mod about.xml"
+            mod.name.lower()
+            if isinstance(mod.name, str)
+            else "name error in mod about.xml"
         )
         packageid_to_path[pid] = path
 
-    def safe_name(name: object) -> str:
-        if isinstance(name, str):
-            return name.lower()
-        return "name error in mod about.xml"
-
-    active_mods_alphabetized = sorted(
-        packageid_to_name.items(), key=lambda x: safe_name(x[1]), reverse=False
+    # Every mod with a graph entry is placed in alphabetical order; each one
+    # claims its not yet claimed (transitive) dependencies for its slot
+    roots = sorted(
+        (pid for pid in packageid_to_name if pid in dependency_graph),
+        key=lambda pid: (packageid_to_name[pid], pid),
     )
-
-    dependencies_alphabetized: dict[str, set[str]] = {}
-    for pid, _name in active_mods_alphabetized:
-        if pid in dependency_graph:
-            dependencies_alphabetized[pid] = dependency_graph[pid]
+    slot: dict[str, int] = {}
+    for rank, root in enumerate(roots):
+        if root in slot:
+            continue
+        slot[root] = rank
+        stack = [root]
+        while stack:
+            for dep in dependency_graph.get(stack.pop(), ()):
+                if dep in packageid_to_name and dep not in slot:
+                    slot[dep] = rank
+                    stack.append(dep)
+
+    def sort_key(pid: str) -> tuple[int, str, str]:
+        return slot[pid], packageid_to_name[pid], pid
+
+    pending: dict[str, int] = {}
+    dependents: dict[str, list[str]] = {}
+    for pid in slot:
+        deps = {dep for dep in dependency_graph.get(pid, ()) if dep in slot}
+        deps.discard(pid)
+        pending[pid] = len(deps)
+        for dep in deps:
+            dependents.setdefault(dep, []).append(pid)
+
+    heap = [sort_key(pid) for pid, count in pending.items() if count == 0]
+    heapq.heapify(heap)
+    by_key = sorted(slot, key=sort_key)
+    next_forced = 0
 
     mods_load_order: list[str] = []
-    for package_id in dependencies_alphabetized:
-        if package_id not in mods_load_order:
-            mods_load_order.append(package_id)
-            index_just_appended = mods_load_order.index(package_id)
-            _recursively_force_insert(
-                mods_load_order,
-                dependency_graph,
-                package_id,
-                packageid_to_name,
-                index_just_appended,
-            )
+    placed: set[str] = set()
+    while len(mods_load_order) < len(slot):
+        if not heap:
+            # Only dependency cycles are left, break up the first one
+            while by_key[next_forced] in placed:
+                next_forced += 1
+            heapq.heappush(heap, sort_key(by_key[next_forced]))
+        *_, package_id = heapq.heappop(heap)
+        if package_id in placed:
+            continue
+        placed.add(package_id)
+        mods_load_order.append(package_id)
+        for dependent in dependents.get(package_id, ()):
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                heapq.heappush(heap, sort_key(dependent))
 
-    reordered: list[str] = []
-    for package_id in mods_load_order:
-        if package_id in packageid_to_path:
-            reordered.append(packageid_to_path[package_id])
+    reordered = [packageid_to_path[package_id] for package_id in mods_load_order]
 
     logger.info(f"Finished Alphabetical sort with {len(reordered)} mods")
     return reordered
-
-
-def _recursively_force_insert(
-    mods_load_order: list[str],
-    dependency_graph: dict[str, set[str]],
-    package_id: str,
-    packageid_to_name: dict[str, str],
-    index_just_appended: int,
-) -> None:
-    deps_of_package = dependency_graph.get(package_id, set())
-    deps_id_to_name: dict[str, str] = {}
-    for dep_id in deps_of_package:
-        if dep_id in packageid_to_name:
-            deps_id_to_name[dep_id] = packageid_to_name[dep_id]
-
-    deps_alphabetized = sorted(
-        deps_id_to_name.items(), key=lambda x: x[1], reverse=False
-    )
-
-    for dep_id, _dep_name in deps_alphabetized:
-        if dep_id not in mods_load_order:
-            index_to_insert_at = index_just_appended
-            for e in reversed(
-                mods_load_order[index_just_appended : mods_load_order.index(package_id)]
-            ):
-                if dep_id in dependency_graph and e in dependency_graph[dep_id]:
-                    index_to_insert_at = mods_load_order.index(e) + 1
-                    break
-
-            mods_load_order.insert(index_to_insert_at, dep_id)
-            new_idx = mods_load_order.index(dep_id)
-            _recursively_force_insert(
-                mods_load_order,
-                dependency_graph,
-                dep_id,
-                packageid_to_name,
-                new_idx,
-            )
@@ -1,13 +1,20 @@
 from collections.abc import Mapping
+from typing import TYPE_CHECKING
 
-import networkx as nx
 from loguru import logger
 from PySide6.QtCore import QCoreApplication
 from toposort import CircularDependencyError, toposort
 
 from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod
+from app.utils.lazy_import import lazy_import
 from app.views.dialogue import show_warning
 
+if TYPE_CHECKING:
+    import networkx as nx
+else:
+    # Only needed to report dependency cycles
+    nx = lazy_import("networkx")
+
 
 def do_topo_sort(
     dependency_graph: dict[str, set[str]],
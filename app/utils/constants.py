@@ -19,6 +19,11 @@ class SortMethod(str, Enum):
     TOPOLOGICAL = "Topological"
 
 
+class MetadataParserBackend(str, Enum):
+    THREADS = "Threads"
+    PROCESSES = "Processes"
+
+
 DB_BUILDER_PRUNE_EXCEPTIONS = [
     "database",
     "rules",
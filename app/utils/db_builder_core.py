@@ -11,6 +11,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from app.utils import http
 from app.utils.constants import (
     DB_BUILDER_PRUNE_EXCEPTIONS,
     DB_BUILDER_RECURSE_EXCEPTIONS,
@@ -18,6 +19,7 @@ from app.utils.constants import (
 )
 from app.utils.dict_utils import recursively_update_dict
 from app.utils.json_utils import atomic_json_dump
+from app.utils.steam.webapi.checkpoint import BuildCheckpoint, checkpoint_path_for
 from app.utils.steam.webapi.wrapper import DynamicQuery
 
 
@@ -123,6 +125,12 @@ class DBBuilderCore:
         get_appid_deps: Whether to query DLC dependencies
         update: Whether to update existing DB (merge) or overwrite
         progress_callback: Optional callback for progress messages
+        concurrency: Number of WebAPI GetDetails requests sent at the same time
+        checkpoint: Whether to record progress next to the output database,
+            so an interrupted build can be resumed
+        resume: Whether to continue from the recorded checkpoint instead of
+            starting over. After a completed build, only new and updated mods
+            are requested again.
     """
 
     def __init__(
@@ -134,6 +142,9 @@ class DBBuilderCore:
         get_appid_deps: bool = False,
         update: bool = False,
         progress_callback: Callable[[str], None] | None = None,
+        concurrency: int = 1,
+        checkpoint: bool = False,
+        resume: bool = False,
     ) -> None:
         self.apikey = apikey
         self.appid = appid
@@ -143,6 +154,10 @@ class DBBuilderCore:
         self.publishedfileids: list[str] = []
         self.update = update
         self.progress_callback = progress_callback or (lambda msg: None)
+        self.concurrency = max(1, concurrency)
+        self.checkpoint = checkpoint or resume
+        self.resume = resume
+        self.updated_since: int | None = None
 
     def run(self) -> bool:
         """
@@ -164,33 +179,15 @@ class DBBuilderCore:
             self.progress_callback(
                 f'\nInitializing "DynamicQuery" with configured Steam API key for AppID: {self.appid}\n\n'
             )
-            # Create query
-            dynamic_query = DynamicQuery(
-                apikey=self.apikey,
-                appid=self.appid,
-                life=self.database_expiry,
-                get_appid_deps=self.get_appid_deps,
-                callback=self.progress_callback,
-                output_database_path=self.output_database_path,
-            )
-            # Compile PublishedFileIds
-            dynamic_query.pfids_by_appid()
-            # Make sure we have PublishedFileIds to work with...
-            if len(dynamic_query.publishedfileids) == 0:  # If we didn't get any pfids
-                self.progress_callback(
-                    "Did not receive any PublishedFileIds from IPublishedFileService/QueryFiles! Cannot continue!"
-                )
-                return False  # Exit operation
-
-            database = self._init_empty_db_from_publishedfileids(
-                dynamic_query.publishedfileids
-            )
-            dynamic_query.create_steam_db(
-                database=database, publishedfileids=dynamic_query.publishedfileids
-            )
-            self._output_database(dynamic_query.database)
-            self.progress_callback("SteamDatabasebuilder: Completed!")
-            return True
+            if self.concurrency > http.DEFAULT_POOL_MAXSIZE:
+                # Keep a connection open for every concurrent request
+                http.configure_pool(pool_maxsize=self.concurrency)
+            checkpoint = self._open_checkpoint() if self.checkpoint else None
+            try:
+                return self._build(checkpoint)
+            finally:
+                if checkpoint is not None:
+                    checkpoint.close()
         else:  # Otherwise, API key is not valid
             self.progress_callback(
                 "SteamDatabaseBuilder (no_local): Invalid Steam WebAPI key!"
@@ -198,6 +195,71 @@ class DBBuilderCore:
             self.progress_callback("SteamDatabaseBuilder (no_local): Exiting...")
             return False
 
+    def _open_checkpoint(self) -> BuildCheckpoint:
+        checkpoint = BuildCheckpoint(
+            checkpoint_path_for(self.output_database_path), self.appid
+        )
+        if not self.resume:
+            checkpoint.reset()
+        self.updated_since = checkpoint.begin()
+        if self.updated_since is not None:
+            self.progress_callback(
+                f"Incremental build from checkpoint: {checkpoint.path}\n"
+                "Only new and updated mods will be requested"
+            )
+        elif checkpoint.details_count:
+            self.progress_callback(
+                f"Resuming from checkpoint: {checkpoint.path}\n"
+                f"Details of {checkpoint.details_count} mods were already retrieved"
+            )
+        else:
+            self.progress_callback(f"Recording checkpoint: {checkpoint.path}")
+        return checkpoint
+
+    def _build(self, checkpoint: BuildCheckpoint | None) -> bool:
+        """
+        Query the WebAPI and write the database.
+
+        Args:
+            checkpoint: Checkpoint to record progress in and reuse results from
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Create query
+        dynamic_query = DynamicQuery(
+            apikey=self.apikey,
+            appid=self.appid,
+            life=self.database_expiry,
+            get_appid_deps=self.get_appid_deps,
+            callback=self.progress_callback,
+            output_database_path=self.output_database_path,
+            concurrency=self.concurrency,
+            checkpoint=checkpoint,
+        )
+        # Compile PublishedFileIds
+        dynamic_query.pfids_by_appid()
+        # Make sure we have PublishedFileIds to work with...
+        if len(dynamic_query.publishedfileids) == 0:  # If we didn't get any pfids
+            self.progress_callback(
+                "Did not receive any PublishedFileIds from IPublishedFileService/QueryFiles! Cannot continue!"
+            )
+            return False  # Exit operation
+
+        if self.updated_since is not None:
+            dynamic_query.discard_updated_details(self.updated_since)
+        database = self._init_empty_db_from_publishedfileids(
+            dynamic_query.publishedfileids
+        )
+        dynamic_query.create_steam_db(
+            database=database, publishedfileids=dynamic_query.publishedfileids
+        )
+        self._output_database(dynamic_query.database)
+        if checkpoint is not None:
+            checkpoint.complete()
+        self.progress_callback("SteamDatabasebuilder: Completed!")
+        return True
+
     def _init_empty_db_from_publishedfileids(
         self, publishedfileids: list[str]
     ) -> dict[str, Any]:
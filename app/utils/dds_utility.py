@@ -14,8 +14,12 @@ class DDSUtility:
         self.settings = settings
         logger.info("DDSUtility initialized.")
 
-    def delete_dds_files_without_png(self) -> None:
-        """Deletes all DDS files that do not have a corresponding PNG file."""
+    def delete_dds_files_without_png(self) -> int:
+        """
+        Deletes all DDS files that do not have a corresponding PNG file.
+
+        :return: The number of deleted DDS files
+        """
         logger.info(
             "Running checks for deleting DDS files without corresponding PNG files..."
         )
@@ -52,3 +56,4 @@ class DDSUtility:
         logger.info(
             f"Deleted {deleted_count} DDS files without corresponding PNG files"
         )
+        return deleted_count
@@ -0,0 +1,277 @@
+"""Compressed, incremental backups of a directory as ZIP archives.
+
+Files are read ahead on a thread pool while the previous ones are deflated
+and written to the archive in order. Files that are already compressed are
+stored as they are. Each archive holds a manifest of the size
+and modification time of every file backed up, so a later backup can store
+only the files that changed since a previous one, and refer to it as its base.
+"""
+
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+import msgspec
+from loguru import logger
+
+# Name of the manifest member of a backup archive
+MANIFEST_NAME = "backup_manifest.json"
+# Deflate level of backups, zlib's default trade-off of speed and size
+DEFAULT_COMPRESSION_LEVEL = 6
+# Extensions of files whose content is already compressed
+COMPRESSED_EXTENSIONS = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".dds",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".ogg",
+        ".png",
+        ".rar",
+        ".webp",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
+# Files larger than this are streamed into the archive instead of being
+# read into memory on the thread pool
+LARGE_FILE_SIZE = 32 * 1024 * 1024
+# Bytes of files read ahead and kept in memory until they are written
+MAX_PENDING_SIZE = 256 * 1024 * 1024
+# Earliest modification time a ZIP member can have
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+class BackupManifest(msgspec.Struct):
+    """Files of a backup, and the backup it only stores the changes to."""
+
+    # Size and modification time in nanoseconds of each member, directories
+    # included, by member name
+    members: dict[str, tuple[int, int]]
+    # Path of the base backup relative to the folder of this one, or its
+    # absolute path if there is no relative path, e.g. on another drive
+    base: str | None = None
+
+
+def read_backup_manifest(archive_path: str | Path) -> BackupManifest | None:
+    """
+    :param archive_path: Path of a backup archive
+    :return: Manifest of the backup, or None if the archive has none
+    """
+    with ZipFile(archive_path) as archive:
+        try:
+            data = archive.read(MANIFEST_NAME)
+        except KeyError:
+            return None
+    return msgspec.json.decode(data, type=BackupManifest)
+
+
+def backup_members(archive_path: str | Path) -> list[tuple[Path, list[str] | None]]:
+    """
+    Find the archives a backup is restored from, following its base backups.
+
+    :param archive_path: Path of a backup archive
+    :return: Each archive to extract, oldest first, with the names of the
+        members to extract from it, or None to extract all members of an
+        archive without manifest
+    :raises FileNotFoundError: If a base backup is missing
+    :raises ValueError: If base backups refer to each other in a loop
+    """
+    path = Path(archive_path)
+    manifest = read_backup_manifest(path)
+    if manifest is None:
+        return [(path, None)]
+    remaining = set(manifest.members)
+    chain: list[tuple[Path, list[str] | None]] = []
+    seen = {path.resolve()}
+    while True:
+        with ZipFile(path) as archive:
+            names = [name for name in archive.namelist() if name in remaining]
+        remaining.difference_update(names)
+        chain.append((path, names))
+        if manifest is None or manifest.base is None or not remaining:
+            break
+        path = path.parent / manifest.base
+        if not path.is_file():
+            raise FileNotFoundError(f"Base backup not found: {path}")
+        if path.resolve() in seen:
+            raise ValueError(f"Base backups refer to each other: {path}")
+        seen.add(path.resolve())
+        manifest = read_backup_manifest(path)
+    if remaining:
+        logger.warning(f"{len(remaining)} files are missing from the backups")
+    chain.reverse()
+    return chain
+
+
+def _base_path(base_archive: str | Path, archive_path: str | Path) -> str:
+    """:return: Path of a base backup as stored in the manifest of a backup"""
+    base = Path(base_archive).absolute()
+    try:
+        return Path(
+            os.path.relpath(base, Path(archive_path).absolute().parent)
+        ).as_posix()
+    except ValueError:
+        return base.as_posix()
+
+
+def _is_linked_directory(path: str) -> bool:
+    return os.path.islink(path) or os.path.isjunction(path)
+
+
+def _zip_info(name: str, stat: os.stat_result) -> ZipInfo:
+    """:return: Member info of a file or directory, as ZipInfo.from_file"""
+    date_time = max(time.localtime(stat.st_mtime)[:6], ZIP_EPOCH)
+    info = ZipInfo(name, date_time)
+    info.external_attr = (stat.st_mode & 0xFFFF) << 16
+    if info.is_dir():
+        info.external_attr |= 0x10  # MS-DOS directory flag
+    else:
+        info.file_size = stat.st_size
+    return info
+
+
+def create_directory_backup(
+    source_dir: str | Path,
+    archive_path: str | Path,
+    extra_members: Mapping[str, bytes] | None = None,
+    base_archive: str | Path | None = None,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    max_workers: int | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> BackupManifest:
+    """
+    Back up a directory to a ZIP archive. Linked directories are skipped.
+
+    :param source_dir: Directory to back up
+    :param archive_path: Path of the archive to write
+    :param extra_members: Data of members to add that are not in the directory
+    :param base_archive: Previous backup of the directory. Only the files whose
+        size or modification time changed since are stored
+    :param compression_level: Deflate level from 0, which stores all files,
+        to 9
+    :param max_workers: Number of threads that read files ahead, defaults to
+        the number of processors
+    :param progress_callback: Called with the number of files written and the
+        number of files to write
+    :return: Manifest of the backup
+    """
+    source = Path(source_dir)
+    base = read_backup_manifest(base_archive) if base_archive is not None else None
+    if base_archive is not None and base is None:
+        logger.warning(
+            f"{base_archive} has no backup manifest, so every file is backed up"
+        )
+    base_members = base.members if base is not None else {}
+
+    # First pass: find the files that changed since the base backup
+    members: dict[str, tuple[int, int]] = {}
+    directories: list[ZipInfo] = []
+    files: list[tuple[Path, ZipInfo]] = []
+    for root, dirs, filenames in os.walk(source, topdown=True, followlinks=False):
+        dirs[:] = [d for d in dirs if not _is_linked_directory(os.path.join(root, d))]
+        relative_root = os.path.relpath(root, source)
+        prefix = (
+            "" if relative_root == "." else relative_root.replace(os.sep, "/") + "/"
+        )
+        for name in dirs:
+            member = f"{prefix}{name}/"
+            stat = os.stat(os.path.join(root, name))
+            members[member] = (0, 0)
+            directories.append(_zip_info(member, stat))
+        for name in filenames:
+            path = Path(root, name)
+            member = f"{prefix}{name}"
+            try:
+                stat = path.stat()
+            except OSError as e:
+                logger.warning(f"Skipping {path}: {e}")
+                continue
+            members[member] = (stat.st_size, stat.st_mtime_ns)
+            if base_members.get(member) != members[member]:
+                files.append((path, _zip_info(member, stat)))
+
+    manifest = BackupManifest(
+        members,
+        _base_path(base_archive, archive_path)
+        if base is not None and base_archive
+        else None,
+    )
+    total = len(files)
+    stored_bytes = written_bytes = 0
+    start = time.perf_counter()
+    with (
+        ZipFile(archive_path, "w", strict_timestamps=False) as archive,
+        ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor,
+    ):
+        for info in directories:
+            archive.writestr(info, b"")
+        # Files are written in order, while the next ones are read
+        pending: deque[tuple[ZipInfo, int, Future[bytes]]] = deque()
+        pending_size = 0
+        done = 0
+
+        def file_done(info: ZipInfo, error: OSError | None) -> None:
+            nonlocal done, written_bytes
+            if error is None:
+                written_bytes += info.compress_size
+            else:
+                # Backed up again by the next backup based on this one
+                logger.warning(f"Failed to back up {info.filename}: {error}")
+                del members[info.filename]
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, total)
+
+        def write_pending() -> None:
+            nonlocal pending_size
+            info, compress_type, future = pending.popleft()
+            pending_size -= info.file_size
+            try:
+                data = future.result()
+                archive.writestr(info, data, compress_type, compression_level)
+            except OSError as e:
+                file_done(info, e)
+            else:
+                file_done(info, None)
+
+        for path, info in files:
+            store = (
+                compression_level == 0
+                or path.suffix.lower() in COMPRESSED_EXTENSIONS
+                or info.file_size == 0
+            )
+            compress_type = ZIP_STORED if store else ZIP_DEFLATED
+            stored_bytes += info.file_size
+            if info.file_size > LARGE_FILE_SIZE:
+                try:
+                    archive.write(path, info.filename, compress_type, compression_level)
+                except OSError as e:
+                    file_done(info, e)
+                else:
+                    file_done(archive.getinfo(info.filename), None)
+                continue
+            pending.append((info, compress_type, executor.submit(path.read_bytes)))
+            pending_size += info.file_size
+            while pending and (pending_size > MAX_PENDING_SIZE or pending[0][2].done()):
+                write_pending()
+        while pending:
+            write_pending()
+        for name, data in (extra_members or {}).items():
+            archive.writestr(name, data, ZIP_DEFLATED)
+        archive.writestr(MANIFEST_NAME, msgspec.json.encode(manifest), ZIP_DEFLATED)
+
+    logger.info(
+        f"Backed up {total} of {len(members) - len(directories)} "
+        f"files ({stored_bytes / 1e6:.1f} MB to {written_bytes / 1e6:.1f} MB) "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    return manifest
@@ -116,6 +116,9 @@ class EventBus(QObject):
     do_delete_outdated_entries_in_aux_db = Signal()
     do_set_all_entries_in_aux_db_as_outdated = Signal()
 
+    # Text to show in the status panel
+    do_show_status_message = Signal(str)
+
     refresh_started = Signal()
     refresh_finished = Signal()
     do_metadata_refresh_cache = Signal()
@@ -1,5 +1,4 @@
 import os
-import re
 from collections.abc import Callable, Generator
 from typing import Any
 
@@ -7,19 +6,30 @@ from charset_normalizer import from_bytes
 from loguru import logger
 
 from app.controllers.metadata_controller import MetadataController
+from app.utils.file_search_engine import FileHit, ParallelFileSearch, SearchQuery
+from app.utils.file_search_index import FileSearchIndex
 from app.utils.mod_utils import get_mod_name_from_pfid
 
 
 class FileSearch:
     """Utility class for performing file searches with advanced features."""
 
-    def __init__(self, metadata_controller: MetadataController | None = None) -> None:
+    def __init__(
+        self,
+        metadata_controller: MetadataController | None = None,
+        index: FileSearchIndex | None = None,
+    ) -> None:
         self.stop_requested = False
         self.metadata_controller = metadata_controller or MetadataController.instance()
+        self.index = index
+        self._engine: ParallelFileSearch | None = None
 
     def stop_search(self) -> None:
         """Stop the current search operation."""
         self.stop_requested = True
+        engine = self._engine
+        if engine is not None:
+            engine.cancel()
 
     def reset(self) -> None:
         """Reset the search state."""
@@ -55,6 +65,42 @@ class FileSearch:
             if isinstance(result, dict):
                 yield result
 
+    def batched_search(
+        self,
+        search_type: str,
+        search_text: str,
+        root_paths: list[str],
+        options: dict[str, Any],
+    ) -> Generator[list[tuple[str, str, str, str]], None, None]:
+        """
+        Search with previews, yielding the results in batches as they are found.
+
+        Args:
+            search_type (str): Type of search ("standard", "xml", "pattern")
+            search_text (str): The text to search for.
+            root_paths (List[str]): List of root directories to search in.
+            options (Dict[str, Any]): Search options, as for _generic_search.
+
+        Yields:
+            List[Tuple[str, str, str, str]]: Mod name, file name, file path and
+            preview of each match in the batch.
+        """
+        search_options = self._search_type_options(search_type, options)
+        search_options["preview"] = True
+        query = SearchQuery.from_options(search_text, search_options)
+
+        mod_names: dict[str, str] = {}
+        for hits in self._search_hits(query, root_paths):
+            yield [
+                (
+                    self._mod_name(hit.root_path, mod_names),
+                    os.path.basename(hit.file_path),
+                    hit.file_path,
+                    hit.preview,
+                )
+                for hit in hits
+            ]
+
     def _generic_search(
         self,
         search_text: str,
@@ -80,103 +126,88 @@ class FileSearch:
         Yields:
             Dict or Tuple depending on return_dict flag.
         """
-        file_extensions = options.get("file_extensions", [])
-        ignore_extensions = options.get("ignore_extensions", [])
-        case_sensitive = options.get("case_sensitive", False)
-        use_regex = options.get("use_regex", False)
-        preview = options.get("preview", False)
         return_dict = options.get("return_dict", False)
+        query = SearchQuery.from_options(search_text, options)
+
+        mod_names: dict[str, str] = {}
+        for hits in self._search_hits(query, root_paths):
+            for hit in hits:
+                if return_dict:
+                    result: dict[str, str] | tuple[str, str, str] = {
+                        "file_path": hit.file_path,
+                        "preview": hit.preview,
+                    }
+                else:
+                    result = (
+                        self._mod_name(hit.root_path, mod_names),
+                        os.path.basename(hit.file_path),
+                        hit.file_path,
+                    )
+                if result_callback:
+                    result_callback(
+                        *(result.values() if isinstance(result, dict) else result)
+                    )
+                yield result
 
-        exclude_options = options.get("exclude_options", {})
-        excluded_dirs: set[str] = set()
-        if exclude_options.get("skip_translations"):
-            excluded_dirs.add("Languages")
-        if exclude_options.get("skip_git"):
-            excluded_dirs.add(".git")
-        if exclude_options.get("skip_source"):
-            excluded_dirs.add("Source")
-        if exclude_options.get("skip_textures"):
-            excluded_dirs.add("Textures")
-
-        for root_path in root_paths:
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                if excluded_dirs:
-                    dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
-                if self.stop_requested:
-                    logger.info("Search stopped by user.")
-                    return
-
-                for filename in filenames:
-                    # Skip files with ignored extensions
-                    if any(filename.endswith(ext) for ext in ignore_extensions):
-                        continue
-
-                    # Only process files with specified extensions if provided
-                    if file_extensions and not any(
-                        filename.lower().endswith(ext.lower())
-                        for ext in file_extensions
-                    ):
-                        continue
-
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        for content_chunk in self._read_file_in_chunks(file_path):
-                            if self._matches(
-                                content_chunk, search_text, case_sensitive, use_regex
-                            ):
-                                if return_dict:
-                                    result: dict[str, str] | tuple[str, str, str] = {
-                                        "file_path": file_path,
-                                        "preview": self._get_preview(
-                                            content_chunk, search_text, case_sensitive
-                                        )
-                                        if preview
-                                        else "",
-                                    }
-                                else:
-                                    # Extract pfid (publishedfileid) from file_path or root_path
-                                    pfid = os.path.basename(root_path)
-                                    mod_name = get_mod_name_from_pfid(pfid)
-                                    result = (
-                                        mod_name,
-                                        filename,
-                                        file_path,
-                                    )
-                                if result_callback:
-                                    if isinstance(result, dict):
-                                        result_callback(*result.values())
-                                    elif isinstance(result, tuple):
-                                        result_callback(*result)
-                                    else:
-                                        result_callback(result)
-                                yield result
-                                break
-                    except Exception as e:  # noqa: BLE001
-                        logger.error(f"Error reading file {file_path}: {e}")
-
-    def _read_file_in_chunks(
-        self, file_path: str, chunk_size: int = 1024 * 1024
-    ) -> Generator[str, None, None]:
+    def _search_hits(
+        self, query: SearchQuery, root_paths: list[str]
+    ) -> Generator[list[FileHit], None, None]:
         """
-        Read a file in chunks to handle large files efficiently.
+        Run a query on the search index and worker pool until it completes or
+        is stopped. Folders the index is not up to date for are scanned, then
+        indexed again in the background.
 
         Args:
-            file_path (str): Path to the file to read.
-            chunk_size (int): Size of each chunk in bytes.
+            query (SearchQuery): What to search for.
+            root_paths (List[str]): List of root directories to search in.
 
         Yields:
-            str: A chunk of the file content.
+            List[FileHit]: Batches of matching files.
         """
-        if not os.path.exists(file_path):
-            logger.warning(f"File does not exist: {file_path}")
+        if self.stop_requested:
             return
 
-        try:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(chunk_size):
-                    yield chunk.decode("utf-8", errors="ignore")
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Failed to read file {file_path} in chunks: {e}")
+        # Answer up to date folders from the index, and scan the others
+        indexed: list[str] = []
+        if self.index is not None and self.index.covers(query):
+            indexed = self.index.fresh_roots(root_paths)
+            for hits in self.index.search(query, indexed):
+                if self.stop_requested:
+                    break
+                yield hits
+        answered = set(indexed)
+        scanned = [root for root in root_paths if root not in answered]
+
+        if scanned and not self.stop_requested:
+            self._engine = ParallelFileSearch()
+            try:
+                yield from self._engine.search(query, scanned)
+            finally:
+                self._engine = None
+        if self.stop_requested:
+            logger.info("Search stopped by user.")
+        elif self.index is not None and scanned:
+            self.index.schedule_update(scanned)
+
+    @staticmethod
+    def _mod_name(root_path: str, mod_names: dict[str, str]) -> str:
+        """Look up the name of the mod a root path belongs to, once per search."""
+        if root_path not in mod_names:
+            # Extract pfid (publishedfileid) from root_path
+            mod_names[root_path] = get_mod_name_from_pfid(os.path.basename(root_path))
+        return mod_names[root_path]
+
+    @staticmethod
+    def _search_type_options(
+        search_type: str, options: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply search-type specific options to a copy of the options."""
+        search_options = options.copy()
+        if search_type == "xml":
+            search_options["file_extensions"] = [".xml"]
+        elif search_type == "pattern":
+            search_options["use_regex"] = True
+        return search_options
 
     def _create_search_method(
         self, search_type: str
@@ -200,15 +231,9 @@ class FileSearch:
             options: dict[str, Any],
             result_callback: Callable[[str, str, str], None] | None = None,
         ) -> Generator[tuple[str, str, str], None, None]:
-            # Apply search-type specific options
-            search_options = options.copy()
+            search_options = self._search_type_options(search_type, options)
             search_options["return_dict"] = False
 
-            if search_type == "xml":
-                search_options["file_extensions"] = [".xml"]
-            elif search_type == "pattern":
-                search_options["use_regex"] = True
-
             # Use a generator expression to ensure we only yield tuples
             for result in self._generic_search(
                 search_text, root_paths, search_options, result_callback
@@ -223,29 +248,6 @@ class FileSearch:
     standard_search = property(lambda self: self._create_search_method("standard"))
     pattern_search = property(lambda self: self._create_search_method("pattern"))
 
-    def _matches(
-        self, content: str, search_text: str, case_sensitive: bool, use_regex: bool
-    ) -> bool:
-        """Check if the content matches the search criteria."""
-        if use_regex:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            return re.search(search_text, content, flags) is not None
-        else:
-            if not case_sensitive:
-                content = content.lower()
-                search_text = search_text.lower()
-            return search_text in content
-
-    def _get_preview(self, content: str, search_text: str, case_sensitive: bool) -> str:
-        """Generate a preview of the match in the content."""
-        lines = content.splitlines()
-        for i, line in enumerate(lines):
-            if search_text in (line if case_sensitive else line.lower()):
-                start = max(0, i - 2)
-                end = min(len(lines), i + 3)
-                return "\n".join(lines[start:end])
-        return ""
-
     def _read_file_with_encodings(self, file_path: str, encodings: list[str]) -> str:
         """
         Attempt to read a file using a list of encodings.
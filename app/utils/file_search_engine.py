@@ -0,0 +1,547 @@
+"""
+Parallel file content search.
+
+The mod folders to search are split into tasks, one per top-level folder of
+each root, which a pool of worker processes (or threads, for small searches)
+works through. A worker reads each candidate file once - memory-mapped when
+it is large - and matches literal patterns on the raw bytes, so only the
+files that match are decoded. Their preview is built from the same buffer.
+Results are streamed back one batch per task.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from xml.dom import minidom
+
+from charset_normalizer import from_bytes
+from loguru import logger
+
+from app.utils.generic import format_file_size
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 4 * 1024 * 1024
+# Only the start of files larger than this is shown in previews
+MAX_PREVIEW_SIZE = 20 * 1024 * 1024
+TRUNCATED_PREVIEW_SIZE = 1024 * 1024
+# Searches with fewer tasks than this use threads, as starting worker
+# processes would take longer than the search itself
+PROCESS_POOL_MIN_TASKS = 64
+# Seconds between checks for cancellation while waiting for workers
+CANCEL_POLL_INTERVAL = 0.1
+
+EXCLUDE_OPTION_DIRS = {
+    "skip_translations": "Languages",
+    "skip_git": ".git",
+    "skip_source": "Source",
+    "skip_textures": "Textures",
+}
+FALLBACK_ENCODINGS = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """What to search for, and in which files."""
+
+    pattern: str
+    case_sensitive: bool = False
+    use_regex: bool = False
+    file_extensions: tuple[str, ...] = ()
+    ignore_extensions: tuple[str, ...] = ()
+    excluded_dirs: frozenset[str] = frozenset()
+    preview: bool = False
+
+    @classmethod
+    def from_options(cls, pattern: str, options: dict[str, Any]) -> "SearchQuery":
+        """
+        :param pattern: Text or regular expression to search for
+        :param options: Search options as used by FileSearch
+        :return: The query described by the options
+        """
+        exclude_options = options.get("exclude_options", {})
+        return cls(
+            pattern=pattern,
+            case_sensitive=bool(options.get("case_sensitive", False)),
+            use_regex=bool(options.get("use_regex", False)),
+            file_extensions=tuple(
+                ext.lower() for ext in options.get("file_extensions", [])
+            ),
+            ignore_extensions=tuple(options.get("ignore_extensions", [])),
+            excluded_dirs=frozenset(
+                folder
+                for option, folder in EXCLUDE_OPTION_DIRS.items()
+                if exclude_options.get(option)
+            ),
+            preview=bool(options.get("preview", False)),
+        )
+
+    def wants_file(self, filename: str) -> bool:
+        """:return: Whether a file of this name is searched"""
+        if filename.endswith(self.ignore_extensions):
+            return False
+        return not self.file_extensions or filename.lower().endswith(
+            self.file_extensions
+        )
+
+    def wants_path(self, root_path: str, file_path: str) -> bool:
+        """:return: Whether a file found below a root path is searched"""
+        folders = os.path.relpath(os.path.dirname(file_path), root_path).split(os.sep)
+        return self.wants_file(os.path.basename(file_path)) and not (
+            self.excluded_dirs.intersection(folders)
+        )
+
+
+@dataclass(frozen=True)
+class FileHit:
+    """A file whose content matches a query."""
+
+    root_path: str
+    file_path: str
+    preview: str = ""
+
+
+class _Matcher:
+    """Match a query against the raw content of a file."""
+
+    def __init__(self, query: SearchQuery) -> None:
+        self._needle: bytes | None = None
+        self._bytes_regex: re.Pattern[bytes] | None = None
+        self._text_regex: re.Pattern[str] | None = None
+        self._text_needle: str | None = None
+        if query.use_regex:
+            flags = 0 if query.case_sensitive else re.IGNORECASE
+            self._text_regex = re.compile(query.pattern, flags)
+        elif query.case_sensitive:
+            self._needle = query.pattern.encode("utf-8")
+        elif query.pattern.isascii():
+            self._bytes_regex = re.compile(
+                re.escape(query.pattern.encode("ascii")), re.IGNORECASE
+            )
+        else:
+            self._text_needle = query.pattern.lower()
+
+    def matches(self, data: bytes | mmap.mmap) -> bool:
+        if self._needle is not None:
+            return data.find(self._needle) != -1
+        if self._bytes_regex is not None:
+            return self._bytes_regex.search(data) is not None
+        text = data[:].decode("utf-8", errors="ignore")
+        if self._text_regex is not None:
+            return self._text_regex.search(text) is not None
+        assert self._text_needle is not None
+        return self._text_needle in text.lower()
+
+
+@contextmanager
+def _file_buffer(file_path: str) -> Iterator[bytes | mmap.mmap]:
+    """Open a file as bytes, or as a read-only memory map if it is large."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+        else:
+            yield f.read()
+
+
+def decode_content(data: bytes) -> str:
+    """
+    Decode file content for display, guessing its encoding.
+
+    :param data: Raw file content
+    :return: The content with normalized line endings
+    """
+    text: str | None = None
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        best = from_bytes(data[:4096]).best()
+        encodings = ([best.encoding] if best is not None else []) + FALLBACK_ENCODINGS
+        for encoding in encodings:
+            try:
+                text = data.decode(encoding)
+                break
+            except (UnicodeDecodeError, LookupError):
+                continue
+    if text is None:
+        text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _preview_content(data: bytes | mmap.mmap, file_path: str) -> str:
+    if len(data) > MAX_PREVIEW_SIZE:
+        logger.warning(
+            f"File too large to read fully: {file_path} ({format_file_size(len(data))})"
+        )
+        return (
+            data[:TRUNCATED_PREVIEW_SIZE].decode("utf-8", errors="replace")
+            + "\n\n[File truncated due to size...]"
+        )
+    return decode_content(data[:])
+
+
+def read_preview_content(file_path: str) -> str:
+    """
+    :param file_path: File to preview
+    :return: The content to build the file's preview from, or an empty
+        string if it cannot be read
+    """
+    try:
+        with _file_buffer(file_path) as data:
+            return _preview_content(data, file_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read file {file_path}: {e}")
+        return ""
+
+
+def _highlight(line: str, start: int, end: int) -> str:
+    return line[:start] + "**" + line[start:end] + "**" + line[end:]
+
+
+def _find_match(query: SearchQuery, text: str) -> tuple[int, int] | None:
+    """:return: Start and end of the first match in the text, or None"""
+    if query.use_regex:
+        flags = 0 if query.case_sensitive else re.IGNORECASE
+        match = re.search(query.pattern, text, flags)
+        return match.span() if match else None
+    if query.case_sensitive:
+        pos = text.find(query.pattern)
+    else:
+        pos = text.lower().find(query.pattern.lower())
+    return (pos, pos + len(query.pattern)) if pos != -1 else None
+
+
+def build_preview(query: SearchQuery, file_path: str, content: str) -> str:
+    """
+    Build the preview of a match with context and highlighting.
+
+    :param query: The query the file matched
+    :param file_path: The matching file
+    :param content: The content of the file
+    :return: The preview, or an empty string if the content does not match
+    """
+    try:
+        if not content:
+            return "Error: Could not read file content"
+
+        # Special handling for XML files
+        _, ext = os.path.splitext(file_path.lower())
+        if ext == ".xml" and not query.use_regex:
+            xml_preview = _build_xml_preview(query, file_path, content)
+            if xml_preview:
+                return xml_preview
+
+        try:
+            match = _find_match(query, content)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {e}")
+            return f"Error: Invalid regex pattern: {e}"
+        if match is None:
+            return ""
+
+        lines = content.split("\n")
+        match_line_index = content.count("\n", 0, match[0])
+
+        # Get context lines (3 lines before and after the match)
+        start_line = max(0, match_line_index - 3)
+        end_line = min(len(lines), match_line_index + 4)
+
+        preview_lines = []
+        for i in range(start_line, end_line):
+            line = lines[i]
+            if i == match_line_index:
+                line_prefix = f"→ {i + 1}: "
+                line_match = _find_match(query, line)
+                if line_match is not None:
+                    line = _highlight(line, *line_match)
+            else:
+                line_prefix = f"  {i + 1}  "
+            preview_lines.append(f"{line_prefix}{line}")
+
+        # Add ellipsis if needed
+        prefix = "...\n" if start_line > 0 else ""
+        suffix = "\n..." if end_line < len(lines) else ""
+
+        # Add a header with file info
+        file_size_str = format_file_size(os.path.getsize(file_path))
+        header = f"File: {os.path.basename(file_path)} ({file_size_str})\n"
+        header += f"Path: {os.path.dirname(file_path)}\n"
+        header += f"Match at line {match_line_index + 1}:\n"
+
+        joined_preview = "\n".join(preview_lines)
+        return f"{header}\n{prefix}{joined_preview}{suffix}"
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Failed to get preview for {file_path}: {e}")
+        return f"Error generating preview: {e}"
+
+
+def _find_element_with_text(
+    element: ET.Element, search_text: str, case_sensitive: bool
+) -> ET.Element | None:
+    element_text = element.text or ""
+    if not case_sensitive:
+        element_text = element_text.lower()
+        search_text = search_text.lower()
+    if search_text in element_text:
+        return element
+
+    for value in element.attrib.values():
+        if not case_sensitive:
+            value = value.lower()
+        if search_text in value:
+            return element
+
+    for child in element:
+        result = _find_element_with_text(child, search_text, case_sensitive)
+        if result is not None:
+            return result
+    return None
+
+
+def _build_xml_preview(query: SearchQuery, file_path: str, content: str) -> str:
+    """
+    Build a structured preview showing the XML element that matched.
+
+    :return: The preview, or an empty string to fall back to the text preview
+    """
+    search_term = query.pattern if query.case_sensitive else query.pattern.lower()
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return ""
+    try:
+        element = _find_element_with_text(root, search_term, query.case_sensitive)
+        if element is None:
+            return ""
+
+        element_str = ET.tostring(element, encoding="unicode")
+        pretty_xml = minidom.parseString(element_str).toprettyxml(indent="  ")
+        # Remove XML declaration
+        if pretty_xml.startswith("<?xml"):
+            pretty_xml = pretty_xml.split("\n", 1)[1]
+
+        # Highlight the search term
+        if not query.case_sensitive:
+            pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+            pretty_xml = pattern.sub("**\\g<0>**", pretty_xml)
+        else:
+            pretty_xml = pretty_xml.replace(search_term, f"**{search_term}**")
+
+        preview = [
+            f"File: {os.path.basename(file_path)} (XML)",
+            "─" * 40,  # Separator line
+            "Matched XML Element:",
+            pretty_xml,
+        ]
+        return "\n".join(preview)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Error generating XML preview for {file_path}: {e}")
+        return ""
+
+
+def _search_file(
+    query: SearchQuery, matcher: _Matcher, root_path: str, file_path: str
+) -> FileHit | None:
+    with _file_buffer(file_path) as data:
+        if not data or not matcher.matches(data):
+            return None
+        preview = ""
+        if query.preview:
+            preview = build_preview(query, file_path, _preview_content(data, file_path))
+    return FileHit(root_path, file_path, preview)
+
+
+def _walk(
+    directory: str, recursive: bool, excluded_dirs: frozenset[str]
+) -> Iterator[tuple[str, list[str]]]:
+    for dirpath, dirnames, filenames in os.walk(directory):
+        yield dirpath, filenames
+        if not recursive:
+            return
+        if excluded_dirs:
+            dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
+
+
+def search_files(
+    query: SearchQuery, root_path: str, file_paths: Iterable[str]
+) -> list[FileHit]:
+    """
+    Search the given files.
+
+    :param query: What to search for
+    :param root_path: Root path the files belong to
+    :param file_paths: Files to search
+    :return: The files that match
+    """
+    matcher = _Matcher(query)
+    hits: list[FileHit] = []
+    for file_path in file_paths:
+        try:
+            hit = _search_file(query, matcher, root_path, file_path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            continue
+        if hit is not None:
+            hits.append(hit)
+    return hits
+
+
+def search_directory(
+    query: SearchQuery, root_path: str, directory: str, recursive: bool
+) -> list[FileHit]:
+    """
+    Search the files of a directory. Runs in the worker pool.
+
+    :param query: What to search for
+    :param root_path: Root path the directory belongs to
+    :param directory: Directory to search
+    :param recursive: Whether subdirectories are searched too
+    :return: The files that match
+    """
+    return search_files(
+        query,
+        root_path,
+        (
+            os.path.join(dirpath, filename)
+            for dirpath, filenames in _walk(directory, recursive, query.excluded_dirs)
+            for filename in filenames
+            if query.wants_file(filename)
+        ),
+    )
+
+
+def _search_tasks(
+    query: SearchQuery, root_paths: Iterable[str]
+) -> Iterator[tuple[str, str, bool]]:
+    """
+    Split roots into tasks: the files directly in each root, and each of
+    its folders. A single folder holding every mod still fans out per mod.
+    """
+    for root_path in root_paths:
+        try:
+            with os.scandir(root_path) as entries:
+                subdirs = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir() and entry.name not in query.excluded_dirs
+                ]
+        except OSError as e:
+            logger.warning(f"Cannot search {root_path}: {e}")
+            continue
+        yield root_path, root_path, False
+        for subdir in sorted(subdirs):
+            yield root_path, subdir, True
+
+
+class ParallelFileSearch:
+    """
+    Search file contents on a pool of workers.
+
+    :param max_workers: Number of workers, defaults to the number of CPUs
+    :param use_processes: Whether the workers are processes or threads.
+        By default, processes are used for large searches only.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, use_processes: bool | None = None
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop the running search. Queued tasks are dropped."""
+        self._cancelled.set()
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def search(
+        self, query: SearchQuery, root_paths: Iterable[str]
+    ) -> Iterator[list[FileHit]]:
+        """
+        :param query: What to search for
+        :param root_paths: Folders to search
+        :return: Batches of matching files, in the order they are found
+        :raises re.error: If the query is an invalid regular expression
+        """
+        self._cancelled.clear()
+        # Fail on an invalid pattern here instead of in every task
+        _Matcher(query)
+        tasks = list(_search_tasks(query, root_paths))
+        workers = min(self.max_workers, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                if self.cancelled:
+                    return
+                hits = search_directory(query, *task)
+                if hits:
+                    yield hits
+            return
+
+        use_processes = self.use_processes
+        if use_processes is None:
+            use_processes = len(tasks) >= PROCESS_POOL_MIN_TASKS
+        executor: Executor
+        if use_processes:
+            # Searches run on a QThread, and forking a threaded process can
+            # deadlock the child
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="file-search"
+            )
+        with self._lock:
+            self._executor = executor
+        try:
+            pending = {
+                executor.submit(search_directory, query, *task) for task in tasks
+            }
+            # Futures cancelled by cancel() never complete a wait, so poll
+            while pending and not self.cancelled:
+                done, pending = wait(
+                    pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    if self.cancelled:
+                        return
+                    try:
+                        hits = future.result()
+                    except CancelledError:
+                        return
+                    except BrokenProcessPool as e:
+                        logger.error(f"File search workers stopped unexpectedly: {e}")
+                        return
+                    except Exception as e:  # noqa: BLE001
+                        logger.error(f"Error during file search: {e}")
+                        continue
+                    if hits:
+                        yield hits
+        finally:
+            with self._lock:
+                self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,321 @@
+"""
+Persistent full-text index of mod folder contents for file search.
+
+The text of each indexed file is stored in an SQLite FTS5 table with the
+trigram tokenizer, which answers substring queries of three or more
+characters from the index. A folder is only answered from the index while
+its signature - the count, total size and latest mtime of its files -
+matches the one recorded when it was indexed. The signature is verified
+on every search, as it only takes a stat of each file, so edits made while
+RimSort runs are never missed. Folders that are not indexed or have changed
+are scanned instead and indexed again in the background.
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import ClassVar
+
+from loguru import logger
+
+from app.utils.file_search_engine import (
+    FileHit,
+    SearchQuery,
+    build_preview,
+    decode_content,
+    search_files,
+)
+from app.utils.ignore_extensions import IGNORE_EXTENSIONS
+
+FILE_SEARCH_INDEX_FILENAME = "file_search_index.sqlite3"
+# The trigram tokenizer cannot look up shorter patterns
+MIN_INDEXED_PATTERN_LENGTH = 3
+# Larger files, and binary files, are searched on disk instead
+MAX_INDEXED_FILE_SIZE = 8 * 1024 * 1024
+# Folders that are never indexed, and must be excluded by indexed searches
+UNINDEXED_DIRS = frozenset({".git"})
+# Hits are returned in batches of this size
+SEARCH_BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    root_path TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    root_path TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    indexed INTEGER NOT NULL,
+    UNIQUE (root_path, file_path)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS contents USING fts5(body, tokenize='trigram');
+"""
+
+
+def _indexed_file_paths(root_path: str) -> Iterator[str]:
+    """Files below a root path that belong in the index."""
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = [d for d in dirnames if d not in UNINDEXED_DIRS]
+        for filename in filenames:
+            if not filename.endswith(tuple(IGNORE_EXTENSIONS)):
+                yield os.path.join(dirpath, filename)
+
+
+def folder_signature(root_path: str) -> str | None:
+    """
+    :param root_path: Folder to sign
+    :return: Count, total size and latest mtime of the folder's indexed
+        files, or None if the folder does not exist
+    """
+    if not os.path.isdir(root_path):
+        return None
+    count = size = latest = 0
+    for file_path in _indexed_file_paths(root_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        count += 1
+        size += stat.st_size
+        latest = max(latest, stat.st_mtime_ns)
+    return f"{count}:{size}:{latest}"
+
+
+class FileSearchIndex:
+    """
+    Full-text index of the contents of searched folders.
+
+    :param db_path: SQLite file to store the index in
+    """
+
+    _instances: ClassVar[dict[Path, "FileSearchIndex"]] = {}
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._updater: threading.Thread | None = None
+        try:
+            with self._connection() as connection:
+                connection.executescript(_SCHEMA)
+            self.available = True
+        except sqlite3.Error as e:
+            logger.warning(f"File search index is not available: {e}")
+            self.available = False
+
+    @classmethod
+    def get_or_create_cached_instance(cls, db_path: Path) -> "FileSearchIndex":
+        """
+        Get or create a cached instance of the index.
+        This cached index is only for the specified db_path.
+        """
+        if db_path not in cls._instances:
+            cls._instances[db_path] = cls(db_path)
+        return cls._instances[db_path]
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            # The index can always be rebuilt, so it is not synced on commit
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                yield connection
+
+    def covers(self, query: SearchQuery) -> bool:
+        """:return: Whether the index can answer the query"""
+        if not self.available or query.use_regex:
+            return False
+        if len(query.pattern) < MIN_INDEXED_PATTERN_LENGTH:
+            return False
+        if not UNINDEXED_DIRS <= query.excluded_dirs:
+            return False
+        ignored = tuple(IGNORE_EXTENSIONS)
+        if query.file_extensions:
+            return not any(ext.endswith(ignored) for ext in query.file_extensions)
+        return set(IGNORE_EXTENSIONS) <= set(query.ignore_extensions)
+
+    def fresh_roots(self, root_paths: Iterable[str]) -> list[str]:
+        """
+        :param root_paths: Folders to search
+        :return: The folders whose index is up to date
+        """
+        root_paths = list(dict.fromkeys(root_paths))
+        with self._connection() as connection:
+            recorded = self._signatures(connection, root_paths)
+        return [
+            root
+            for root in root_paths
+            if root in recorded and folder_signature(root) == recorded[root]
+        ]
+
+    def search(
+        self, query: SearchQuery, root_paths: list[str]
+    ) -> Iterator[list[FileHit]]:
+        """
+        Search indexed folders.
+
+        :param query: What to search for, which the index must cover
+        :param root_paths: Folders whose index is up to date
+        :return: Batches of matching files
+        """
+        phrase = '"' + query.pattern.replace('"', '""') + '"'
+        unindexed: dict[str, list[str]] = {}
+        with self._connection() as connection:
+            for start in range(0, len(root_paths), 500):
+                roots = root_paths[start : start + 500]
+                placeholders = ",".join("?" * len(roots))
+                sql = (
+                    "SELECT files.root_path, files.file_path, contents.body"
+                    " FROM contents JOIN files ON files.id = contents.rowid"
+                    f" WHERE contents MATCH ? AND files.root_path IN ({placeholders})"
+                )
+                parameters: list[str] = [phrase, *roots]
+                if query.case_sensitive:
+                    sql += " AND instr(contents.body, ?) > 0"
+                    parameters.append(query.pattern)
+                rows = connection.execute(sql, parameters)
+                while batch := rows.fetchmany(SEARCH_BATCH_SIZE):
+                    hits = [
+                        FileHit(
+                            root_path,
+                            file_path,
+                            build_preview(query, file_path, body)
+                            if query.preview
+                            else "",
+                        )
+                        for root_path, file_path, body in batch
+                        if query.wants_path(root_path, file_path)
+                    ]
+                    if hits:
+                        yield hits
+                for root_path, file_path in self._unindexed_files(connection, roots):
+                    unindexed.setdefault(root_path, []).append(file_path)
+            for root_path, file_paths in unindexed.items():
+                hits = search_files(
+                    query,
+                    root_path,
+                    (path for path in file_paths if query.wants_path(root_path, path)),
+                )
+                if hits:
+                    yield hits
+
+    def schedule_update(self, root_paths: Iterable[str]) -> None:
+        """
+        Index folders again in the background.
+
+        :param root_paths: Folders that are not indexed or have changed
+        """
+        if not self.available:
+            return
+        with self._lock:
+            self._pending.update(root_paths)
+            if self._updater is not None or not self._pending:
+                return
+            self._updater = threading.Thread(
+                target=self._update_pending, name="file-search-index", daemon=True
+            )
+            self._updater.start()
+
+    def _update_pending(self) -> None:
+        while True:
+            with self._lock:
+                root_paths = list(self._pending)
+                self._pending.clear()
+                if not root_paths:
+                    self._updater = None
+                    return
+            try:
+                self.update(root_paths)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update the file search index: {e}")
+
+    def update(self, root_paths: Iterable[str]) -> None:
+        """
+        Index the folders whose signature changed since they were last indexed.
+
+        :param root_paths: Folders to index
+        """
+        with self._connection() as connection:
+            for root_path in root_paths:
+                self._update(connection, root_path)
+                connection.commit()
+
+    def _update(self, connection: sqlite3.Connection, root_path: str) -> None:
+        signature = folder_signature(root_path)
+        recorded = self._signatures(connection, [root_path]).get(root_path)
+        if recorded != signature:
+            self._forget(connection, root_path)
+        if recorded != signature and signature is not None:
+            logger.debug(f"Indexing {root_path} for file search")
+            for file_path in _indexed_file_paths(root_path):
+                self._index_file(connection, root_path, file_path)
+            connection.execute(
+                "INSERT INTO folders (root_path, signature) VALUES (?, ?)",
+                (root_path, signature),
+            )
+
+    @staticmethod
+    def _index_file(
+        connection: sqlite3.Connection, root_path: str, file_path: str
+    ) -> None:
+        body: str | None = None
+        try:
+            if os.path.getsize(file_path) <= MAX_INDEXED_FILE_SIZE:
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                if b"\0" not in data[:8192]:
+                    body = decode_content(data)
+        except OSError as e:
+            logger.debug(f"Not indexing {file_path}: {e}")
+        cursor = connection.execute(
+            "INSERT INTO files (root_path, file_path, indexed) VALUES (?, ?, ?)",
+            (root_path, file_path, body is not None),
+        )
+        if body is not None:
+            connection.execute(
+                "INSERT INTO contents (rowid, body) VALUES (?, ?)",
+                (cursor.lastrowid, body),
+            )
+
+    @staticmethod
+    def _forget(connection: sqlite3.Connection, root_path: str) -> None:
+        connection.execute(
+            "DELETE FROM contents WHERE rowid IN"
+            " (SELECT id FROM files WHERE root_path = ?)",
+            (root_path,),
+        )
+        connection.execute("DELETE FROM files WHERE root_path = ?", (root_path,))
+        connection.execute("DELETE FROM folders WHERE root_path = ?", (root_path,))
+
+    @staticmethod
+    def _signatures(
+        connection: sqlite3.Connection, root_paths: list[str]
+    ) -> dict[str, str]:
+        signatures: dict[str, str] = {}
+        for start in range(0, len(root_paths), 500):
+            roots = root_paths[start : start + 500]
+            placeholders = ",".join("?" * len(roots))
+            rows = connection.execute(
+                "SELECT root_path, signature FROM folders"
+                f" WHERE root_path IN ({placeholders})",
+                roots,
+            )
+            signatures.update(rows)
+        return signatures
+
+    @staticmethod
+    def _unindexed_files(
+        connection: sqlite3.Connection, root_paths: list[str]
+    ) -> list[tuple[str, str]]:
+        """:return: Root path and path of the files searched on disk"""
+        placeholders = ",".join("?" * len(root_paths))
+        return connection.execute(
+            "SELECT root_path, file_path FROM files"
+            f" WHERE indexed = 0 AND root_path IN ({placeholders})",
+            root_paths,
+        ).fetchall()
@@ -5,16 +5,32 @@ Wraps PyGitHub to fetch release data from GitHub repositories,
 caching results in SQLAlchemy-backed SQLite to respect rate limits.
 """
 
+from __future__ import annotations
+
 import json
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from github import Github, GithubException
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from app.utils import http
 from app.utils.github.models import GitHubReleaseCache
+from app.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import github
+else:
+    # PyGitHub is only needed once releases are fetched from the API
+    github = lazy_import("github")
+
+# PyGitHub clients by token, shared by all providers. A client keeps its
+# connection to the API open, so reusing it saves a TLS handshake per lookup.
+_github_clients: dict[str | None, github.Github] = {}
+_github_clients_lock = threading.Lock()
 
 
 @dataclass
@@ -160,11 +176,19 @@ class GitHubProvider:
         self._token = github_token
         self._cache_session = cache_session
 
-    def _get_github_client(self) -> Github:
-        """Create a PyGitHub client, optionally authenticated."""
-        if self._token:
-            return Github(self._token)
-        return Github()
+    def _get_github_client(self) -> github.Github:
+        """Return the shared PyGitHub client, optionally authenticated."""
+        with _github_clients_lock:
+            client = _github_clients.get(self._token)
+            if client is None:
+                if self._token:
+                    client = github.Github(
+                        self._token, pool_size=http.DEFAULT_POOL_MAXSIZE
+                    )
+                else:
+                    client = github.Github(pool_size=http.DEFAULT_POOL_MAXSIZE)
+                _github_clients[self._token] = client
+            return client
 
     def get_releases(
         self,
@@ -254,7 +278,7 @@ class GitHubProvider:
             self._update_cache(owner_repo, releases)
             return releases
 
-        except GithubException as e:
+        except github.GithubException as e:
             if e.status in (403, 429):
                 logger.warning(f"GitHub rate limit hit for {owner_repo}")
                 raise GitHubRateLimitError(
@@ -5,14 +5,26 @@ calling requests.get/post/head directly, to ensure consistent timeout behavior.
 
 Transient failures (connection errors and the status codes in
 RETRY_STATUS_CODES) are retried automatically for idempotent methods using
-exponential backoff. A fresh Session is created per request so no state is
-shared between threads.
+exponential backoff.
+
+Requests go through a process-wide pool of keep-alive connections, so
+repeated requests to the same host (Steam WebAPI chunks, GitHub, database
+downloads) reuse an open TCP/TLS connection instead of handshaking again.
+Each thread sends its requests through its own Session, and cookies are
+dropped after every request, so no state is shared between threads or
+requests. Clients that need their own Session, e.g. to keep cookies, can
+still share the connections with new_session() or mount_pool(). Clients that
+handle rate limits (429) themselves can mount an adapter that only retries
+server errors.
 """
 
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
 DEFAULT_TIMEOUT: int | float = 15
@@ -22,35 +34,241 @@ DEFAULT_RETRIES: int = 4
 # Backoff factor (seconds); urllib3 uses this for exponential backoff between
 # retries.
 DEFAULT_BACKOFF_FACTOR: float = 1
+# Server error status codes treated as transient and retried.
+SERVER_ERROR_STATUS_CODES: tuple[int, ...] = (500, 502, 503, 504)
 # Status codes treated as transient and retried (rate limit + server errors).
-RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+RETRY_STATUS_CODES: tuple[int, ...] = (429, *SERVER_ERROR_STATUS_CODES)
+
+# Number of hosts the pool keeps connections open to.
+DEFAULT_POOL_CONNECTIONS: int = 16
+# Number of idle connections kept open per host.
+DEFAULT_POOL_MAXSIZE: int = 16
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Connection reuse counters of the shared pool.
+
+    :param requests: Requests sent, including retries
+    :param connections_opened: New connections opened for them
+    """
+
+    requests: int
+    connections_opened: int
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests that were sent over an already open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+
+class _PoolCounters:
+    """Thread-safe counters updated by the connection pools."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(self.requests, self.connections_opened)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
 
 
-def _new_session() -> requests.Session:
-    """Create a Session with retry/backoff mounted for HTTP and HTTPS."""
-    retry = Retry(
+_counters = _PoolCounters()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self) -> Any:
+        _counters.count_connection()
+        return super()._new_conn()
+
+    def urlopen(self, *args: Any, **kwargs: Any) -> Any:
+        # Retries call urlopen again, so every attempt is counted
+        _counters.count_request()
+        return super().urlopen(*args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self) -> Any:
+        _counters.count_connection()
+        return super()._new_conn()
+
+    def urlopen(self, *args: Any, **kwargs: Any) -> Any:
+        _counters.count_request()
+        return super().urlopen(*args, **kwargs)
+
+
+class _PooledAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connection pools count opened connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _new_retry(retry_rate_limits: bool = True) -> Retry:
+    return Retry(
         total=DEFAULT_RETRIES,
         read=0,
         backoff_factor=DEFAULT_BACKOFF_FACTOR,
-        status_forcelist=RETRY_STATUS_CODES,
+        status_forcelist=(
+            RETRY_STATUS_CODES if retry_rate_limits else SERVER_ERROR_STATUS_CODES
+        ),
         allowed_methods=frozenset(["GET", "HEAD"]),
-        respect_retry_after_header=True,
+        # urllib3 retries any 429 with a Retry-After header when this is set,
+        # whether 429 is in status_forcelist or not
+        respect_retry_after_header=retry_rate_limits,
         # Return the final response instead of raising so callers keep using
         # response.raise_for_status() as before.
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+
+
+def _new_adapter(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    retry_rate_limits: bool = True,
+) -> HTTPAdapter:
+    """Create a pooled adapter with retry/backoff."""
+    return _PooledAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=_new_retry(retry_rate_limits),
+    )
+
+
+def _new_session(adapter: HTTPAdapter | None = None) -> requests.Session:
+    """Create a Session with adapter (or a new retrying one) mounted for HTTP and HTTPS."""
+    if adapter is None:
+        adapter = _new_adapter()
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
+class _Pool:
+    """The shared adapters and the Session of each thread that uses them."""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> None:
+        self.adapter = _new_adapter(pool_connections, pool_maxsize, pool_block)
+        # Returns 429 responses to the caller instead of retrying them
+        self.server_error_adapter = _new_adapter(
+            pool_connections, pool_maxsize, pool_block, retry_rate_limits=False
+        )
+        self._local = threading.local()
+
+    def close(self) -> None:
+        self.adapter.close()
+        self.server_error_adapter.close()
+
+    def session(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = _new_session(self.adapter)
+            self._local.session = session
+        return session
+
+
+_pool_lock = threading.Lock()
+_pool: _Pool | None = None
+
+
+def _get_pool() -> _Pool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _Pool()
+        return _pool
+
+
+def configure_pool(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+) -> None:
+    """Replace the shared connection pool, e.g. to allow more parallel requests.
+
+    Open connections of the previous pool are closed once their responses
+    are released. The reuse counters are reset.
+
+    :param pool_connections: Number of hosts to keep connections open to
+    :param pool_maxsize: Number of connections kept open per host
+    :param pool_block: Wait for a free connection instead of opening a
+        throwaway one when all pool_maxsize connections of a host are busy
+    """
+    global _pool
+    with _pool_lock:
+        previous = _pool
+        _pool = _Pool(pool_connections, pool_maxsize, pool_block)
+        _counters.reset()
+    if previous is not None:
+        previous.close()
+
+
+def pool_stats() -> PoolStats:
+    """Return the connection reuse counters of the shared pool."""
+    return _counters.snapshot()
+
+
+def mount_pool(
+    session: requests.Session, retry_rate_limits: bool = True
+) -> requests.Session:
+    """Send the requests of session through the shared connection pool.
+
+    The session keeps its own headers and cookies. It must not be closed,
+    as that would close the shared pool's connections.
+
+    :param session: Session to mount the shared adapter on
+    :param retry_rate_limits: Retry 429 responses. Pass False if the caller
+        waits out rate limits itself, so its retries are not stacked on top
+        of the adapter's
+    :return: The same session
+    """
+    pool = _get_pool()
+    adapter = pool.adapter if retry_rate_limits else pool.server_error_adapter
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def new_session() -> requests.Session:
+    """Create a Session with its own cookies that uses the shared connection pool."""
+    return mount_pool(requests.Session())
+
+
 def _request(method: str, url: str, **kwargs: Any) -> requests.Response:
-    """Send a request through a Session with a default timeout."""
+    """Send a request through the calling thread's pooled Session with a default timeout."""
     kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    with _new_session() as session:
+    session = _get_pool().session()
+    try:
         return session.request(method, url, **kwargs)
+    finally:
+        session.cookies.clear()
 
 
 # jscpd:ignore-start
@@ -2,7 +2,8 @@
 
 Downloads zip archives from HTTP URLs (e.g. GitHub release/archive endpoints),
 extracts them to a target directory, and caches ETag/Last-Modified headers for
-conditional GET requests on subsequent runs.
+conditional GET requests on subsequent runs. SteamDB and rules JSON files in a
+freshly extracted archive get a compact sidecar for fast, lazy loading.
 """
 
 import json
@@ -19,6 +20,7 @@ import requests
 from loguru import logger
 from PySide6.QtCore import QThread, Signal
 
+from app.models.metadata.metadata_compact_db import generate_compact_dbs
 from app.utils import http
 
 DOWNLOAD_CHUNK_SIZE = 131072  # 128KB
@@ -158,7 +160,8 @@ class HttpDatabaseDownloader:
         Uses conditional GET headers when cached metadata exists. On a 304
         response the existing files are left untouched. On a 200 response the
         zip is streamed to a temp file, extracted, and the target directory is
-        replaced atomically.
+        replaced atomically. Compact sidecars are then written for any SteamDB
+        or rules JSON files at the top of the extracted directory.
 
         :param url: URL of the zip archive to download
         :param target_dir: Parent directory where ``repo_name/`` will be created
@@ -172,49 +175,54 @@ class HttpDatabaseDownloader:
         headers = self._build_conditional_headers(cache)
 
         try:
+            # Closing the streamed response hands its connection back to the pool
             response = http.get(url, headers=headers, stream=True, timeout=30)
-            response.raise_for_status()
-
-            if response.status_code == 304:
-                logger.info(f"{repo_name}: already up to date (304)")
-                return DownloadResult.UP_TO_DATE, None
-
-            total_size_str = response.headers.get("Content-Length")
-            total_size = int(total_size_str) if total_size_str else None
-
-            target_dir.mkdir(parents=True, exist_ok=True)
-            temp_fd = tempfile.NamedTemporaryFile(  # noqa: SIM115
-                dir=str(target_dir), suffix=".zip", delete=False
-            )
-            temp_path = Path(temp_fd.name)
-
-            try:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                    if cancel_check and cancel_check():
-                        raise _DownloadCancelled()
-                    if chunk:
-                        temp_fd.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
-                temp_fd.close()
-
-                extracted = self._extract_zip_to_dir(temp_path, target_dir, repo_name)
-
-                new_etag = response.headers.get("ETag")
-                new_last_modified = response.headers.get("Last-Modified")
-                self._write_cache_metadata(extracted, new_etag, new_last_modified)
-
-                logger.info(f"{repo_name}: downloaded and extracted successfully")
-                return DownloadResult.UPDATED, None
-
-            finally:
-                if temp_path.exists():
-                    try:
-                        temp_path.unlink()
-                    except OSError:
-                        pass
+            with response:
+                response.raise_for_status()
+
+                if response.status_code == 304:
+                    logger.info(f"{repo_name}: already up to date (304)")
+                    return DownloadResult.UP_TO_DATE, None
+
+                total_size_str = response.headers.get("Content-Length")
+                total_size = int(total_size_str) if total_size_str else None
+
+                target_dir.mkdir(parents=True, exist_ok=True)
+                temp_fd = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                    dir=str(target_dir), suffix=".zip", delete=False
+                )
+                temp_path = Path(temp_fd.name)
+
+                try:
+                    downloaded = 0
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if cancel_check and cancel_check():
+                            raise _DownloadCancelled()
+                        if chunk:
+                            temp_fd.write(chunk)
+                            downloaded += len(chunk)
+                            if progress_callback:
+                                progress_callback(downloaded, total_size)
+                    temp_fd.close()
+
+                    extracted = self._extract_zip_to_dir(
+                        temp_path, target_dir, repo_name
+                    )
+                    generate_compact_dbs(extracted)
+
+                    new_etag = response.headers.get("ETag")
+                    new_last_modified = response.headers.get("Last-Modified")
+                    self._write_cache_metadata(extracted, new_etag, new_last_modified)
+
+                    logger.info(f"{repo_name}: downloaded and extracted successfully")
+                    return DownloadResult.UPDATED, None
+
+                finally:
+                    if temp_path.exists():
+                        try:
+                            temp_path.unlink()
+                        except OSError:
+                            pass
 
         except _DownloadCancelled:
             logger.info(f"{repo_name}: download cancelled")
@@ -0,0 +1,64 @@
+"""Modules that are imported the first time they are used.
+
+Heavy dependencies that are only needed by rarely used features are bound
+at module scope with ``lazy_import`` instead of an import statement, so they
+do not add to the time until the main window appears::
+
+    if TYPE_CHECKING:
+        import networkx as nx
+    else:
+        nx = lazy_import("networkx")
+
+Type checkers see the real module, while at runtime ``nx`` imports networkx
+on its first attribute access. Nuitka does not follow these imports, so the
+modules must be included in the build with a ``nuitka-project`` option in
+app/__main__.py.
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a module that imports it on the first attribute access.
+
+    :param name: Absolute name of the module
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "not loaded" if self.__dict__["_lazy_module"] is None else "loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    :param name: Absolute name of the module
+    :return: The module if it is already imported, otherwise a stand-in
+        that imports it on first use
+    """
+    return sys.modules.get(name) or LazyModule(name)
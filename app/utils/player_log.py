@@ -0,0 +1,632 @@
+"""
+Line-indexed game logs.
+
+A log is scanned once for the byte offsets its lines start at, so any line
+can be decoded on its own and only the lines that are shown are decoded. The
+lines are indexed in steps of a few megabytes, which also find the runs of
+repeated lines, and then counted against the statistics patterns in a single
+pass. Scans pick up where the previous one ended, so when the game appends
+to its log only the new lines are scanned.
+
+Log files are memory-mapped only while they are read, as the game cannot
+replace its log while it is mapped on Windows.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import accumulate
+from pathlib import Path
+
+from loguru import logger
+
+# Bytes indexed in one step of a scan
+SCAN_CHUNK_SIZE = 8 * 1024 * 1024
+# Bytes decoded at a time when matching patterns
+MATCH_CHUNK_SIZE = 4 * 1024 * 1024
+# Logs with fewer new bytes than this have their statistics counted on the
+# scanning thread, as starting worker processes would take longer
+PROCESS_POOL_MIN_SIZE = 4 * MATCH_CHUNK_SIZE
+# Seconds between checks for cancellation while waiting for workers
+CANCEL_POLL_INTERVAL = 0.1
+# Bytes at the start of the log that identify it
+HEADER_SIZE = 256
+
+ENCODING = "utf-8"
+# A line followed by one or more copies of itself
+_REPEATED_LINES = re.compile(rb"^([^\n]*+\n)\1+", re.MULTILINE)
+
+Buffer = bytes | mmap.mmap
+
+
+@dataclass
+class LogScan:
+    """Lines found by one step of a scan."""
+
+    # Number of the first line found
+    first_line: int
+    # Start offsets of the lines found, followed by the offset the last ends at
+    offsets: array[int]
+    # Lengths of the runs of identical lines, by the number of their first line
+    repeats: dict[int, int] = field(default_factory=dict)
+    # Whether the first line is identical to the line before it
+    continues: bool = False
+    # Whether the last line has no line break yet. It is scanned again with
+    # whatever is appended to it.
+    partial: bool = False
+    # Length in bytes of the longest line found
+    longest_line: int = 0
+    # Start of the log, only set by the step scanning its first line
+    header: bytes = b""
+
+
+@dataclass
+class LogStatistics:
+    """Lines found by a scan that match each statistics pattern."""
+
+    counts: dict[str, int]
+    # Part of ``counts`` from a partial last line
+    partial_counts: dict[str, int] = field(default_factory=dict)
+
+
+def line_pattern(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """
+    :param pattern: Pattern to look for in lines
+    :return: The pattern with ``^`` and ``$`` matching at every line
+    """
+    if pattern.flags & re.MULTILINE:
+        return pattern
+    return re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+
+def line_matches(pattern: re.Pattern[str], text: str) -> Iterator[int]:
+    """
+    Search each line of ``text`` for ``pattern`` once, skipping to the next
+    line after a match.
+
+    :param pattern: Pattern built with ``line_pattern``
+    :param text: Whole lines of a log
+    :return: Offset in ``text`` of the first match in each matching line
+    """
+    search, find = pattern.search, text.find
+    position = 0
+    while match := search(text, position):
+        start = match.start()
+        yield start
+        position = find("\n", start) + 1
+        if not position:
+            return
+
+
+def matching_lines_in(
+    pattern: re.Pattern[str], text: str, first_line: int = 0
+) -> array[int]:
+    """
+    :param pattern: Pattern built with ``line_pattern``
+    :param text: Whole lines of a log
+    :param first_line: Number of the first line in ``text``
+    :return: Numbers of the lines ``pattern`` is found in
+    """
+    lines = array("q")
+    line, position = first_line, 0
+    for start in line_matches(pattern, text):
+        line += text.count("\n", position, start)
+        position = start
+        lines.append(line)
+    return lines
+
+
+def scan_log(
+    data: Buffer,
+    start: int = 0,
+    first_line: int = 0,
+    previous_start: int | None = None,
+    chunk_size: int = SCAN_CHUNK_SIZE,
+) -> Iterator[LogScan]:
+    """
+    Index the lines of a log from a line start to its end.
+
+    :param data: Content of the log
+    :param start: Offset of the line to start at
+    :param first_line: Number of the line at ``start``
+    :param previous_start: Offset of the line before ``start``, if any
+    :param chunk_size: Bytes indexed in one step
+    :return: The lines found by each step
+    """
+    size = len(data)
+    line = first_line
+    while start < size:
+        newline = data.rfind(b"\n", start, min(start + chunk_size, size))
+        if newline == -1:
+            newline = data.find(b"\n", start + chunk_size)
+        end = size if newline == -1 else newline + 1
+        chunk = data[start:end]
+        lengths = [len(part) + 1 for part in chunk.split(b"\n")]
+        partial = not chunk.endswith(b"\n")
+        if partial:
+            lengths[-1] -= 1
+        else:
+            # Nothing follows the last line break
+            lengths.pop()
+
+        offsets = array("q", accumulate(lengths, initial=start))
+        scan = LogScan(
+            first_line=line,
+            offsets=offsets,
+            partial=partial,
+            longest_line=max(lengths),
+        )
+        if line == 0:
+            scan.header = bytes(data[:HEADER_SIZE])
+        elif previous_start is not None:
+            scan.continues = data[previous_start:start] == data[start : offsets[1]]
+
+        run_line, position = line, 0
+        for match in _REPEATED_LINES.finditer(chunk):
+            run_line += chunk.count(b"\n", position, match.start())
+            position = match.start()
+            scan.repeats[run_line] = (match.end() - match.start()) // len(
+                match.group(1)
+            )
+
+        yield scan
+        previous_start = offsets[-2]
+        line += len(offsets) - 1
+        start = end
+
+
+def _line_ranges(data: Buffer, start: int, end: int) -> list[tuple[int, int]]:
+    """Split the lines between two line starts into ranges of about
+    MATCH_CHUNK_SIZE bytes."""
+    ranges = []
+    while start < end:
+        stop = data.rfind(b"\n", start, min(start + MATCH_CHUNK_SIZE, end)) + 1
+        if stop == 0 or end - start <= MATCH_CHUNK_SIZE:
+            stop = end
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _count_lines(
+    patterns: Mapping[str, re.Pattern[str]],
+    data: Buffer,
+    ranges: Iterable[tuple[int, int]],
+) -> dict[str, int]:
+    regexes = {name: line_pattern(pattern) for name, pattern in patterns.items()}
+    counts = dict.fromkeys(patterns, 0)
+    for start, end in ranges:
+        text = data[start:end].decode(ENCODING, errors="ignore")
+        for name, regex in regexes.items():
+            counts[name] += sum(1 for _ in line_matches(regex, text))
+    return counts
+
+
+def _count_file_lines(
+    path: Path, start: int, end: int, patterns: Mapping[str, re.Pattern[str]]
+) -> dict[str, int]:
+    """Count the lines of a part of a log file in a worker process."""
+    with map_log(path) as data:
+        return _count_lines(patterns, data, [(start, end)])
+
+
+@contextmanager
+def map_log(path: Path) -> Iterator[Buffer]:
+    """
+    Memory-map a log file for reading.
+
+    :param path: Path of the log
+    :return: Content of the log, empty bytes if the file is empty
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+class PlayerLog:
+    """
+    Index of the lines of a game log.
+
+    Lines are numbered from 0. The index is only changed by ``apply`` and
+    ``add_statistics`` with the results of ``scan``, which can run on another
+    thread. Applying a scan only adds lines, or extends a partial last line,
+    in one step, so searches can read the lines indexed when they started
+    from other threads.
+
+    :param path: Path of the log file
+    :param content: Content of a log that is not a file
+    """
+
+    def __init__(self, path: Path | None = None, content: bytes = b"") -> None:
+        self.path = path
+        self.content = content
+        # Start offsets of the lines, followed by the offset the last ends at
+        self.offsets = array("q", [0])
+        self.statistics: dict[str, int] = {}
+        self.repeats: dict[int, int] = {}
+        self.partial = False
+        self.longest_line = 0
+        self.header = b""
+        self._partial_counts: dict[str, int] = {}
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def size(self) -> int:
+        """Bytes of the log that are indexed."""
+        return self.offsets[-1]
+
+    @property
+    def complete_line_count(self) -> int:
+        """Number of lines that end with a line break."""
+        return self.line_count - 1 if self.partial else self.line_count
+
+    @contextmanager
+    def buffer(self) -> Iterator[Buffer]:
+        """:return: Content of the log"""
+        if self.path is None:
+            yield self.content
+        else:
+            with map_log(self.path) as data:
+                yield data
+
+    def scan(
+        self,
+        patterns: Mapping[str, re.Pattern[str]] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> Iterator[LogScan | LogStatistics]:
+        """
+        Scan the log from where the previous scan ended. The lines are
+        indexed in steps first, then their statistics are counted. The
+        returned iterator does not change the index, so it can run on another
+        thread.
+
+        :param patterns: Statistics patterns, by name
+        :param is_cancelled: Stops counting the statistics when it returns True
+        :return: The lines found by each step, followed by their statistics
+            if there are patterns
+        """
+        first_line = self.complete_line_count
+        start = self.offsets[first_line]
+        previous_start = self.offsets[first_line - 1] if first_line else None
+
+        def steps() -> Iterator[LogScan | LogStatistics]:
+            end = partial_start = start
+            with self.buffer() as data:
+                for step in scan_log(data, start, first_line, previous_start):
+                    end = step.offsets[-1]
+                    partial_start = step.offsets[-2] if step.partial else end
+                    yield step
+            if not patterns:
+                return
+            counts = self.count_lines(patterns, start, partial_start, is_cancelled)
+            if counts is None:
+                return
+            partial_counts = self.count_lines(patterns, partial_start, end) or {}
+            for name, count in partial_counts.items():
+                counts[name] += count
+            yield LogStatistics(counts, partial_counts)
+
+        return steps()
+
+    def apply(self, scan: LogScan) -> None:
+        """Add the lines found by a step of ``scan`` to the index."""
+        if scan.first_line != self.complete_line_count:
+            raise ValueError(
+                f"Scan starts at line {scan.first_line}, "
+                f"expected line {self.complete_line_count}"
+            )
+        # Replaces the end offset, and the partial line if it was scanned again
+        self.offsets[scan.first_line :] = scan.offsets
+        self.partial = scan.partial
+        self.longest_line = max(self.longest_line, scan.longest_line)
+        if scan.first_line == 0:
+            self.header = scan.header
+
+        repeats = dict(scan.repeats)
+        if scan.continues:
+            # The run of the line before the scan goes on
+            last_run = next(reversed(self.repeats), None)
+            if last_run is None or last_run + self.repeats[last_run] != scan.first_line:
+                last_run = scan.first_line - 1
+                self.repeats[last_run] = 1
+            self.repeats[last_run] += repeats.pop(scan.first_line, 1)
+        self.repeats.update(repeats)
+
+    def add_statistics(self, statistics: LogStatistics) -> None:
+        """Add the statistics counted by ``scan`` once its lines are applied."""
+        # The partial line was counted again
+        for name, count in self._partial_counts.items():
+            self.statistics[name] -= count
+        for name, count in statistics.counts.items():
+            self.statistics[name] = self.statistics.get(name, 0) + count
+        self._partial_counts = statistics.partial_counts
+
+    def count_lines(
+        self,
+        patterns: Mapping[str, re.Pattern[str]],
+        start: int,
+        end: int,
+        is_cancelled: Callable[[], bool] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, int] | None:
+        """
+        Count the lines between two line starts that match each pattern.
+        Large parts of log files are counted on a pool of processes.
+
+        :param patterns: Patterns, by name
+        :param start: Offset to start at
+        :param end: Offset to end at
+        :param is_cancelled: Stops counting when it returns True
+        :param max_workers: Number of processes, defaults to the number of CPUs
+        :return: Number of lines matching each pattern, None if cancelled
+        """
+        with self.buffer() as data:
+            ranges = _line_ranges(data, start, end)
+            workers = min(max_workers or os.cpu_count() or 1, len(ranges))
+            if self.path is None or workers <= 1 or end - start < PROCESS_POOL_MIN_SIZE:
+                counts = dict.fromkeys(patterns, 0)
+                for part in ranges:
+                    if is_cancelled is not None and is_cancelled():
+                        return None
+                    for name, count in _count_lines(patterns, data, [part]).items():
+                        counts[name] += count
+                return counts
+
+        # Scans run on a QThreadPool thread, and forking a threaded process
+        # can deadlock the child
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            counts = dict.fromkeys(patterns, 0)
+            pending = {
+                executor.submit(_count_file_lines, self.path, *part, dict(patterns))
+                for part in ranges
+            }
+            while pending:
+                if is_cancelled is not None and is_cancelled():
+                    return None
+                done, pending = wait(
+                    pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    for name, count in future.result().items():
+                        counts[name] += count
+            return counts
+        except BrokenProcessPool as e:
+            logger.warning(f"Counting on worker processes failed, counting here: {e}")
+            with self.buffer() as data:
+                return _count_lines(patterns, data, ranges)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_replaced(self) -> bool:
+        """:return: Whether the log file was replaced since it was scanned"""
+        if self.path is None or not self.header:
+            return False
+        with self.buffer() as data:
+            return len(data) < self.size or data[: len(self.header)] != self.header
+
+    def read_lines(self, lines: Sequence[int]) -> list[str]:
+        """
+        :param lines: Numbers of the lines to read
+        :return: The decoded lines, without line breaks
+        """
+        offsets = self.offsets
+        with self.buffer() as data:
+            return [
+                data[offsets[line] : offsets[line + 1]]
+                .decode(ENCODING, errors="ignore")
+                .rstrip("\r\n")
+                for line in lines
+            ]
+
+    def matching_lines(
+        self,
+        patterns: Sequence[re.Pattern[str]],
+        first_line: int = 0,
+        stop_line: int | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> Iterator[tuple[int, array[int]]]:
+        """
+        Find the lines matching all patterns. The lines to search are set
+        when this is called, so the returned iterator can run on another
+        thread.
+
+        :param patterns: Patterns to look for in lines
+        :param first_line: Number of the line to start at
+        :param stop_line: Number of the line to stop before, defaults to the
+            number of lines
+        :param is_cancelled: Stops the search when it returns True
+        :return: For each step of the search, the number of the line it
+            stopped before and the numbers of the lines found
+        """
+        regexes = [line_pattern(pattern) for pattern in patterns]
+        offsets = self.offsets
+        stop_line = self.line_count if stop_line is None else stop_line
+
+        def steps() -> Iterator[tuple[int, array[int]]]:
+            with self.buffer() as data:
+                line = first_line
+                while line < stop_line:
+                    if is_cancelled is not None and is_cancelled():
+                        return
+                    stop = bisect_right(
+                        offsets, offsets[line] + MATCH_CHUNK_SIZE, line + 1, stop_line
+                    )
+                    text = data[offsets[line] : offsets[stop]].decode(
+                        ENCODING, errors="ignore"
+                    )
+                    found = matching_lines_in(regexes[0], text, line)
+                    for regex in regexes[1:]:
+                        if not found:
+                            break
+                        also = set(matching_lines_in(regex, text, line))
+                        found = array("q", (n for n in found if n in also))
+                    yield stop, found
+                    line = stop
+
+        return steps()
+
+    def matching_rows(
+        self,
+        patterns: Sequence[re.Pattern[str]],
+        rows: array[int],
+        first_row: int = 0,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> Iterator[tuple[int, array[int]]]:
+        """
+        Find the rows showing a line that matches all patterns, as returned
+        by ``matching_lines``.
+
+        :param patterns: Patterns to look for in lines
+        :param rows: Numbers of the lines shown from ``first_row`` on
+        :param first_row: Number of the first row to search
+        :param is_cancelled: Stops the search when it returns True
+        :return: For each step of the search, the number of the row it
+            stopped before and the numbers of the rows found
+        """
+        if not rows:
+            return iter(())
+        matches = self.matching_lines(patterns, rows[0], rows[-1] + 1, is_cancelled)
+
+        def steps() -> Iterator[tuple[int, array[int]]]:
+            for stop_line, lines in matches:
+                found = array(
+                    "q",
+                    (
+                        first_row + row
+                        for line in lines
+                        if (row := row_of(rows, line)) is not None
+                    ),
+                )
+                yield first_row + bisect_left(rows, stop_line), found
+
+        return steps()
+
+    def filtered_rows(
+        self,
+        patterns: Sequence[re.Pattern[str]],
+        first_line: int = 0,
+        previous: int | None = None,
+        previous_count: int = 1,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> Iterator[tuple[array[int], dict[int, int]]]:
+        """
+        Lines to show from ``first_line`` on that match all patterns, with
+        runs of repeated lines shown once, as returned by ``collapse``. The
+        lines to search are set when this is called, so the returned
+        iterator can run on another thread.
+
+        :param patterns: Patterns to look for in lines
+        :param first_line: Number of the line to start at
+        :param previous: Number of the line shown before ``first_line``
+        :param previous_count: Length of the run ``previous`` is shown for
+        :param is_cancelled: Stops the search when it returns True
+        :return: For each step of the search that found lines, the numbers
+            of the lines to show and the lengths of the runs
+        """
+        matches = self.matching_lines(patterns, first_line, is_cancelled=is_cancelled)
+
+        def steps() -> Iterator[tuple[array[int], dict[int, int]]]:
+            last, last_count = previous, previous_count
+            for _, lines in matches:
+                rows, counts = self.collapse(lines, last, last_count)
+                if rows:
+                    last, last_count = rows[-1], 1
+                if last is not None:
+                    last_count = counts.get(last, last_count)
+                if rows or counts:
+                    yield rows, counts
+
+        return steps()
+
+    def rows(self, first_line: int = 0) -> tuple[array[int], dict[int, int]]:
+        """
+        Lines to show from ``first_line`` on, with runs of repeated lines
+        shown once.
+
+        :param first_line: Number of the line to start at
+        :return: Numbers of the lines to show, and the length of each run
+            that goes on from ``first_line`` on, by the number of its first
+            line
+        """
+        rows = array("q")
+        counts: dict[int, int] = {}
+        line = first_line
+        for run_line, count in self.repeats.items():
+            if run_line + count <= line:
+                continue
+            if run_line >= line:
+                rows.extend(range(line, run_line + 1))
+            counts[run_line] = count
+            line = run_line + count
+        rows.extend(range(line, self.line_count))
+        return rows, counts
+
+    def collapse(
+        self,
+        lines: Iterable[int],
+        previous: int | None = None,
+        previous_count: int = 1,
+    ) -> tuple[array[int], dict[int, int]]:
+        """
+        Show runs of identical lines among ``lines`` once.
+
+        :param lines: Numbers of lines, in ascending order
+        :param previous: Number of the line shown before ``lines``, which
+            they may repeat
+        :param previous_count: Length of the run ``previous`` is shown for
+        :return: Numbers of the lines to show, and the length of each run,
+            by the number of its first line
+        """
+        rows = array("q")
+        counts: dict[int, int] = {}
+        offsets = self.offsets
+        with self.buffer() as data:
+            last = previous
+            last_content = (
+                data[offsets[previous] : offsets[previous + 1]]
+                if previous is not None
+                else None
+            )
+            for line in lines:
+                content = data[offsets[line] : offsets[line + 1]]
+                if (
+                    last is not None
+                    and content == last_content
+                    and content.endswith(b"\n")
+                ):
+                    counts[last] = (
+                        counts.get(last, previous_count if last == previous else 1) + 1
+                    )
+                else:
+                    rows.append(line)
+                    last, last_content = line, content
+        return rows, counts
+
+
+def row_of(rows: array[int], line: int) -> int | None:
+    """
+    :param rows: Numbers of the lines shown, in ascending order
+    :param line: Number of a line
+    :return: Row the line is shown in, if it is shown
+    """
+    row = bisect_left(rows, line)
+    if row < len(rows) and rows[row] == line:
+        return row
+    return None
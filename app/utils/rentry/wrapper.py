@@ -34,7 +34,8 @@ class HttpClient:
 
     def __init__(self) -> None:
         """Initialize a session for making HTTP requests."""
-        self.session = requests.Session()
+        # Own cookies for the CSRF token, shared keep-alive connections
+        self.session = http.new_session()
 
     def make_request(
         self,
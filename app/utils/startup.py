@@ -0,0 +1,185 @@
+"""
+Stages of application startup.
+
+The main window is shown as soon as it is built, and IO-heavy stages run
+afterwards on the global thread pool. The wall time of every stage is
+recorded, and logged once all of them have finished. Running RimSort with
+the --startup-report flag also prints the timings to stdout.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from loguru import logger
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+STARTUP_REPORT_ENV = "RIMSORT_STARTUP_REPORT"
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    name: str
+    # Seconds since startup began
+    start: float
+    duration: float
+    background: bool = False
+
+
+class StartupTimer:
+    """
+    Records the wall time of startup stages.
+
+    The report is made once the foreground stages are finished and no
+    background stage is running.
+
+    :param clock: Returns the current time in seconds
+    """
+
+    _instance: ClassVar["StartupTimer | None"] = None
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._stages: list[StageTiming] = []
+        self._running: set[str] = set()
+        self._finished = False
+        self._reported = False
+
+    @classmethod
+    def instance(cls) -> "StartupTimer":
+        """:return: The timer of this application run"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def stages(self) -> list[StageTiming]:
+        with self._lock:
+            return list(self._stages)
+
+    @contextmanager
+    def stage(self, name: str, background: bool = False) -> Iterator[None]:
+        """
+        Time the stage run in the context.
+
+        :param name: Name of the stage in the report
+        :param background: Whether the stage runs on a background thread
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            end = self._clock()
+            with self._lock:
+                if not self._reported:
+                    self._stages.append(
+                        StageTiming(name, start - self._origin, end - start, background)
+                    )
+
+    def start_background(self, name: str) -> None:
+        """Delay the report until the background stage is finished."""
+        with self._lock:
+            if not self._reported:
+                self._running.add(name)
+
+    def finish_background(self, name: str) -> None:
+        with self._lock:
+            self._running.discard(name)
+        self._report_if_done()
+
+    def finish(self) -> None:
+        """Mark the foreground stages as finished."""
+        with self._lock:
+            self._finished = True
+        self._report_if_done()
+
+    def report(self) -> str:
+        """:return: A table of the stages in the order they finished"""
+        stages = self.stages
+        total = max((s.start + s.duration for s in stages), default=0.0)
+        width = max((len(s.name) for s in stages), default=5) + len(" (background)")
+        lines = [
+            f"Startup finished in {total:.3f} s",
+            f"  {'stage':<{width}} {'start':>9} {'wall':>9}",
+        ]
+        for s in stages:
+            name = f"{s.name} (background)" if s.background else s.name
+            lines.append(f"  {name:<{width}} {s.start:>7.3f} s {s.duration:>7.3f} s")
+        return "\n".join(lines)
+
+    def _report_if_done(self) -> None:
+        with self._lock:
+            if self._reported or not self._finished or self._running:
+                return
+            self._reported = True
+        report = self.report()
+        logger.info(report)
+        if os.environ.get(STARTUP_REPORT_ENV):
+            print(report, flush=True)
+
+
+class BackgroundStageSignals(QObject):
+    # The return value of the stage, or None if it failed
+    finished = Signal(object)
+
+
+class BackgroundStage(QRunnable):
+    """
+    A startup stage run on a background thread.
+
+    :param name: Name of the stage in the startup report
+    :param target: The work of the stage
+    :param timer: Timer to record the stage with
+    """
+
+    def __init__(
+        self,
+        name: str,
+        target: Callable[[], Any],
+        timer: StartupTimer | None = None,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.target = target
+        self.timer = timer or StartupTimer.instance()
+        self.signals = BackgroundStageSignals()
+        self.timer.start_background(name)
+
+    @Slot()
+    def run(self) -> None:
+        result = None
+        try:
+            with self.timer.stage(self.name, background=True):
+                result = self.target()
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Startup stage '{self.name}' failed")
+        finally:
+            self.timer.finish_background(self.name)
+        self.signals.finished.emit(result)
+
+
+def run_in_background(
+    name: str,
+    target: Callable[[], Any],
+    on_finished: Callable[[Any], None] | None = None,
+) -> BackgroundStage:
+    """
+    Start a startup stage on the global thread pool.
+
+    :param name: Name of the stage in the startup report
+    :param target: The work of the stage
+    :param on_finished: Slot of a QObject on the main thread, called with
+        the return value of the stage
+    :return: The started stage
+    """
+    stage = BackgroundStage(name, target)
+    if on_finished is not None:
+        stage.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(stage)
+    return stage
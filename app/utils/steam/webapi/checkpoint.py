@@ -0,0 +1,201 @@
+"""
+Checkpoint store for Steam Workshop database builds.
+
+A build records every QueryFiles page and every GetDetails chunk it
+completes in an SQLite file next to the output database. A resumed build
+replays the recorded pages and only requests the details that are missing.
+Once a build completes, its checkpoint serves the next build as a cache:
+only new mods and mods whose time_updated changed are requested again.
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from time import time
+from typing import Any
+
+CHECKPOINT_SUFFIX = ".checkpoint.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS query_pages (
+    cursor TEXT PRIMARY KEY,
+    response TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS details (
+    publishedfileid TEXT PRIMARY KEY,
+    time_updated INTEGER NOT NULL,
+    detail TEXT NOT NULL
+);
+"""
+
+
+def checkpoint_path_for(output_database_path: str | Path) -> Path:
+    """
+    :param output_database_path: Path of the database being built
+    :return: Path of the build's checkpoint file, in the same directory
+    """
+    output = Path(output_database_path)
+    return output.with_name(output.name + CHECKPOINT_SUFFIX)
+
+
+class BuildCheckpoint:
+    """
+    Completed QueryFiles pages and GetDetails results of a database build.
+
+    :param path: SQLite file to store the checkpoint in
+    :param appid: AppID being built. A checkpoint of another AppID is discarded.
+    """
+
+    def __init__(self, path: str | Path, appid: int) -> None:
+        self.path = Path(path)
+        self.appid = appid
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(_SCHEMA)
+        if self._get_meta("appid") not in (None, str(appid)):
+            self.reset()
+        self._set_meta("appid", str(appid))
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def reset(self) -> None:
+        """Forget everything, so the next build starts from scratch."""
+        with self._connection:
+            self._connection.execute("DELETE FROM meta")
+            self._connection.execute("DELETE FROM query_pages")
+            self._connection.execute("DELETE FROM details")
+            self._set_meta("appid", str(self.appid))
+
+    def begin(self) -> int | None:
+        """
+        Start a build, or resume the one the checkpoint was recorded by.
+
+        If the recorded build completed, the new build is incremental: the
+        QueryFiles pages are dropped to discover new and removed mods, while
+        the details are kept.
+
+        :return: Start time of the completed build the new one is
+            incremental to, or None if it is a full build
+        """
+        with self._connection:
+            if self._get_meta("completed") is not None:
+                started = self._get_meta("started")
+                self._connection.execute("DELETE FROM query_pages")
+                self._connection.execute("DELETE FROM meta WHERE key = 'completed'")
+                if started is not None:
+                    self._set_meta("updated_since", started)
+                self._set_meta("started", str(int(time())))
+            elif self._get_meta("started") is None:
+                self._set_meta("started", str(int(time())))
+        # Kept until the build completes, so a resumed incremental build
+        # still looks for the updated mods
+        updated_since = self._get_meta("updated_since")
+        return int(updated_since) if updated_since is not None else None
+
+    def complete(self) -> None:
+        """Mark the build as completed."""
+        with self._connection:
+            self._set_meta("completed", str(int(time())))
+            self._connection.execute("DELETE FROM meta WHERE key = 'updated_since'")
+
+    @property
+    def details_count(self) -> int:
+        """Number of mods whose details are recorded."""
+        row = self._connection.execute("SELECT COUNT(*) FROM details").fetchone()
+        return int(row[0])
+
+    def query_page(self, cursor: str) -> dict[str, Any] | None:
+        """
+        :param cursor: Cursor the page was requested with
+        :return: The recorded QueryFiles response, or None
+        """
+        row = self._connection.execute(
+            "SELECT response FROM query_pages WHERE cursor = ?", (cursor,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record_query_page(self, cursor: str, response: dict[str, Any]) -> None:
+        """
+        :param cursor: Cursor the page was requested with
+        :param response: The QueryFiles response
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO query_pages (cursor, response) VALUES (?, ?)",
+                (cursor, json.dumps(response)),
+            )
+
+    def details(self, publishedfileids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        :param publishedfileids: PublishedFileIds to look up
+        :return: The recorded GetDetails result of each one that has one
+        """
+        found: dict[str, dict[str, Any]] = {}
+        wanted = list(dict.fromkeys(publishedfileids))
+        # Stay below SQLite's default limit of host parameters
+        for start in range(0, len(wanted), 500):
+            batch = wanted[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._connection.execute(
+                "SELECT publishedfileid, detail FROM details"
+                f" WHERE publishedfileid IN ({placeholders})",
+                batch,
+            )
+            found.update((pfid, json.loads(detail)) for pfid, detail in rows)
+        return found
+
+    def time_updated(self) -> dict[str, int]:
+        """:return: The recorded time_updated of every mod"""
+        rows = self._connection.execute(
+            "SELECT publishedfileid, time_updated FROM details"
+        )
+        return dict(rows)
+
+    def record_details(self, details: Iterable[dict[str, Any]]) -> None:
+        """
+        Record the result of a GetDetails chunk.
+
+        :param details: publishedfiledetails of the chunk
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO details (publishedfileid, time_updated, detail)"
+                " VALUES (?, ?, ?)",
+                (
+                    (
+                        str(detail["publishedfileid"]),
+                        int(detail.get("time_updated") or 0),
+                        json.dumps(detail),
+                    )
+                    for detail in details
+                ),
+            )
+
+    def discard_details(self, publishedfileids: Iterable[str]) -> None:
+        """
+        Drop recorded details so they are requested again.
+
+        :param publishedfileids: PublishedFileIds whose details are outdated
+        """
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM details WHERE publishedfileid = ?",
+                ((pfid,) for pfid in publishedfileids),
+            )
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
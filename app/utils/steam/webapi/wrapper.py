@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import sys
+import threading
 import traceback
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from logging import WARNING, getLogger
 from math import ceil
 from multiprocessing import Lock, Pool, cpu_count
-from time import sleep, time
+from time import monotonic, sleep, time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -27,6 +29,7 @@ from app.utils.steam.steamworks.wrapper import (
     SteamworksAppDependenciesQuery,
     _pool_init_worker,
 )
+from app.utils.steam.webapi.checkpoint import BuildCheckpoint
 from app.views.dialogue import show_warning
 
 STEAM_THERE_WAS_A_PROBLEM_FLAG = "There was a problem accessing the item. "
@@ -46,6 +49,17 @@ BASE_URL = "https://steamcommunity.com"
 BASE_URL_STEAMFILES = "https://steamcommunity.com/sharedfiles/filedetails/?id="
 BASE_URL_WORKSHOP = "https://steamcommunity.com/workshop/filedetails/?id="
 
+# Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
+GET_DETAILS_CHUNK_SIZE = 200
+# Attempts per GetDetails chunk while Steam answers 429 Too Many Requests
+RATE_LIMIT_ATTEMPTS = 5
+# First wait after a 429 without a Retry-After header, doubled on each attempt
+RATE_LIMIT_BACKOFF = 2.0
+# QueryFiles query_type listing the most recently updated items first
+QUERY_TYPE_RANKED_BY_LAST_UPDATED = 21
+# Allowance for the difference between the local clock and Steam's
+UPDATED_SINCE_MARGIN = 3600
+
 
 class CollectionImport:
     """
@@ -246,6 +260,41 @@ def _find_value_in_dict(coll: dict[str, Any], key: str) -> Any:
     return coll.get(key_found)
 
 
+class _RateLimitCooldown:
+    """A pause shared by all workers of a query after Steam rate limited one."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def extend(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, monotonic() + seconds)
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._until - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+
+def _rate_limit_delay(error: requests.HTTPError, attempt: int) -> float | None:
+    """
+    Return how long to wait before retrying a rate limited request.
+
+    :param error: Error raised for the response
+    :param attempt: Number of the failed attempt, starting at 0
+    :return: Seconds to wait, or None if the error is not a rate limit
+    """
+    response = error.response
+    if response is None or response.status_code != 429:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return RATE_LIMIT_BACKOFF * 2**attempt
+
+
 class DynamicQuery(QObject):
     """
     Create DynamicQuery object to initialize the scraped data from Workshop
@@ -255,6 +304,10 @@ class DynamicQuery(QObject):
     :param life: The lifespan of the Query in terms of the seconds added to the time of
     database generation. This adds an 'expiry' to the data being cached.
     :param get_appid_deps: This toggle determines whether or not to query DLC dependency data
+    :param concurrency: Number of IPublishedFileService/GetDetails chunks fetched
+    at the same time
+    :param checkpoint: Store of completed QueryFiles pages and GetDetails
+    chunks. Recorded results are reused instead of being requested again.
     """
 
     dq_messaging_signal = Signal(str)
@@ -267,6 +320,8 @@ class DynamicQuery(QObject):
         life: int = 0,
         callback: Callable[[str], None] | None = None,
         output_database_path: str = "",
+        concurrency: int = 1,
+        checkpoint: BuildCheckpoint | None = None,
     ) -> None:
         QObject.__init__(self)
 
@@ -284,6 +339,8 @@ class DynamicQuery(QObject):
         self.total = 0
         self.database: dict[str, Any] = {}
         self.callback = callback
+        self.concurrency = max(1, concurrency)
+        self.checkpoint = checkpoint
 
     def __expires(self, life: int) -> int:
         """Returns current epoch + life
@@ -394,7 +451,14 @@ class DynamicQuery(QObject):
         # The API request failed, and we're still here, so initialize the API
         logger.debug("WebAPI is not active!")
         try:  # Try to initialize the API
-            self.api = WebAPI(self.apikey, format="json", https=True)
+            api = WebAPI(
+                self.apikey, format="json", https=True, auto_load_interfaces=False
+            )
+            # Reuse the shared keep-alive connections for every WebAPI call.
+            # Rate limits are waited out by _get_details_chunk, not the adapter
+            http.mount_pool(api.session, retry_rate_limits=False)
+            api.load_interfaces(api.fetch_interfaces())
+            self.api = api
         except Exception as e:  # noqa: BLE001
             self.api = None
             # Catch exceptions that can potentially leak Steam API key
@@ -536,14 +600,86 @@ class DynamicQuery(QObject):
         self._emit_message(f"IPublishedFileService/GetDetails chunk [0/{total}]")
         if not self.api:
             return None
+        recorded = self.checkpoint.details(publishedfileids) if self.checkpoint else {}
+        if recorded:
+            self._emit_message(
+                f"Reusing checkpointed details of {len(recorded)} mods\n"
+            )
+        to_fetch = [pfid for pfid in publishedfileids if pfid not in recorded]
+        items_processed = total - len(to_fetch)
         all_details: list[dict[str, Any]] = []
-        for chunk in chunks(
-            _list=publishedfileids, limit=200
-        ):  # Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
-            chunk_total = len(chunk)
-            items_processed += chunk_total
-            # Uncomment to see the pfids from each chunk
-            # logger.debug(f"{chunk_total} PublishedFileIds in chunk: {chunk}")
+        batches = list(chunks(_list=to_fetch, limit=GET_DETAILS_CHUNK_SIZE))
+        cooldown = _RateLimitCooldown()
+        # Chunks are fetched concurrently but consumed in request order, so the
+        # details (and the database built from them) do not depend on timing
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, max(1, len(batches))),
+            thread_name_prefix="GetDetails",
+        ) as executor:
+            futures = [
+                executor.submit(self._get_details_chunk, chunk, cooldown)
+                for chunk in batches
+            ]
+            for chunk, future in zip(batches, futures, strict=True):
+                items_processed += len(chunk)
+                # Uncomment to see the pfids from each chunk
+                # logger.debug(f"{len(chunk)} PublishedFileIds in chunk: {chunk}")
+                try:
+                    details = future.result()
+                    if self.checkpoint:
+                        self.checkpoint.record_details(details)
+                    all_details.extend(details)
+                except KeyboardInterrupt:
+                    # Do not wait for the chunks that have not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                except Exception as e:  # noqa: BLE001
+                    stacktrace = traceback.format_exc()
+                    if (
+                        e.__class__.__name__ == "HTTPError"
+                        or e.__class__.__name__ == "SSLError"
+                    ):  # requests.exceptions.HTTPError OR urllib3.exceptions.SSLError
+                        pattern = "&key="
+                        stacktrace = stacktrace[
+                            : len(stacktrace)
+                            - (
+                                len(stacktrace)
+                                - (stacktrace.find(pattern) + len(pattern))
+                            )
+                        ]
+                    logger.error(
+                        f"IPublishedFileService/GetDetails errored querying batch [{items_processed}/{total}]: {stacktrace}"
+                    )
+                self._emit_message(
+                    f"IPublishedFileService/GetDetails chunk [{items_processed}/{total}]"
+                )
+        if self.checkpoint:
+            fetched = {str(detail["publishedfileid"]): detail for detail in all_details}
+            all_details = [
+                detail
+                for pfid in publishedfileids
+                if (detail := recorded.get(pfid) or fetched.get(pfid)) is not None
+            ]
+        missing_children = self._process_mod_details(all_details, json_to_update)
+        return json_to_update, missing_children, all_details
+
+    def _get_details_chunk(
+        self, chunk: list[str], cooldown: _RateLimitCooldown
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the publishedfiledetails of one chunk of PublishedFileIds.
+
+        When Steam answers 429 Too Many Requests, every worker of the query
+        pauses for the Retry-After time (or an exponential backoff) before the
+        chunk is requested again.
+
+        :param chunk: PublishedFileIds to query
+        :param cooldown: Pause shared by the workers of the query
+        :return: publishedfiledetails of the chunk
+        """
+        assert self.api is not None
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            cooldown.wait()
             try:
                 response = self.api.call(
                     method_path="IPublishedFileService.GetDetails",
@@ -563,26 +699,17 @@ class DynamicQuery(QObject):
                     includereactions=False,
                     admin_query=False,
                 )
-                all_details.extend(response["response"]["publishedfiledetails"])
-            except Exception as e:  # noqa: BLE001
-                stacktrace = traceback.format_exc()
-                if (
-                    e.__class__.__name__ == "HTTPError"
-                    or e.__class__.__name__ == "SSLError"
-                ):  # requests.exceptions.HTTPError OR urllib3.exceptions.SSLError
-                    pattern = "&key="
-                    stacktrace = stacktrace[
-                        : len(stacktrace)
-                        - (len(stacktrace) - (stacktrace.find(pattern) + len(pattern)))
-                    ]
-                logger.error(
-                    f"IPublishedFileService/GetDetails errored querying batch [{items_processed}/{total}]: {stacktrace}"
+            except requests.HTTPError as e:
+                delay = _rate_limit_delay(e, attempt)
+                if delay is None or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                logger.warning(
+                    f"IPublishedFileService/GetDetails rate limited, retrying in {delay:g}s"
                 )
-            self._emit_message(
-                f"IPublishedFileService/GetDetails chunk [{items_processed}/{total}]"
-            )
-        missing_children = self._process_mod_details(all_details, json_to_update)
-        return json_to_update, missing_children, all_details
+                cooldown.extend(delay)
+                continue
+            return response["response"]["publishedfiledetails"]
+        return []
 
     def IPublishedFileService_QueryFiles(self, cursor: str) -> str:
         """
@@ -608,7 +735,8 @@ class DynamicQuery(QObject):
                 "Tried to query files while API was not properly initialized."
             )  # Exit query
 
-        result = self.api.call(
+        recorded = self.checkpoint.query_page(cursor) if self.checkpoint else None
+        result = recorded or self.api.call(
             method_path="IPublishedFileService.QueryFiles",
             key=self.apikey,
             query_type=1,
@@ -650,6 +778,8 @@ class DynamicQuery(QObject):
             strip_description_bbcode=False,
             admin_query=False,
         )
+        if self.checkpoint and recorded is None:
+            self.checkpoint.record_query_page(cursor, result)
         # Print total mods found we need to iter through paginations to get info for
         if (  # noqa: SIM102
             self.pagenum and self.total == 0
@@ -676,6 +806,85 @@ class DynamicQuery(QObject):
         self.pagenum += 1
         return result["response"]["next_cursor"]
 
+    def IPublishedFileService_QueryFiles_updated_since(
+        self, since: int
+    ) -> dict[str, int]:
+        """
+        Page through the workshop items from the most recently updated on,
+        until the items were last updated before since.
+
+        https://steamapi.xpaw.me/#IPublishedFileService/QueryFiles
+
+        :param since: Epoch seconds
+        :return: time_updated of the items updated since then, by PublishedFileId
+        """
+        if self.api is None:
+            raise Exception(  # noqa: TRY002
+                "Tried to query files while API was not properly initialized."
+            )  # Exit query
+
+        updated: dict[str, int] = {}
+        cursor = "*"
+        while True:
+            response = self.api.call(
+                method_path="IPublishedFileService.QueryFiles",
+                key=self.apikey,
+                query_type=QUERY_TYPE_RANKED_BY_LAST_UPDATED,
+                cursor=cursor,
+                numperpage=100,
+                creator_appid=self.appid,
+                appid=self.appid,
+                filetype=0,
+                ids_only=False,
+                return_children=False,
+                # Without details, items only carry their PublishedFileId
+                return_details=True,
+            )["response"]
+            page = response.get("publishedfiledetails", [])
+            for item in page:
+                time_updated = int(item.get("time_updated", 0))
+                if time_updated < since:
+                    return updated
+                updated[str(item["publishedfileid"])] = time_updated
+            next_cursor = response.get("next_cursor")
+            if not page or not next_cursor or next_cursor == cursor:
+                return updated
+            cursor = next_cursor
+
+    def discard_updated_details(self, since: int) -> None:
+        """
+        Drop the checkpointed details of the mods whose time_updated changed
+        since a previous build, so they are requested again.
+
+        If the updated mods cannot be listed, every checkpointed detail is
+        dropped.
+
+        :param since: Start time of the previous build, in epoch seconds
+        """
+        if self.checkpoint is None:
+            return
+        recorded = self.checkpoint.time_updated()
+        try:
+            updated = self.IPublishedFileService_QueryFiles_updated_since(
+                since - UPDATED_SINCE_MARGIN
+            )
+        except Exception as e:  # noqa: BLE001
+            # The exception may contain the Steam API key, so only log its type
+            logger.warning(
+                f"Could not list updated mods, refetching all details: {e.__class__.__name__}"
+            )
+            self.checkpoint.discard_details(recorded)
+            return
+        stale = [
+            pfid
+            for pfid, time_updated in updated.items()
+            if pfid in recorded and recorded[pfid] != time_updated
+        ]
+        self.checkpoint.discard_details(stale)
+        self._emit_message(
+            f"\n{len(stale)} checkpointed mods were updated since the previous build"
+        )
+
     def _merge_app_deps(
         self, query: dict[str, Any], pfids_appid_deps: dict[int, list[int]]
     ) -> None:
@@ -3,6 +3,7 @@
 # creates a utils→views layer violation. Ideally these functions should accept
 # callbacks or live in the views layer. Inherited from the old metadata.py.
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -41,7 +42,7 @@ class WorkshopUpdateResult:
 
 
 def check_if_pfids_blacklisted(
-    publishedfileids: list[str], steamdb: dict[str, Any]
+    publishedfileids: list[str], steamdb: Mapping[str, Any]
 ) -> list[str]:
     """Filter out blacklisted mods from a list of published file IDs.
 
@@ -1,8 +1,9 @@
+import heapq
 import os
-from functools import partial
+from collections.abc import Callable
 from pathlib import Path
-from threading import Timer
-from typing import Any
+from threading import Condition, Thread
+from time import monotonic
 
 from loguru import logger
 from PySide6.QtCore import QObject, Signal
@@ -15,12 +16,133 @@ from app.controllers.metadata_controller import MetadataController
 from app.models.instance import Instance
 from app.services.mod_path_service import get_mod_paths, resolve_data_source
 
+MOD_CHANGE_OPERATIONS = ("created", "deleted", "updated")
+
+
+class ModChangeDispatcher:
+    """Debounce mod folder changes on one thread and deliver them in batches.
+
+    Each mod path keeps only its latest pending operation, due once no event
+    arrived for it for the cooldown period. Pending paths are ordered in a
+    priority queue by due time. When the first path is due, it is delivered
+    in a single call of the callback together with every path that becomes
+    due within the batch window, so a burst of events ends in one batch.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[str], list[str], list[str]], None],
+        delay: float = 3.0,
+        batch_window: float = 0.5,
+    ) -> None:
+        """
+        :param callback: Called on the dispatcher thread with the created,
+            deleted and updated mod paths of a batch
+        :param delay: Seconds without events before a path is delivered
+        :param batch_window: Seconds a path may be delivered early to join a batch
+        """
+        self.callback = callback
+        self.delay = delay
+        self.batch_window = batch_window
+        self._condition = Condition()
+        # Latest operation and due time of every pending path
+        self._pending: dict[str, tuple[str, float]] = {}
+        # (due time, path) entries, outdated once the path is scheduled again
+        self._queue: list[tuple[float, str]] = []
+        self._thread: Thread | None = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> dict[str, str]:
+        """The pending operation of every path."""
+        with self._condition:
+            return {path: op for path, (op, _) in self._pending.items()}
+
+    def start(self) -> None:
+        """Start the dispatcher thread, unless it is already running."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = Thread(
+                target=self._run, name="WatchdogDispatcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the dispatcher thread and drop all pending changes."""
+        with self._condition:
+            self._stopping = True
+            self._pending.clear()
+            self._queue.clear()
+            thread, self._thread = self._thread, None
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+
+    def schedule(self, operation: str, path: str) -> None:
+        """Schedule an operation for a mod path, replacing its pending one.
+
+        A mod that is updated while its creation is pending stays created.
+
+        :param operation: One of MOD_CHANGE_OPERATIONS
+        :param path: The mod path
+        """
+        with self._condition:
+            previous = self._pending.get(path)
+            if previous is not None and (previous[0], operation) == (
+                "created",
+                "updated",
+            ):
+                operation = "created"
+            due = monotonic() + self.delay
+            self._pending[path] = (operation, due)
+            heapq.heappush(self._queue, (due, path))
+            self._condition.notify()
+
+    def flush(self) -> tuple[list[str], list[str], list[str]]:
+        """Take the changes that are due, grouped by operation.
+
+        :return: Created, deleted and updated mod paths
+        """
+        with self._condition:
+            return self._take_due(monotonic())
+
+    def _take_due(self, now: float) -> tuple[list[str], list[str], list[str]]:
+        batch: dict[str, list[str]] = {op: [] for op in MOD_CHANGE_OPERATIONS}
+        while self._queue and self._queue[0][0] <= now + self.batch_window:
+            due, path = heapq.heappop(self._queue)
+            pending = self._pending.get(path)
+            if pending is None or pending[1] != due:
+                # Superseded by a later event for the same path
+                continue
+            del self._pending[path]
+            batch[pending[0]].append(path)
+        return batch["created"], batch["deleted"], batch["updated"]
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    now = monotonic()
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    timeout = self._queue[0][0] - now if self._queue else None
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+                batch = self._take_due(monotonic())
+            if any(batch):
+                try:
+                    self.callback(*batch)
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(f"Unable to dispatch mod changes: {e!s}")
+
 
 class WatchdogHandler(FileSystemEventHandler, QObject):
     acf_changed = Signal(bool, bool)
-    mod_created = Signal(str, str)
-    mod_deleted = Signal(str, str)
-    mod_updated = Signal(str, str)
+    # Batched mod folder changes: created, deleted and updated mod paths
+    mods_changed = Signal(list, list, list)
 
     def __init__(self, instance: Instance) -> None:
         """Initialize the WatchdogHandler.
@@ -40,6 +162,13 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
             str(workshop_acf) if workshop_acf is not None else None
         )
         self.steamcmd_appworkshop_acf_path = self.metadata_controller.steamcmd_acf_path
+        # Resolve the tracked .acf paths once instead of on every event
+        self._workshop_acf_resolved = (
+            Path(self.workshop_acf_path).resolve()
+            if self.workshop_acf_path is not None
+            else None
+        )
+        self._steamcmd_acf_resolved = Path(self.steamcmd_appworkshop_acf_path).resolve()
         self._instance = instance
         # Steam .acf file monitoring
         self.watchdog_acf_observer: BaseObserver | None
@@ -47,18 +176,19 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
         # Mod directory monitoring
         self.watchdog_mods_observer: BaseObserver | None
         self.watchdog_mods_observer = Observer()
-        # Keep track of cooldowns for each mod path
-        self.cooldown_timers: dict[str, Any] = {}
+        # Debounces mod changes and emits them in batches
+        self.dispatcher = ModChangeDispatcher(self.mods_changed.emit)
         self.__add_acf_observers()
         self.__add_mod_observers(get_mod_paths(self._instance))
 
     def start(self) -> None:
-        """Start all configured observers.
+        """Start all configured observers and the mod change dispatcher.
 
         Each observer is only started if it exists and is not already alive.
         Logs a warning if an observer is None or already running.
         """
         try:
+            self.dispatcher.start()
             if self.watchdog_acf_observer is not None:
                 if self.watchdog_acf_observer.is_alive():
                     logger.warning("Watchdog Steam .acf Observer is already running.")
@@ -79,7 +209,7 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
             )
 
     def stop(self) -> None:
-        """Stop all observers and cancel pending cooldown timers."""
+        """Stop all observers and the dispatcher, dropping pending mod changes."""
         if self.watchdog_acf_observer is not None:
             if self.watchdog_acf_observer.is_alive():
                 self.watchdog_acf_observer.stop()
@@ -90,10 +220,7 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
                 self.watchdog_mods_observer.stop()
                 self.watchdog_mods_observer.join()
             self.watchdog_mods_observer = None
-        timers = list(self.cooldown_timers.values())
-        self.cooldown_timers.clear()
-        for timer in timers:
-            timer.cancel()
+        self.dispatcher.stop()
 
     def __add_acf_observers(self) -> None:
         """Add observers to the watchdog observer for applicable Steam .acf files.
@@ -145,24 +272,17 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
         :rtype: bool
         """
 
+        # Most events are for mod files, so skip resolving them
+        if event.is_directory or event_scr_path.suffix != ".acf":
+            return False
         # Normalize the paths that are being compared
         event_scr_path = event_scr_path.resolve()
-        workshop_acf_resolved = (
-            Path(self.workshop_acf_path).resolve()
-            if self.workshop_acf_path is not None
-            else None
-        )
-        steamcmd_appworkshop_acf_path = Path(
-            self.steamcmd_appworkshop_acf_path
-        ).resolve()
+        workshop_acf_resolved = self._workshop_acf_resolved
+        steamcmd_appworkshop_acf_path = self._steamcmd_acf_resolved
         # Explicitly check if the file created is an .acf file that we track metadata from
         if (
-            not event.is_directory
-            and event_scr_path.suffix == ".acf"
-            and (
-                event_scr_path == workshop_acf_resolved
-                or event_scr_path == steamcmd_appworkshop_acf_path
-            )
+            event_scr_path == workshop_acf_resolved
+            or event_scr_path == steamcmd_appworkshop_acf_path
         ):
             logger.debug(f"ACF file change detected: {event_scr_path}")
             logger.debug(f"Event: {event}")
@@ -173,37 +293,19 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
             return True
         return False
 
-    def __cooldown_mod_change(
-        self, callback: dict[str, str], delay: float = 3.0
-    ) -> None:
-        """Execute a callback after a cooldown period. A cooldown period is used
-        to prevent rapid-fire events from triggering multiple callbacks.
+    def __cooldown_mod_change(self, operation: str, mod_path: str) -> None:
+        """Queue a mod change to be emitted once events for the mod stop arriving.
+        A cooldown period is used to prevent rapid-fire events from triggering
+        multiple callbacks.
 
-        :param callback: A dictionary containing the operation, data_source, and mod path.
-        :type callback: dict[str, str]
-        :param delay: The number of seconds to wait before executing the callback. Defaults to 3.0.
-        :type delay: float
+        :param operation: The change, one of "created", "deleted" or "updated".
+        :type operation: str
+        :param mod_path: The mod path.
+        :type mod_path: str
 
         :return: None
         """
-        operation = callback["operation"]
-        mod_path = callback["path"]
-        data_source = callback.get("data_source", "")
-
-        # Cancel any existing timers for this key
-        timer = self.cooldown_timers.get(mod_path)
-        if timer:
-            timer.cancel()
-        # Construct cooldown timer for the given operation from the callback and start it
-        self.cooldown_timers[mod_path] = Timer(
-            delay,
-            partial(
-                getattr(self, f"mod_{operation}").emit,
-                data_source,
-                mod_path,
-            ),
-        )
-        self.cooldown_timers[mod_path].start()
+        self.dispatcher.schedule(operation, mod_path)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """A function called when a file or directory is created.
@@ -230,13 +332,7 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
             logger.debug(f"Mod directory created: {event_scr_path_str}")
             logger.debug(f"Mod data source: {data_source}")
             # Signal mod creation
-            self.__cooldown_mod_change(
-                callback={
-                    "operation": "created",
-                    "data_source": data_source or "",
-                    "path": event_scr_path_str,
-                }
-            )
+            self.__cooldown_mod_change("created", event_scr_path_str)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """A function called when a file or directory is deleted.
@@ -257,12 +353,7 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
         )
         if is_known_mod:
             logger.debug(f"Mod directory deleted: {event_scr_path_str}")
-            self.__cooldown_mod_change(
-                callback={
-                    "operation": "deleted",
-                    "path": event_scr_path_str,
-                }
-            )
+            self.__cooldown_mod_change("deleted", event_scr_path_str)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """A function called when a file or directory is modified.
@@ -284,9 +375,4 @@ class WatchdogHandler(FileSystemEventHandler, QObject):
             )
             if mod_path is not None:
                 logger.debug(f"Mod metadata modified: {event_scr_path_str}")
-                self.__cooldown_mod_change(
-                    callback={
-                        "operation": "updated",
-                        "path": mod_path,
-                    }
-                )
+                self.__cooldown_mod_change("updated", mod_path)
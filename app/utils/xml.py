@@ -1,13 +1,20 @@
 import gzip
 import os
 import xml.etree.ElementTree as ET
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from xml.dom import minidom
 
 import zstandard as zstd
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from app.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+else:
+    # Only needed when xml.etree.ElementTree fails to parse a file
+    bs4 = lazy_import("bs4")
+
 
 def etree_to_dict(t: Any) -> dict[str, Any]:
     """
@@ -108,7 +115,7 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
         logger.debug("Trying to parse with BeautifulSoup as a fallback")
         try:
             with __open_file_maybe_compressed(path) as f:
-                soup = BeautifulSoup(f.read(), "lxml-xml")
+                soup = bs4.BeautifulSoup(f.read(), "lxml-xml")
                 # Find and remove empty tags
                 empty_tags = soup.find_all(
                     lambda tag: not tag.text.strip() or len(tag) == 0
@@ -154,7 +154,19 @@ class FileSearchDialog(QDialog):
 
         search_options_column.addWidget(self.xml_only)
         search_options_column.addWidget(self.case_sensitive)
+        self.use_index = QCheckBox(self.tr("Use search index"))
+        self.use_index.setChecked(True)
+        self.use_index.setToolTip(
+            self.tr(
+                "Answer searches from an index of mod file contents.\n"
+                "The index is built in the background after a search and\n"
+                "kept up to date as mods change. Regex searches, and searches\n"
+                "for fewer than 3 characters, always scan the files."
+            )
+        )
+
         search_options_column.addWidget(self.use_regex)
+        search_options_column.addWidget(self.use_index)
         search_options_column.addStretch()
 
         # Connect regex checkbox
@@ -647,6 +659,7 @@ class FileSearchDialog(QDialog):
             "algorithm": algorithm,
             "case_sensitive": self.case_sensitive.isChecked(),
             "use_regex": self.use_regex.isChecked(),
+            "use_index": self.use_index.isChecked(),
             "recursive": True,  # Always do recursive search
             "file_type": file_type,
             "file_extensions": selected_extensions,
@@ -680,60 +693,58 @@ class FileSearchDialog(QDialog):
     def add_result(
         self, mod_name: str, file_name: str, path: str, preview: str = ""
     ) -> None:
-        """Add a search result to the table with improved performance and error handling."""
-        try:
-            # Batch insertion for better performance
-            current_row = self.results_table.rowCount()
-            batch_size = 10  # Increased batch size for efficiency
-
-            if current_row % batch_size == 0:
-                self.results_table.setSortingEnabled(False)
-                self.results_table.setUpdatesEnabled(False)
-
-            # Insert new row
-            row = current_row
-            self.results_table.insertRow(row)
-
-            # Truncate preview intelligently
-            max_preview_length = 1000
-            if len(preview) > max_preview_length:
-                cutoff = preview.rfind("\n", 0, max_preview_length)
-                cutoff = (
-                    cutoff if cutoff > max_preview_length // 2 else max_preview_length
-                )
-                preview = preview[:cutoff] + "\n... [Preview truncated]"
-
-            # Create table items
-            mod_item = QTableWidgetItem(mod_name)
-            file_item = QTableWidgetItem(file_name)
-            path_item = QTableWidgetItem(path)
-            preview_item = QTableWidgetItem(preview)
-
-            # Set tooltips and formatting
-            mod_item.setToolTip(f"Mod: {mod_name}")
-            file_item.setToolTip(f"File: {file_name}")
-            path_item.setToolTip(f"Path: {path}")
-            preview_item.setToolTip(self.tr("Right-click for actions"))
-            preview_item.setFont(QFont("Courier New", 9))
-            preview_item.setFlags(preview_item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-
-            # Add items to table
-            self.results_table.setItem(row, 0, mod_item)
-            self.results_table.setItem(row, 1, file_item)
-            self.results_table.setItem(row, 2, path_item)
-            self.results_table.setItem(row, 3, preview_item)
-
-            # Re-enable updates and sorting at batch boundaries
-            if (
-                current_row % batch_size == batch_size - 1
-                or current_row == self.results_table.rowCount() - 1
-            ):
-                self.results_table.setUpdatesEnabled(True)
-                self.results_table.setSortingEnabled(True)
+        """Add a search result to the table."""
+        self.add_results([(mod_name, file_name, path, preview)])
 
+    def add_results(self, results: list[tuple[str, str, str, str]]) -> None:
+        """
+        Add a batch of search results to the table, repainting and sorting once.
+
+        :param results: (mod_name, file_name, path, preview) of each result
+        """
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            for mod_name, file_name, path, preview in results:
+                self._insert_result_row(mod_name, file_name, path, preview)
         except Exception as e:  # noqa: BLE001
             logger.error(f"Error adding result: {e}")
+        finally:
             self.results_table.setUpdatesEnabled(True)
+            self.results_table.setSortingEnabled(True)
+
+    def _insert_result_row(
+        self, mod_name: str, file_name: str, path: str, preview: str
+    ) -> None:
+        row = self.results_table.rowCount()
+        self.results_table.insertRow(row)
+
+        # Truncate preview intelligently
+        max_preview_length = 1000
+        if len(preview) > max_preview_length:
+            cutoff = preview.rfind("\n", 0, max_preview_length)
+            cutoff = cutoff if cutoff > max_preview_length // 2 else max_preview_length
+            preview = preview[:cutoff] + "\n... [Preview truncated]"
+
+        # Create table items
+        mod_item = QTableWidgetItem(mod_name)
+        file_item = QTableWidgetItem(file_name)
+        path_item = QTableWidgetItem(path)
+        preview_item = QTableWidgetItem(preview)
+
+        # Set tooltips and formatting
+        mod_item.setToolTip(f"Mod: {mod_name}")
+        file_item.setToolTip(f"File: {file_name}")
+        path_item.setToolTip(f"Path: {path}")
+        preview_item.setToolTip(self.tr("Right-click for actions"))
+        preview_item.setFont(QFont("Courier New", 9))
+        preview_item.setFlags(preview_item.flags() ^ Qt.ItemFlag.ItemIsEditable)
+
+        # Add items to table
+        self.results_table.setItem(row, 0, mod_item)
+        self.results_table.setItem(row, 1, file_item)
+        self.results_table.setItem(row, 2, path_item)
+        self.results_table.setItem(row, 3, preview_item)
 
     def clear_results(self) -> None:
         """clear all results from the table"""
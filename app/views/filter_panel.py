@@ -619,7 +619,7 @@ class FilterButton(QToolButton):
         self._badge_label.hide()
 
         # Create the filter panel
-        self.filter_panel = FilterPanel()
+        self.filter_panel = FilterPanel(self)
         self.filter_panel.filters_changed.connect(self._update_badge)
 
         self.clicked.connect(self._show_panel)
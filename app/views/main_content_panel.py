@@ -9,7 +9,7 @@ import webbrowser
 from collections.abc import Callable
 from functools import partial
 from pathlib import Path
-from typing import Any, Literal, Optional, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast, overload
 
 from loguru import logger
 from PySide6.QtCore import (
@@ -62,10 +62,10 @@ from app.utils.generic import (
     upload_log_to_privatebin,
 )
 from app.utils.json_utils import atomic_json_dump
+from app.utils.lazy_import import lazy_import
 from app.utils.rentry.wrapper import RentryImport
 from app.utils.startup_impact import invalidate_startup_impact_cache
 from app.utils.steam.availability import check_steam_available
-from app.utils.steam.steambrowser.browser import SteamBrowser
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.steam.steamworks.wrapper import (
     SteamworksGameLaunch,
@@ -104,6 +104,12 @@ from app.windows.runner_panel import RunnerPanel
 from app.windows.use_this_instead_panel import UseThisInsteadPanel
 from app.windows.workshop_mod_updater_panel import WorkshopModUpdaterPanel
 
+if TYPE_CHECKING:
+    from app.utils.steam.steambrowser import browser
+else:
+    # QtWebEngine is only loaded when the Steam Workshop browser is opened
+    browser = lazy_import("app.utils.steam.steambrowser.browser")
+
 
 class MainContent(QObject):
     """
@@ -149,7 +155,7 @@ class MainContent(QObject):
 
     def _init_services(self) -> None:
         self.db_builder = DatabaseBuilder(self.settings)
-        self.steam_browser: SteamBrowser | None = None
+        self.steam_browser: browser.SteamBrowser | None = None
         self._workshop_restore_target: QWidget | None = None
         self.steamcmd_runner: RunnerPanel | None = None
         self.steamcmd_wrapper = SteamcmdInterface.instance()
@@ -279,16 +285,13 @@ class MainContent(QObject):
         EventBus().do_optimize_textures.connect(self._do_optimize_textures)
         EventBus().do_delete_dds_textures.connect(self._do_delete_dds_textures)
 
-        self.metadata_controller.mod_created_signal.connect(
-            self.mods_panel.on_mod_created
-        )
         self.metadata_controller.mod_deleted_signal.connect(
             self.mods_panel.on_mod_deleted
         )
-        self.metadata_controller.mod_metadata_updated_signal.connect(
-            self.mods_panel.on_mod_metadata_updated
-        )
         self.metadata_controller.metadata_refreshed.connect(self._on_metadata_refreshed)
+        self.metadata_controller.metadata_changed.connect(
+            self.mods_panel.on_metadata_changed
+        )
         self.mods_panel.active_mods_list.key_press_signal.connect(
             self.__handle_active_mod_key_press
         )
@@ -375,8 +378,8 @@ class MainContent(QObject):
         self.window_manager.close_all()
 
     def do_metadata_refresh_cache(self) -> None:
-        """Force Refresh metadata cache"""
-        self.metadata_controller.refresh_metadata()
+        """Refresh the metadata cache, re-parsing only mods that changed on disk"""
+        self.metadata_controller.refresh_metadata_incremental()
 
     def check_if_essential_paths_are_set(self, prompt: bool = True) -> bool:
         """
@@ -1966,7 +1969,7 @@ class MainContent(QObject):
                 self.steam_browser.destroyed.connect(self._on_steam_browser_restore)
             return
 
-        self.steam_browser = SteamBrowser(
+        self.steam_browser = browser.SteamBrowser(
             startpage,
             self.metadata_controller,
             self.settings,
@@ -35,6 +35,7 @@ from app.utils.acf_utils import refresh_acf_metadata
 from app.utils.app_info import AppInfo
 from app.utils.event_bus import EventBus
 from app.utils.gui_info import GUIInfo
+from app.utils.startup import StartupTimer
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.watchdog import WatchdogHandler
 from app.utils.window_launch_state import apply_window_launch_state
@@ -113,6 +114,7 @@ class MainWindow(QMainWindow):
         self.main_content_panel.stop_watchdog_signal.connect(self.shutdown_watchdog)
 
         self.bottom_panel = Status()
+        EventBus().do_show_status_message.connect(self.bottom_panel.actions_slot)
 
         # Create and add the Main Content panel tab
         self.main_content_tab = QWidget()
@@ -305,7 +307,8 @@ class MainWindow(QMainWindow):
             self.settings.current_instance
         )
         # REFRESH CONFIGURED METADATA
-        self.main_content_panel._do_refresh(is_initial=is_initial)
+        with StartupTimer.instance().stage("Refresh metadata"):
+            self.main_content_panel._do_refresh(is_initial=is_initial)
         # If the window was closed during scanning, skip remaining initialization
         if not self.isVisible():
             return
@@ -400,14 +403,8 @@ class MainWindow(QMainWindow):
         self.watchdog_event_handler.acf_changed.connect(
             partial(refresh_acf_metadata, self.main_content_panel.metadata_controller)
         )
-        self.watchdog_event_handler.mod_created.connect(
-            self.main_content_panel.metadata_controller.process_creation
-        )
-        self.watchdog_event_handler.mod_deleted.connect(
-            self.main_content_panel.metadata_controller.process_deletion
-        )
-        self.watchdog_event_handler.mod_updated.connect(
-            self.main_content_panel.metadata_controller.process_update
+        self.watchdog_event_handler.mods_changed.connect(
+            self.main_content_panel.metadata_controller.process_changes
         )
         self.watchdog_event_handler.start()
 
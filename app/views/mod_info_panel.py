@@ -605,6 +605,8 @@ class ModInfoPanel:
         new_notes = self.notes.toPlainText()
         mod_data = self.current_mod_item.data(Qt.ItemDataRole.UserRole)
         mod_data["user_notes"] = new_notes
+        # Lets the mod list pick up the new notes for its search index
+        self.current_mod_item.setData(Qt.ItemDataRole.UserRole, mod_data)
         # Update Aux DB
         path = mod_data["path"]
         if not path:
@@ -5,16 +5,20 @@ from functools import partial
 from pathlib import Path
 from shutil import copy2, copytree
 from traceback import format_exc
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from loguru import logger
 from platformdirs import PlatformDirs
 from PySide6.QtCore import (
+    QAbstractItemModel,
     QEvent,
     QItemSelection,
     QKeyCombination,
     QModelIndex,
     QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QRect,
     QRectF,
     QSize,
     Qt,
@@ -31,9 +35,13 @@ from PySide6.QtGui import (
     QEnterEvent,
     QFocusEvent,
     QFontMetrics,
+    QHelpEvent,
     QIcon,
     QKeyEvent,
     QKeySequence,
+    QMouseEvent,
+    QPainter,
+    QPalette,
     QResizeEvent,
 )
 from PySide6.QtWidgets import (
@@ -54,18 +62,22 @@ from PySide6.QtWidgets import (
     QProgressDialog,
     QPushButton,
     QSplitter,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QToolButton,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
-from rapidfuzz import fuzz
-from sqlalchemy import text
 
 from app.controllers.metadata_controller import MetadataController
 from app.controllers.metadata_db_controller import AuxMetadataController
 from app.models.divider import DividerData, generate_divider_uuid, is_divider_uuid
 from app.models.filter_state import FilterState
 from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod, ModType
+from app.models.mod_list_validation import ModListValidationIndex
+from app.models.mod_search_index import ModSearchEntry, ModSearchIndex
 from app.models.settings import Settings
 from app.sort.mod_sorting import (
     _FOLDER_SIZE_CACHE,
@@ -120,6 +132,102 @@ from app.views.divider_widget import DividerItemInner
 from app.views.filter_panel import FilterButton
 
 
+def mod_tool_tip_text(
+    metadata_controller: MetadataController,
+    settings: Settings,
+    path: str,
+    tags: list[str] | None = None,
+) -> str:
+    """
+    Compose the tooltip text shown when hovering a mod in a mod list.
+
+    :param metadata_controller: MetadataController to look the mod up in
+    :param settings: an instance of Settings for accessing the aux DB
+    :param path: str, the path of the mod
+    :param tags: the mod's user tags, read from the aux DB if None
+    :return: string containing the tool_tip_text
+    """
+    mod = metadata_controller.get_mod(path)
+
+    name_line = f"Mod: {mod.name if mod is not None else 'Not specified'}\n"
+
+    if tags is None:
+        tags = auxdb_get_mod_tags(settings, path)
+    tags_line = f"Tags: {', '.join(tags) if tags else 'None'}\n"
+
+    if isinstance(mod, AboutXmlMod) and mod.authors:
+        authors_text = ", ".join(mod.authors)
+    else:
+        authors_text = "Not specified"
+    author_line = f"Authors: {authors_text}\n"
+
+    package_id = (
+        str(mod.package_id) if isinstance(mod, AboutXmlMod) else "Not specified"
+    )
+    package_id_line = f"PackageID: {package_id}\n"
+
+    mod_version = (
+        mod.mod_version
+        if isinstance(mod, AboutXmlMod) and mod.mod_version
+        else "Not specified"
+    )
+    modversion_line = f"Mod Version: {mod_version}\n"
+
+    if mod is not None and mod.supported_versions:
+        supported_versions_text = ", ".join(sorted(mod.supported_versions))
+    else:
+        supported_versions_text = "Not specified"
+    supported_versions_line = f"Supported Versions: {supported_versions_text}\n"
+
+    mod_path_str = (
+        str(mod.mod_path)
+        if mod is not None and mod.mod_path is not None
+        else "Not specified"
+    )
+    path_line = f"Path: {mod_path_str}\n"
+
+    # Add folder size and filesystem modification time information without heavy IO on hover
+    # Folder size: read from in-memory cache only; avoid computing on tooltip
+    folder_size_line = "Folder Size: Not available\n"
+    if mod is not None and mod.mod_path is not None:
+        cached = _FOLDER_SIZE_CACHE.get(str(mod.mod_path))
+        if cached:
+            folder_size_line = f"Folder Size: {format_file_size(cached[1])}\n"
+
+    # Filesystem modified time: prefer cached metadata value
+    fs_time_val = mod.internal_time_touched if mod is not None else None
+    if isinstance(fs_time_val, int) and fs_time_val > 0:
+        try:
+            dt_fs = datetime.fromtimestamp(fs_time_val)  # noqa: DTZ006
+            formatted_time = dt_fs.strftime("%Y-%m-%d %H:%M:%S")
+            last_touched_line = f"Filesystem Modified: {formatted_time}"
+        except (ValueError, OSError, OverflowError):
+            last_touched_line = "Filesystem Modified: Invalid timestamp"
+    else:
+        last_touched_line = "Filesystem Modified: Not available"
+
+    return f"{name_line}{tags_line}{author_line}{package_id_line}{modversion_line}{folder_size_line}{supported_versions_line}{path_line}{last_touched_line}"
+
+
+def mod_source_icon(mod: ListedMod | None) -> QIcon:
+    """
+    Return the QIcon for a mod's source type (expansion, workshop, or local mod).
+
+    :param mod: the mod, or None if it is unknown
+    :return: QIcon object set to the path of the corresponding icon image
+    """
+    if mod is not None:
+        if mod.mod_type == ModType.LUDEON:
+            return ModListIcons.ludeon_icon()
+        elif mod.mod_type in (ModType.LOCAL, ModType.GIT, ModType.STEAM_CMD):
+            return ModListIcons.local_icon()
+        elif mod.mod_type == ModType.STEAM_WORKSHOP:
+            return ModListIcons.steam_icon()
+    package_id = str(mod.package_id) if isinstance(mod, AboutXmlMod) else "unknown"
+    logger.error(f"No type found for mod list item with package id {package_id}")
+    return ModListIcons.local_icon()
+
+
 class ModListItemInner(QWidget):
     """
     Subclass for QWidget. Used to store data for a single
@@ -485,65 +593,7 @@ class ModListItemInner(QWidget):
 
         :return: string containing the tool_tip_text
         """
-        mod = self.metadata_controller.get_mod(self.path)
-
-        name_line = f"Mod: {mod.name if mod is not None else 'Not specified'}\n"
-
-        tags = auxdb_get_mod_tags(self.settings, self.path)
-        tags_line = f"Tags: {', '.join(tags) if tags else 'None'}\n"
-
-        if isinstance(mod, AboutXmlMod) and mod.authors:
-            authors_text = ", ".join(mod.authors)
-        else:
-            authors_text = "Not specified"
-        author_line = f"Authors: {authors_text}\n"
-
-        package_id = (
-            str(mod.package_id) if isinstance(mod, AboutXmlMod) else "Not specified"
-        )
-        package_id_line = f"PackageID: {package_id}\n"
-
-        mod_version = (
-            mod.mod_version
-            if isinstance(mod, AboutXmlMod) and mod.mod_version
-            else "Not specified"
-        )
-        modversion_line = f"Mod Version: {mod_version}\n"
-
-        if mod is not None and mod.supported_versions:
-            supported_versions_text = ", ".join(sorted(mod.supported_versions))
-        else:
-            supported_versions_text = "Not specified"
-        supported_versions_line = f"Supported Versions: {supported_versions_text}\n"
-
-        mod_path_str = (
-            str(mod.mod_path)
-            if mod is not None and mod.mod_path is not None
-            else "Not specified"
-        )
-        path_line = f"Path: {mod_path_str}\n"
-
-        # Add folder size and filesystem modification time information without heavy IO on hover
-        # Folder size: read from in-memory cache only; avoid computing on tooltip
-        folder_size_line = "Folder Size: Not available\n"
-        if mod is not None and mod.mod_path is not None:
-            cached = _FOLDER_SIZE_CACHE.get(str(mod.mod_path))
-            if cached:
-                folder_size_line = f"Folder Size: {format_file_size(cached[1])}\n"
-
-        # Filesystem modified time: prefer cached metadata value
-        fs_time_val = mod.internal_time_touched if mod is not None else None
-        if isinstance(fs_time_val, int) and fs_time_val > 0:
-            try:
-                dt_fs = datetime.fromtimestamp(fs_time_val)  # noqa: DTZ006
-                formatted_time = dt_fs.strftime("%Y-%m-%d %H:%M:%S")
-                last_touched_line = f"Filesystem Modified: {formatted_time}"
-            except (ValueError, OSError, OverflowError):
-                last_touched_line = "Filesystem Modified: Invalid timestamp"
-        else:
-            last_touched_line = "Filesystem Modified: Not available"
-
-        return f"{name_line}{tags_line}{author_line}{package_id_line}{modversion_line}{folder_size_line}{supported_versions_line}{path_line}{last_touched_line}"
+        return mod_tool_tip_text(self.metadata_controller, self.settings, self.path)
 
     def get_icon(self) -> QIcon:
         """
@@ -552,17 +602,7 @@ class ModListItemInner(QWidget):
 
         :return: QIcon object set to the path of the corresponding icon image
         """
-        mod = self.metadata_controller.get_mod(self.path)
-        if mod is not None:
-            if mod.mod_type == ModType.LUDEON:
-                return ModListIcons.ludeon_icon()
-            elif mod.mod_type in (ModType.LOCAL, ModType.GIT, ModType.STEAM_CMD):
-                return ModListIcons.local_icon()
-            elif mod.mod_type == ModType.STEAM_WORKSHOP:
-                return ModListIcons.steam_icon()
-        package_id = str(mod.package_id) if isinstance(mod, AboutXmlMod) else "unknown"
-        logger.error(f"No type found for ModListItemInner with package id {package_id}")
-        return ModListIcons.local_icon()
+        return mod_source_icon(self.metadata_controller.get_mod(self.path))
 
     def resizeEvent(self, event: QResizeEvent, icon_count: int = -1) -> None:
         """
@@ -1143,6 +1183,390 @@ class ModListIcons:
         return cls._clear_icon
 
 
+class _RowPart(NamedTuple):
+    """A piece of a painted mod row: an icon or a short text with its tooltip."""
+
+    kind: str
+    rect: QRect
+    icon: QIcon | None = None
+    text: str = ""
+    tooltip: str = ""
+    color: QColor | None = None
+
+
+class ModListItemDelegate(QStyledItemDelegate):
+    """
+    Paints mod rows of a ModListWidget without a ModListItemInner per row.
+
+    Used when the mod_list_paint_rows setting was enabled on the last rebuild
+    of the list. Every paint reads the item's UserRole metadata and the mod's
+    metadata, and draws the same icons, name, tags, colors and error/warning
+    badges as ModListItemInner.
+    Tooltips and clicks on the badges are resolved against the same row
+    layout. Dividers and lists in widget mode are painted by the base class.
+    """
+
+    ICON_SIZE = 20
+
+    toggle_warning_signal = Signal(str, str)
+
+    def __init__(self, list_widget: "ModListWidget") -> None:
+        super().__init__(list_widget)
+        self.list_widget = list_widget
+
+    def _paints(self, index: QModelIndex | QPersistentModelIndex) -> bool:
+        if not self.list_widget.paint_rows:
+            return False
+        data = index.data(Qt.ItemDataRole.UserRole)
+        return data is not None and not getattr(data, "is_divider", False)
+
+    def _text_part(
+        self,
+        kind: str,
+        text: str,
+        tooltip: str,
+        metrics: QFontMetrics,
+        color: QColor | None = None,
+    ) -> _RowPart:
+        width = metrics.horizontalAdvance(text) + 6
+        return _RowPart(kind, QRect(0, 0, width, 0), None, text, tooltip, color)
+
+    def _icon_part(self, kind: str, icon: QIcon, tooltip: str = "") -> _RowPart:
+        return _RowPart(kind, QRect(0, 0, self.ICON_SIZE, 0), icon, "", tooltip)
+
+    def row_parts(
+        self, option: QStyleOptionViewItem, data: CustomListWidgetItemMetadata
+    ) -> list[_RowPart]:
+        """
+        Lay out the icons and texts of a mod row, left to right.
+
+        Mirrors the layout of ModListItemInner: source and type icons, the
+        elided name and tags, then the indicators and badges.
+
+        :param option: the style option holding the row rectangle and font
+        :param data: the item's UserRole metadata
+        :return: the row's parts, positioned inside option.rect
+        """
+        settings = self.list_widget.settings
+        mod = self.list_widget.metadata_controller.get_mod(data["path"])
+        metrics = QFontMetrics(option.font)
+
+        leading: list[_RowPart] = []
+        if mod is not None and mod.mod_type == ModType.GIT:
+            leading.append(
+                self._icon_part(
+                    "git",
+                    ModListIcons.git_icon(),
+                    self.tr("Local mod that contains a git repository"),
+                )
+            )
+        elif mod is not None and mod.mod_type == ModType.STEAM_CMD:
+            leading.append(
+                self._icon_part(
+                    "steamcmd",
+                    ModListIcons.steamcmd_icon(),
+                    self.tr("Local mod that can be used with SteamCMD"),
+                )
+            )
+        else:
+            source_tooltips = {
+                ModType.LUDEON: self.tr("Official RimWorld content by Ludeon Studios"),
+                ModType.LOCAL: self.tr("Installed locally"),
+                ModType.STEAM_WORKSHOP: self.tr("Subscribed via Steam"),
+            }
+            leading.append(
+                self._icon_part(
+                    "source",
+                    mod_source_icon(mod),
+                    source_tooltips.get(mod.mod_type, "") if mod is not None else "",
+                )
+            )
+        if settings.mod_type_filter:
+            if mod is not None and mod.c_sharp_mod:
+                leading.append(
+                    self._icon_part(
+                        "csharp",
+                        ModListIcons.csharp_icon(),
+                        self.tr("Contains custom C# assemblies (custom code)"),
+                    )
+                )
+            else:
+                leading.append(
+                    self._icon_part(
+                        "xml",
+                        ModListIcons.xml_icon(),
+                        self.tr("Contains custom content (textures / XML)"),
+                    )
+                )
+
+        trailing: list[_RowPart] = []
+        list_type = data.__dict__.get("list_type")
+        if settings.show_save_comparison_indicators:
+            if list_type == "Inactive" and data.__dict__.get("in_save", False):
+                trailing.append(
+                    self._icon_part(
+                        "in_save", ModListIcons.clear_icon(), self.tr("In latest save")
+                    )
+                )
+            elif list_type == "Active" and data.__dict__.get("is_new", False):
+                trailing.append(
+                    self._icon_part(
+                        "new", ModListIcons.new_icon(), self.tr("Not in latest save")
+                    )
+                )
+        if settings.mod_list_updated_indicator and data.__dict__.get(
+            "is_recently_updated", False
+        ):
+            updated_timestamp = getattr(data, "updated_timestamp", None)
+            trailing.append(
+                self._icon_part(
+                    "updated",
+                    ModListIcons.updated_icon(),
+                    self.tr(
+                        "Updated {time_ago}. Click to open the Workshop changelog."
+                    ).format(time_ago=get_relative_time(updated_timestamp))
+                    if updated_timestamp
+                    else self.tr("Recently updated"),
+                )
+            )
+        if self.list_widget.show_translation_status:
+            package_id = str(mod.package_id) if isinstance(mod, AboutXmlMod) else ""
+            if package_id in self.list_widget.translation_lookup:
+                trailing.append(
+                    self._text_part(
+                        "translation",
+                        "🟢",
+                        self.tr(
+                            "Translation available - This mod has a translation or is already localized"
+                        ),
+                        metrics,
+                    )
+                )
+            else:
+                trailing.append(
+                    self._text_part(
+                        "translation",
+                        "🔴",
+                        self.tr(
+                            "No translation found - This mod does not have a translation installed"
+                        ),
+                        metrics,
+                    )
+                )
+        if data["warnings"]:
+            trailing.append(
+                self._icon_part(
+                    "warning", ModListIcons.warning_icon(), data["warnings"]
+                )
+            )
+        if data["errors"]:
+            trailing.append(
+                self._icon_part("error", ModListIcons.error_icon(), data["errors"])
+            )
+        startup_impact_s = data.__dict__.get("startup_impact_s")
+        if settings.mod_list_startup_impact and startup_impact_s is not None:
+            if startup_impact_s >= IMPACT_HIGH_THRESHOLD_S:
+                impact_color = QColor("#d9534f")
+            elif startup_impact_s >= IMPACT_WARN_THRESHOLD_S:
+                impact_color = QColor("#f0ad4e")
+            else:
+                impact_color = QColor("#5cb85c")
+            trailing.append(
+                self._text_part(
+                    "impact",
+                    format_impact(startup_impact_s),
+                    data.__dict__.get("startup_impact_tooltip", ""),
+                    metrics,
+                    impact_color,
+                )
+            )
+
+        # Same width split as ModListItemInner.resizeEvent
+        rect = option.rect
+        icon_count = sum(part.icon is not None for part in leading + trailing)
+        reserved = sum(part.rect.width() for part in leading + trailing)
+        padding = 6 if icon_count > 2 else 0
+        available = max(0, rect.width() - reserved - padding)
+        parts = list(leading)
+
+        tags = data["mod_tags"] if data.__dict__.get("show_tags", False) else None
+        tags_width = 0
+        tags_text = ""
+        if tags:
+            full_tags_text = " ".join(f"[{tag}]" for tag in tags)
+            tags_width = min(
+                int(available * 0.35), metrics.horizontalAdvance(full_tags_text) + 6
+            )
+            tags_text = " " + metrics.elidedText(
+                full_tags_text, Qt.TextElideMode.ElideRight, tags_width
+            )
+        name = mod.name if mod is not None else None
+        if not isinstance(name, str):
+            name = "name error in mod about.xml"
+        name_width = max(int(available * 0.45), available - tags_width)
+        name = metrics.elidedText(name, Qt.TextElideMode.ElideRight, name_width)
+        parts.append(
+            _RowPart(
+                "name", QRect(0, 0, metrics.horizontalAdvance(name), 0), None, name
+            )
+        )
+        if tags:
+            parts.append(
+                _RowPart(
+                    "tags",
+                    QRect(0, 0, metrics.horizontalAdvance(tags_text), 0),
+                    None,
+                    tags_text,
+                    " ".join(f"[{tag}]" for tag in tags),
+                )
+            )
+        parts.extend(trailing)
+
+        x = rect.left()
+        placed: list[_RowPart] = []
+        for part in parts:
+            placed.append(
+                part._replace(
+                    rect=QRect(x, rect.top(), part.rect.width(), rect.height())
+                )
+            )
+            x += part.rect.width()
+        return placed
+
+    def part_at(
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+        pos: QPoint,
+    ) -> _RowPart | None:
+        """
+        Return the part of a painted mod row under pos, if any.
+
+        :param option: the style option holding the row rectangle and font
+        :param index: the row's model index
+        :param pos: the position in viewport coordinates
+        :return: the part under pos, or None
+        """
+        data = index.data(Qt.ItemDataRole.UserRole)
+        for part in self.row_parts(option, data):
+            if part.rect.contains(pos):
+                return part
+        return None
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        # Background, hover and selection, as styled for QListWidget::item
+        super().paint(painter, option, index)
+        if not self._paints(index):
+            return
+        data = index.data(Qt.ItemDataRole.UserRole)
+        settings = self.list_widget.settings
+        state = option.state
+        highlighted = bool(
+            state & (QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_MouseOver)
+        )
+
+        if data["filtered"]:
+            text_color = QColor("grey")
+        elif data["errors"] or data["warnings"]:
+            text_color = QColor("red")
+        else:
+            text_color = option.palette.color(QPalette.ColorRole.Text)
+        mod_color = data["mod_color"]
+        painter.save()
+        if mod_color is not None and not highlighted:
+            if settings.color_background_instead_of_text_toggle:
+                painter.fillRect(option.rect, mod_color)
+            else:
+                text_color = mod_color
+        for part in self.row_parts(option, data):
+            if part.icon is not None:
+                size = self.ICON_SIZE
+                top = part.rect.top() + (part.rect.height() - size) // 2
+                part.icon.paint(painter, QRect(part.rect.left(), top, size, size))
+            else:
+                painter.setPen(part.color or text_color)
+                painter.drawText(
+                    part.rect,
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    part.text,
+                )
+        painter.restore()
+
+    def sizeHint(
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        if not self._paints(index):
+            return super().sizeHint(option, index)
+        # Same height as a ModListItemInner with 20px icons
+        height = max(self.ICON_SIZE, QFontMetrics(option.font).height())
+        return QSize(0, height)
+
+    def helpEvent(
+        self,
+        event: QHelpEvent,
+        view: QAbstractItemView,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        if event.type() != QEvent.Type.ToolTip or not self._paints(index):
+            return super().helpEvent(event, view, option, index)
+        data = index.data(Qt.ItemDataRole.UserRole)
+        part = self.part_at(option, index, event.pos())
+        tooltip = part.tooltip if part is not None else ""
+        if not tooltip:
+            tooltip = mod_tool_tip_text(
+                self.list_widget.metadata_controller,
+                self.list_widget.settings,
+                data["path"],
+                data["mod_tags"],
+            )
+        QToolTip.showText(event.globalPos(), tooltip, view)
+        return True
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        if (
+            event.type() != QEvent.Type.MouseButtonRelease
+            or not isinstance(event, QMouseEvent)
+            or event.button() != Qt.MouseButton.LeftButton
+            or not self._paints(index)
+        ):
+            return super().editorEvent(event, model, option, index)
+        part = self.part_at(option, index, event.position().toPoint())
+        if part is None:
+            return super().editorEvent(event, model, option, index)
+        path = index.data(Qt.ItemDataRole.UserRole)["path"]
+        mod = self.list_widget.metadata_controller.get_mod(path)
+        if part.kind in ("warning", "error"):
+            package_id = str(mod.package_id) if isinstance(mod, AboutXmlMod) else ""
+            self.toggle_warning_signal.emit(package_id, path)
+            return True
+        if part.kind == "updated" and mod is not None and mod.published_file_id:
+            open_url_browser(
+                f"https://steamcommunity.com/sharedfiles/filedetails/changelog/{mod.published_file_id}"
+            )
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class _ModValidation(NamedTuple):
+    """The last error / warning check of a mod and what it was based on."""
+
+    state: tuple[Any, ...]
+    error_summary: str = ""
+    warning_summary: str = ""
+
+
 class ModListWidget(QListWidget):
     """
     Subclass for QListWidget. Used to store lists for
@@ -1230,6 +1654,11 @@ class ModListWidget(QListWidget):
         # Optimizes performance
         # self.setUniformItemSizes(True)
 
+        # Paints mod rows when paint_rows is set
+        self.row_delegate = ModListItemDelegate(self)
+        self.row_delegate.toggle_warning_signal.connect(self.toggle_warning)
+        self.setItemDelegate(self.row_delegate)
+
         # Slot to handle item widgets when itemChanged()
         self.itemChanged.connect(self.handle_item_data_changed)
 
@@ -1260,6 +1689,16 @@ class ModListWidget(QListWidget):
         # User tags display state. This must survive list rebuilds/sorting.
         self.show_tags: bool = False
 
+        # Whether mod rows are painted by row_delegate instead of item widgets.
+        # Read from the settings when the list is rebuilt
+        self.paint_rows: bool = self.settings.mod_list_paint_rows
+
+        # Search bar index over the mods in this list, keyed by path
+        self.search_index = ModSearchIndex()
+        # Positions and rule edges for incremental error / warning checks
+        self.validation_index = ModListValidationIndex()
+        self._validation_results: dict[str, _ModValidation] = {}
+
         self.deletion_sub_menu = ModDeletionMenu(
             self.settings,
             self._get_selected_metadata,
@@ -2926,6 +3365,11 @@ class ModListWidget(QListWidget):
             self._update_single_divider_mod_count(item)
             return
 
+        if self.paint_rows:
+            # The row delegate paints the mod straight from the item data
+            self.update(self.indexFromItem(item))
+            return
+
         errors_warnings = data["errors_warnings"]
         errors = data["errors"]
         warnings = data["warnings"]
@@ -3004,11 +3448,42 @@ class ModListWidget(QListWidget):
         """
         This slot is called when an item's data changes
         """
+        data = item.data(Qt.ItemDataRole.UserRole)
+        if data is not None and not getattr(data, "is_divider", False):
+            # Keep the searchable tags and notes in step with the item data
+            entry = self.search_index.get(data["path"])
+            if entry is not None and (
+                entry.tag_set != frozenset(data["mod_tags"])
+                or entry.notes != (data.__dict__.get("user_notes") or "").lower()
+            ):
+                self.update_search_entry(data["path"], data)
         widget = self.itemWidget(item)
         if widget is not None and isinstance(widget, ModListItemInner):
             widget.repolish(item)
 
+    def update_search_entry(
+        self, uuid: str, item_data: CustomListWidgetItemMetadata
+    ) -> ModSearchEntry | None:
+        """
+        Index a mod of this list for the search bar.
+
+        :param uuid: str, the path of the mod
+        :param item_data: the metadata of the mod's list item
+        :return: the new search entry, or None if the mod has no metadata
+        """
+        mod = self.metadata_controller.get_mod(uuid)
+        if mod is None:
+            self.search_index.discard(uuid)
+            return None
+        entry = ModSearchEntry.from_mod(
+            mod, item_data["mod_tags"], item_data.__dict__.get("user_notes")
+        )
+        self.search_index.add(uuid, entry)
+        return entry
+
     def repolish_all_items(self) -> None:
+        if self.paint_rows:
+            self.viewport().update()
         for row in range(self.count()):
             item = self.item(row)
             if item is None:
@@ -3025,6 +3500,7 @@ class ModListWidget(QListWidget):
         """
         if uuid in self.paths:
             self.paths.remove(uuid)
+        self.search_index.discard(uuid)
 
     def handle_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
         """
@@ -3087,6 +3563,7 @@ class ModListWidget(QListWidget):
                     pass
                 uuid = data["path"]
                 self.paths.insert(idx, uuid)
+                self.update_search_entry(uuid, data)
                 self.item_added_signal.emit(uuid)
         # Update list signal if all items are loaded
         if len(self.paths) == self.count():
@@ -3352,6 +3829,8 @@ class ModListWidget(QListWidget):
         item_index = self.paths.index(uuid)
         item = self.item(item_index)
         logger.debug(f"Rebuilding widget for item {uuid} at index {item_index}")
+        self.validation_index.mark_dirty(uuid)
+        self.update_search_entry(uuid, item.data(Qt.ItemDataRole.UserRole))
         # Destroy the item's previous widget immediately. Recreate if the item is visible.
         widget = self.itemWidget(item)
         if widget:
@@ -3424,8 +3903,12 @@ class ModListWidget(QListWidget):
         mod_data: ListedMod,
         packageid_to_path: dict[str, str],
         current_mod_index: int,
+        positions: dict[str, int],
     ) -> tuple[set[str], set[str]]:
-        """Check for load order violations."""
+        """Check for load order violations.
+
+        :param positions: index of every path in the list
+        """
         load_before_violations: set[str] = set()
         load_after_violations: set[str] = set()
         if not isinstance(mod_data, AboutXmlMod):
@@ -3434,22 +3917,16 @@ class ModListWidget(QListWidget):
         # violation: this mod's index >= the other mod's index
         for pid in mod_data.overall_rules.load_before:
             pid_str = str(pid)
-            if pid_str in packageid_to_path:
-                other_path = packageid_to_path[pid_str]
-                if other_path in self.paths and current_mod_index >= self.paths.index(
-                    other_path
-                ):
-                    load_before_violations.add(pid_str)
+            other_index = positions.get(packageid_to_path.get(pid_str, ""))
+            if other_index is not None and current_mod_index >= other_index:
+                load_before_violations.add(pid_str)
         # load_after: this mod should load AFTER the listed mods
         # violation: this mod's index <= the other mod's index
         for pid in mod_data.overall_rules.load_after:
             pid_str = str(pid)
-            if pid_str in packageid_to_path:
-                other_path = packageid_to_path[pid_str]
-                if other_path in self.paths and current_mod_index <= self.paths.index(
-                    other_path
-                ):
-                    load_after_violations.add(pid_str)
+            other_index = positions.get(packageid_to_path.get(pid_str, ""))
+            if other_index is not None and current_mod_index <= other_index:
+                load_after_violations.add(pid_str)
         return load_before_violations, load_after_violations
 
     def _check_version_mismatch(self, uuid: str) -> bool:
@@ -3460,51 +3937,49 @@ class ModListWidget(QListWidget):
         """Check if use_this_instead is applicable."""
         return bool(current_item_data["alternative"])
 
+    def _validation_state(
+        self,
+        item_data: CustomListWidgetItemMetadata,
+        package_id: str,
+        updated_cutoff: float,
+    ) -> tuple[Any, ...]:
+        """
+        What the error / warning check of a mod depends on besides its rules,
+        the list order and the settings.
+
+        :param item_data: the metadata of the mod's list item
+        :param package_id: the package id of the mod, or an empty string
+        :param updated_cutoff: timestamp after which a mod counts as recently
+            updated, or 0 if the indicator is disabled
+        :return: a tuple that compares equal while the check stays valid
+        """
+        updated_timestamp = getattr(item_data, "updated_timestamp", None)
+        return (
+            item_data,
+            item_data["warning_toggled"],
+            package_id in self.ignore_warning_list,
+            item_data["alternative"],
+            bool(
+                updated_cutoff
+                and updated_timestamp
+                and updated_timestamp >= updated_cutoff
+            ),
+        )
+
     def recalculate_internal_errors_warnings(self) -> tuple[str, str, int, int]:
         """
         Whenever the respective mod list has items added to it, or has
         items removed from it, or has items rearranged around within it,
-        calculate the internal list errors / warnings for the mod list
+        calculate the internal list errors / warnings for the mod list.
+
+        Only the mods the change can affect are checked again, see
+        ModListValidationIndex. Every other mod keeps the result of its
+        last check.
         """
         logger.info(f"Recalculating {self.list_type} list errors / warnings")
 
         all_mods_metadata = self.metadata_controller.mods_metadata
 
-        mod_uuids = [u for u in self.paths if not is_divider_uuid(u)]
-        packageid_to_uuid: dict[str, str] = {}
-        for uuid in mod_uuids:
-            mod = all_mods_metadata.get(uuid)
-            if isinstance(mod, AboutXmlMod):
-                packageid_to_uuid[str(mod.package_id)] = uuid
-        package_ids_set = set(packageid_to_uuid.keys())
-
-        package_id_to_errors: dict[str, dict[str, None | set[str] | bool]] = {
-            uuid: {
-                "missing_dependencies": set() if self.list_type == "Active" else None,
-                "alternative_dependencies": set()
-                if self.list_type == "Active"
-                else None,
-                "conflicting_incompatibilities": (
-                    set() if self.list_type == "Active" else None
-                ),
-                "reverse_incompatibilities": (
-                    set() if self.list_type == "Active" else None
-                ),
-                "load_before_violations": set() if self.list_type == "Active" else None,
-                "load_after_violations": set() if self.list_type == "Active" else None,
-                "version_mismatch": True,
-                "use_this_instead": set()
-                if self.settings.external_use_this_instead_metadata_source != "None"
-                else None,
-            }
-            for uuid in mod_uuids
-        }
-
-        num_warnings = 0
-        total_warning_text = ""
-        num_errors = 0
-        total_error_text = ""
-
         # Load latest save package ids once for this run, only if feature enabled
         save_compare_enabled: bool = self.settings.show_save_comparison_indicators
         if save_compare_enabled:
@@ -3532,14 +4007,66 @@ class ModListWidget(QListWidget):
             except (KeyError, AttributeError):
                 startup_impact_report = None
 
-        for uuid, mod_errors in package_id_to_errors.items():
-            current_mod_index = self.paths.index(uuid)
+        use_this_instead_enabled = (
+            self.settings.external_use_this_instead_metadata_source != "None"
+        )
+        # Anything outside the list the checks depend on. When it changes,
+        # every mod is checked again.
+        context = (
+            self.metadata_controller.game_version,
+            self.metadata_controller.metadata_mediator.no_version_warning,
+            self.metadata_controller.settings.use_alternative_package_ids_as_satisfying_dependencies,
+            use_this_instead_enabled,
+            latest_save_ids,
+            startup_impact_report,
+        )
+        dirty = self.validation_index.update(self.paths, all_mods_metadata, context)
+        positions = self.validation_index.positions
+        packageid_to_uuid = self.validation_index.packageid_to_uuid
+        package_ids_set = set(packageid_to_uuid)
+
+        results: dict[str, _ModValidation] = {}
+        rechecked = 0
+        for uuid in self.paths:
+            if is_divider_uuid(uuid):
+                continue
+            current_mod_index = positions[uuid]
             current_item = self.item(current_mod_index)
             if current_item is None:
                 continue
             current_item_data = current_item.data(Qt.ItemDataRole.UserRole)
             if getattr(current_item_data, "is_divider", False):
                 continue
+            cached = self._validation_results.get(uuid)
+            if (
+                uuid not in dirty
+                and cached is not None
+                and cached.state
+                == self._validation_state(
+                    current_item_data,
+                    self.validation_index.package_id(uuid),
+                    updated_cutoff,
+                )
+            ):
+                results[uuid] = cached
+                continue
+            rechecked += 1
+            mod_errors: dict[str, None | set[str] | bool] = {
+                "missing_dependencies": set() if self.list_type == "Active" else None,
+                "alternative_dependencies": set()
+                if self.list_type == "Active"
+                else None,
+                "conflicting_incompatibilities": (
+                    set() if self.list_type == "Active" else None
+                ),
+                "reverse_incompatibilities": (
+                    set() if self.list_type == "Active" else None
+                ),
+                "load_before_violations": set() if self.list_type == "Active" else None,
+                "load_after_violations": set() if self.list_type == "Active" else None,
+                "version_mismatch": True,
+                "use_this_instead": set() if use_this_instead_enabled else None,
+            }
             current_item_data["mismatch"] = False
             current_item_data["errors"] = ""
             current_item_data["warnings"] = ""
@@ -3581,6 +4108,9 @@ class ModListWidget(QListWidget):
                 current_item_data.__dict__["is_recently_updated"] = False
             mod_data = all_mods_metadata.get(uuid)
             if mod_data is None:
+                results[uuid] = _ModValidation(
+                    self._validation_state(current_item_data, "", updated_cutoff)
+                )
                 continue
             pkg_id_str = (
                 str(mod_data.package_id) if isinstance(mod_data, AboutXmlMod) else ""
@@ -3640,7 +4170,7 @@ class ModListWidget(QListWidget):
                     mod_errors["load_before_violations"],
                     mod_errors["load_after_violations"],
                 ) = self._check_load_order_violations(
-                    mod_data, packageid_to_uuid, current_mod_index
+                    mod_data, packageid_to_uuid, current_mod_index, positions
                 )
             # Calculate any needed string for errors
             tool_tip_text = ""
@@ -3728,6 +4258,7 @@ class ModListWidget(QListWidget):
                     "\nAn alternative updated mod is recommended:\n{alternative}"
                 ).format(alternative=current_item_data["alternative"])
             # Add to error summary if any missing dependencies or incompatibilities
+            error_summary = ""
             if self.list_type == "Active" and any(
                 mod_errors[key]
                 for key in [
@@ -3736,14 +4267,14 @@ class ModListWidget(QListWidget):
                     "reverse_incompatibilities",
                 ]
             ):
-                num_errors += 1
-                total_error_text += f"\n\n{mod_data.name}"
-                total_error_text += "\n" + "=" * len(mod_data.name)
-                total_error_text += tool_tip_text
+                error_summary = f"\n\n{mod_data.name}"
+                error_summary += "\n" + "=" * len(mod_data.name)
+                error_summary += tool_tip_text
 
             # Add to warning summary if any loadBefore or loadAfter violations, or version mismatch
             # Version mismatch is determined earlier without checking if the mod is in ignore_warning_list
             # so we have to check it again here in order to not display a faulty, empty version warning
+            warning_summary = ""
             if (
                 self.list_type == "Active"
                 and pkg_id_str not in self.ignore_warning_list
@@ -3757,10 +4288,9 @@ class ModListWidget(QListWidget):
                     ]
                 )
             ):
-                num_warnings += 1
-                total_warning_text += f"\n\n{mod_data.name}"
-                total_warning_text += "\n============================="
-                total_warning_text += tool_tip_text
+                warning_summary = f"\n\n{mod_data.name}"
+                warning_summary += "\n============================="
+                warning_summary += tool_tip_text
             # Add tooltip to item data and set the data back to the item
             current_item_data["errors_warnings"] = tool_tip_text.strip()
             current_item_data["warnings"] = tool_tip_text[
@@ -3768,7 +4298,21 @@ class ModListWidget(QListWidget):
             ].strip()
             current_item_data["errors"] = current_item_data["errors"].strip()
             current_item.setData(Qt.ItemDataRole.UserRole, current_item_data)
-        logger.info(f"Finished recalculating {self.list_type} list errors and warnings")
+            results[uuid] = _ModValidation(
+                self._validation_state(current_item_data, pkg_id_str, updated_cutoff),
+                error_summary,
+                warning_summary,
+            )
+        self._validation_results = results
+
+        total_error_text = "".join(r.error_summary for r in results.values())
+        total_warning_text = "".join(r.warning_summary for r in results.values())
+        num_errors = sum(1 for r in results.values() if r.error_summary)
+        num_warnings = sum(1 for r in results.values() if r.warning_summary)
+        logger.info(
+            f"Finished recalculating {self.list_type} list errors and warnings "
+            f"({rechecked} of {len(results)} mods rechecked)"
+        )
         return total_error_text, total_warning_text, num_errors, num_warnings
 
     def _build_startup_impact_tooltip(
@@ -3944,6 +4488,9 @@ class ModListWidget(QListWidget):
 
         self.clear()
         self.paths = []
+        self.paint_rows = self.settings.mod_list_paint_rows
+        self.search_index.clear()
+        self.validation_index.invalidate()
         if uuids:  # Insert data...
             for uuid_key in uuids:
                 if is_divider_uuid(uuid_key):
@@ -3973,6 +4520,7 @@ class ModListWidget(QListWidget):
                     data.__dict__["show_tags"] = self.show_tags
                 list_item.setData(Qt.ItemDataRole.UserRole, data)
                 self.addItem(list_item)
+                self.update_search_entry(uuid_key, data)
                 # When refreshing, update entry if needed?
             # Set uuids list to match the widget after all items are added
             self.paths = list(uuids)
@@ -4993,11 +5541,13 @@ class ModsPanel(QWidget):
             index = self.active_mods_list.paths.index(uuid)
             self.active_mods_list.takeItem(index)
             self.active_mods_list.paths.pop(index)
+            self.active_mods_list.search_index.discard(uuid)
             self.update_count(list_type="Active")
         elif uuid in self.inactive_mods_list.paths:
             index = self.inactive_mods_list.paths.index(uuid)
             self.inactive_mods_list.takeItem(index)
             self.inactive_mods_list.paths.pop(index)
+            self.inactive_mods_list.search_index.discard(uuid)
             self.update_count(list_type="Inactive")
 
     def on_mod_metadata_updated(self, uuid: str) -> None:
@@ -5006,6 +5556,33 @@ class ModsPanel(QWidget):
         elif uuid in self.inactive_mods_list.paths:
             self.inactive_mods_list.rebuild_item_widget_from_uuid(uuid=uuid)
 
+    def on_metadata_changed(
+        self, added: list[str], removed: list[str], changed: list[str]
+    ) -> None:
+        """Patch both mod lists after an incremental metadata refresh.
+
+        Removed mods are taken out, changed mods get their widgets rebuilt and
+        added mods are appended to the inactive list, instead of recreating
+        every row.
+
+        :param added: Paths of mods that appeared
+        :param removed: Paths of mods that disappeared
+        :param changed: Paths of mods whose metadata changed
+        """
+        for uuid in removed:
+            self.on_mod_deleted(uuid)
+        for uuid in changed:
+            self.on_mod_metadata_updated(uuid)
+        for uuid in added:
+            if (
+                uuid not in self.active_mods_list.paths
+                and uuid not in self.inactive_mods_list.paths
+            ):
+                self.on_mod_created(uuid)
+        self.update_count(list_type="Inactive")
+        self.recalculate_list_errors_warnings("Active")
+        self.recalculate_list_errors_warnings("Inactive")
+
     def recalculate_list_errors_warnings(self, list_type: str) -> None:
         """
         Update the errors/warnings summary frame with current mod list status.
@@ -5125,37 +5702,6 @@ class ModsPanel(QWidget):
             )
             self.inactive_mods_search.clearFocus()
 
-    def search_mod_notes(self, pattern: str, limit: int = 5000) -> set[str]:
-        """Searches mod notes using fuzzy search, returning mod paths matching search pattern."""
-        if not pattern.strip():
-            return set()
-
-        pattern = pattern.strip().lower()
-        SEARCH_SQL = text("""
-            SELECT path, user_notes
-            FROM auxiliary_metadata
-            LIMIT :limit;
-        """)
-
-        aux_metadata_controller = AuxMetadataController.get_or_create_cached_instance(
-            self.settings.aux_db_path
-        )
-        with aux_metadata_controller.engine.connect() as conn:
-            result = conn.execute(SEARCH_SQL, {"limit": limit})
-            rows = result.fetchall()
-
-        # TODO: Allow user to set fuzzy threshold?
-        fuzz_threshold = 80 if len(pattern) > 5 else 70
-        matching_paths = set()
-        for path, note in rows:
-            note = (note or "").lower()
-
-            score = fuzz.partial_ratio(pattern, note)
-            if score >= fuzz_threshold:
-                matching_paths.add(path)
-
-        return matching_paths
-
     def signal_search_and_filters(
         self,
         list_type: str,
@@ -5212,159 +5758,163 @@ class ModsPanel(QWidget):
             search_filter = "publishedfileid"
         elif _filter.currentText() == self.tr("Version"):
             search_filter = "version"
-        # Filter the list using any search and filter state
+        mod_list = (
+            self.active_mods_list if list_type == "Active" else self.inactive_mods_list
+        )
+        search_index = mod_list.search_index
+        # Resolve the search pattern to the set of matching paths up front.
+        # Rows outside `pattern_matches` are filtered. Matching rows are
+        # unfiltered when `unfilter_matches` is set and otherwise keep their
+        # previous state. A blank notes or tags search unfilters every row.
+        pattern_matches: set[str] | None = None
+        unfilter_matches = False
+        unfilter_all = False
+        if search_filter == "version" and pattern:
+            pattern_matches = search_index.substring_matches("version", pattern)
+        elif search_filter in ("notes", "tags"):
+            if not pattern.strip():
+                unfilter_all = True
+            elif search_filter == "notes":
+                pattern_matches = search_index.notes_matches(pattern)
+            else:
+                pattern_matches = search_index.substring_matches("tags", pattern)
+            unfilter_matches = True
+        # Filter by name and mod notes
+        elif (
+            pattern.strip()
+            and search_filter == "name"
+            and self.settings.include_mod_notes_in_mod_name_filter
+        ):
+            pattern_matches = search_index.substring_matches(
+                "name", pattern
+            ) | search_index.notes_matches(pattern)
+            unfilter_matches = True
+        elif pattern and search_filter in (
+            "name",
+            "packageid",
+            "authors",
+            "publishedfileid",
+        ):
+            pattern_matches = search_index.substring_matches(search_filter, pattern)
+        # Source filtering (set-based from FilterState)
+        allowed_types: set[ModType] | None = None
+        if fs.sources != FilterState.ALL_SOURCES:
+            _type_to_source = {
+                ModType.LUDEON: "expansion",
+                ModType.STEAM_WORKSHOP: "workshop",
+                ModType.LOCAL: "local",
+                ModType.GIT: "local",
+                ModType.STEAM_CMD: "local",
+                ModType.UNKNOWN: "local",
+            }
+            allowed_types = {
+                mod_type
+                for mod_type in ModType
+                if _type_to_source.get(mod_type, "local") in fs.sources
+                or ("git_repo" in fs.sources and mod_type == ModType.GIT)
+                or ("steamcmd" in fs.sources and mod_type == ModType.STEAM_CMD)
+            }
+        filter_tags = bool(fs.tags or fs.include_no_tags)
+        # Filter the list using any search and filter state. Only rows whose
+        # state changes get their visibility and item data touched.
         num_filtered = 0
         num_unfiltered = 0
-        # Ensure `matches` is defined even if we don't call `search_mod_notes`.
-        matches: set[str] = set()
-        if pattern.strip() and (
-            search_filter == "notes"
-            or (
-                search_filter == "name"
-                and self.settings.include_mod_notes_in_mod_name_filter
-            )
-        ):
-            matches = self.search_mod_notes(pattern)
         for idx, uuid in enumerate(uuids):
-            item = (
-                self.active_mods_list.item(idx)
-                if list_type == "Active"
-                else self.inactive_mods_list.item(idx)
-            )
-            if item is None:
-                continue
             if is_divider_uuid(uuid):
                 continue
+            item = mod_list.item(idx)
+            if item is None:
+                continue
             item_data = item.data(Qt.ItemDataRole.UserRole)
             if getattr(item_data, "is_divider", False):
                 continue
             # Check if UUID exists in metadata before accessing
             if uuid not in self.metadata_controller.mods_metadata:
                 continue
-            mod_obj = self.metadata_controller.get_mod(uuid)
-            if mod_obj is None:
-                continue
+            entry = search_index.get(uuid)
+            if entry is None:
+                entry = mod_list.update_search_entry(uuid, item_data)
+                if entry is None:
+                    continue
+            hidden = item.isHidden()
+            was_filtered = item_data["filtered"]
             # Hide invalid items if enabled in settings
             if self.settings.hide_invalid_mods_when_filtering:
                 invalid = item_data["invalid"]
                 if invalid and filters_active:
                     item_data["filtered"] = True
-                    item.setHidden(True)
+                    if not hidden:
+                        item.setHidden(True)
                     continue
                 elif invalid and not filters_active:
                     item_data["filtered"] = False
-                    item.setHidden(False)
+                    if hidden:
+                        item.setHidden(False)
+                        hidden = False
             # Check if the item is filtered
             item_filtered = item_data["filtered"]
 
             # Search pattern filtering
-            if search_filter == "version" and pattern:
-                versions = (
-                    sorted(mod_obj.supported_versions)
-                    if mod_obj.supported_versions
-                    else []
-                )
-                if not versions or not any(
-                    pattern.lower() in v.lower() for v in versions
-                ):
-                    item_filtered = True
-            elif search_filter == "notes":
-                if not pattern.strip():
-                    item_filtered = False
-                else:
-                    _mod_path = str(mod_obj.mod_path) if mod_obj.mod_path else ""
-                    item_filtered = _mod_path not in matches
-            elif search_filter == "tags":
-                tags_list = item_data["mod_tags"]
-                if not pattern.strip():
-                    item_filtered = False
-                else:
-                    item_filtered = not any(
-                        pattern.lower() in tag.lower() for tag in tags_list
-                    )
-            # Filter by name and mod notes
-            elif (
-                pattern.strip()
-                and search_filter == "name"
-                and self.settings.include_mod_notes_in_mod_name_filter
-            ):
-                if not pattern.strip() or (
-                    pattern and mod_obj.name and pattern.lower() in mod_obj.name.lower()
-                ):
-                    item_filtered = False
-                else:
-                    _mod_path = str(mod_obj.mod_path) if mod_obj.mod_path else ""
-                    item_filtered = _mod_path not in matches
-            elif pattern and search_filter == "name":
-                if pattern.lower() not in mod_obj.name.lower():
-                    item_filtered = True
-            elif (
-                pattern
-                and search_filter == "packageid"
-                and isinstance(mod_obj, AboutXmlMod)
-            ):
-                if pattern.lower() not in str(mod_obj.package_id).lower():
+            if unfilter_all:
+                item_filtered = False
+            elif pattern_matches is not None:
+                if uuid in pattern_matches:
+                    if unfilter_matches:
+                        item_filtered = False
+                # Mods without an About.xml have no package id to search
+                elif search_filter != "packageid" or entry.packageid is not None:
                     item_filtered = True
 
-            # Source filtering (set-based from FilterState)
-            if not item_filtered and fs.sources != FilterState.ALL_SOURCES:
-                _type_to_source = {
-                    ModType.LUDEON: "expansion",
-                    ModType.STEAM_WORKSHOP: "workshop",
-                    ModType.LOCAL: "local",
-                    ModType.GIT: "local",
-                    ModType.STEAM_CMD: "local",
-                    ModType.UNKNOWN: "local",
-                }
-                data_source = _type_to_source.get(mod_obj.mod_type, "local")
-                is_git = mod_obj.mod_type == ModType.GIT
-                is_steamcmd = mod_obj.mod_type == ModType.STEAM_CMD
-                source_match = False
-                if data_source in fs.sources:
-                    source_match = True
-                if "git_repo" in fs.sources and is_git:
-                    source_match = True
-                if "steamcmd" in fs.sources and is_steamcmd:
-                    source_match = True
-                if not source_match:
-                    item_filtered = True
+            # Source filtering
+            if (
+                not item_filtered
+                and allowed_types is not None
+                and entry.mod_type not in allowed_types
+            ):
+                item_filtered = True
 
             # Type filtering (string-based from FilterState)
-            if not item_filtered and fs.mod_type != "all":
-                is_csharp = mod_obj.c_sharp_mod
-                if (
-                    fs.mod_type == "csharp"
-                    and not is_csharp
-                    or fs.mod_type == "xml"
-                    and is_csharp
-                ):
-                    item_filtered = True
+            if not item_filtered and (
+                fs.mod_type == "csharp"
+                and not entry.c_sharp_mod
+                or fs.mod_type == "xml"
+                and entry.c_sharp_mod
+            ):
+                item_filtered = True
 
             # User tag filtering (from FilterState)
-            if not item_filtered and (fs.tags or fs.include_no_tags):
-                tags_set = set(item_data["mod_tags"])
-                if not fs.matches_tags(tags_set):
-                    item_filtered = True
+            if (
+                not item_filtered
+                and filter_tags
+                and not fs.matches_tags(set(entry.tag_set))
+            ):
+                item_filtered = True
 
             # Check if the item should be filtered or hidden based on filter state
+            hidden_by_filter = item_data["hidden_by_filter"]
             if filter_state:
-                item.setHidden(item_filtered)
+                if hidden != item_filtered:
+                    item.setHidden(item_filtered)
+                hidden_by_filter = item_filtered
                 if item_filtered:
-                    item_data["hidden_by_filter"] = True
                     item_filtered = False
                     num_filtered += 1
                 else:
-                    item_data["hidden_by_filter"] = False
                     num_unfiltered += 1
             else:
-                if item_filtered and item.isHidden():
+                if item_filtered and hidden:
                     item.setHidden(False)
-                    item_data["hidden_by_filter"] = False
+                    hidden_by_filter = False
                     num_unfiltered += 1
 
-            # Update item data
-            item_data["filtered"] = item_filtered
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
+            # Update item data, repolishing only rows whose state changed
+            if (
+                was_filtered != item_filtered
+                or item_data["hidden_by_filter"] != hidden_by_filter
+            ):
+                item_data["filtered"] = item_filtered
+                item_data["hidden_by_filter"] = hidden_by_filter
+                item.setData(Qt.ItemDataRole.UserRole, item_data)
 
         self.direct_update_count(list_type, num_filtered, num_unfiltered)
         if list_type == "Active":
@@ -5529,6 +6079,8 @@ class ModsPanel(QWidget):
 
         # Update visible items
         for mod_list in [self.active_mods_list, self.inactive_mods_list]:
+            # Painted rows read the lookup on their next paint
+            mod_list.viewport().update()
             for i in range(mod_list.count()):
                 item = mod_list.item(i)
                 widget = mod_list.itemWidget(item)
@@ -1,21 +1,44 @@
-import gc
 import os
 import re
-from collections import deque
-from collections.abc import Callable
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
-from PySide6.QtCore import QObject, QPoint, QRegularExpression, Qt, QTimer, Signal
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import (
+    QAbstractTextDocumentLayout,
+    QAction,
     QColor,
     QFont,
+    QKeySequence,
+    QPainter,
+    QPalette,
     QSyntaxHighlighter,
     QTextCharFormat,
-    QTextCursor,
+    QTextDocument,
+    QTextOption,
 )
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QColorDialog,
@@ -27,11 +50,15 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
+    QMenu,
     QProgressBar,
     QPushButton,
     QSizePolicy,
     QSplitter,
-    QTextEdit,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -42,8 +69,11 @@ from app.models.settings import Settings
 from app.utils import http
 from app.utils.app_info import AppInfo
 from app.utils.generic import launch_process
+from app.utils.player_log import LogScan, LogStatistics, PlayerLog, row_of
 from app.views.dialogue import show_information, show_warning
 
+BOOKMARK_COLOR = QColor("#FFD700")
+
 
 class LogPatternManager:
     """Centralized management of regex patterns for log parsing and highlighting."""
@@ -123,94 +153,128 @@ class LogPatternManager:
         }
         return patterns.get(filter_name.lower())
 
+    @classmethod
+    def get_statistics_patterns(cls) -> dict[str, re.Pattern[str]]:
+        """Get the pattern of each counted log statistic."""
+        return {
+            "infos": cls.INFO_FILTER_PATTERN,
+            "keybinds": cls.KEYBIND_FILTER_PATTERN,
+            "mod_issues": cls.MOD_ISSUE_FILTER_PATTERN,
+            "warnings": cls.WARNING_FILTER_PATTERN,
+            "errors": cls.ERROR_FILTER_PATTERN,
+            "exceptions": cls.EXCEPTION_FILTER_PATTERN,
+        }
 
-class LogContentStorage:
-    """Memory-efficient storage for log content using chunked storage."""
-
-    def __init__(self, max_chunk_size: int = 1024 * 1024):  # 1MB chunks by default
-        self.chunks: deque[str] = deque()
-        self.max_chunk_size = max_chunk_size
-        self.total_size = 0
-        self.line_count = 0
-
-    def append(self, content: str) -> None:
-        """Append content in memory-efficient chunks with optimized string handling."""
-        if not content:
-            return
-
-        # Use a list to collect lines for more efficient string building
-        lines = content.splitlines(keepends=True)
-        current_chunk_lines: list[str] = []
-        current_chunk_size = 0
-
-        for line in lines:
-            line_length = len(line)
-
-            # If adding this line would exceed chunk size and we have existing content
-            if (
-                current_chunk_size + line_length > self.max_chunk_size
-                and current_chunk_lines
-            ):
-                # Join the current chunk and add to deque
-                self.chunks.append("".join(current_chunk_lines))
-                current_chunk_lines = [line]
-                current_chunk_size = line_length
-            else:
-                current_chunk_lines.append(line)
-                current_chunk_size += line_length
-
-            self.line_count += 1
-
-        # Add any remaining content as a chunk
-        if current_chunk_lines:
-            self.chunks.append("".join(current_chunk_lines))
-
-        self.total_size += len(content)
-
-        # Check if total size exceeds a certain limit (e.g., 10MB)
-        if self.total_size > 10 * 1024 * 1024:  # 10MB limit
-            self.remove_oldest_chunk()
-
-    def remove_oldest_chunk(self) -> None:
-        """Remove the oldest chunk to maintain memory limits."""
-        if self.chunks:
-            removed_chunk = self.chunks.popleft()  # Remove the oldest chunk
-            self.total_size -= len(removed_chunk)  # Update total size
-            logger.debug(f"Removed oldest chunk of size {len(removed_chunk)} bytes.")
-
-    def clear(self) -> None:
-        """Clear all stored content and trigger garbage collection."""
-        self.chunks.clear()
-        self.total_size = 0
-        self.line_count = 0
-        # Force garbage collection to reclaim memory immediately
-        gc.collect(generation=2)  # Collect all generations for maximum memory recovery
-
-    def get_full_content(self) -> str:
-        """Get the full content as a string (use sparingly)."""
-        return "".join(self.chunks)
 
-    def get_lines(self, start_line: int = 0, end_line: int | None = None) -> list[str]:
-        """Get specific lines efficiently without loading entire content."""
-        lines = []
-        current_line = 0
+class LogLineModel(QAbstractListModel):
+    """Rows of the log display. Lines are only decoded when they are shown."""
 
-        for chunk in self.chunks:
-            chunk_lines = chunk.splitlines(keepends=True)
-            for line in chunk_lines:
-                if current_line >= start_line:
-                    lines.append(line)
-                    if end_line and current_line >= end_line:
-                        return lines
-                current_line += 1
+    # Decoded lines kept in memory
+    CACHE_SIZE = 4096
+    # Rows decoded together when a row is shown that is not cached
+    READ_AHEAD = 128
 
-        return lines
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.log = PlayerLog()
+        # Number of the line shown in each row
+        self.rows: array[int] = array("q")
+        # Lengths of the runs of repeated lines shown in one row, by line number
+        self.counts: dict[int, int] = {}
+        # Numbers of the bookmarked lines
+        self.bookmarks: set[int] = set()
+        self._cache: OrderedDict[int, str] = OrderedDict()
+
+    def rowCount(
+        self,
+        parent: QModelIndex | QPersistentModelIndex = QModelIndex(),  # noqa: B008
+    ) -> int:
+        return 0 if parent.isValid() else len(self.rows)
 
-    def __len__(self) -> int:
-        return self.total_size
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.text(index.row())
+        if (
+            role == Qt.ItemDataRole.BackgroundRole
+            and self.rows[index.row()] in self.bookmarks
+        ):
+            return BOOKMARK_COLOR
+        return None
 
-    def __str__(self) -> str:
-        return self.get_full_content()
+    def text(self, row: int) -> str:
+        """:return: Text shown in the row"""
+        line = self.rows[row]
+        text = self._cache.get(line)
+        if text is None:
+            lines = self.rows[row : row + self.READ_AHEAD]
+            try:
+                texts = self.log.read_lines(lines)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read lines of the player log: {e}")
+                texts = [""] * len(lines)
+            self._cache.update(zip(lines, texts, strict=True))
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            text = texts[0]
+        else:
+            self._cache.move_to_end(line)
+        count = self.counts.get(line)
+        return f"{text} (Repeated {count} times)" if count else text
+
+    def row_texts(self) -> Iterator[str]:
+        """:return: Text of every row, read without filling the cache"""
+        for start in range(0, len(self.rows), self.CACHE_SIZE):
+            lines = self.rows[start : start + self.CACHE_SIZE]
+            for line, text in zip(lines, self.log.read_lines(lines), strict=True):
+                count = self.counts.get(line)
+                yield f"{text} (Repeated {count} times)" if count else text
+
+    def last_line(self) -> int | None:
+        """:return: Number of the line shown in the last row"""
+        return self.rows[-1] if self.rows else None
+
+    def reset(self, log: PlayerLog) -> None:
+        """Show no rows of ``log``."""
+        self.beginResetModel()
+        self.log = log
+        self.rows = array("q")
+        self.counts = {}
+        self._cache.clear()
+        self.endResetModel()
+
+    def truncate(self, line: int) -> None:
+        """Remove the rows of ``line`` and the lines after it."""
+        row = bisect_left(self.rows, line)
+        if row < len(self.rows):
+            self.beginRemoveRows(QModelIndex(), row, len(self.rows) - 1)
+            del self.rows[row:]
+            self.endRemoveRows()
+        for cached in [cached for cached in self._cache if cached >= line]:
+            del self._cache[cached]
+
+    def append(self, rows: array[int], counts: dict[int, int]) -> None:
+        """
+        Add rows after the last row.
+
+        :param rows: Numbers of the lines to show
+        :param counts: Lengths of the runs of repeated lines, which may go
+            on from a line that is already shown
+        """
+        shown = [row for line in counts if (row := row_of(self.rows, line)) is not None]
+        self.counts.update(counts)
+        if rows:
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+        for row in shown:
+            self.dataChanged.emit(self.index(row), self.index(row))
 
 
 class LogHighlighter(QSyntaxHighlighter):
@@ -229,8 +293,9 @@ class LogHighlighter(QSyntaxHighlighter):
         self.search_format = QTextCharFormat()
         self.search_format.setBackground(QColor("#005500"))
 
-        self.search_term: str | None = None
-        self._search_regex: re.Pattern[str] | None = None  # Cache compiled regex
+        self.search_regex: re.Pattern[str] | None = None
+        # Whether the text highlighted next may contain search matches
+        self.may_match = True
 
         # Define patterns with priority (higher index = higher priority)
         # Use patterns from LogPatternManager for consistency
@@ -252,16 +317,9 @@ class LogHighlighter(QSyntaxHighlighter):
         self.search_format.setBackground(color)
         self.rehighlight()
 
-    def set_search_term(self, term: str | None) -> None:
-        """Set the current search term and compile regex for highlighting."""
-        self.search_term = term
-        if term:
-            try:
-                self._search_regex = re.compile(re.escape(term), re.IGNORECASE)
-            except re.error:
-                self._search_regex = None
-        else:
-            self._search_regex = None
+    def set_search_regex(self, regex: re.Pattern[str] | None) -> None:
+        """Set the pattern of the search matches to highlight."""
+        self.search_regex = regex
         self.rehighlight()
 
     def _make_format(self, color: str, bold: bool = False) -> QTextCharFormat:
@@ -273,9 +331,9 @@ class LogHighlighter(QSyntaxHighlighter):
 
     def highlightBlock(self, text: str) -> None:
         # Highlight search matches first (highest priority)
-        if self._search_regex:
+        if self.search_regex is not None and self.may_match:
             try:
-                for match in self._search_regex.finditer(text):
+                for match in self.search_regex.finditer(text):
                     start, end = match.span()
                     self.setFormat(start, end - start, self.search_format)
             except Exception:  # noqa: BLE001, S110
@@ -287,9 +345,224 @@ class LogHighlighter(QSyntaxHighlighter):
                 self.setFormat(start, end - start, fmt)
 
 
+class LogLineDelegate(QStyledItemDelegate):
+    """Paints the rows of the log display with the syntax highlighting of
+    ``LogHighlighter``."""
+
+    # Widest line in characters the display scrolls to
+    MAX_LINE_WIDTH = 2000
+
+    def __init__(self, model: LogLineModel, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.model = model
+        self.document = QTextDocument(self)
+        self.document.setDocumentMargin(0)
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapMode.NoWrap)
+        self.document.setDefaultTextOption(option)
+        self.highlighter = LogHighlighter(self.document)
+        self.selection_color = QColor("#0076FC")
+        # Rows whose search matches are highlighted, searched for in the rows
+        # not indexed yet
+        self.match_index: LogMatchIndex | None = None
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        rect = option.rect
+        painter.save()
+        background = index.data(Qt.ItemDataRole.BackgroundRole)
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, self.selection_color)
+        elif background is not None:
+            painter.fillRect(rect, background)
+
+        row, match_index = index.row(), self.match_index
+        self.highlighter.may_match = (
+            match_index is None or row >= match_index.searched or row in match_index
+        )
+        self.document.setDefaultFont(option.font)
+        self.document.setPlainText(index.data(Qt.ItemDataRole.DisplayRole))
+        painter.translate(rect.topLeft())
+        painter.setClipRect(0, 0, rect.width(), rect.height())
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(
+            QPalette.ColorRole.Text,
+            option.palette.color(QPalette.ColorRole.Text),
+        )
+        self.document.documentLayout().draw(painter, context)
+        painter.restore()
+
+    def sizeHint(
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        # Every row has the size of the first, so it fits the longest line
+        metrics = option.fontMetrics
+        width = metrics.horizontalAdvance("M") * min(
+            self.model.log.longest_line, self.MAX_LINE_WIDTH
+        )
+        return QSize(width, metrics.height() + 2)
+
+
+class LogTaskSignals(QObject):
+    """Signals of a LogTask, which also cancel it. The thread pool deletes
+    the task once it has run, so the task is only referred to by these."""
+
+    # Each result of the task
+    result = Signal(object)
+    finished = Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+class LogTask(QRunnable):
+    """
+    Runs a job on the player log on a background thread.
+
+    :param job: Called with a function that tells whether the task was
+        cancelled, and returns the results of the job. It is called on the
+        current thread, so it can set which lines the job reads.
+    """
+
+    def __init__(self, job: Callable[[Callable[[], bool]], Iterable[object]]) -> None:
+        super().__init__()
+        self.signals = LogTaskSignals()
+        self.results = job(self.signals.cancelled.is_set)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            for result in self.results:
+                if self.signals.cancelled.is_set():
+                    return
+                self.signals.result.emit(result)
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Failed to process the player log: {e}")
+        finally:
+            self.signals.finished.emit()
+
+
+def start_log_task(
+    job: Callable[[Callable[[], bool]], Iterable[object]],
+    on_result: Callable[[Any], None],
+    on_finished: Callable[[], None],
+) -> LogTaskSignals:
+    """
+    Start a LogTask on the global thread pool.
+
+    :param job: The job of the task
+    :param on_result: Slot called with each result of the job
+    :param on_finished: Slot called when the task is done
+    :return: Signals of the task, to tell which task a slot is called by
+    """
+    task = LogTask(job)
+    task.signals.result.connect(on_result)
+    task.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(task)
+    return task.signals
+
+
+class LogMatchIndex(QObject):
+    """
+    Rows of the log display whose line matches a pattern.
+
+    The rows are searched on a background task, and ``update`` searches the
+    rows shown since, so each row is only searched once per pattern.
+
+    :param model: The rows to search
+    :param regex: The pattern to search for
+    :param parent: Parent object
+    """
+
+    # Rows were added to ``rows``
+    found = Signal()
+    # The rows shown are all searched
+    finished = Signal()
+
+    def __init__(
+        self,
+        model: LogLineModel,
+        regex: re.Pattern[str],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.model = model
+        self.regex = regex
+        # Matching rows, in ascending order
+        self.rows: list[int] = []
+        # Number of rows searched
+        self.searched = 0
+        self._task: LogTaskSignals | None = None
+        # Number of the row the running search stops before
+        self._stop = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self._task is None and self.searched >= self.model.rowCount()
+
+    def __contains__(self, row: int) -> bool:
+        position = bisect_left(self.rows, row)
+        return position < len(self.rows) and self.rows[position] == row
+
+    def update(self) -> None:
+        """Search the rows shown since the last search, unless searching."""
+        if self._task is not None or self.searched >= self.model.rowCount():
+            return
+        log, first_row = self.model.log, self.searched
+        rows = self.model.rows[first_row:]
+        self._stop = first_row + len(rows)
+        self._task = start_log_task(
+            lambda cancelled: log.matching_rows(
+                [self.regex], rows, first_row, cancelled
+            ),
+            self._on_found,
+            self._on_finished,
+        )
+
+    def truncate(self, row: int) -> None:
+        """Forget the matches from ``row`` on, as the rows there changed."""
+        if row >= (self.searched if self._task is None else self._stop):
+            return
+        self.cancel()
+        self.searched = min(self.searched, row)
+        del self.rows[bisect_left(self.rows, row) :]
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @Slot(object)
+    def _on_found(self, result: tuple[int, array[int]]) -> None:
+        if self._task is None or self.sender() is not self._task:
+            return
+        self.searched, rows = result
+        if rows:
+            self.rows.extend(rows)
+            self.found.emit()
+
+    @Slot()
+    def _on_finished(self) -> None:
+        if self._task is None or self.sender() is not self._task:
+            return
+        self._task = None
+        # Rows may have been shown during the search
+        self.update()
+        if self.is_complete:
+            self.finished.emit()
+
+
 class PlayerLogTab(QWidget):
-    matches: list[QTextCursor]
-    last_log_size: int
+    # Rows of the search matches
+    matches: list[int]
     total_lines_label: QPushButton
     info_label: QPushButton
     keybind_label: QPushButton
@@ -313,14 +586,26 @@ class PlayerLogTab(QWidget):
     )
     _error_pattern = re.compile(r"\b(error|failed|fatal)\b|\[E\]", re.IGNORECASE)
     _exception_pattern = re.compile(r"exception", re.IGNORECASE)
+    _issue_pattern = re.compile(
+        "|".join(
+            f"(?:{pattern.pattern})"
+            for pattern in (
+                _keybind_pattern,
+                _mod_issue_pattern,
+                _warning_pattern,
+                _error_pattern,
+                _exception_pattern,
+            )
+        ),
+        re.IGNORECASE,
+    )
 
     def __init__(self, settings: Settings) -> None:
         super().__init__()
         self.settings = settings
         self.player_log_path: Path | None = None
-        self.log_storage = LogContentStorage()  # Use new memory-efficient storage
-        self.current_log_content: str = ""
-        self.filtered_content: str = ""
+        self.player_log = PlayerLog()
+        self.url: str | None = None
         self.log_stats: dict[str, int] = {
             "total_lines": 0,
             "infos": 0,
@@ -331,19 +616,30 @@ class PlayerLogTab(QWidget):
             "exceptions": 0,
         }
         self.highlighter: LogHighlighter
-        self.log_display: QTextEdit
+        self.log_display: QListView
+        self.log_model: LogLineModel
         self.current_match_index: int = -1
         self.matches = []
-        self.last_log_size: int = 0
         self._last_nav_pattern: str | None = None
-        self._pattern_matches_cache: dict[str, list[QTextCursor]] = {}
-        self._pattern_regex_cache: dict[str, QRegularExpression] = {}
+        # Rows matching each quick navigation pattern
+        self._pattern_indexes: dict[str, LogMatchIndex] = {}
+        self._pattern_regex_cache: dict[str, re.Pattern[str] | None] = {}
+        # Rows matching the search text
+        self._search_index: LogMatchIndex | None = None
+        # Quick navigation pattern and direction to go once more rows are
+        # searched
+        self._pending_navigation: tuple[str, bool] | None = None
+        # Signals of the running filter, and the line to filter again from
+        # once it is done
+        self._filter: LogTaskSignals | None = None
+        self._filter_from: int | None = None
+        # Signals of the running scan
+        self._scan: LogTaskSignals | None = None
+        # Offsets the running scan starts and ends at, for its progress
+        self._scan_range = (0, 0)
 
         self.bookmarked_lines: set[int] = set()  # Store line numbers of bookmarks
 
-        self.quick_nav_highlight_format = QTextCharFormat()
-        self.quick_nav_highlight_format.setBackground(QColor("#0076FC"))
-
         self._file_change_debounce_timer = QTimer(self)
         self._file_change_debounce_timer.setSingleShot(True)
         self._file_change_debounce_timer.setInterval(
@@ -355,30 +651,6 @@ class PlayerLogTab(QWidget):
         # Delay loading the log by 5 seconds after initialization
         QTimer.singleShot(5000, self._delayed_load_log)
 
-    def _collapse_repeated_lines(self, lines: list[str]) -> list[str]:
-        """Collapse consecutive repeated lines into a single line with a count."""
-        if not lines:
-            return []
-        collapsed_lines = []
-        prev_line = lines[0]
-        count = 1
-        for line in lines[1:]:
-            if line == prev_line:
-                count += 1
-            else:
-                if count > 1:
-                    collapsed_lines.append(f"{prev_line} (Repeated {count} times)")
-                else:
-                    collapsed_lines.append(prev_line)
-                prev_line = line
-                count = 1
-        # Handle last group
-        if count > 1:
-            collapsed_lines.append(f"{prev_line} (Repeated {count} times)")
-        else:
-            collapsed_lines.append(prev_line)
-        return collapsed_lines
-
     def _delayed_load_log(self) -> None:
         if self.settings.auto_load_player_log_on_startup:
             self.player_log_path = self._get_player_log_path()
@@ -390,21 +662,19 @@ class PlayerLogTab(QWidget):
         self.settings.save()
 
     def set_highlight_color(self, color: QColor) -> None:
+        """Set the color used for search term highlighting and quick navigation."""
         self.highlighter.set_highlight_color(color)
-        self.quick_nav_highlight_format.setBackground(color)
-        self._highlight_quick_navigation(color)
-
-    def _highlight_quick_navigation(self, color: QColor) -> None:
-        """Highlight quick navigation matches with the given color."""
-        self.highlighter.set_highlight_color(color)
-        self.search_text_changed(self.search_input.text() if self.search_input else "")
-
-    def _clear_log_display(self) -> None:
-        self.log_display.clear()
+        self.log_delegate.selection_color = color
+        self.log_display.viewport().update()
 
     def clear_log(self) -> None:
         """Clear the log content, statistics, and display."""
-        self.log_storage.clear()
+        self._cancel_scan()
+        self._cancel_filter()
+        self.player_log = PlayerLog(self.player_log_path)
+        self.log_model.reset(self.player_log)
+        self._reset_match_indexes()
+        self.search_text_changed(self.search_input.text())
         self.log_stats = {
             "total_lines": 0,
             "infos": 0,
@@ -414,16 +684,11 @@ class PlayerLogTab(QWidget):
             "errors": 0,
             "exceptions": 0,
         }
-        self.last_log_size = 0
-        self._clear_log_display()
         self._update_statistics()
         self._update_file_info()
 
     def scroll_to_end(self) -> None:
-        cursor = self.log_display.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_display.setTextCursor(cursor)
-        self.log_display.ensureCursorVisible()
+        self.log_display.scrollToBottom()
 
     def _get_player_log_path(self) -> Path | None:
         try:
@@ -451,10 +716,6 @@ class PlayerLogTab(QWidget):
         self._init_left_panel()
         self._init_middle_panel()
 
-        # Add context menu action for bookmarking lines
-        self.log_display.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.log_display.customContextMenuRequested.connect(self.show_context_menu)
-
         self.horizontal_splitter = QSplitter(Qt.Orientation.Horizontal)
         self.horizontal_splitter.setObjectName("logSplitter")
         self.horizontal_splitter.setSizePolicy(
@@ -497,9 +758,23 @@ class PlayerLogTab(QWidget):
         self.middle_layout = QVBoxLayout(self.middle_panel)
         self.middle_layout.setContentsMargins(8, 8, 8, 8)
 
-        self.log_display = QTextEdit()
+        self.log_model = LogLineModel(self)
+        self.log_model.bookmarks = self.bookmarked_lines
+        self.log_display = QListView()
         self.log_display.setObjectName("logDisplay")
-        self.log_display.setReadOnly(True)
+        self.log_display.setModel(self.log_model)
+        # Rows are only laid out and decoded when they are visible
+        self.log_display.setUniformItemSizes(True)
+        # Lay the rows of long logs out while events are processed
+        self.log_display.setLayoutMode(QListView.LayoutMode.Batched)
+        self.log_display.setBatchSize(20000)
+        self.log_display.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        self.log_display.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.log_display.setHorizontalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
         self.log_display.setFont(QFont("Consolas", 10))
         self.log_display.setMinimumSize(400, 200)
         self.log_display.setSizePolicy(
@@ -507,9 +782,16 @@ class PlayerLogTab(QWidget):
         )
         self.log_display.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.log_display.customContextMenuRequested.connect(self.show_context_menu)
+        copy_action = QAction(self.tr("Copy"), self.log_display)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_action.triggered.connect(self.copy_selected_lines)
+        self.log_display.addAction(copy_action)
         self.middle_layout.addWidget(self.log_display)
 
-        self.highlighter = LogHighlighter(self.log_display.document())
+        self.log_delegate = LogLineDelegate(self.log_model, self.log_display)
+        self.log_display.setItemDelegate(self.log_delegate)
+        self.highlighter = self.log_delegate.highlighter
 
     def _init_file_info_group(self) -> None:
         file_info_group = QGroupBox(self.tr("File Info"))
@@ -737,17 +1019,13 @@ class PlayerLogTab(QWidget):
                 self.tr("All Issues"),
             ]
         )
-        self.filter_combo.currentIndexChanged.connect(
-            lambda _: self.apply_filter(clear_log=True, filter_type="Type")
-        )
+        self.filter_combo.currentIndexChanged.connect(lambda _: self.apply_filter())
         filter_layout.addWidget(self.filter_combo)
 
         self.mod_filter_input = QLineEdit()
         self.mod_filter_input.setObjectName("modFilterInput")
         self.mod_filter_input.setPlaceholderText(self.tr("Filter by mod name..."))
-        self.mod_filter_input.textChanged.connect(
-            lambda _: self.apply_filter(clear_log=True, filter_type="Search")
-        )
+        self.mod_filter_input.textChanged.connect(lambda _: self.apply_filter())
         filter_layout.addWidget(self.mod_filter_input)
         search_filter_layout.addLayout(filter_layout)
 
@@ -865,55 +1143,24 @@ class PlayerLogTab(QWidget):
             if self.player_log_path is None:
                 logger.debug("Player log path is None in _process_file_change.")
                 return
+            if self._scan is not None:
+                # Check again once the running scan is done
+                self._file_change_debounce_timer.start()
+                return
+            if self.player_log.is_replaced():
+                logger.debug("Player log was replaced, reloading log.")
+                self.load_log()
+                return
             current_size = self.player_log_path.stat().st_size
             logger.debug(
-                f"_process_file_change: current_size={current_size}, last_log_size={self.last_log_size}"
+                f"_process_file_change: current_size={current_size}, indexed_size={self.player_log.size}"
             )
-            with open(
-                self.player_log_path, "r", encoding="utf-8", errors="ignore"
-            ) as f:
-                while True:
-                    if current_size < self.last_log_size:
-                        logger.debug(
-                            "File size smaller than last log size, treating as reset."
-                        )
-                        self.log_storage.clear()
-                        self.last_log_size = 0
-                        self.load_log()
-                        current_size = self.player_log_path.stat().st_size
-                        continue
-                    f.seek(self.last_log_size)
-                    new_content = f.read()
-                    logger.debug(
-                        f"Read {len(new_content)} new characters from log file: {new_content[:100]}..."  # Log first 100 characters
-                    )
-                    if new_content.startswith("Mono path"):
-                        logger.debug(
-                            "New content starts with 'Mono path', reloading log."
-                        )
-                        self.log_storage.clear()
-                        self.last_log_size = 0
-                        self.load_log()
-                        current_size = self.player_log_path.stat().st_size
-                        continue
-                    if not new_content:
-                        logger.debug("No new content read from log file.")
-                        # Instead of breaking, restart the debounce timer to keep monitoring
-                        self._file_change_debounce_timer.start()
-                        return
-                    logger.debug(
-                        f"Appending {len(new_content)} new characters to log content."
-                    )
-                    self.log_storage.append(new_content)  # Use new storage method
-                    self.current_log_content = str(
-                        self.log_storage
-                    )  # Keep for backward compatibility
-                    self.last_log_size = current_size
-                    break
-            self._analyze_log_content(new_content)  # Analyze only the new content
-            self._update_file_info()
-            self._update_statistics()
-            self.apply_filter(new_content)
+            if current_size == self.player_log.size:
+                logger.debug("No new content in log file.")
+                # Instead of stopping, restart the debounce timer to keep monitoring
+                self._file_change_debounce_timer.start()
+                return
+            self._start_scan()
         except Exception as e:  # noqa: BLE001
             logger.error(f"Error reading appended log content: {e!s}")
             self._file_change_debounce_timer.start()  # Restart the debounce timer on error
@@ -1003,69 +1250,131 @@ class PlayerLogTab(QWidget):
         self.color_picker_button.setEnabled(True)
         self.nav_group.setEnabled(True)
 
-    def load_log(self, chunk_size: int = 1024) -> None:
-        """Load the player log file content in chunks for lazy loading."""
+    def load_log(self) -> None:
+        """Load the player log file, scanning it on a background thread."""
         if self.player_log_path is None or not self.player_log_path.exists():
             show_warning("Player log file does not exist.")
             return
-        try:
-            self.clear_log()
-            self.progress_bar.setValue(0)
-            self.progress_bar.show()
-            self.disable_options()
-            self.log_storage.clear()  # Clear previous content
-            self.log_stats = {
-                "total_lines": 0,
-                "infos": 0,
-                "keybinds": 0,
-                "mod_issues": 0,
-                "warnings": 0,
-                "errors": 0,
-                "exceptions": 0,
-            }
-            with open(
-                self.player_log_path, "r", encoding="utf-8", errors="ignore"
-            ) as f:
-                total_chunks = max(
-                    1,
-                    (self.player_log_path.stat().st_size + chunk_size - 1)
-                    // chunk_size,
-                )
-                chunk_cnt = 0
-                self.progress_bar.setTextVisible(True)
-                self.progress_bar.setFormat(self.tr("Reading file... %p%"))
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    self.log_storage.append(chunk)  # Use new storage method
-                    self._analyze_log_content(chunk)
-                    chunk_cnt += 1
-                    progress = (chunk_cnt / total_chunks) * 100
-                    self.progress_bar.setValue(int(progress))
-                    QApplication.processEvents()
-
-            self.last_log_size = len(self.log_storage)  # Update based on new storage
-            self.current_log_content = str(
-                self.log_storage
-            )  # Keep for backward compatibility
-            self._update_file_info()
-            self._update_statistics()
-            self.apply_filter()
-            self.enable_options()
-            logger.info(
-                "Loaded player log file in chunks using memory-efficient storage."
-            )
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Failed to load player log file: {e}")
+        self.clear_log()
+        self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.setFormat(self.tr("Reading file... %p%"))
+        self.progress_bar.show()
+        self.disable_options()
+        self._start_scan()
+
+    def _start_scan(self) -> None:
+        """Scan the player log from where the previous scan ended."""
+        log = self.player_log
+        size = len(log.content) if log.path is None else log.path.stat().st_size
+        self._scan_range = (log.size, size)
+        patterns = LogPatternManager.get_statistics_patterns()
+        self._scan = start_log_task(
+            lambda cancelled: log.scan(patterns, cancelled),
+            self._on_log_scanned,
+            self._on_log_scan_finished,
+        )
+
+    def _cancel_scan(self) -> None:
+        if self._scan is not None:
+            self._scan.cancel()
+            self._scan = None
             self.progress_bar.hide()
-            self.enable_options()
+
+    def _is_current_scan(self) -> bool:
+        return self._scan is not None and self.sender() is self._scan
+
+    @Slot(object)
+    def _on_log_scanned(self, result: LogScan | LogStatistics) -> None:
+        if not self._is_current_scan():
+            return
+        if isinstance(result, LogStatistics):
+            self.player_log.add_statistics(result)
+        else:
+            self.player_log.apply(result)
+            self._show_lines_from(result.first_line)
+            start, end = self._scan_range
+            indexed = result.offsets[-1]
+            if end > start:
+                progress = (indexed - start) / (end - start) * 100
+                self.progress_bar.setValue(min(100, int(progress)))
+            if indexed >= end:
+                # The lines can be browsed while their statistics are counted
+                self.progress_bar.setFormat(self.tr("Counting log statistics..."))
+                self.enable_options()
+        self.log_stats.update(
+            total_lines=self.player_log.line_count, **self.player_log.statistics
+        )
+        self._update_statistics()
+
+    @Slot()
+    def _on_log_scan_finished(self) -> None:
+        if not self._is_current_scan():
+            return
+        self._scan = None
+        self.progress_bar.setValue(100)
+        self.progress_bar.hide()
+        self._update_file_info()
+        self.enable_options()
+        logger.info(
+            f"Indexed {self.player_log.line_count} lines of the player log "
+            f"({self.player_log.size} bytes)."
+        )
+
+    def _show_lines_from(self, first_line: int) -> None:
+        """Show the lines from ``first_line`` on that pass the filters."""
+        patterns = self._filter_patterns()
+        if patterns and self._filter is not None:
+            # Filtered once the running filter is done
+            if self._filter_from is None or first_line < self._filter_from:
+                self._filter_from = first_line
+            return
+        self.log_model.truncate(first_line)
+        self._truncate_match_indexes(self.log_model.rowCount())
+        if patterns:
+            log = self.player_log
+            previous = self.log_model.last_line()
+            previous_count = (
+                self.log_model.counts.get(previous, 1) if previous is not None else 1
+            )
+            self._filter = start_log_task(
+                lambda cancelled: log.filtered_rows(
+                    patterns, first_line, previous, previous_count, cancelled
+                ),
+                self._on_lines_filtered,
+                self._on_filter_finished,
+            )
+        else:
+            self.log_model.append(*self.player_log.rows(first_line))
+            self._update_match_indexes()
+
+    def _cancel_filter(self) -> None:
+        if self._filter is not None:
+            self._filter.cancel()
+            self._filter = None
+        self._filter_from = None
+
+    @Slot(object)
+    def _on_lines_filtered(self, result: tuple[array[int], dict[int, int]]) -> None:
+        if self._filter is None or self.sender() is not self._filter:
+            return
+        self.log_model.append(*result)
+        self._update_match_indexes()
+
+    @Slot()
+    def _on_filter_finished(self) -> None:
+        if self._filter is None or self.sender() is not self._filter:
+            return
+        self._filter = None
+        first_line, self._filter_from = self._filter_from, None
+        if first_line is not None:
+            self._show_lines_from(first_line)
 
     def _update_file_info(self) -> None:
         """Update the file info labels with path, size, and last modified date."""
         if self.player_log_path is None:
             # Show info for logs loaded from URL
-            if self.current_log_content:
+            if self.player_log.content:
                 url = self.url
                 if url:
                     self.file_path_label.setText(
@@ -1075,7 +1384,7 @@ class PlayerLogTab(QWidget):
                     self.file_path_label.setText(self.tr("Path: Loaded from URL"))
                 self.file_size_label.setText(
                     self.tr("Size: {size:,} bytes").format(
-                        size=len(self.current_log_content)
+                        size=len(self.player_log.content)
                     )
                 )
                 self.last_modified_label.setText(self.tr("Modified: N/A"))
@@ -1103,7 +1412,7 @@ class PlayerLogTab(QWidget):
                 return f"{size:.1f} PB"
 
             size_str = format_size(size_bytes)
-            modified_str = datetime.fromtimestamp(modified_time).strftime(  # noqa: DTZ006
+            modified_str = datetime.fromtimestamp(modified_time).strftime(
                 "%Y-%m-%d %H:%M:%S"
             )
 
@@ -1134,163 +1443,163 @@ class PlayerLogTab(QWidget):
         self.search_text_changed(self.search_input.text() if self.search_input else "")
 
     def search_text_changed(self, text: str) -> None:
-        self.highlighter.set_search_term(text)
-        self.matches.clear()
+        """Search the rows shown for the text, on a background task."""
+        if self._search_index is not None:
+            self._search_index.cancel()
+            self._search_index.deleteLater()
+            self._search_index = None
+        self.matches = []
         self.current_match_index = -1
-        if not text:
-            self._update_match_count()
+        regex = self._get_cached_regex(text) if text else None
+        if regex is not None:
+            index = LogMatchIndex(self.log_model, regex, self)
+            index.found.connect(self._on_search_found)
+            index.finished.connect(self._update_match_count)
+            self._search_index = index
+            self.matches = index.rows
+            index.update()
+        self.highlighter.set_search_regex(regex)
+        self.log_delegate.match_index = self._search_index
+        self.log_display.viewport().update()
+        self._update_match_count()
+
+    @Slot()
+    def _on_search_found(self) -> None:
+        if self.sender() is not self._search_index:
             return
-        cursor = self.log_display.textCursor()
-        document = self.log_display.document()
-        regex = QRegularExpression(
-            text, QRegularExpression.PatternOption.CaseInsensitiveOption
-        )
-        pos = 0
-        while True:
-            match = regex.match(document.toPlainText(), pos)
-            if not match.hasMatch():
-                break
-            start = match.capturedStart()
-            end = match.capturedEnd()
-            cursor.setPosition(start)
-            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
-            self.matches.append(QTextCursor(cursor))
-            pos = end
-        if self.matches:
+        if self.current_match_index < 0:
             self.current_match_index = 0
-            self.log_display.setTextCursor(self.matches[0])
+            self._select_row(self.matches[0])
+        self._update_match_count()
+
+    def _match_indexes(self) -> list[LogMatchIndex]:
+        indexes = list(self._pattern_indexes.values())
+        if self._search_index is not None:
+            indexes.append(self._search_index)
+        return indexes
+
+    def _update_match_indexes(self) -> None:
+        """Search the rows shown since the match indexes were updated."""
+        for index in self._match_indexes():
+            index.update()
+
+    def _truncate_match_indexes(self, row: int) -> None:
+        """Forget the matches from ``row`` on, as the rows there changed."""
+        for index in self._match_indexes():
+            index.truncate(row)
+        if self.current_match_index >= len(self.matches):
+            self.current_match_index = len(self.matches) - 1
         self._update_match_count()
 
+    def _reset_match_indexes(self) -> None:
+        """Forget the matches of the quick navigation patterns."""
+        for index in self._pattern_indexes.values():
+            index.cancel()
+            index.deleteLater()
+        self._pattern_indexes.clear()
+        self._pending_navigation = None
+
+    def _select_row(self, row: int) -> None:
+        index = self.log_model.index(row)
+        self.log_display.setCurrentIndex(index)
+        self.log_display.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+
     def goto_previous_match(self) -> None:
         if not self.matches:
             return
         self.current_match_index = (self.current_match_index - 1) % len(self.matches)
-        if self.current_match_index < 0:
-            self.current_match_index = (
-                len(self.matches) - 1
-            )  # Wrap around to last match
-        self.log_display.setTextCursor(self.matches[self.current_match_index])
+        self._select_row(self.matches[self.current_match_index])
         self._update_match_count()
 
     def goto_next_match(self) -> None:
         if not self.matches:
             return
         self.current_match_index = (self.current_match_index + 1) % len(self.matches)
-        self.log_display.setTextCursor(self.matches[self.current_match_index])
+        self._select_row(self.matches[self.current_match_index])
         self._update_match_count()
 
-    def _get_cached_regex(self, pattern: str) -> QRegularExpression:
-        """Get a cached regex object or create and cache a new one."""
+    def _get_cached_regex(self, pattern: str) -> re.Pattern[str] | None:
+        """Get a cached regex object or create and cache a new one.
+
+        Returns None if the pattern is not a valid regex.
+        """
         if pattern not in self._pattern_regex_cache:
-            self._pattern_regex_cache[pattern] = QRegularExpression(
-                pattern, QRegularExpression.PatternOption.CaseInsensitiveOption
-            )
+            try:
+                self._pattern_regex_cache[pattern] = re.compile(pattern, re.IGNORECASE)
+            except re.error:
+                self._pattern_regex_cache[pattern] = None
         return self._pattern_regex_cache[pattern]
 
-    def _get_cached_matches(self, pattern: str) -> list[QTextCursor]:
-        """Get cached matches for a pattern or find and cache them."""
-        if pattern not in self._pattern_matches_cache:
+    def _get_pattern_index(self, pattern: str) -> LogMatchIndex | None:
+        """Get the match index of a quick navigation pattern, creating it if needed."""
+        index = self._pattern_indexes.get(pattern)
+        if index is None:
             regex = self._get_cached_regex(pattern)
-            document = self.log_display.document()
-            plain_text = document.toPlainText()
-
-            matches = []
-            it = regex.globalMatch(plain_text)
-            while it.hasNext():
-                match = it.next()
-                if match.hasMatch():
-                    cursor = QTextCursor(document)
-                    cursor.setPosition(match.capturedStart())
-                    cursor.setPosition(
-                        match.capturedEnd(), QTextCursor.MoveMode.KeepAnchor
-                    )
-                    matches.append(QTextCursor(cursor))
-
-            self._pattern_matches_cache[pattern] = matches
-
-        return self._pattern_matches_cache[pattern]
-
-    def _clear_pattern_cache(self, pattern: str | None = None) -> None:
-        """Clear cached matches for a specific pattern or all patterns."""
-        if pattern:
-            self._pattern_matches_cache.pop(pattern, None)
-        else:
-            self._pattern_matches_cache.clear()
+            if regex is None:
+                return None
+            index = LogMatchIndex(self.log_model, regex, self)
+            index.found.connect(self._retry_navigation)
+            index.finished.connect(self._retry_navigation)
+            self._pattern_indexes[pattern] = index
+            index.update()
+        return index
 
     def goto_previous_pattern(self, pattern: str) -> None:
-        """Navigate to the previous occurrence of the pattern with caching and wrapping."""
-        if not pattern:
-            return
-        try:
-            matches = self._get_cached_matches(pattern)
-            if not matches:
-                return
-
-            current_cursor = self.log_display.textCursor()
-            current_pos = current_cursor.position()
-
-            # Find the previous match (closest match before current position)
-            prev_match = None
-            for i in range(len(matches) - 1, -1, -1):
-                match_cursor = matches[i]
-                if match_cursor.selectionStart() < current_pos:
-                    prev_match = match_cursor
-                    break
-
-            # wrap around to the last match, If no previous match found (cursor is before first match or at start)
-            if prev_match is None and matches:
-                prev_match = matches[-1]
-
-            if prev_match:
-                self.log_display.setTextCursor(QTextCursor(prev_match))
-                self.log_display.ensureCursorVisible()
-
-                # Update visual feedback
-                self._update_navigation_feedback(pattern, len(matches))
-
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Error in goto_previous_pattern: {e}")
-            self._clear_pattern_cache(pattern)
+        """Navigate to the previous occurrence of the pattern, wrapping around."""
+        self._goto_pattern(pattern, forward=False)
 
     def goto_next_pattern(self, pattern: str) -> None:
-        """Navigate to the next occurrence of the pattern with caching and wrapping."""
-        try:
-            matches = self._get_cached_matches(pattern)
-            if not matches:
-                return
-
-            current_cursor = self.log_display.textCursor()
-            current_pos = current_cursor.position()
-
-            # Find the next match
-            next_match = None
-            for match_cursor in matches:
-                if match_cursor.selectionStart() > current_pos:
-                    next_match = match_cursor
-                    break
-
-            # If no next match found, wrap around to the first match
-            if next_match is None and matches:
-                next_match = matches[0]
-
-            if next_match:
-                self.log_display.setTextCursor(QTextCursor(next_match))
-                self.log_display.ensureCursorVisible()
-
-                # Update visual feedback
-                self._update_navigation_feedback(pattern, len(matches))
+        """Navigate to the next occurrence of the pattern, wrapping around."""
+        self._goto_pattern(pattern, forward=True)
+
+    def _goto_pattern(self, pattern: str, forward: bool) -> None:
+        """
+        Select the next or previous row matching a quick navigation pattern.
+        If the rows it may be in are still being searched, it is selected
+        once they are.
+
+        :param pattern: The quick navigation pattern
+        :param forward: Whether to select the next row, or the previous one
+        """
+        if not pattern:
+            return
+        index = self._get_pattern_index(pattern)
+        if index is None:
+            return
+        self._pending_navigation = None
+        rows = index.rows
+        current_row = self.log_display.currentIndex().row()
+        target = None
+        if forward:
+            position = bisect_right(rows, current_row)
+            if position < len(rows):
+                target = rows[position]
+            elif index.is_complete and rows:
+                target = rows[0]
+        else:
+            position = bisect_left(rows, current_row) - 1
+            if position >= 0 and index.searched >= current_row:
+                target = rows[position]
+            elif index.is_complete and rows:
+                target = rows[-1]
+        if target is None:
+            if not index.is_complete:
+                self._pending_navigation = (pattern, forward)
+            return
+        self._select_row(target)
+        self._update_navigation_feedback(pattern, len(rows))
 
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Error in goto_next_pattern: {e}")
-            self._clear_pattern_cache(pattern)
+    @Slot()
+    def _retry_navigation(self) -> None:
+        if self._pending_navigation is None:
+            return
+        pattern, forward = self._pending_navigation
+        if self.sender() is self._pattern_indexes.get(pattern):
+            self._goto_pattern(pattern, forward)
 
     def _update_navigation_feedback(self, pattern: str, total_matches: int) -> None:
         """Update visual feedback for navigation."""
-        # Highlight the current match temporarily
-        cursor = self.log_display.textCursor()
-        cursor.select(QTextCursor.SelectionType.WordUnderCursor)
-        cursor.mergeCharFormat(self.quick_nav_highlight_format)
-
+        # The selected row is painted in the highlight color
         # Update status message (optional - could be shown in a status bar)
         logger.debug(
             f"Navigated to pattern '{pattern}' - {total_matches} total matches"
@@ -1312,7 +1621,7 @@ class PlayerLogTab(QWidget):
             self.load_log()
 
     def load_log_from_link(self) -> None:
-        def load_log_from_link_in_chunks() -> None:
+        def load_log_from_link_in_chunks() -> bytes:
             self.progress_bar.setFormat(self.tr("Reading log from URL... %p%"))
             self.progress_bar.setValue(0)
             self.progress_bar.setTextVisible(True)
@@ -1329,35 +1638,34 @@ class PlayerLogTab(QWidget):
                     break
                 chunks.append(chunk)
                 downloaded += len(chunk)
-                self._analyze_log_content(chunk.decode("utf-8", errors="ignore"))
 
                 if total_size:
                     progress = int((downloaded / total_size) * 100)
                     self.progress_bar.setValue(progress)
                 QApplication.processEvents()
 
-            self.current_log_content = b"".join(chunks).decode("utf-8", errors="ignore")
             self.progress_bar.setValue(100)
+            return b"".join(chunks)
 
         url, ok = QInputDialog.getText(
             self, self.tr("Load Log from Link"), self.tr("Enter URL:")
         )
         if ok and url:
             try:
-                self.clear_log()
                 self.disable_options()
-                load_log_from_link_in_chunks()
+                content = load_log_from_link_in_chunks()
                 self.player_log_path = None  # Not a file
                 self.url = url
-                self._update_file_info()
-                self._update_statistics()
-                self.apply_filter()
-                self.enable_options()
+                self.clear_log()
+                self.player_log.content = content
+                self._start_scan()
                 show_information(
                     title=self.tr("Log loaded successfully from URL"),
                     text=f"{url}",
                 )
             except Exception as e:  # noqa: BLE001
+                self.progress_bar.hide()
+                self.enable_options()
                 show_warning(
                     title=self.tr("Failed to load log from URL"),
                     text=self.tr("Failed due to error: {error}").format(error=e),
@@ -1373,37 +1681,54 @@ class PlayerLogTab(QWidget):
         if file_path:
             try:
                 with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(self.filtered_content)
+                    for row, text in enumerate(self.log_model.row_texts()):
+                        if row:
+                            f.write("\n")
+                        f.write(text)
                 show_information(f"Log exported to {file_path}")
             except OSError as e:
                 show_warning(f"Failed to export log: {e.strerror}")
             except Exception as e:  # noqa: BLE001
                 show_warning(f"Failed to export log: {type(e).__name__}: {e}")
 
+    def copy_selected_lines(self) -> None:
+        """Copy the text of the selected rows to the clipboard."""
+        rows = sorted(index.row() for index in self.log_display.selectedIndexes())
+        if rows:
+            QApplication.clipboard().setText(
+                "\n".join(self.log_model.text(row) for row in rows)
+            )
+
     def show_context_menu(self, pos: QPoint) -> None:
-        menu = self.log_display.createStandardContextMenu()
-        cursor = self.log_display.cursorForPosition(pos)
-        line_number = cursor.blockNumber()
-        bookmark_action_text = (
-            "Remove Bookmark"
-            if line_number in self.bookmarked_lines
-            else "Add Bookmark"
-        )
-        bookmark_action = menu.addAction(bookmark_action_text)
-        bookmark_action.triggered.connect(lambda: self.toggle_bookmark(line_number))
-        pathmatch = LogPatternManager.PATHLIKE_PATTERN.findall(cursor.block().text())
-        if pathmatch:
-            for path in pathmatch:
-                for candidate in (
-                    path,
-                    path[:-1],
-                ):  # error messages frequently tag on a ] or other terminator character
-                    if os.path.exists(candidate):
-                        menu.addAction(
-                            f"Open '{candidate}'", lambda p=candidate: self.open_file(p)
-                        )
-                        break
-        menu.exec(self.log_display.mapToGlobal(pos))
+        menu = QMenu(self)
+        copy_action = menu.addAction(self.tr("Copy"))
+        copy_action.triggered.connect(self.copy_selected_lines)
+        index = self.log_display.indexAt(pos)
+        if index.isValid():
+            line_number = self.log_model.rows[index.row()]
+            bookmark_action_text = (
+                "Remove Bookmark"
+                if line_number in self.bookmarked_lines
+                else "Add Bookmark"
+            )
+            bookmark_action = menu.addAction(bookmark_action_text)
+            bookmark_action.triggered.connect(lambda: self.toggle_bookmark(line_number))
+            pathmatch = LogPatternManager.PATHLIKE_PATTERN.findall(
+                self.log_model.text(index.row())
+            )
+            if pathmatch:
+                for path in pathmatch:
+                    for candidate in (
+                        path,
+                        path[:-1],
+                    ):  # error messages frequently tag on a ] or other terminator character
+                        if os.path.exists(candidate):
+                            menu.addAction(
+                                f"Open '{candidate}'",
+                                lambda p=candidate: self.open_file(p),
+                            )
+                            break
+        menu.exec(self.log_display.viewport().mapToGlobal(pos))
 
     def open_file(self, file_path: str) -> None:
         if self.settings.text_editor_location:
@@ -1421,129 +1746,37 @@ class PlayerLogTab(QWidget):
         self.highlight_bookmarks()
 
     def highlight_bookmarks(self) -> None:
-        """Highlight only changed bookmark lines for efficiency."""
-        fmt = QTextCharFormat()
-        fmt.setBackground(QColor("#FFD700"))  # Gold color for bookmarks
-        clear_fmt = QTextCharFormat()
-        clear_fmt.setBackground(QColor("transparent"))
-        doc = self.log_display.document()
-        # Only update lines that are bookmarked
-        for i in range(doc.blockCount()):
-            block = doc.findBlockByNumber(i)
-            cursor = QTextCursor(block)
-            cursor.select(QTextCursor.SelectionType.LineUnderCursor)
-            if i in self.bookmarked_lines:
-                cursor.setCharFormat(fmt)
-            else:
-                cursor.setCharFormat(clear_fmt)
-
-    def _analyze_log_content(self, new_content: str) -> None:
-        """Analyze the log content and update statistics more efficiently."""
-        # NOTE: Gets increasingly slower with chunks over 1024/2048
-        lines = new_content.splitlines()
-        self.log_stats["total_lines"] += len(lines)
-
-        # Use LogPatternManager patterns for consistency
-        for line in lines:
-            if LogPatternManager.INFO_FILTER_PATTERN.search(line):
-                self.log_stats["infos"] += 1
-            if LogPatternManager.KEYBIND_FILTER_PATTERN.search(line):
-                self.log_stats["keybinds"] += 1
-            if LogPatternManager.MOD_ISSUE_FILTER_PATTERN.search(line):
-                self.log_stats["mod_issues"] += 1
-            if LogPatternManager.WARNING_FILTER_PATTERN.search(line):
-                self.log_stats["warnings"] += 1
-            if LogPatternManager.ERROR_FILTER_PATTERN.search(line):
-                self.log_stats["errors"] += 1
-            if LogPatternManager.EXCEPTION_FILTER_PATTERN.search(line):
-                self.log_stats["exceptions"] += 1
-
-    def apply_filter(
-        self,
-        new_content: str = "",
-        clear_log: bool = False,
-        chunk_size: int = 1024,
-        filter_type: str = "",
-    ) -> None:
-        """Apply the selected filter and mod name filter to the log content more efficiently."""
-        if clear_log:
-            self.clear_log()
-        self.progress_bar.setFormat(self.tr("Loading file... %p%"))
-        self.progress_bar.show()
-        filter_text = (
-            self.filter_combo.currentText() if self.filter_combo else "All Entries"
-        )
-        mod_filter = self.mod_filter_input.text() if self.mod_filter_input else ""
-        lines = new_content.splitlines() or self.current_log_content.splitlines()
-
-        if filter_type == "Search":
-            self.disable_options(skip_mod_filter_input=True)
-        elif filter_type == "Type":
-            self.disable_options()
-
-        filtered_lines = []
-        # Precompile combined patterns for filters
-        keybind_pattern = self._keybind_pattern
-        mod_issue_pattern = self._mod_issue_pattern
-        warning_pattern = self._warning_pattern
-        error_pattern = self._error_pattern
-        exception_pattern = self._exception_pattern
-
-        for line in lines:
-            if mod_filter and mod_filter.lower() not in line.lower():
-                continue
-            if (
-                filter_text == self.tr("All Entries")
-                or filter_text == self.tr("Infos Only")
-                and self._info_pattern.search(line)
-                or filter_text == self.tr("Keybinds Only")
-                and keybind_pattern.search(line)
-                or filter_text == self.tr("Mod Issues")
-                and mod_issue_pattern.search(line)
-                or filter_text == self.tr("Warnings Only")
-                and warning_pattern.search(line)
-                or filter_text == self.tr("Errors Only")
-                and error_pattern.search(line)
-                or filter_text == self.tr("Exceptions Only")
-                and exception_pattern.search(line)
-                or filter_text == self.tr("All Issues")
-                and (
-                    keybind_pattern.search(line)
-                    or mod_issue_pattern.search(line)
-                    or warning_pattern.search(line)
-                    or error_pattern.search(line)
-                    or exception_pattern.search(line)
-                )
-            ):
-                filtered_lines.append(line)
-        # Collapse repeated lines before displaying
-        collapsed_lines = self._collapse_repeated_lines(filtered_lines)
-        self.filtered_content = "\n".join(collapsed_lines)
-        scroll_bar = self.log_display.verticalScrollBar()
-        total_chunks = max(
-            1, (len(self.filtered_content) + chunk_size - 1) // chunk_size
-        )
-        chunk_cnt = 0
-        for i in range(0, len(self.filtered_content), chunk_size):
-            old_value = scroll_bar.value()
-            chunk = self.filtered_content[i : i + chunk_size]
-            self.log_display.append(chunk)
-            scroll_bar.setValue(old_value)
-            chunk_cnt += 1  # noqa: SIM113
-            progress = (chunk_cnt / total_chunks) * 100
-            self.progress_bar.setValue(int(progress))
-            QApplication.processEvents()
-
-        self.progress_bar.setValue(100)
-        self.progress_bar.hide()
-
-        self._update_match_count()
-
-        # Optimize the statistics update
-        self._update_statistics()
-
-        if filter_type:
-            self.enable_options()
+        """Repaint the visible rows, so bookmarked lines are highlighted."""
+        self.log_display.viewport().update()
+
+    def _filter_patterns(self) -> list[re.Pattern[str]]:
+        """Get the patterns a line must match to pass the filters."""
+        filter_text = self.filter_combo.currentText()
+        type_patterns = {
+            self.tr("Infos Only"): self._info_pattern,
+            self.tr("Keybinds Only"): self._keybind_pattern,
+            self.tr("Mod Issues"): self._mod_issue_pattern,
+            self.tr("Warnings Only"): self._warning_pattern,
+            self.tr("Errors Only"): self._error_pattern,
+            self.tr("Exceptions Only"): self._exception_pattern,
+            self.tr("All Issues"): self._issue_pattern,
+        }
+        patterns = []
+        if filter_text in type_patterns:
+            patterns.append(type_patterns[filter_text])
+        mod_filter = self.mod_filter_input.text()
+        if mod_filter:
+            patterns.append(re.compile(re.escape(mod_filter), re.IGNORECASE))
+        return patterns
+
+    def apply_filter(self) -> None:
+        """Show the lines of the log that pass the selected filter and mod
+        name filter. The lines are filtered on a background task."""
+        self._cancel_filter()
+        self.log_model.reset(self.player_log)
+        self._reset_match_indexes()
+        self._show_lines_from(0)
+        self.search_text_changed(self.search_input.text())
 
     def _update_statistics(self) -> None:
         """Update the statistics labels in the UI (consolidated)."""
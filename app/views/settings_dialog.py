@@ -818,6 +818,22 @@ This basically preserves your mod coloring, user notes etc. for this many second
         )
         xml_parsing_group_box_layout.addWidget(self.case_insensitive_about_xml_checkbox)
 
+        self.metadata_parser_threads_radio = QRadioButton(
+            self.tr("Parse mod metadata on threads")
+        )
+        xml_parsing_group_box_layout.addWidget(self.metadata_parser_threads_radio)
+        self.metadata_parser_processes_radio = QRadioButton(
+            self.tr("Parse mod metadata in separate processes")
+        )
+        self.metadata_parser_processes_radio.setToolTip(
+            self.tr(
+                "Parses About.xml files in worker processes so all CPU cores are used.\n"
+                "Speeds up the first scan of large mod collections on multi-core CPUs,\n"
+                "at the cost of a short startup delay for the worker processes."
+            )
+        )
+        xml_parsing_group_box_layout.addWidget(self.metadata_parser_processes_radio)
+
         # Mod list options group
         _, modlist_option_group_box_layout = self._add_group_box(tab_layout)
 
@@ -908,6 +924,19 @@ This basically preserves your mod coloring, user notes etc. for this many second
         )
         modlist_option_group_box_layout.addWidget(self.mod_list_startup_impact_checkbox)
 
+        # Painted mod list rows checkbox
+        self.mod_list_paint_rows_checkbox = QCheckBox(
+            self.tr("Draw mod list rows without per-row widgets")
+        )
+        self.mod_list_paint_rows_checkbox.setToolTip(
+            self.tr(
+                "Draws each mod list row directly instead of creating a widget for it.\n"
+                "Makes scrolling, filtering and rebuilding large mod lists faster.\n"
+                "Applies the next time the mod lists are rebuilt."
+            )
+        )
+        modlist_option_group_box_layout.addWidget(self.mod_list_paint_rows_checkbox)
+
         # Hide invalid mod filtering checkbox
         self.hide_invalid_mods_when_filtering_checkbox = QCheckBox(
             self.tr("Hide invalid mods when filtering")
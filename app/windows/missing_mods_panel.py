@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import Any
 
 from loguru import logger
@@ -157,12 +158,12 @@ class MissingModsPrompt(BaseModsPanel):
         """
         return self.packageids
 
-    def _get_steam_database(self) -> dict[str, Any] | None:
+    def _get_steam_database(self) -> Mapping[str, Any] | None:
         """
-        Get the Steam database dictionary, with null safety.
+        Get the Steam database mapping, with null safety.
 
         Returns:
-            The Steam database dict, or None if unavailable.
+            The Steam database, or None if unavailable.
         """
         steam_db = self.metadata_controller.steam_db
         if steam_db is None:
@@ -32,6 +32,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.controllers.metadata_controller import MetadataController
+from app.models.metadata.metadata_compact_db import compact_enc_hook
 from app.models.metadata.metadata_structure import AboutXmlMod
 from app.utils.app_info import AppInfo
 from app.views.dialogue import show_warning
@@ -134,7 +135,7 @@ class RuleEditor(QWidget):
 
         if schema is None:
             return {}
-        return msgspec.to_builtins(schema.rules)
+        return msgspec.to_builtins(schema.rules, enc_hook=compact_enc_hook)
 
     def __init__(
         self,
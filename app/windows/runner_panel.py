@@ -1,5 +1,5 @@
 import os
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from platform import system
 from re import compile, search
 from typing import TYPE_CHECKING, Any
@@ -46,7 +46,7 @@ class RunnerPanel(QWidget):
         self,
         todds_dry_run_support: bool = False,
         steamcmd_download_tracking: list[str] | None = None,
-        steam_db: dict[str, Any] | None = None,
+        steam_db: Mapping[str, Any] | None = None,
         auto_close_on_complete: bool = False,
     ):
         """
@@ -67,7 +67,7 @@ class RunnerPanel(QWidget):
         self.installEventFilter(self)
         self.previous_line = ""
         self.steamcmd_download_tracking = steamcmd_download_tracking or []
-        self.steam_db = steam_db or {}
+        self.steam_db: Mapping[str, Any] = steam_db or {}
         self.todds_dry_run_support = todds_dry_run_support
         self.auto_close_on_complete = auto_close_on_complete
 
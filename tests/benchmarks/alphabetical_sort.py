@@ -0,0 +1,171 @@
+"""Benchmark do_alphabetical_sort on synthetic mod sets of growing size.
+
+Compares the heap-based sort against the previous implementation, which
+inserted every dependency with repeated ``list.index``/``list.insert`` calls
+from a recursive helper. The previous implementation is only run up to
+``--legacy-max`` mods, and gives up on graphs deeper than the recursion
+limit.
+
+Usage: python -m tests.benchmarks.alphabetical_sort [--sizes 500 2000 5000]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Mapping
+
+from loguru import logger
+
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    CaseInsensitiveStr,
+    ListedMod,
+)
+from app.sort.alphabetical_sort import do_alphabetical_sort
+
+SortFunction = Callable[
+    [dict[str, set[str]], set[str], Mapping[str, ListedMod]], list[str]
+]
+
+
+def build_mods(
+    count: int, deps_per_mod: float = 3.0
+) -> tuple[dict[str, ListedMod], dict[str, set[str]]]:
+    """Build ``count`` mods with random names and an acyclic dependency graph.
+
+    Each mod depends on about ``deps_per_mod`` mods created after it, with a
+    bias towards a few popular frameworks like real mod lists have.
+    """
+    rng = random.Random(42)
+    mods: dict[str, ListedMod] = {}
+    graph: dict[str, set[str]] = {}
+    frameworks = max(1, count // 100)
+    for i in range(count):
+        path = f"/mods/{i:05d}"
+        mods[path] = AboutXmlMod(
+            name=f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}mod {rng.randrange(10**6)}",
+            package_id=CaseInsensitiveStr(f"author{i}.mod"),
+        )
+        deps: set[str] = set()
+        for _ in range(rng.randint(0, int(deps_per_mod * 2))):
+            if i >= count - frameworks - 1:
+                break
+            if rng.random() < 0.5:
+                target = rng.randrange(count - frameworks, count)
+            else:
+                target = rng.randrange(i + 1, count)
+            deps.add(f"author{target}.mod")
+        graph[f"author{i}.mod"] = deps
+    return mods, graph
+
+
+def legacy_alphabetical_sort(
+    dependency_graph: dict[str, set[str]],
+    active_mod_paths: set[str],
+    mods_metadata: Mapping[str, ListedMod],
+) -> list[str]:
+    """The alphabetical sort as it was before the heap-based rewrite."""
+    packageid_to_name: dict[str, str] = {}
+    packageid_to_path: dict[str, str] = {}
+    for path in active_mod_paths:
+        mod = mods_metadata.get(path)
+        if not isinstance(mod, AboutXmlMod):
+            continue
+        pid = str(mod.package_id)
+        packageid_to_name[pid] = mod.name
+        packageid_to_path[pid] = path
+
+    active_mods_alphabetized = sorted(
+        packageid_to_name.items(), key=lambda x: x[1].lower()
+    )
+    mods_load_order: list[str] = []
+
+    def force_insert(package_id: str, index_just_appended: int) -> None:
+        deps_alphabetized = sorted(
+            (
+                (dep_id, packageid_to_name[dep_id])
+                for dep_id in dependency_graph.get(package_id, set())
+                if dep_id in packageid_to_name
+            ),
+            key=lambda x: x[1],
+        )
+        for dep_id, _dep_name in deps_alphabetized:
+            if dep_id not in mods_load_order:
+                index_to_insert_at = index_just_appended
+                for e in reversed(
+                    mods_load_order[
+                        index_just_appended : mods_load_order.index(package_id)
+                    ]
+                ):
+                    if dep_id in dependency_graph and e in dependency_graph[dep_id]:
+                        index_to_insert_at = mods_load_order.index(e) + 1
+                        break
+                mods_load_order.insert(index_to_insert_at, dep_id)
+                force_insert(dep_id, mods_load_order.index(dep_id))
+
+    for package_id, _name in active_mods_alphabetized:
+        if package_id in dependency_graph and package_id not in mods_load_order:
+            mods_load_order.append(package_id)
+            force_insert(package_id, mods_load_order.index(package_id))
+
+    return [
+        packageid_to_path[pid] for pid in mods_load_order if pid in packageid_to_path
+    ]
+
+
+def time_sort(
+    sort: SortFunction,
+    graph: dict[str, set[str]],
+    mods: dict[str, ListedMod],
+    runs: int,
+) -> tuple[float, list[str]]:
+    best = float("inf")
+    result: list[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = sort(graph, set(mods), mods)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--deps", type=float, default=3.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--legacy-max", type=int, default=2000)
+    args = parser.parse_args()
+
+    logger.remove()
+    print(f"{'mods':>6} {'edges':>7} {'heap':>10} {'legacy':>12} {'speedup':>8}")
+    for size in args.sizes:
+        mods, graph = build_mods(size, args.deps)
+        edges = sum(len(deps) for deps in graph.values())
+        heap_time, result = time_sort(do_alphabetical_sort, graph, mods, args.runs)
+
+        position = {path: i for i, path in enumerate(result)}
+        assert len(result) == size
+        assert all(
+            position[f"/mods/{int(dep[6:-4]):05d}"] < position[f"/mods/{i:05d}"]
+            for i, deps in enumerate(graph.values())
+            for dep in deps
+        )
+
+        legacy = "skipped"
+        speedup = ""
+        if size <= args.legacy_max:
+            try:
+                legacy_time, _ = time_sort(legacy_alphabetical_sort, graph, mods, 1)
+            except RecursionError:
+                legacy = "recursion"
+            else:
+                legacy = f"{legacy_time * 1000:.1f} ms"
+                speedup = f"{legacy_time / heap_time:.0f}x"
+        print(
+            f"{size:>6} {edges:>7} {heap_time * 1000:>7.1f} ms "
+            f"{legacy:>12} {speedup:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark syncing the aux metadata DB after a metadata refresh.
+
+Compares AuxMetadataController.bulk_upsert and the batched update_from_acf
+against the previous per-row path, which called get_or_create for every mod
+and updated the ACF times of each entry through the ORM. Both run on an empty
+DB (first refresh) and on a DB that already holds every mod (later
+refreshes), and must leave identical rows behind.
+
+Usage: python -m tests.benchmarks.aux_metadata_upsert [--mods 2000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.controllers.metadata_db_controller import AuxMetadataController
+from app.models.metadata.metadata_db import AuxMetadataEntry
+from app.models.metadata.metadata_structure import ModType
+from app.utils.steam.steamfiles.wrapper import acf_to_dict, dict_to_acf
+
+MOD_TYPES = [ModType.LOCAL, ModType.STEAM_WORKSHOP, ModType.STEAM_CMD]
+
+
+def build_mods(count: int) -> dict[str, dict[str, Any]]:
+    """Build the aux DB fields of ``count`` mods, keyed by path."""
+    mods: dict[str, dict[str, Any]] = {}
+    for i in range(count):
+        mod_type = MOD_TYPES[i % len(MOD_TYPES)]
+        mods[f"/mods/{i:05d}"] = {
+            "type": str(mod_type),
+            "published_file_id": None if mod_type == ModType.LOCAL else str(i),
+        }
+    return mods
+
+
+def write_acf(path: Path, mods: dict[str, dict[str, Any]]) -> None:
+    """Write a Workshop ACF with times for every Workshop mod."""
+    rng = random.Random(42)
+    dict_to_acf(
+        {
+            "AppWorkshop": {
+                "WorkshopItemDetails": {
+                    fields["published_file_id"]: {
+                        "timeupdated": str(rng.randrange(1_600_000_000, 1_700_000_000)),
+                        "timetouched": str(rng.randrange(1_600_000_000, 1_700_000_000)),
+                    }
+                    for fields in mods.values()
+                    if fields["type"] == str(ModType.STEAM_WORKSHOP)
+                }
+            }
+        },
+        str(path),
+    )
+
+
+def per_row_sync(
+    db: AuxMetadataController, mods: dict[str, dict[str, Any]], acf_path: Path
+) -> None:
+    """The previous implementation of the aux DB sync."""
+    with db.Session() as session:
+        for path, fields in mods.items():
+            entry = db.get_or_create(session, path)
+            entry.type = fields["type"]
+            entry.published_file_id = fields["published_file_id"]
+        per_row_update_from_acf(session, acf_path, ModType.STEAM_WORKSHOP)
+        session.commit()
+
+
+def per_row_update_from_acf(
+    session: Session, acf_path: Path, mod_type: ModType
+) -> None:
+    workshop_items = acf_to_dict(str(acf_path))["AppWorkshop"]["WorkshopItemDetails"]
+    entries = (
+        session.query(AuxMetadataEntry)
+        .filter(
+            AuxMetadataEntry.published_file_id.in_(workshop_items.keys()),
+            AuxMetadataEntry.type == str(mod_type),
+        )
+        .all()
+    )
+    for entry in entries:
+        data = workshop_items[str(entry.published_file_id)]
+        entry.acf_time_updated = data.get("timeupdated", -1)
+        entry.acf_time_touched = data.get("timetouched", -1)
+    session.commit()
+
+
+def bulk_sync(
+    db: AuxMetadataController, mods: dict[str, dict[str, Any]], acf_path: Path
+) -> None:
+    """The aux DB sync done by MetadataController._finish_full_refresh."""
+    with db.Session() as session:
+        db.bulk_upsert(session, mods)
+        db.update_from_acf(session, acf_path, ModType.STEAM_WORKSHOP)
+        session.commit()
+
+
+def rows(db: AuxMetadataController) -> list[tuple[Any, ...]]:
+    with db.Session() as session:
+        return [
+            (
+                entry.path,
+                entry.type,
+                entry.published_file_id,
+                entry.acf_time_updated,
+                entry.acf_time_touched,
+            )
+            for entry in session.query(AuxMetadataEntry).order_by(AuxMetadataEntry.path)
+        ]
+
+
+def time_sync(
+    sync: Callable[[AuxMetadataController, dict[str, dict[str, Any]], Path], None],
+    db_path: Path,
+    mods: dict[str, dict[str, Any]],
+    acf_path: Path,
+    runs: int,
+) -> tuple[float, float]:
+    """:return: Best time of a sync into an empty DB and into a filled DB"""
+    first, again = [], []
+    for run in range(runs):
+        db = AuxMetadataController(db_path.with_suffix(f".{run}.db"))
+        start = time.perf_counter()
+        sync(db, mods, acf_path)
+        first.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        sync(db, mods, acf_path)
+        again.append(time.perf_counter() - start)
+        db.engine.dispose()
+    return min(first), min(again)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    mods = build_mods(args.mods)
+    with tempfile.TemporaryDirectory() as tmp:
+        acf_path = Path(tmp) / "appworkshop_294100.acf"
+        write_acf(acf_path, mods)
+
+        per_row_db = AuxMetadataController(Path(tmp) / "per_row.db")
+        bulk_db = AuxMetadataController(Path(tmp) / "bulk.db")
+        per_row_sync(per_row_db, mods, acf_path)
+        bulk_sync(bulk_db, mods, acf_path)
+        assert rows(per_row_db) == rows(bulk_db)
+
+        per_row = time_sync(per_row_sync, Path(tmp) / "a", mods, acf_path, args.runs)
+        bulk = time_sync(bulk_sync, Path(tmp) / "b", mods, acf_path, args.runs)
+
+    print(f"{args.mods} mods")
+    print(f"{'refresh':<10} {'per row':>12} {'bulk':>12}")
+    for label, per_row_time, bulk_time in zip(
+        ("first", "again"), per_row, bulk, strict=True
+    ):
+        print(
+            f"{label:<10} {per_row_time * 1000:>9.1f} ms {bulk_time * 1000:>9.1f} ms "
+            f"({per_row_time / bulk_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark backing up a synthetic instance folder.
+
+Compares create_directory_backup against the previous backup loop, which
+stored every file uncompressed on one thread and resolved every directory
+it walked, and against that loop deflating every file. Reports the time
+and archive size of a full backup, and of a backup that only stores the
+files changed since it.
+
+Usage: python -m tests.benchmarks.directory_backup [--mods 200] [--workers 4]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from loguru import logger
+
+from app.utils.directory_backup import create_directory_backup
+
+
+def write_instance(path: Path, mods: int) -> None:
+    """Write mods of XML defs, which compress well, and textures, which don't."""
+    rng = random.Random(42)
+    for mod in range(mods):
+        defs = path / f"Mod_{mod}" / "Defs"
+        textures = path / f"Mod_{mod}" / "Textures"
+        defs.mkdir(parents=True)
+        textures.mkdir()
+        for i in range(10):
+            (defs / f"Things_{i}.xml").write_text(
+                "".join(
+                    f"<ThingDef><defName>Thing_{mod}_{i}_{j}</defName>"
+                    f"<label>thing {rng.randrange(1000)}</label></ThingDef>\n"
+                    for j in range(200)
+                )
+            )
+        for i in range(4):
+            (textures / f"Thing_{i}.png").write_bytes(rng.randbytes(64 * 1024))
+
+
+def legacy_backup(
+    source: Path, archive_path: Path, compression: int = ZIP_STORED
+) -> None:
+    """The previous backup loop, without its debug logging."""
+    with ZipFile(archive_path, "w", compression) as archive:
+        for root, dirs, files in os.walk(source, topdown=True, followlinks=False):
+            if Path(root).absolute() != Path(root).resolve():
+                dirs.clear()
+                files.clear()
+                continue
+            for name in dirs + files:
+                path = os.path.join(root, name)
+                archive.write(path, os.path.relpath(path, source))
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def best_of(runs: int, func: Callable[[], float]) -> float:
+    return min(func() for _ in range(runs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "instance"
+        write_instance(source, args.mods)
+        legacy_path = Path(directory) / "legacy.zip"
+        deflated_path = Path(directory) / "deflated.zip"
+        full_path = Path(directory) / "full.zip"
+        changes_path = Path(directory) / "changes.zip"
+
+        legacy = best_of(
+            args.runs, lambda: timed(lambda: legacy_backup(source, legacy_path))
+        )
+        deflated = best_of(
+            args.runs,
+            lambda: timed(lambda: legacy_backup(source, deflated_path, ZIP_DEFLATED)),
+        )
+        full = best_of(
+            args.runs,
+            lambda: timed(
+                lambda: create_directory_backup(
+                    source, full_path, max_workers=args.workers
+                )
+            ),
+        )
+        for mod in range(0, args.mods, 20):
+            (source / f"Mod_{mod}" / "Defs" / "Things_0.xml").write_text("<Defs/>")
+        changes = best_of(
+            args.runs,
+            lambda: timed(
+                lambda: create_directory_backup(
+                    source, changes_path, base_archive=full_path
+                )
+            ),
+        )
+
+        print(f"{'backup':>8} {'seconds':>8} {'MB':>8}")
+        for name, seconds, path in (
+            ("legacy", legacy, legacy_path),
+            ("deflated", deflated, deflated_path),
+            ("full", full, full_path),
+            ("changes", changes, changes_path),
+        ):
+            print(f"{name:>8} {seconds:>8.2f} {path.stat().st_size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark file search answered from the full-text index against a scan.
+
+Searches a synthetic corpus of mod Defs, or a real mods folder, for common
+and rare terms. Terms of a real folder are picked with find_search_terms.
+Both ways of searching must find the same files.
+
+Usage: python -m tests.benchmarks.file_search_index [--mods 500] [--mods-path DIR]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.file_search_engine import FileHit, ParallelFileSearch, SearchQuery
+from app.utils.file_search_index import FileSearchIndex
+from app.utils.ignore_extensions import IGNORE_EXTENSIONS
+from tests.benchmarks.find_search_terms import analyze_terms
+
+WORDS = ["Steel", "Wood", "Plasteel", "Uranium", "Jade", "Gold", "Silver"]
+THINGS = ["Wall", "Door", "Table", "Chair", "Bed", "Lamp", "Turret", "Cooler"]
+
+
+def build_corpus(mods_path: Path, count: int) -> list[str]:
+    """Write ``count`` mods of ThingDefs, each with a unique rare term."""
+    rng = random.Random(42)
+    for i in range(count):
+        defs = mods_path / f"{i:05d}" / "Defs"
+        defs.mkdir(parents=True)
+        for file_index in range(10):
+            things = "".join(
+                f'  <ThingDef ParentName="BuildingBase">\n'
+                f"    <defName>{rng.choice(WORDS)}_{rng.choice(THINGS)}_{i}_{n}</defName>\n"
+                f"    <label>{rng.choice(WORDS).lower()} {rng.choice(THINGS).lower()}</label>\n"
+                f"    <description>Built by mod {i}. Marker{i:05d}x{file_index}.</description>\n"
+                f"  </ThingDef>\n"
+                for n in range(40)
+            )
+            (defs / f"Things_{file_index}.xml").write_text(f"<Defs>\n{things}</Defs>\n")
+    return [str(path) for path in sorted(mods_path.iterdir())]
+
+
+def best_of(runs: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def found(batches: Iterable[list[FileHit]]) -> set[str]:
+    return {hit.file_path for batch in batches for hit in batch}
+
+
+def scan(query: SearchQuery, roots: list[str]) -> set[str]:
+    return found(ParallelFileSearch().search(query, roots))
+
+
+def search_index(
+    index: FileSearchIndex, query: SearchQuery, roots: list[str]
+) -> set[str]:
+    """Search as FileSearch does, verifying the folders are up to date."""
+    return found(index.search(query, index.fresh_roots(roots)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=500)
+    parser.add_argument("--mods-path", help="Search a real mods folder instead")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.mods_path:
+            mods_path = Path(args.mods_path)
+            roots = [str(path) for path in sorted(mods_path.iterdir()) if path.is_dir()]
+            _, common_terms, rare_terms = analyze_terms(str(mods_path))
+            terms = common_terms[:2] + rare_terms[:2]
+        else:
+            roots = build_corpus(Path(tmp) / "mods", args.mods)
+            terms = ["Plasteel_Turret", "marker00042x3", "ThingDef"]
+
+        index = FileSearchIndex(Path(tmp) / "index.sqlite3")
+        start = time.perf_counter()
+        index.update(roots)
+        build_time = time.perf_counter() - start
+        assert index.fresh_roots(roots) == roots
+
+        print(f"{len(roots)} mods, index built in {build_time:.1f} s")
+        print(f"{'term':<24} {'files':>7} {'scan':>12} {'index':>12}")
+        for term in terms:
+            query = SearchQuery.from_options(
+                term,
+                {
+                    "ignore_extensions": IGNORE_EXTENSIONS,
+                    "exclude_options": {"skip_git": True},
+                },
+            )
+            scanned = scan(query, roots)
+            indexed = search_index(index, query, roots)
+            assert scanned == indexed, term
+
+            scan_time = best_of(args.runs, partial(scan, query, roots))
+            index_time = best_of(args.runs, partial(search_index, index, query, roots))
+            print(
+                f"{term:<24} {len(indexed):>7} {scan_time * 1000:>9.1f} ms "
+                f"{index_time * 1000:>9.1f} ms ({scan_time / index_time:.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Measure the cold import time of the GUI and CLI entry points.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime``,
+and the modules imported by the interpreter itself are left out. Prints the
+best total over the runs, the modules that took the most time, and whether
+any of the lazily imported dependencies was loaded anyway.
+
+Usage: python -m tests.benchmarks.import_time [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Entry points and the cold import time they should stay within, in seconds.
+# The budgets leave room for slower CI machines; the measured times are
+# around a quarter of them.
+IMPORT_BUDGETS = {
+    "app.__main__": 2.5,
+    "app.cli.main": 1.0,
+}
+
+# Bound with app.utils.lazy_import, and not needed to start RimSort
+LAZY_MODULES = (
+    "bs4",
+    "github",
+    "networkx",
+    "PySide6.QtWebEngineWidgets",
+    "app.utils.steam.steambrowser.browser",
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    # Seconds spent importing the entry point
+    total: float
+    # Seconds spent in each module itself, without its imports
+    self_times: dict[str, float]
+    # Cumulative seconds of each module, with its imports
+    cumulative_times: dict[str, float]
+
+
+def _run_importtime(code: str) -> list[tuple[str, int, int, int]]:
+    """
+    :param code: Code run with ``python -X importtime -c``
+    :return: Name, nesting level, self and cumulative microseconds of every
+        imported module
+    """
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+        stripped = name.lstrip()
+        level = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, level, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure_import(module: str) -> ImportTiming:
+    """
+    Import a module in a fresh interpreter.
+
+    :param module: Absolute name of the module
+    :return: Timing of the import
+    """
+    startup = {name for name, *_ in _run_importtime("pass")}
+    entries = [
+        entry
+        for entry in _run_importtime(f"import {module}")
+        if entry[0] not in startup
+    ]
+    return ImportTiming(
+        total=sum(cumulative for _, level, _, cumulative in entries if level == 0)
+        / 1e6,
+        self_times={name: self_us / 1e6 for name, _, self_us, _ in entries},
+        cumulative_times={name: cumulative / 1e6 for name, _, _, cumulative in entries},
+    )
+
+
+def best_import(module: str, runs: int) -> ImportTiming:
+    """:return: The fastest of ``runs`` imports of the module"""
+    return min((measure_import(module) for _ in range(runs)), key=lambda t: t.total)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    for module, budget in IMPORT_BUDGETS.items():
+        timing = best_import(module, args.runs)
+        loaded = [name for name in LAZY_MODULES if name in timing.cumulative_times]
+        print(f"{module}: {timing.total * 1000:.1f} ms (budget {budget * 1000:.0f} ms)")
+        print(f"  {'module':<56} {'self':>10} {'cumulative':>12}")
+        slowest = sorted(
+            timing.cumulative_times.items(), key=lambda item: item[1], reverse=True
+        )
+        for name, cumulative in slowest[: args.top]:
+            print(
+                f"  {name:<56} {timing.self_times[name] * 1000:>7.1f} ms "
+                f"{cumulative * 1000:>9.1f} ms"
+            )
+        print(f"  lazy modules loaded: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
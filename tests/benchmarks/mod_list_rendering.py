@@ -0,0 +1,123 @@
+"""Benchmark scrolling a ModListWidget with per-row widgets and painted rows.
+
+Fills a mod list with ``--mods`` synthetic mods, then scrolls through the
+whole list page by page, rendering every page offscreen. In widget mode each
+newly visible row gets a ModListItemInner; with the mod_list_paint_rows
+setting the ModListItemDelegate paints the rows instead.
+
+Usage: QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.mod_list_rendering [--mods 3000]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    CaseInsensitiveStr,
+    ModType,
+)
+from app.models.settings import Settings
+from app.utils.custom_list_widget_item import CustomListWidgetItem
+from app.utils.custom_list_widget_item_metadata import CustomListWidgetItemMetadata
+from app.views.mods_panel import ModListWidget
+
+MOD_TYPES = [ModType.LOCAL, ModType.STEAM_WORKSHOP, ModType.STEAM_CMD, ModType.GIT]
+
+
+def build_mods(count: int) -> dict[str, AboutXmlMod]:
+    mods: dict[str, AboutXmlMod] = {}
+    for i in range(count):
+        path = f"/mods/{i:05d}"
+        mod = AboutXmlMod(
+            name=f"Synthetic mod number {i} with a fairly long name",
+            package_id=CaseInsensitiveStr(f"author{i}.mod"),
+        )
+        mod.mod_type = MOD_TYPES[i % len(MOD_TYPES)]
+        mod._mod_path = Path(path)
+        mods[path] = mod
+    return mods
+
+
+def fill_list(mod_list: ModListWidget, paths: list[str]) -> None:
+    """Add items carrying the metadata fields the rows read, without the aux DB."""
+    for i, path in enumerate(paths):
+        data = object.__new__(CustomListWidgetItemMetadata)
+        data.__dict__.update(
+            path=path,
+            errors_warnings="",
+            errors="Missing dependency" if i % 10 == 0 else "",
+            warnings="Version mismatch" if i % 7 == 0 else "",
+            filtered=False,
+            invalid=False,
+            mismatch=False,
+            alternative=None,
+            mod_color=None,
+            mod_tags=["qol"] if i % 5 == 0 else [],
+            list_type=mod_list.list_type,
+            show_tags=True,
+        )
+        item = CustomListWidgetItem(mod_list)
+        item.setData(Qt.ItemDataRole.UserRole, data)
+        mod_list.addItem(item)
+    mod_list.paths = list(paths)
+
+
+def scroll_through(paint_rows: bool, mods: dict[str, AboutXmlMod]) -> float:
+    settings = MagicMock(spec=Settings)
+    settings.mod_list_paint_rows = paint_rows
+    settings.mod_type_filter = True
+    settings.show_save_comparison_indicators = False
+    settings.mod_list_updated_indicator = False
+    settings.mod_list_startup_impact = False
+    settings.color_background_instead_of_text_toggle = True
+    metadata_controller = MagicMock()
+    metadata_controller.get_mod.side_effect = mods.get
+
+    mod_list = ModListWidget("Inactive", settings, metadata_controller)
+    mod_list.resize(500, 800)
+    mod_list.show()
+    fill_list(mod_list, list(mods))
+    QApplication.processEvents()
+
+    scroll_bar = mod_list.verticalScrollBar()
+    start = time.perf_counter()
+    mod_list.check_widgets_visible()
+    mod_list.grab()
+    while scroll_bar.value() < scroll_bar.maximum():
+        scroll_bar.setValue(scroll_bar.value() + scroll_bar.pageStep())
+        mod_list.grab()
+    elapsed = time.perf_counter() - start
+    mod_list.close()
+    mod_list.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=3000)
+    args = parser.parse_args()
+
+    logger.remove()
+    app = QApplication.instance() or QApplication([])
+    mods = build_mods(args.mods)
+    with patch("app.views.mods_panel.auxdb_get_mod_tags", return_value=[]):
+        widget_time = scroll_through(False, mods)
+        painted_time = scroll_through(True, mods)
+    print(f"{args.mods} mods, scrolled through the whole list")
+    print(f"{'per-row widgets':<16} {widget_time * 1000:>10.1f} ms")
+    print(
+        f"{'painted rows':<16} {painted_time * 1000:>10.1f} ms "
+        f"({widget_time / painted_time:.1f}x)"
+    )
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
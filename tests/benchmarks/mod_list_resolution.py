@@ -0,0 +1,193 @@
+"""Benchmark MetadataController.get_mods_from_list on synthetic mod sets.
+
+Compares the indexed resolver against the previous implementation, which
+scanned every installed mod for each imported package id and then built the
+inactive list with a list membership test. Both must produce identical
+results.
+
+Usage: python -m tests.benchmarks.mod_list_resolution [--mods 5000] [--list 800]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+from natsort import natsorted
+
+from app.controllers.metadata_controller import MetadataController
+from app.controllers.metadata_db_controller import AuxMetadataController
+from app.models.instance import Instance
+from app.models.metadata.metadata_structure import (
+    SOURCE_PRIORITY_DEFAULT,
+    SOURCE_PRIORITY_STEAM,
+    AboutXmlMod,
+    CaseInsensitiveStr,
+    ListedMod,
+    ModType,
+)
+from app.models.settings import Settings
+from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
+
+MOD_TYPES = [ModType.LOCAL, ModType.STEAM_WORKSHOP, ModType.STEAM_CMD]
+
+
+def build_mods(count: int, duplicate_ratio: float = 0.05) -> dict[str, ListedMod]:
+    """Build ``count`` mods, a share of which duplicate another mod's package id."""
+    rng = random.Random(42)
+    mods: dict[str, ListedMod] = {}
+    for i in range(count):
+        if i and rng.random() < duplicate_ratio:
+            package_id = f"author{rng.randrange(i)}.mod"
+        else:
+            package_id = f"author{i}.mod"
+        path = f"/mods/{i:05d}"
+        mod = AboutXmlMod(name=f"Mod {i}", package_id=CaseInsensitiveStr(package_id))
+        mod.mod_type = MOD_TYPES[i % len(MOD_TYPES)]
+        mod._mod_path = Path(path)
+        mods[path] = mod
+    return mods
+
+
+def build_mod_list(mods: dict[str, ListedMod], size: int) -> list[str]:
+    """Pick ``size`` package ids, with some _steam suffixes and missing ids."""
+    rng = random.Random(7)
+    package_ids = sorted(
+        {str(m.package_id) for m in mods.values() if isinstance(m, AboutXmlMod)}
+    )
+    picked = rng.sample(package_ids, min(size, len(package_ids)))
+    mod_list = [
+        f"{pid}_steam" if i % 10 == 0 else pid.upper() if i % 7 == 0 else pid
+        for i, pid in enumerate(picked)
+    ]
+    mod_list.extend(f"missing{i}.mod" for i in range(size // 20))
+    return mod_list
+
+
+def legacy_get_mods_from_list(
+    all_mods: dict[str, ListedMod], package_ids_to_import: list[str]
+) -> tuple[list[str], list[str], dict[str, list[str]], list[str]]:
+    """The resolver as it was before the package id index."""
+    active_mod_paths: list[str] = []
+    duplicate_mods: dict[str, list[str]] = {}
+    duplicates_processed: list[str] = []
+    populated_mods: list[str] = []
+    to_populate: list[str] = []
+
+    for path, mod_data in all_mods.items():
+        if isinstance(mod_data, AboutXmlMod):
+            duplicate_mods.setdefault(str(mod_data.package_id), []).append(path)
+    duplicate_mods = {k: v for k, v in duplicate_mods.items() if len(v) > 1}
+
+    for package_id in package_ids_to_import:
+        normalized = package_id.lower()
+        stripped = normalized.replace("_steam", "")
+        is_steam = "_steam" in normalized
+        target_id = stripped if is_steam else normalized
+        to_populate.append(target_id)
+        sources_order = SOURCE_PRIORITY_STEAM if is_steam else SOURCE_PRIORITY_DEFAULT
+        for path, mod in all_mods.items():
+            if not isinstance(mod, AboutXmlMod):
+                continue
+            if str(mod.package_id) in [normalized, stripped]:
+                if target_id not in duplicate_mods:
+                    populated_mods.append(target_id)
+                    active_mod_paths.append(path)
+                else:
+                    if target_id in duplicates_processed:
+                        continue
+                    for source_type in sources_order:
+                        matching_paths = [
+                            dup_path
+                            for dup_path in duplicate_mods[target_id]
+                            if all_mods[dup_path].mod_type == source_type
+                        ]
+                        source_paths_sorted = natsorted(matching_paths)
+                        if source_paths_sorted:
+                            populated_mods.append(target_id)
+                            duplicates_processed.append(target_id)
+                            active_mod_paths.append(source_paths_sorted[0])
+                            break
+
+    missing_mods = list(set(to_populate) - set(populated_mods))
+    inactive_mod_paths = [path for path in all_mods if path not in active_mod_paths]
+    return active_mod_paths, inactive_mod_paths, duplicate_mods, missing_mods
+
+
+def make_controller(db_path: Path) -> MetadataController:
+    """Create a MetadataController without any configured paths."""
+    with (
+        patch.object(SteamcmdInterface, "instance"),
+        patch.object(MetadataController, "reset_paths"),
+    ):
+        return MetadataController(
+            MagicMock(spec=Settings),
+            lambda: MagicMock(spec=Instance),
+            AuxMetadataController(db_path),
+        )
+
+
+def best_of(runs: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=5000)
+    parser.add_argument("--list", type=int, default=800)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    mods = build_mods(args.mods)
+    mod_list = build_mod_list(mods, args.list)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        controller = make_controller(Path(tmp) / "aux.db")
+        controller.metadata_mediator._mods_metadata = mods
+        controller._invalidate_caches()
+
+        legacy = legacy_get_mods_from_list(mods, mod_list)
+        indexed = controller.get_mods_from_list(mod_list)
+        assert legacy[:3] == indexed[:3]
+        assert sorted(legacy[3]) == sorted(indexed[3])
+
+        legacy_time = best_of(
+            args.runs, lambda: legacy_get_mods_from_list(mods, mod_list)
+        )
+
+        def _indexed_cold() -> None:
+            controller._invalidate_caches()
+            controller.get_mods_from_list(mod_list)
+
+        indexed_cold = best_of(args.runs, _indexed_cold)
+        indexed_warm = best_of(
+            args.runs, lambda: controller.get_mods_from_list(mod_list)
+        )
+
+    print(
+        f"{args.mods} mods, {len(mod_list)} ids in list, "
+        f"{len(indexed[0])} active, {len(indexed[2])} duplicated package ids"
+    )
+    print(f"{'legacy scan':<24} {legacy_time * 1000:>10.1f} ms")
+    print(
+        f"{'indexed (cold index)':<24} {indexed_cold * 1000:>10.1f} ms "
+        f"({legacy_time / indexed_cold:.0f}x)"
+    )
+    print(
+        f"{'indexed (warm index)':<24} {indexed_warm * 1000:>10.1f} ms "
+        f"({legacy_time / indexed_warm:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark loading synthetic Player.log files of growing size.
+
+Compares the line index of PlayerLog against the previous loading loop,
+which read the log in 1 KB chunks and matched every line of each chunk
+against the statistics patterns before anything could be shown. Reports
+when the first screen of lines is readable, when the whole log is indexed,
+and when its statistics are counted.
+
+Usage: python -m tests.benchmarks.player_log [--lines 100000 1000000]
+"""
+
+import argparse
+import random
+import re
+import tempfile
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.player_log import LogStatistics, PlayerLog
+from app.views.player_log_tab import LogPatternManager
+
+# Rows shown by a maximized log view
+SCREEN_LINES = 60
+
+
+def write_log(path: Path, lines: int) -> None:
+    """Write a log with the mix of lines of a heavily modded session."""
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            r = rng.random()
+            if r < 0.03:
+                f.write(f"Exception in Verse.Thing_{i}: NullReferenceException\n")
+            elif r < 0.08:
+                f.write(f"[Mod {i % 300}] Warning: obsolete def Thing_{i}\n")
+            elif r < 0.10:
+                f.write(f"Error while loading Thing_{i}: could not resolve\n")
+            elif r < 0.15:
+                f.write("(Filename: C:\\buildslave\\unity\\build Line: 42)\n")
+            else:
+                f.write(f"Loaded texture Things/Item/Thing_{i} in {i % 97} ms\n")
+
+
+def legacy_load(path: Path, patterns: Mapping[str, re.Pattern[str]]) -> float:
+    """
+    The previous loading loop, without its UI updates.
+
+    :return: Seconds until the first lines could be shown
+    """
+    start = time.perf_counter()
+    counts = dict.fromkeys(patterns, 0)
+    chunks = []
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while chunk := f.read(1024):
+            chunks.append(chunk)
+            for line in chunk.splitlines():
+                for name, pattern in patterns.items():
+                    if pattern.search(line):
+                        counts[name] += 1
+    lines = "".join(chunks).splitlines()[:SCREEN_LINES]
+    assert len(lines) == SCREEN_LINES
+    return time.perf_counter() - start
+
+
+def indexed_load(
+    path: Path, patterns: Mapping[str, re.Pattern[str]]
+) -> tuple[float, float, float]:
+    """:return: Seconds until the first lines are shown, the log is indexed
+    and its statistics are counted"""
+    start = time.perf_counter()
+    log = PlayerLog(path)
+    first = indexed = 0.0
+    for result in log.scan(patterns):
+        if isinstance(result, LogStatistics):
+            log.add_statistics(result)
+            continue
+        log.apply(result)
+        if not first:
+            log.read_lines(range(min(SCREEN_LINES, log.line_count)))
+            first = time.perf_counter() - start
+        indexed = time.perf_counter() - start
+    return first, indexed, time.perf_counter() - start
+
+
+def best_of(runs: int, func: Callable[[], tuple[float, ...]]) -> tuple[float, ...]:
+    return min((func() for _ in range(runs)), key=lambda times: times[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    patterns = LogPatternManager.get_statistics_patterns()
+    print(
+        f"{'lines':>10} {'MB':>8} {'legacy':>10} "
+        f"{'first rows':>11} {'indexed':>10} {'statistics':>11}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for lines in args.lines:
+            path = Path(directory) / "Player.log"
+            write_log(path, lines)
+            (legacy,) = best_of(
+                args.runs,
+                lambda: (legacy_load(path, patterns),),  # noqa: B023
+            )
+            first, indexed, counted = best_of(
+                args.runs,
+                lambda: indexed_load(path, patterns),  # noqa: B023
+            )
+            print(
+                f"{lines:>10} {path.stat().st_size / 1e6:>8.1f} "
+                f"{legacy * 1000:>8.0f}ms {first * 1000:>9.0f}ms "
+                f"{indexed * 1000:>8.0f}ms {counted * 1000:>9.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
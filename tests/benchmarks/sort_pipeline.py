@@ -0,0 +1,212 @@
+"""Benchmark every stage of the sort pipeline on synthetic mod universes.
+
+Generates mod lists with realistic rule densities (a few popular frameworks
+most mods load after, some loadBefore rules, modDependencies, load first and
+load last mods) and times each stage on its own:
+
+- ``compile``: CompiledDependencyData.build
+- ``graphs``: Sorter.generate_dependency_graphs
+- ``topo`` / ``alpha``: do_topo_sort / do_alphabetical_sort over the tiers
+- ``sort-topo`` / ``sort-alpha``: the whole tiered Sorter.sort pipeline
+- ``cycles``: find_circular_dependencies on the graph with a few cycles added
+
+Each stage reports its best wall time and, from a separate traced run, its
+peak traced memory. Results can be saved with ``--json`` and later checked
+against with ``--compare``, which exits non-zero when a stage got slower
+than the tolerance allows. Runs headless; the warning dialog of
+find_circular_dependencies is not shown.
+
+Usage: python -m tests.benchmarks.sort_pipeline [--sizes 500 2000 5000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from loguru import logger
+
+from app.controllers.sort_controller import Sorter
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    BaseRules,
+    CaseInsensitiveSet,
+    CaseInsensitiveStr,
+    CompiledDependencyData,
+    DependencyMod,
+    ListedMod,
+    Rules,
+)
+from app.sort.alphabetical_sort import do_alphabetical_sort
+from app.sort.topo_sort import do_topo_sort, find_circular_dependencies
+from app.utils.constants import SortMethod
+
+STAGES = ["compile", "graphs", "topo", "alpha", "sort-topo", "sort-alpha", "cycles"]
+
+
+def build_universe(count: int, seed: int = 42) -> dict[str, ListedMod]:
+    """Build ``count`` mods whose rules only point at mods created earlier.
+
+    That keeps the load order rules acyclic. The first mods play the part of
+    Core, Harmony and frameworks, which most other mods load after.
+    """
+    rng = random.Random(seed)
+    mods: dict[str, ListedMod] = {}
+    package_ids = ["ludeon.rimworld", "brrainz.harmony"]
+    package_ids += [f"author{i}.mod" for i in range(len(package_ids), count)]
+    frameworks = max(2, count // 50)
+
+    def _earlier(i: int) -> str:
+        if rng.random() < 0.6:
+            return package_ids[rng.randrange(min(i, frameworks))]
+        return package_ids[rng.randrange(i)]
+
+    for i, pid in enumerate(package_ids):
+        about = BaseRules()
+        if i:
+            about.load_after = CaseInsensitiveSet(
+                _earlier(i) for _ in range(rng.choice([0, 1, 1, 2, 2, 3]))
+            )
+            for _ in range(rng.choice([0, 0, 1, 2])):
+                dep = _earlier(i)
+                about.dependencies[CaseInsensitiveStr(dep)] = DependencyMod(
+                    package_id=CaseInsensitiveStr(dep)
+                )
+            if rng.random() < 0.01:
+                about.incompatible_with = CaseInsensitiveSet([_earlier(i)])
+        if i < count - 1 and rng.random() < 0.1:
+            about.load_before = CaseInsensitiveSet(
+                [package_ids[rng.randrange(i + 1, count)]]
+            )
+        community = Rules(
+            load_first=2 <= i < frameworks and rng.random() < 0.3,
+            load_last=i > count * 0.98,
+        )
+        path = f"/mods/{i:05d}"
+        mod = AboutXmlMod(
+            name=f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}mod {rng.randrange(10**6)}",
+            package_id=CaseInsensitiveStr(pid),
+            about_rules=about,
+            community_rules=community,
+        )
+        mod.mod_path = Path(path)
+        mods[path] = mod
+    return mods
+
+
+def with_cycles(
+    graph: dict[str, set[str]], count: int, seed: int = 7
+) -> dict[str, set[str]]:
+    """Copy ``graph`` and add ``count`` short dependency cycles to it."""
+    rng = random.Random(seed)
+    cyclic = {pid: set(deps) for pid, deps in graph.items()}
+    candidates = sorted(pid for pid, deps in cyclic.items() if deps)
+    for pid in rng.sample(candidates, min(count, len(candidates))):
+        dep = min(cyclic[pid])
+        cyclic.setdefault(dep, set()).add(pid)
+    return cyclic
+
+
+def measure(func: Callable[[], object], runs: int) -> tuple[float, int]:
+    """Return the best wall time over ``runs`` and the traced peak memory."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def bench_size(count: int, runs: int) -> dict[str, tuple[float, int]]:
+    mods = build_universe(count)
+    active = set(mods)
+    options = {
+        "use_moddependencies_as_loadTheseBefore": True,
+        "use_alternative_package_ids": True,
+    }
+    compiled = CompiledDependencyData.build(mods, **options)
+    sorter = Sorter(SortMethod.TOPOLOGICAL, compiled, mods, active)
+    tier_graphs = sorter.generate_dependency_graphs()
+    cyclic = with_cycles(tier_graphs[2], 5)
+
+    def _sort_tiers(sort: Callable[..., list[str]]) -> None:
+        for graph in tier_graphs:
+            sort(graph, active, mods)
+
+    def _full_sort(method: SortMethod) -> None:
+        success, order = Sorter(method, compiled, mods, active).sort()
+        assert success and len(order) == count
+
+    stages: dict[str, Callable[[], object]] = {
+        "compile": lambda: CompiledDependencyData.build(mods, **options),
+        "graphs": sorter.generate_dependency_graphs,
+        "topo": lambda: _sort_tiers(do_topo_sort),
+        "alpha": lambda: _sort_tiers(do_alphabetical_sort),
+        "sort-topo": lambda: _full_sort(SortMethod.TOPOLOGICAL),
+        "sort-alpha": lambda: _full_sort(SortMethod.ALPHABETICAL),
+        "cycles": lambda: find_circular_dependencies(cyclic),
+    }
+    return {name: measure(stages[name], runs) for name in STAGES}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Write the results to this file")
+    parser.add_argument(
+        "--compare", type=Path, help="Fail if slower than the results in this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Allowed slowdown factor for --compare (default: 1.5)",
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    with patch("app.sort.topo_sort.show_warning"):
+        for count in args.sizes:
+            print(f"\n{count} mods")
+            print(f"{'stage':<12} {'time':>10} {'peak memory':>14}")
+            results[str(count)] = {}
+            for stage, (seconds, peak) in bench_size(count, args.runs).items():
+                results[str(count)][stage] = {"seconds": seconds, "peak_bytes": peak}
+                print(
+                    f"{stage:<12} {seconds * 1000:>7.1f} ms {peak / 2**20:>11.2f} MiB"
+                )
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = [
+            f"{count} mods, {stage}: {old['seconds'] * 1000:.1f} ms -> "
+            f"{results[count][stage]['seconds'] * 1000:.1f} ms"
+            for count, stages in baseline.items()
+            if count in results
+            for stage, old in stages.items()
+            if stage in results[count]
+            and results[count][stage]["seconds"] > old["seconds"] * args.tolerance
+        ]
+        if regressions:
+            print("\nRegressions:\n" + "\n".join(regressions))
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 from app.controllers.settings_tabs.sorting_tab_controller import SortingTabController
 from app.models.settings import Settings
-from app.utils.constants import SortMethod
+from app.utils.constants import MetadataParserBackend, SortMethod
 
 
 class TestSortingTabUpdateView:
@@ -30,6 +30,17 @@ class TestSortingTabUpdateView:
 
         dialog.sorting_alphabetical_radio.setChecked.assert_called_with(True)
 
+    def test_processes_backend_sets_processes_radio(
+        self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
+    ) -> None:
+        controller, settings, dialog = sorting_tab
+        settings.metadata_parser_backend = MetadataParserBackend.PROCESSES
+
+        controller.update_view_from_model()
+
+        dialog.metadata_parser_processes_radio.setChecked.assert_called_with(True)
+        dialog.metadata_parser_threads_radio.setChecked.assert_not_called()
+
     def test_unconditional_checkboxes_pushed_to_view(
         self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
     ) -> None:
@@ -61,6 +72,16 @@ class TestSortingTabUpdateView:
         dialog.mod_list_updated_threshold_spinbox.setValue.assert_called_with(7)
         dialog.mod_list_updated_threshold_spinbox.setEnabled.assert_called_with(True)
 
+    def test_paint_rows_pushed_to_view(
+        self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
+    ) -> None:
+        controller, settings, dialog = sorting_tab
+        settings.mod_list_paint_rows = True
+
+        controller.update_view_from_model()
+
+        dialog.mod_list_paint_rows_checkbox.setChecked.assert_called_with(True)
+
     def test_if_guarded_checkboxes_only_set_when_true(
         self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
     ) -> None:
@@ -105,6 +126,17 @@ class TestSortingTabUpdateModel:
 
         assert settings.sorting_algorithm == SortMethod.TOPOLOGICAL
 
+    def test_processes_radio_sets_parser_backend(
+        self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
+    ) -> None:
+        controller, settings, dialog = sorting_tab
+        dialog.sorting_topological_radio.isChecked.return_value = True
+        dialog.metadata_parser_processes_radio.isChecked.return_value = True
+
+        controller.update_model_from_view()
+
+        assert settings.metadata_parser_backend == MetadataParserBackend.PROCESSES
+
     def test_checkbox_values_read_into_model(
         self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
     ) -> None:
@@ -145,3 +177,14 @@ class TestSortingTabUpdateModel:
 
         assert settings.mod_list_updated_indicator is True
         assert settings.mod_list_updated_threshold_days == 14
+
+    def test_paint_rows_read_into_model(
+        self, sorting_tab: tuple[SortingTabController, Settings, MagicMock]
+    ) -> None:
+        controller, settings, dialog = sorting_tab
+        dialog.sorting_topological_radio.isChecked.return_value = True
+        dialog.mod_list_paint_rows_checkbox.isChecked.return_value = True
+
+        controller.update_model_from_view()
+
+        assert settings.mod_list_paint_rows is True
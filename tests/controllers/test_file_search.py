@@ -473,3 +473,21 @@ def test_skip_translations_works_with_standard_search(setup_test_files: str) ->
     assert len(language_files_skip) == 0, (
         f"Expected no Languages/ files in standard_search when skip is on, got {language_files_skip}"
     )
+
+
+def test_batched_search_streams_results_with_previews(setup_test_files: str) -> None:
+    """Test that batched_search yields previews built while searching, and stops."""
+    from app.utils.file_search import FileSearch
+
+    file_search = FileSearch(metadata_controller=MagicMock())
+
+    batches = list(
+        file_search.batched_search("xml", "test mod", [setup_test_files], {})
+    )
+
+    results = [result for batch in batches for result in batch]
+    assert {file_name for _, file_name, _, _ in results} == {"About.xml"}
+    assert all("**test mod" in preview for _, _, _, preview in results)
+
+    file_search.stop_search()
+    assert list(file_search.batched_search("xml", "test", [setup_test_files], {})) == []
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+from app.controllers.instance_controller import InstanceController
+from app.models.instance import Instance
+
+
+def _controller(tmp_path: Path) -> InstanceController:
+    return InstanceController(
+        Instance(name="Modded", instance_folder_override=str(tmp_path / "instances"))
+    )
+
+
+def test_restores_changes_over_base_backup(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    folder = controller.instance_folder_path
+    (folder / "steam").mkdir(parents=True)
+    (folder / "steam" / "mod.xml").write_text("<Mod/>")
+    (folder / "old.txt").write_text("removed later")
+    full = str(tmp_path / "full.zip")
+    controller.compress_to_archive(full)
+
+    (folder / "old.txt").unlink()
+    (folder / "new.txt").write_text("added")
+    changes = str(tmp_path / "changes.zip")
+    controller.compress_to_archive(changes, base_archive=full)
+
+    restored = InstanceController.from_archive(changes)
+    restored.extract_from_archive(changes)
+
+    assert restored.instance == controller.instance
+    assert sorted(
+        os.path.relpath(os.path.join(root, name), folder)
+        for root, _, files in os.walk(folder)
+        for name in files
+    ) == ["new.txt", os.path.join("steam", "mod.xml")]
+    assert (folder / "steam" / "mod.xml").read_text() == "<Mod/>"
+
+
+def test_restores_base_backup_from_another_folder(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    folder = controller.instance_folder_path
+    folder.mkdir(parents=True)
+    (folder / "kept.txt").write_text("from base")
+    (tmp_path / "storage").mkdir()
+    full = str(tmp_path / "storage" / "full.zip")
+    controller.compress_to_archive(full)
+
+    (folder / "new.txt").write_text("added")
+    (tmp_path / "backups").mkdir()
+    changes = str(tmp_path / "backups" / "changes.zip")
+    controller.compress_to_archive(changes, base_archive=full)
+
+    restored = InstanceController.from_archive(changes)
+    restored.extract_from_archive(changes)
+
+    assert (folder / "kept.txt").read_text() == "from base"
+    assert (folder / "new.txt").read_text() == "added"
@@ -14,11 +14,13 @@ from app.models.instance import Instance
 from app.models.metadata.metadata_structure import (
     AboutXmlMod,
     CaseInsensitiveStr,
+    CompiledDependencyData,
     ModType,
     SteamDbSchema,
 )
 from app.models.settings import Settings
 from app.utils.app_info import AppInfo
+from app.utils.constants import MetadataParserBackend
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.views.settings_dialog import SettingsDialog
 
@@ -48,6 +50,7 @@ def mock_settings() -> Generator[MagicMock, None, None]:
         mock_settings.prefer_versioned_about_tags = True
         mock_settings.database_expiry = 0
         mock_settings.case_insensitive_about_xml_lookup = True
+        mock_settings.metadata_parser_backend = MetadataParserBackend.THREADS
 
         yield mock_settings
 
@@ -477,6 +480,34 @@ def test_delete_mod_emits_signal(
     assert emitted == [str(steam_mod_1_path)]
 
 
+def test_refresh_metadata_incremental_emits_changes(
+    metadata_controller: MetadataController,
+    mock_active_instance: MagicMock,
+    tmp_path: Path,
+    qtbot: Any,
+) -> None:
+    mod_examples = tmp_path / "mod_examples"
+    shutil.copytree("tests/data/mod_examples", mod_examples)
+    mock_active_instance.game_folder = str(mod_examples / "RimWorld")
+    mock_active_instance.local_folder = str(mod_examples / "Local")
+    mock_active_instance.workshop_folder = str(mod_examples / "Steam")
+
+    with qtbot.waitSignal(metadata_controller.metadata_refreshed):
+        metadata_controller.refresh_metadata_incremental()
+
+    removed_path = mod_examples / "Local" / "local_mod_2"
+    shutil.rmtree(removed_path)
+    refreshed: list[bool] = []
+    metadata_controller.metadata_refreshed.connect(lambda: refreshed.append(True))
+    with qtbot.waitSignal(metadata_controller.metadata_changed) as blocker:
+        metadata_controller.refresh_metadata_incremental()
+
+    assert blocker.args == [[], [str(removed_path)], []]
+    assert not refreshed
+    _, aux_metadata = metadata_controller.get_metadata_with_path(removed_path)
+    assert aux_metadata is None
+
+
 def test_metadata_controller_delete_mod(
     metadata_controller_p: MetadataController,
 ) -> None:
@@ -523,6 +554,29 @@ def test_metadata_controller_delete_mod(
     assert aux_metadata_2 is None
 
 
+def test_compile_is_patched_after_delete_mod(
+    metadata_controller_p: MetadataController,
+) -> None:
+    metadata_controller_p.refresh_metadata()
+    compiled = metadata_controller_p.compile(
+        use_moddependencies_as_loadTheseBefore=True
+    )
+    assert (
+        metadata_controller_p.compile(use_moddependencies_as_loadTheseBefore=True)
+        is compiled
+    )
+
+    metadata_controller_p.delete_mod(Path("tests/data/mod_examples/Steam/steam_mod_1"))
+
+    patched = metadata_controller_p.compile(use_moddependencies_as_loadTheseBefore=True)
+    assert patched is compiled
+    assert patched == CompiledDependencyData.build(
+        metadata_controller_p.mods_metadata,
+        use_moddependencies_as_loadTheseBefore=True,
+    )
+    assert metadata_controller_p.compile() is not compiled
+
+
 # ---- Task 4: set_steam_db_blacklist mutation method ----
 
 
@@ -671,10 +725,10 @@ def test_set_steam_db_blacklist_persists_to_disk(
     assert raw["version"] >= expected_min
 
 
-def test_process_creation_adds_mod_to_metadata(
+def test_process_changes_adds_created_mod_to_metadata(
     metadata_controller: MetadataController, tmp_path: Path
 ) -> None:
-    """process_creation should parse a mod and add it to mods_metadata."""
+    """process_changes should parse a created mod and add it to mods_metadata."""
     mod_path = tmp_path / "test_mod"
     mod_path.mkdir()
     about_dir = mod_path / "About"
@@ -688,14 +742,14 @@ def test_process_creation_adds_mod_to_metadata(
     metadata_controller.metadata_mediator._game_version = "1.5"
     metadata_controller.metadata_mediator._mods_metadata = {}
 
-    metadata_controller.process_creation("local", str(mod_path))
+    metadata_controller.process_changes([str(mod_path)], [], [])
     assert str(mod_path) in metadata_controller.mods_metadata
 
 
-def test_process_deletion_removes_mod(
+def test_process_changes_removes_deleted_mod(
     metadata_controller: MetadataController, tmp_path: Path
 ) -> None:
-    """process_deletion should remove a mod from mods_metadata."""
+    """process_changes should remove a deleted mod from mods_metadata."""
     mod_path = str(tmp_path / "test_mod")
     from app.models.metadata.metadata_structure import ListedMod
 
@@ -703,14 +757,14 @@ def test_process_deletion_removes_mod(
     mock_mod = MagicMock(spec=ListedMod)
     metadata_controller.metadata_mediator._mods_metadata[mod_path] = mock_mod
 
-    metadata_controller.process_deletion("local", mod_path)
+    metadata_controller.process_changes([], [mod_path], [])
     assert mod_path not in metadata_controller.mods_metadata
 
 
-def test_process_update_refreshes_metadata(
+def test_process_changes_refreshes_updated_mod(
     metadata_controller: MetadataController, tmp_path: Path
 ) -> None:
-    """process_update should re-parse a mod and update mods_metadata."""
+    """process_changes should re-parse an updated mod and update mods_metadata."""
     mod_path = tmp_path / "test_mod"
     mod_path.mkdir()
     about_dir = mod_path / "About"
@@ -724,16 +778,52 @@ def test_process_update_refreshes_metadata(
     metadata_controller.metadata_mediator._game_version = "1.5"
     metadata_controller.metadata_mediator._mods_metadata = {}
 
-    metadata_controller.process_creation("local", str(mod_path))
+    metadata_controller.process_changes([str(mod_path)], [], [])
     assert metadata_controller.mods_metadata[str(mod_path)].name == "Original Name"
 
     (about_dir / "About.xml").write_text(
         "<ModMetaData><name>Updated Name</name><packageId>test.mod</packageId></ModMetaData>"
     )
-    metadata_controller.process_update("local", str(mod_path))
+    metadata_controller.process_changes([], [], [str(mod_path)])
     assert metadata_controller.mods_metadata[str(mod_path)].name == "Updated Name"
 
 
+def test_process_changes_applies_batch_in_one_pass(
+    metadata_controller: MetadataController, tmp_path: Path
+) -> None:
+    """process_changes should parse, remove and report a batch of changes at once."""
+    from app.models.metadata.metadata_structure import ListedMod
+
+    mod_paths = []
+    for name in ("new_a", "new_b", "existing"):
+        mod_path = tmp_path / name
+        (mod_path / "About").mkdir(parents=True)
+        (mod_path / "About" / "About.xml").write_text(
+            f"<ModMetaData><name>{name}</name><packageId>test.{name}</packageId></ModMetaData>"
+        )
+        mod_paths.append(str(mod_path))
+    new_a, new_b, existing = mod_paths
+    gone = str(tmp_path / "gone")
+
+    metadata_controller.metadata_mediator.local_mods_path = tmp_path
+    metadata_controller.metadata_mediator.game_path = tmp_path
+    metadata_controller.metadata_mediator._game_version = "1.5"
+    metadata_controller.metadata_mediator._mods_metadata = {
+        gone: MagicMock(spec=ListedMod),
+    }
+    metadata_controller.process_changes([existing], [], [])
+    emitted: list[tuple[list[str], list[str], list[str]]] = []
+    metadata_controller.metadata_changed.connect(lambda *args: emitted.append(args))
+
+    metadata_controller.process_changes(
+        [new_a, new_b, str(tmp_path / "not_a_mod")], [gone], [existing]
+    )
+
+    assert emitted == [([new_a, new_b], [gone], [existing])]
+    assert gone not in metadata_controller.mods_metadata
+    assert metadata_controller.mods_metadata[new_b].name == "new_b"
+
+
 # ---- Task 4: get_mods_from_list ----
 
 
@@ -1004,6 +1094,32 @@ def test_get_mods_from_list_empty_list(
     assert missing == []
 
 
+def test_get_mods_from_list_index_tracks_metadata_changes(
+    metadata_controller: MetadataController,
+) -> None:
+    """The package ID index is rebuilt after mods are added or removed."""
+    mod_a = _make_about_xml_mod("Mod A", "author.moda", ModType.LOCAL, "/mods/mod_a")
+    mod_b = _make_about_xml_mod("Mod B", "author.modb", ModType.LOCAL, "/mods/mod_b")
+    metadata_controller.metadata_mediator._mods_metadata = {"/mods/mod_a": mod_a}
+
+    _, _, _, missing = metadata_controller.get_mods_from_list(["author.modB"])
+    assert missing == ["author.modb"]
+
+    metadata_controller.metadata_mediator.mods_metadata["/mods/mod_b"] = mod_b
+    metadata_controller._invalidate_caches()
+
+    active, inactive, _, missing = metadata_controller.get_mods_from_list(
+        ["author.modB"]
+    )
+    assert active == ["/mods/mod_b"]
+    assert inactive == ["/mods/mod_a"]
+    assert missing == []
+    assert metadata_controller.packageid_to_paths == {
+        "author.moda": {"/mods/mod_a"},
+        "author.modb": {"/mods/mod_b"},
+    }
+
+
 # ---- Local mods path derivation ----
 
 
@@ -1,3 +1,4 @@
+import random
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -450,3 +451,95 @@ def test_compile_inferred_edges_allow_tier_zero_target() -> None:
     mods: dict[str, ListedMod] = {"/mods/a": mod_a, "/mods/core": mod_core}
     compiled = _compile(mods, use_moddependencies_as_loadTheseBefore=True)
     assert "ludeon.rimworld" in compiled.deps_graph.get("mod.a", set())
+
+
+# --- Incremental update tests ---
+
+
+_RANDOM_PACKAGE_IDS = [f"mod.{i}" for i in range(8)] + [
+    "ludeon.rimworld",
+    "adaptive.storage.framework",
+]
+
+
+def _random_mod(rng: random.Random, path: str) -> AboutXmlMod:
+    """Create a mod with random rules over a small pool of package IDs."""
+
+    def _some() -> list[str]:
+        return rng.sample(_RANDOM_PACKAGE_IDS, rng.randint(0, 2))
+
+    mod = _make_mod(
+        rng.choice(_RANDOM_PACKAGE_IDS),
+        path,
+        load_after=_some(),
+        load_before=_some(),
+        load_first=rng.random() < 0.1,
+        load_last=rng.random() < 0.1,
+        incompatible_with=_some() if rng.random() < 0.3 else None,
+    )
+    for dep_pid in _some() + _some():
+        dep = DependencyMod(package_id=CaseInsensitiveStr(dep_pid))
+        dep.alternative_package_ids = {CaseInsensitiveStr(p) for p in _some()}
+        mod.about_rules.dependencies[CaseInsensitiveStr(dep_pid)] = dep
+    return mod
+
+
+@pytest.mark.parametrize("use_alternatives", [False, True])
+@pytest.mark.parametrize("use_inferred", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_updates_match_full_build(
+    seed: int, use_inferred: bool, use_alternatives: bool
+) -> None:
+    """add_mod/update_mod/remove_mod leave the same data as a fresh build."""
+    rng = random.Random(seed)
+    options = {
+        "use_moddependencies_as_loadTheseBefore": use_inferred,
+        "use_alternative_package_ids": use_alternatives,
+    }
+    mods: dict[str, ListedMod] = {
+        f"/mods/{i}": _random_mod(rng, f"/mods/{i}") for i in range(6)
+    }
+    compiled = _compile(mods, **options)
+    next_path = len(mods)
+
+    for _ in range(80):
+        action = rng.random()
+        if action < 0.35 or not mods:
+            path = f"/mods/{next_path}"
+            next_path += 1
+            mods[path] = _random_mod(rng, path)
+            compiled.add_mod(path, mods[path])
+        elif action < 0.7:
+            path = rng.choice(list(mods))
+            mods[path] = _random_mod(rng, path)
+            compiled.update_mod(path, mods[path])
+        else:
+            path = rng.choice(list(mods))
+            del mods[path]
+            compiled.remove_mod(path)
+        assert compiled == _compile(mods, **options)
+
+
+def test_incremental_remove_restores_alternative_dependency() -> None:
+    """Removing the primary dependency makes the inferred edge use the alternative."""
+    mods = _make_alt_dep_mods()
+    mods["/mods/primary"] = _make_mod("mod.primary", "/mods/primary")
+    compiled = _compile(
+        mods,
+        use_moddependencies_as_loadTheseBefore=True,
+        use_alternative_package_ids=True,
+    )
+    assert compiled.deps_graph["mod.a"] == {"mod.primary"}
+
+    compiled.remove_mod("/mods/primary")
+    assert compiled.deps_graph["mod.a"] == {"mod.alt"}
+    assert compiled.rev_deps_graph == {"mod.alt": {"mod.a"}}
+
+
+def test_incremental_ignores_non_aboutxmlmod() -> None:
+    """Mods without About.xml rules never enter the graph."""
+    compiled = _compile({})
+    compiled.add_mod("/mods/x", ListedMod())
+    assert compiled == _compile({})
+    compiled.remove_mod("/mods/x")
+    assert compiled == _compile({})
@@ -1,10 +1,13 @@
 from collections.abc import Generator
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from app.controllers.metadata_db_controller import AuxMetadataController
 from app.models.metadata.metadata_db import AuxMetadataEntry, TagsEntry
+from app.models.metadata.metadata_structure import ModType
+from app.utils.steam.steamfiles.wrapper import dict_to_acf
 
 
 @pytest.fixture()
@@ -138,3 +141,88 @@ def test_aux_metadata_webapi_timestamp_fields(tmp_path: Path) -> None:
         assert fetched is not None
         assert fetched.external_time_created == 1234567890
         assert fetched.external_time_updated == 1234567891
+
+
+def test_bulk_upsert(temp_db: AuxMetadataController) -> None:
+    with temp_db.Session() as session:
+        entry = temp_db.get_or_create(session, "/test/path1")
+        entry.user_notes = "kept"
+        entry.type = "ModType.LOCAL"
+        session.commit()
+        temp_db.update(session, "/test/path1", db_time_touched=datetime(2000, 1, 1))
+
+    with temp_db.Session() as session:
+        temp_db.bulk_upsert(
+            session,
+            {
+                "/test/path1": {
+                    "type": "ModType.STEAM_WORKSHOP",
+                    "published_file_id": "1",
+                },
+                "/test/path2": {"type": "ModType.LOCAL", "published_file_id": None},
+            },
+        )
+        session.commit()
+
+    with temp_db.Session() as session:
+        entries = {entry.path: entry for entry in session.query(AuxMetadataEntry).all()}
+        assert entries.keys() == {"/test/path1", "/test/path2"}
+        assert entries["/test/path1"].type == "ModType.STEAM_WORKSHOP"
+        assert entries["/test/path1"].published_file_id == "1"
+        assert entries["/test/path1"].user_notes == "kept"
+        assert entries["/test/path1"].db_time_touched > datetime(2000, 1, 1)
+        assert entries["/test/path2"].type == "ModType.LOCAL"
+        assert entries["/test/path2"].published_file_id is None
+        assert entries["/test/path2"].acf_time_updated == -1
+        assert entries["/test/path2"].db_time_touched is not None
+
+
+def test_bulk_upsert_skips_unchanged_entries(temp_db: AuxMetadataController) -> None:
+    fields = {"/test/path": {"type": "ModType.LOCAL", "published_file_id": None}}
+    with temp_db.Session() as session:
+        temp_db.bulk_upsert(session, fields)
+        session.commit()
+        temp_db.update(session, "/test/path", db_time_touched=datetime(2000, 1, 1))
+
+    with temp_db.Session() as session:
+        temp_db.bulk_upsert(session, fields)
+        session.commit()
+        entry = temp_db.get(session, "/test/path")
+        assert entry is not None
+        assert entry.db_time_touched == datetime(2000, 1, 1)
+
+
+def test_update_from_acf(temp_db: AuxMetadataController, tmp_path: Path) -> None:
+    acf_path = tmp_path / "appworkshop_294100.acf"
+    dict_to_acf(
+        {
+            "AppWorkshop": {
+                "WorkshopItemDetails": {
+                    "1": {"timeupdated": "1700000000", "timetouched": "1700000001"},
+                    "2": {"timeupdated": "1700000002", "timetouched": "1700000003"},
+                }
+            }
+        },
+        str(acf_path),
+    )
+    with temp_db.Session() as session:
+        temp_db.bulk_upsert(
+            session,
+            {
+                "/workshop/1": {
+                    "type": "ModType.STEAM_WORKSHOP",
+                    "published_file_id": "1",
+                },
+                "/steamcmd/2": {"type": "ModType.STEAM_CMD", "published_file_id": "2"},
+            },
+        )
+        temp_db.update_from_acf(session, acf_path, ModType.STEAM_WORKSHOP)
+
+    with temp_db.Session() as session:
+        workshop_entry = temp_db.get(session, "/workshop/1")
+        steamcmd_entry = temp_db.get(session, "/steamcmd/2")
+        assert workshop_entry is not None and steamcmd_entry is not None
+        assert workshop_entry.acf_time_updated == 1700000000
+        assert workshop_entry.acf_time_touched == 1700000001
+        # Only entries of the given mod type are updated
+        assert steamcmd_entry.acf_time_updated == -1
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock, patch
+
+from pytestqt.qtbot import QtBot
+
+from app.controllers.settings_controller import SettingsController
+from app.models.settings import Settings
+
+
+class TestSettingsDialogIsBuiltLazily:
+    def test_dialog_is_built_when_first_opened(self, qtbot: QtBot) -> None:
+        with (
+            patch.object(Settings, "load"),
+            patch(
+                "app.controllers.settings_controller.SettingsDialog",
+                return_value=MagicMock(),
+            ) as dialog_class,
+        ):
+            controller = SettingsController(model=Settings())
+            dialog_class.assert_not_called()
+
+            controller.show_settings_dialog("Locations")
+            controller.show_settings_dialog()
+
+        dialog_class.assert_called_once()
+        dialog = controller.settings_dialog
+        assert dialog is dialog_class.return_value
+        dialog.switch_to_tab.assert_called_once_with("Locations")
+        assert dialog.show.call_count == 2
+        dialog.global_ok_button.clicked.connect.assert_called_once()
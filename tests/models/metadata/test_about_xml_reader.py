@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from app.models.metadata.metadata_factory import create_about_mod, read_about_xml
+from app.models.metadata.metadata_structure import AboutXmlMod
+from app.utils.xml import xml_path_to_json
+
+MOD_EXAMPLES = Path("tests/data/mod_examples")
+TARGET_VERSIONS = ["1.5.4104", "1.4.3901", "Unknown"]
+
+
+def _dict_path(path: Path, target_version: str, prefer_versioned: bool) -> AboutXmlMod:
+    mod_data = {k.lower(): v for k, v in xml_path_to_json(str(path)).items()}
+    _, mod = create_about_mod(mod_data["modmetadata"], target_version, prefer_versioned)
+    return mod
+
+
+def _assert_parity(path: Path, target_version: str, prefer_versioned: bool) -> None:
+    expected = _dict_path(path, target_version, prefer_versioned)
+    actual = read_about_xml(path, target_version, prefer_versioned)
+    assert actual is not None
+    assert actual == expected
+
+
+@pytest.mark.parametrize("prefer_versioned", [True, False])
+@pytest.mark.parametrize("target_version", TARGET_VERSIONS)
+@pytest.mark.parametrize(
+    "about_xml",
+    sorted(MOD_EXAMPLES.rglob("About.xml")),
+    ids=lambda p: p.parent.parent.name,
+)
+def test_parity_with_mod_examples(
+    about_xml: Path, target_version: str, prefer_versioned: bool
+) -> None:
+    _assert_parity(about_xml, target_version, prefer_versioned)
+
+
+SYNTHETIC_ABOUT_XMLS = {
+    "by_version": """
+        <ModMetaData>
+            <packageId>Author.ByVersion</packageId>
+            <name>By Version</name>
+            <authors><li>a</li><li></li><li>b</li></authors>
+            <supportedVersions><li>1.4</li><li>1.5</li></supportedVersions>
+            <description>base</description>
+            <descriptionsByVersion>
+                <v1.4>old</v1.4>
+                <v1.5>new</v1.5>
+            </descriptionsByVersion>
+            <modDependencies>
+                <li><packageId>base.dep</packageId><displayName>Base</displayName></li>
+            </modDependencies>
+            <modDependenciesByVersion>
+                <v1.5>
+                    <li>
+                        <packageId>new.dep</packageId>
+                        <displayName>New</displayName>
+                        <alternativePackageIds>
+                            <li>new.dep.alt</li>
+                            <li MayRequire="x">new.dep.alt2</li>
+                        </alternativePackageIds>
+                    </li>
+                    <li><packageId>single.child</packageId></li>
+                </v1.5>
+                <v1.4 />
+            </modDependenciesByVersion>
+            <loadAfter><li>base.after</li></loadAfter>
+            <loadAfterByVersion><v1.5><li>new.after</li><li>other.after</li></v1.5></loadAfterByVersion>
+            <loadBefore><li>base.before</li></loadBefore>
+            <loadBeforeByVersion><v1.5></v1.5></loadBeforeByVersion>
+            <forceLoadBefore><li>forced.before</li></forceLoadBefore>
+            <incompatibleWith><li>a.b</li><li>c.d</li></incompatibleWith>
+            <incompatibleWithByVersion><v1.4><li>e.f</li></v1.4></incompatibleWithByVersion>
+        </ModMetaData>
+    """,
+    "odd_values": """
+        <ModMetaData>
+            <packageId>  </packageId>
+            <name></name>
+            <author>single</author>
+            <authors>solo</authors>
+            <modVersion>1.0</modVersion>
+            <modIconPath IgnoreIfNoMatchingField="True">Icon/Path</modIconPath>
+            <url>https://example.com</url>
+            <steamAppId>1234</steamAppId>
+            <supportedVersions>1.5</supportedVersions>
+            <loadAfter> </loadAfter>
+            <modDependencies></modDependencies>
+            <unknownField><nested><deep>ignored</deep></nested></unknownField>
+        </ModMetaData>
+    """,
+    "dlc": """
+        <ModMetaData>
+            <packageId>Ludeon.RimWorld.Biotech</packageId>
+            <supportedVersions><li>1.5</li></supportedVersions>
+        </ModMetaData>
+    """,
+}
+
+
+@pytest.mark.parametrize("prefer_versioned", [True, False])
+@pytest.mark.parametrize("target_version", TARGET_VERSIONS)
+@pytest.mark.parametrize("name", sorted(SYNTHETIC_ABOUT_XMLS))
+def test_parity_with_synthetic_about_xml(
+    tmp_path: Path, name: str, target_version: str, prefer_versioned: bool
+) -> None:
+    path = tmp_path / "About.xml"
+    path.write_text(SYNTHETIC_ABOUT_XMLS[name], encoding="utf-8")
+    _assert_parity(path, target_version, prefer_versioned)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "<ModMetaData><name>broken</ModMetaData>",
+        "<Defs><name>not about</name></Defs>",
+        "<ModMetaData><name>a</name><name>b</name></ModMetaData>",
+        "<ModMetaData><loadAfter><li><nested/></li></loadAfter></ModMetaData>",
+    ],
+    ids=["malformed", "wrong_root", "duplicate_field", "nested_list_entry"],
+)
+def test_unsupported_documents_fall_back(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "About.xml"
+    path.write_text(content, encoding="utf-8")
+    assert read_about_xml(path, "1.5.4104") is None
@@ -0,0 +1,151 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.models.metadata.metadata_cache import (
+    MetadataParseCache,
+    hydrate_mod,
+    snapshot_mod,
+)
+from app.models.metadata.metadata_mediator import MetadataMediator
+from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod
+
+
+@pytest.fixture
+def mod_examples(tmp_path: Path) -> Path:
+    dest = tmp_path / "mod_examples"
+    shutil.copytree("tests/data/mod_examples", dest)
+    return dest
+
+
+@pytest.fixture
+def mediator(mod_examples: Path, tmp_path: Path) -> MetadataMediator:
+    return MetadataMediator(
+        user_rules_path=Path("tests/data/dbs/userRules.json"),
+        community_rules_path=None,
+        steam_db_path=None,
+        workshop_mods_path=mod_examples / "Steam",
+        local_mods_path=mod_examples / "Local",
+        game_path=mod_examples / "RimWorld",
+        parse_cache_path=tmp_path / "metadata_cache.db",
+    )
+
+
+def _comparable(mod: object) -> dict[str, object]:
+    assert isinstance(mod, ListedMod)
+    data = {
+        "type": type(mod).__name__,
+        "name": mod.name,
+        "valid": mod.valid,
+        "description": mod.description,
+        "supported_versions": mod.supported_versions,
+        "mod_type": mod.mod_type,
+        "mod_path": mod.mod_path,
+    }
+    if isinstance(mod, AboutXmlMod):
+        data |= {
+            "package_id": mod.package_id,
+            "authors": mod.authors,
+            "steam_app_id": mod.steam_app_id,
+            "load_after": set(mod.overall_rules.load_after),
+            "load_before": set(mod.overall_rules.load_before),
+            "incompatible_with": set(mod.overall_rules.incompatible_with),
+            "dependencies": {
+                str(k): (v.name, set(v.alternative_package_ids))
+                for k, v in mod.overall_rules.dependencies.items()
+            },
+            "load_last": mod.overall_rules.load_last,
+        }
+    return data
+
+
+def test_second_refresh_reuses_cache(mediator: MetadataMediator) -> None:
+    mediator.refresh_metadata()
+    first = {k: _comparable(v) for k, v in mediator.mods_metadata.items()}
+    cache = mediator.parse_cache
+    assert cache is not None
+    assert cache.hits == 0
+    assert cache.misses > 0
+
+    mediator.refresh_metadata()
+    second = {k: _comparable(v) for k, v in mediator.mods_metadata.items()}
+    assert cache.misses == 0
+    assert cache.hits > 0
+    assert first == second
+
+
+def test_cache_persists_across_instances(
+    mediator: MetadataMediator, mod_examples: Path, tmp_path: Path
+) -> None:
+    mediator.refresh_metadata()
+    fresh = MetadataParseCache(tmp_path / "metadata_cache.db")
+    fresh.begin(mediator.game_version, True, True)
+
+    mod_path = mod_examples / "Steam" / "steam_mod_1"
+    _, mod = fresh.lookup(mod_path)
+    assert mod is not None
+    assert fresh.hits == 1
+    assert _comparable(mod) == _comparable(mediator.mods_metadata[str(mod_path)])
+
+
+def test_changed_about_xml_is_reparsed(
+    mediator: MetadataMediator, mod_examples: Path
+) -> None:
+    mediator.refresh_metadata()
+    about = mod_examples / "Local" / "local_mod_1" / "About" / "About.xml"
+    about.write_text(
+        about.read_text(encoding="utf-8").replace("<name>", "<name>Renamed "),
+        encoding="utf-8",
+    )
+
+    mediator.refresh_metadata()
+    cache = mediator.parse_cache
+    assert cache is not None
+    assert cache.misses == 1
+    mod = mediator.mods_metadata[str(mod_examples / "Local" / "local_mod_1")]
+    assert mod.name.startswith("Renamed ")
+
+
+def test_parser_option_change_invalidates(mediator: MetadataMediator) -> None:
+    mediator.refresh_metadata()
+    mediator.refresh_metadata(prefer_versioned=False)
+    cache = mediator.parse_cache
+    assert cache is not None
+    assert cache.hits == 0
+
+
+def test_user_rules_are_reapplied_on_hydration(mediator: MetadataMediator) -> None:
+    mediator.refresh_metadata()
+    mediator.user_rules_path = Path("tests/data/dbs/does_not_exist.json")
+    mediator.refresh_metadata()
+
+    mod = next(m for m in mediator.mods_metadata.values() if isinstance(m, AboutXmlMod))
+    assert not mod.user_rules.load_after
+    assert not mod.user_rules.load_last
+
+
+def test_removed_mods_are_pruned(
+    mediator: MetadataMediator, mod_examples: Path, tmp_path: Path
+) -> None:
+    mediator.refresh_metadata()
+    shutil.rmtree(mod_examples / "Local" / "local_mod_2")
+    mediator.refresh_metadata()
+
+    fresh = MetadataParseCache(tmp_path / "metadata_cache.db")
+    fresh.begin(mediator.game_version, True, True)
+    assert str(mod_examples / "Local" / "local_mod_2") not in fresh._entries
+
+
+def test_snapshot_round_trip(mediator: MetadataMediator) -> None:
+    mediator.refresh_metadata()
+    for path, mod in mediator.mods_metadata.items():
+        snapshot = snapshot_mod(mod)
+        if snapshot is None:
+            continue
+        restored = hydrate_mod(snapshot, Path(path))
+        if isinstance(mod, AboutXmlMod):
+            assert isinstance(restored, AboutXmlMod)
+            assert restored.about_rules == mod.about_rules
+        assert restored.name == mod.name
+        assert restored.mod_type == mod.mod_type
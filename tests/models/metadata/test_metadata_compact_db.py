@@ -0,0 +1,136 @@
+import os
+import shutil
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from app.models.metadata.metadata_compact_db import (
+    LazyEntryMap,
+    compact_db_path,
+    compact_enc_hook,
+    generate_compact_dbs,
+    read_compact_rules_db,
+    read_compact_steam_db,
+    write_compact_db,
+)
+from app.models.metadata.metadata_factory import read_rules_db, read_steam_db
+from app.models.metadata.metadata_structure import (
+    ExternalRulesSchema,
+    SteamDbEntry,
+    SteamDbSchema,
+)
+
+
+@pytest.fixture
+def dbs(tmp_path: Path) -> Path:
+    dest = tmp_path / "dbs"
+    shutil.copytree("tests/data/dbs", dest)
+    return dest
+
+
+def _json_steam_db(path: Path) -> SteamDbSchema:
+    steam_db = msgspec.json.decode(path.read_bytes(), type=SteamDbSchema)
+    steam_db.database = {k.lower(): v for k, v in steam_db.database.items()}
+    return steam_db
+
+
+def test_steam_db_round_trip(dbs: Path) -> None:
+    path = dbs / "steamDB.json"
+    expected = _json_steam_db(path)
+    assert write_compact_db(path) == compact_db_path(path)
+
+    steam_db = read_steam_db(path)
+    assert steam_db is not None
+    database = steam_db.database
+    assert isinstance(database, LazyEntryMap)
+    assert database.decoded_count == 0
+    assert steam_db.version == expected.version
+    assert list(database) == list(expected.database)
+
+    key = next(iter(expected.database))
+    assert key in database
+    assert database[key] == expected.database[key]
+    assert database.decoded_count == 1
+    assert database.to_dict() == expected.database
+
+
+def test_rules_db_round_trip(dbs: Path) -> None:
+    path = dbs / "userRules.json"
+    expected = read_rules_db(path)
+    assert expected is not None
+    write_compact_db(path)
+
+    rules = read_rules_db(path)
+    assert rules is not None
+    assert isinstance(rules.rules, LazyEntryMap)
+    assert rules.timestamp == expected.timestamp
+    assert dict(rules.rules) == expected.rules
+    # A rules sidecar is never mistaken for a SteamDB
+    assert read_compact_steam_db(path) is None
+
+
+def test_stale_sidecar_is_ignored(dbs: Path) -> None:
+    path = dbs / "steamDB.json"
+    write_compact_db(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert read_compact_steam_db(path) is None
+    steam_db = read_steam_db(path)
+    assert steam_db is not None
+    assert isinstance(steam_db.database, dict)
+
+
+def test_corrupt_sidecar_is_ignored(dbs: Path) -> None:
+    path = dbs / "userRules.json"
+    write_compact_db(path)
+    sidecar = compact_db_path(path)
+    sidecar.write_bytes(sidecar.read_bytes()[:20])
+
+    assert read_compact_rules_db(path) is None
+
+
+def test_generate_skips_other_json(dbs: Path) -> None:
+    (dbs / "replacements.json").write_text('{"mods": {}}', encoding="utf-8")
+
+    written = generate_compact_dbs(dbs)
+
+    assert sorted(p.name for p in written) == ["steamDB.rsdb", "userRules.rsdb"]
+    assert not compact_db_path(dbs / "replacements.json").exists()
+
+
+def test_edits_are_kept_and_encoded(dbs: Path) -> None:
+    path = dbs / "steamDB.json"
+    write_compact_db(path)
+    steam_db = read_compact_steam_db(path)
+    assert steam_db is not None
+
+    key = next(iter(steam_db.database))
+    steam_db.database[key].blacklist.value = True
+    steam_db.database["new"] = SteamDbEntry(name="New")
+    del steam_db.database[next(k for k in steam_db.database if k != key)]
+
+    encoded = msgspec.json.encode(steam_db, enc_hook=compact_enc_hook)
+    decoded = msgspec.json.decode(encoded, type=SteamDbSchema)
+    assert decoded.database[key].blacklist.value
+    assert decoded.database["new"].name == "New"
+    assert len(decoded.database) == len(steam_db.database)
+
+    # Rewriting from the edited schema refreshes the sidecar
+    path.write_bytes(encoded)
+    write_compact_db(path, steam_db)
+    reloaded = read_compact_steam_db(path)
+    assert reloaded is not None
+    assert reloaded.database["new"].name == "New"
+
+
+def test_rules_schema_from_sidecar_encodes_like_json(dbs: Path) -> None:
+    path = dbs / "userRules.json"
+    write_compact_db(path)
+    rules = read_compact_rules_db(path)
+    expected = read_rules_db(dbs / "userRules.json")
+    assert rules is not None and expected is not None
+
+    encoded = msgspec.json.encode(rules, enc_hook=compact_enc_hook)
+    assert msgspec.json.decode(encoded, type=ExternalRulesSchema) == expected
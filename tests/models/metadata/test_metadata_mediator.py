@@ -1,10 +1,14 @@
 import json
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from app.models.metadata import metadata_mediator
 from app.models.metadata.metadata_mediator import MetadataMediator
-from app.models.metadata.metadata_structure import AboutXmlMod
+from app.models.metadata.metadata_structure import AboutXmlMod, MetadataChangeSet
+from app.utils.constants import MetadataParserBackend
 
 
 @pytest.fixture
@@ -158,3 +162,184 @@ def test_mediator_loads_use_this_instead(tmp_path: Path) -> None:
     entry = mediator.use_this_instead["111111"]
     assert entry["newName"] == "New Mod"
     assert entry["newPackageId"] == "new.mod.b"
+
+
+@pytest.fixture
+def tmp_mediator(tmp_path: Path) -> MetadataMediator:
+    mod_examples = tmp_path / "mod_examples"
+    shutil.copytree("tests/data/mod_examples", mod_examples)
+    return MetadataMediator(
+        user_rules_path=Path("tests/data/dbs/userRules.json"),
+        community_rules_path=None,
+        steam_db_path=None,
+        workshop_mods_path=mod_examples / "Steam",
+        local_mods_path=mod_examples / "Local",
+        game_path=mod_examples / "RimWorld",
+    )
+
+
+def test_incremental_refresh_falls_back_without_snapshot(
+    tmp_mediator: MetadataMediator,
+) -> None:
+    assert tmp_mediator.refresh_metadata_incremental() is None
+    assert len(tmp_mediator.mods_metadata) > 0
+
+
+def test_incremental_refresh_no_changes(tmp_mediator: MetadataMediator) -> None:
+    tmp_mediator.refresh_metadata()
+    before = dict(tmp_mediator.mods_metadata)
+
+    changes = tmp_mediator.refresh_metadata_incremental()
+    assert changes is not None
+    assert not changes
+    assert tmp_mediator.mods_metadata == before
+
+
+def test_incremental_refresh_detects_changes(tmp_mediator: MetadataMediator) -> None:
+    tmp_mediator.refresh_metadata()
+    assert tmp_mediator.local_mods_path is not None
+    local = tmp_mediator.local_mods_path
+    untouched = tmp_mediator.mods_metadata[str(local / "local_mod_1")]
+
+    about = local / "local_mod_2" / "About" / "About.xml"
+    about.write_text(
+        about.read_text(encoding="utf-8").replace("<name>", "<name>Renamed "),
+        encoding="utf-8",
+    )
+    shutil.copytree(local / "local_mod_1", local / "local_mod_copy")
+    shutil.rmtree(local / "scenario_mod_1")
+
+    changes = tmp_mediator.refresh_metadata_incremental()
+    assert changes is not None
+    assert changes.added == [str(local / "local_mod_copy")]
+    assert changes.removed == [str(local / "scenario_mod_1")]
+    assert changes.changed == [str(local / "local_mod_2")]
+
+    metadata = tmp_mediator.mods_metadata
+    assert str(local / "scenario_mod_1") not in metadata
+    assert str(local / "local_mod_copy") in metadata
+    assert metadata[str(local / "local_mod_2")].name.startswith("Renamed ")
+    # Unchanged mods keep their parsed instance
+    assert metadata[str(local / "local_mod_1")] is untouched
+
+
+def test_incremental_refresh_falls_back_on_option_change(
+    tmp_mediator: MetadataMediator,
+) -> None:
+    tmp_mediator.refresh_metadata()
+    assert tmp_mediator.refresh_metadata_incremental(prefer_versioned=False) is None
+    assert tmp_mediator.refresh_metadata_incremental(prefer_versioned=False) == (
+        MetadataChangeSet()
+    )
+
+
+def test_incremental_refresh_after_versioned_no_version_warning(
+    tmp_mediator: MetadataMediator, tmp_path: Path
+) -> None:
+    versioned = tmp_path / "nvw" / "1.5" / "ModIdsToFix.xml"
+    versioned.parent.mkdir(parents=True)
+    versioned.write_text("<ModIdsToFix><li>mod.a</li></ModIdsToFix>")
+    tmp_mediator.no_version_warning_path = tmp_path / "nvw" / "ModIdsToFix.xml"
+    tmp_mediator.refresh_metadata()
+    assert tmp_mediator.no_version_warning_path == versioned
+
+    assert tmp_mediator.refresh_metadata_incremental() == MetadataChangeSet()
+
+
+def test_process_backend_matches_thread_backend(
+    tmp_mediator: MetadataMediator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tmp_mediator.refresh_metadata()
+    threaded = tmp_mediator.mods_metadata
+
+    monkeypatch.setattr(metadata_mediator, "PROCESS_PARSER_MIN_MODS", 0)
+    tmp_mediator.parser_backend = MetadataParserBackend.PROCESSES
+    tmp_mediator.refresh_metadata()
+    processed = tmp_mediator.mods_metadata
+
+    assert processed.keys() == threaded.keys()
+    for path, mod in threaded.items():
+        other = processed[path]
+        assert type(other) is type(mod)
+        assert other.name == mod.name
+        assert other.valid == mod.valid
+        assert other.mod_type == mod.mod_type
+        if isinstance(mod, AboutXmlMod):
+            assert isinstance(other, AboutXmlMod)
+            assert other.package_id == mod.package_id
+            assert other.about_rules == mod.about_rules
+            assert other.user_rules == mod.user_rules
+
+
+@pytest.fixture
+def counted_db_reads(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    counts = {"rules": 0, "steam_db": 0}
+
+    def _counted(name: str, read: Callable[[Path], object]) -> Callable[[Path], object]:
+        def wrapper(path: Path) -> object:
+            counts[name] += 1
+            return read(path)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        metadata_mediator,
+        "read_rules_db",
+        _counted("rules", metadata_mediator.read_rules_db),
+    )
+    monkeypatch.setattr(
+        metadata_mediator,
+        "read_steam_db",
+        _counted("steam_db", metadata_mediator.read_steam_db),
+    )
+    return counts
+
+
+@pytest.fixture
+def db_mediator(tmp_mediator: MetadataMediator, tmp_path: Path) -> MetadataMediator:
+    dbs = tmp_path / "dbs"
+    shutil.copytree("tests/data/dbs", dbs)
+    tmp_mediator.user_rules_path = dbs / "userRules.json"
+    tmp_mediator.steam_db_path = dbs / "steamDB.json"
+    return tmp_mediator
+
+
+def test_unchanged_external_dbs_are_reused(
+    db_mediator: MetadataMediator, counted_db_reads: dict[str, int]
+) -> None:
+    db_mediator.refresh_metadata()
+    steam_db = db_mediator.steam_db
+    assert counted_db_reads == {"rules": 1, "steam_db": 1}
+
+    db_mediator.refresh_metadata()
+    assert counted_db_reads == {"rules": 1, "steam_db": 1}
+    assert db_mediator.steam_db is steam_db
+
+
+def test_changed_external_db_is_reread(
+    db_mediator: MetadataMediator, counted_db_reads: dict[str, int]
+) -> None:
+    db_mediator.refresh_metadata()
+    assert db_mediator.user_rules_path is not None
+    rules = json.loads(db_mediator.user_rules_path.read_text(encoding="utf-8"))
+    rules["rules"]["added.rule"] = {"loadBottom": {"value": True}}
+    db_mediator.user_rules_path.write_text(json.dumps(rules), encoding="utf-8")
+
+    db_mediator.refresh_metadata()
+    assert counted_db_reads == {"rules": 2, "steam_db": 1}
+    assert db_mediator.user_rules is not None
+    assert "added.rule" in db_mediator.user_rules.rules
+
+
+def test_invalidate_external_dbs_forces_reread(
+    db_mediator: MetadataMediator, counted_db_reads: dict[str, int]
+) -> None:
+    db_mediator.refresh_metadata()
+    db_mediator.invalidate_external_dbs("steam_db")
+    db_mediator.refresh_metadata()
+    assert counted_db_reads == {"rules": 1, "steam_db": 2}
+
+    db_mediator.invalidate_external_dbs()
+    # Loaded DBs feed into every mod, so the next refresh must be a full one
+    assert db_mediator.refresh_metadata_incremental() is None
+    assert counted_db_reads == {"rules": 2, "steam_db": 3}
@@ -0,0 +1,191 @@
+import random
+from itertools import pairwise
+
+import pytest
+
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    BaseRules,
+    CaseInsensitiveSet,
+    CaseInsensitiveStr,
+    DependencyMod,
+    ListedMod,
+)
+from app.models.mod_list_validation import (
+    ModListValidationIndex,
+    longest_increasing_run,
+    rule_targets,
+)
+
+
+def _mod(
+    package_id: str,
+    load_after: list[str] | None = None,
+    dependencies: list[str] | None = None,
+    incompatible_with: list[str] | None = None,
+) -> AboutXmlMod:
+    about = BaseRules()
+    about.load_after = CaseInsensitiveSet(load_after or [])
+    about.incompatible_with = CaseInsensitiveSet(incompatible_with or [])
+    for dep in dependencies or []:
+        about.dependencies[CaseInsensitiveStr(dep)] = DependencyMod(
+            package_id=CaseInsensitiveStr(dep)
+        )
+    return AboutXmlMod(
+        name=package_id, package_id=CaseInsensitiveStr(package_id), about_rules=about
+    )
+
+
+def _outcome(
+    uuid: str, order: list[str], mods: dict[str, ListedMod]
+) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """Load order violations, missing dependencies and incompatibilities of a mod."""
+    mod = mods[uuid]
+    assert isinstance(mod, AboutXmlMod)
+    position: dict[str, int] = {}
+    for i, path in enumerate(order):
+        other = mods[path]
+        assert isinstance(other, AboutXmlMod)
+        position[str(other.package_id)] = i
+    rules = mod.overall_rules
+    return (
+        frozenset(
+            str(pid)
+            for pid in rules.load_after
+            if str(pid) in position and order.index(uuid) <= position[str(pid)]
+        ),
+        frozenset(str(pid) for pid in rules.dependencies if str(pid) not in position),
+        frozenset(str(pid) for pid in rules.incompatible_with if str(pid) in position),
+    )
+
+
+class TestLongestIncreasingRun:
+    @pytest.mark.parametrize(
+        "values, length",
+        [([], 0), ([0, 1, 2, 3], 4), ([3, 2, 1, 0], 1), ([0, 5, 1, 2, 3, 4], 5)],
+    )
+    def test_run_is_increasing_and_longest(
+        self, values: list[int], length: int
+    ) -> None:
+        run = sorted(longest_increasing_run(values))
+
+        assert len(run) == length
+        assert all(values[a] < values[b] for a, b in pairwise(run))
+
+    def test_single_drag_moves_one_mod(self) -> None:
+        # The mod at position 1 was dragged to the end of the list
+        assert longest_increasing_run([0, 2, 3, 4, 1]) == {0, 1, 2, 3}
+
+
+class TestRuleTargets:
+    def test_includes_alternatives_and_replacements(self) -> None:
+        mod = _mod("a.a", load_after=["b.b"], dependencies=["brrainz.harmony"])
+        dep = mod.overall_rules.dependencies[CaseInsensitiveStr("brrainz.harmony")]
+        dep.alternative_package_ids = {CaseInsensitiveStr("c.c")}
+
+        assert rule_targets(mod) == {
+            "b.b",
+            "brrainz.harmony",
+            "c.c",
+            "zetrith.prepatcher",
+            "jikulopo.prepatcher",
+        }
+
+    def test_mod_without_about_xml_has_no_targets(self) -> None:
+        assert rule_targets(ListedMod(name="Loose folder")) == frozenset()
+
+
+class TestModListValidationIndex:
+    def test_first_update_checks_every_mod(self) -> None:
+        mods: dict[str, ListedMod] = {"/a": _mod("a.a"), "/b": _mod("b.b")}
+        index = ModListValidationIndex()
+
+        assert index.update(["/a", "/b"], mods, None) == {"/a", "/b"}
+        assert index.packageid_to_uuid == {"a.a": "/a", "b.b": "/b"}
+        assert index.positions == {"/a": 0, "/b": 1}
+
+    def test_drag_only_rechecks_mods_with_rules_about_it(self) -> None:
+        mods: dict[str, ListedMod] = {
+            f"/{i}": _mod(f"mod{i}.mod", load_after=[f"mod{i - 1}.mod"] if i else [])
+            for i in range(600)
+        }
+        order = list(mods)
+        index = ModListValidationIndex()
+        index.update(order, mods, None)
+
+        order.insert(0, order.pop(300))
+
+        assert index.update(order, mods, None) == {"/300", "/301"}
+        assert index.positions["/300"] == 0
+
+    def test_context_change_rechecks_every_mod(self) -> None:
+        mods: dict[str, ListedMod] = {"/a": _mod("a.a"), "/b": _mod("b.b")}
+        index = ModListValidationIndex()
+        index.update(["/a", "/b"], mods, ("1.5",))
+
+        assert index.update(["/a", "/b"], mods, ("1.5",)) == set()
+        assert index.update(["/a", "/b"], mods, ("1.6",)) == {"/a", "/b"}
+
+    def test_replaced_metadata_rechecks_the_mod_and_its_referrers(self) -> None:
+        mods: dict[str, ListedMod] = {
+            "/a": _mod("a.a"),
+            "/b": _mod("b.b", dependencies=["a.a"]),
+            "/c": _mod("c.c"),
+        }
+        index = ModListValidationIndex()
+        index.update(list(mods), mods, None)
+
+        mods["/a"] = _mod("a.a", incompatible_with=["c.c"])
+
+        assert index.update(list(mods), mods, None) == {"/a", "/b"}
+
+    def test_last_duplicate_package_id_wins(self) -> None:
+        mods: dict[str, ListedMod] = {"/a1": _mod("a.a"), "/a2": _mod("a.a")}
+        index = ModListValidationIndex()
+        index.update(["/a1", "/a2"], mods, None)
+        assert index.packageid_to_uuid["a.a"] == "/a2"
+
+        index.update(["/a2", "/a1"], mods, None)
+        assert index.packageid_to_uuid["a.a"] == "/a1"
+
+        index.update(["/a2"], mods, None)
+        assert index.packageid_to_uuid["a.a"] == "/a2"
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_every_changed_outcome_is_rechecked(self, seed: int) -> None:
+        rng = random.Random(seed)
+        package_ids = [f"mod{i}.mod" for i in range(40)]
+        mods: dict[str, ListedMod] = {
+            f"/{pid}": _mod(
+                pid,
+                load_after=rng.sample(package_ids, rng.randint(0, 2)),
+                dependencies=rng.sample(package_ids, rng.randint(0, 2)),
+                incompatible_with=rng.sample(package_ids, rng.randint(0, 1)),
+            )
+            for pid in package_ids
+        }
+        order = rng.sample(list(mods), 30)
+        index = ModListValidationIndex()
+        index.update(order, mods, None)
+
+        for _ in range(50):
+            before = {uuid: _outcome(uuid, order, mods) for uuid in order}
+            order = list(order)
+            action = rng.random()
+            if action < 0.5:
+                order.insert(
+                    rng.randrange(len(order)), order.pop(rng.randrange(len(order)))
+                )
+            elif action < 0.75 or len(order) < 5:
+                missing = [uuid for uuid in mods if uuid not in order]
+                if missing:
+                    order.insert(rng.randrange(len(order) + 1), rng.choice(missing))
+            else:
+                order.pop(rng.randrange(len(order)))
+
+            dirty = index.update(order, mods, None)
+
+            for uuid in order:
+                if uuid not in before or _outcome(uuid, order, mods) != before[uuid]:
+                    assert uuid in dirty
+            assert index.positions == {uuid: i for i, uuid in enumerate(order)}
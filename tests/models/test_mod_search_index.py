@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    CaseInsensitiveStr,
+    ListedMod,
+    ModType,
+)
+from app.models.mod_search_index import (
+    SUBSTRING_FIELDS,
+    ModSearchEntry,
+    ModSearchIndex,
+)
+
+_WORDS = ["core", "harmony", "hugslib", "vanilla", "expanded", "ui", "qol", "mod"]
+
+
+def _mod(name: str, package_id: str, authors: list[str] | None = None) -> AboutXmlMod:
+    mod = AboutXmlMod(name=name, package_id=CaseInsensitiveStr(package_id))
+    mod.authors = authors or []
+    mod.supported_versions = {"1.4", "1.5"}
+    return mod
+
+
+def _random_entry(rng: random.Random) -> ModSearchEntry:
+    name = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 4)))
+    mod = _mod(
+        name.title(),
+        f"{rng.choice(_WORDS)}.{rng.choice(_WORDS)}",
+        [rng.choice(_WORDS).title() for _ in range(rng.randint(0, 2))],
+    )
+    tags = [rng.choice(_WORDS) for _ in range(rng.randint(0, 2))]
+    return ModSearchEntry.from_mod(mod, tags, "")
+
+
+class TestModSearchEntry:
+    def test_fields_are_lowercased(self) -> None:
+        mod = _mod("Vanilla Expanded", "OskarPotocki.VFE", ["Oskar", "Taranchuk"])
+        mod.published_file_id = "2023507013"
+
+        entry = ModSearchEntry.from_mod(mod, ["QoL", "Framework"], "Load EARLY")
+
+        assert entry.name == "vanilla expanded"
+        assert entry.packageid == "oskarpotocki.vfe"
+        assert entry.authors == "oskar\ntaranchuk"
+        assert entry.publishedfileid == "2023507013"
+        assert entry.version == "1.4\n1.5"
+        assert entry.tags == "qol\nframework"
+        assert entry.notes == "load early"
+        assert entry.tag_set == frozenset({"QoL", "Framework"})
+
+    def test_mod_without_about_xml_has_no_package_id(self) -> None:
+        mod = ListedMod(name="Loose folder")
+        mod.mod_type = ModType.LOCAL
+
+        entry = ModSearchEntry.from_mod(mod, [], None)
+
+        assert entry.packageid is None
+        assert entry.authors == ""
+        assert entry.notes == ""
+
+
+class TestModSearchIndex:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_substring_matches_agree_with_scan(self, seed: int) -> None:
+        rng = random.Random(seed)
+        index = ModSearchIndex()
+        entries: dict[str, ModSearchEntry] = {}
+        for i in range(200):
+            path = f"/mods/{rng.randrange(150)}"
+            if i % 7 == 0:
+                index.discard(path)
+                entries.pop(path, None)
+            else:
+                entries[path] = _random_entry(rng)
+                index.add(path, entries[path])
+
+            field = rng.choice(SUBSTRING_FIELDS)
+            word = rng.choice(_WORDS)
+            # Growing prefixes exercise the narrowing of the last result
+            for end in range(1, len(word) + 1):
+                pattern = word[:end].upper() if end % 2 else word[:end]
+                expected = {
+                    p
+                    for p, entry in entries.items()
+                    if (value := getattr(entry, field)) is not None
+                    and pattern.lower() in value
+                }
+                assert index.substring_matches(field, pattern) == expected
+
+    def test_values_do_not_match_across_lines(self) -> None:
+        index = ModSearchIndex()
+        index.add("/a", ModSearchEntry.from_mod(_mod("A", "a.a"), ["abc", "def"], ""))
+
+        assert index.substring_matches("tags", "cd") == set()
+        assert index.substring_matches("tags", "de") == {"/a"}
+
+    def test_replacing_an_entry_drops_its_old_values(self) -> None:
+        index = ModSearchIndex()
+        index.add(
+            "/a", ModSearchEntry.from_mod(_mod("Harmony", "brrainz.harmony"), [], "")
+        )
+        assert index.substring_matches("name", "harm") == {"/a"}
+
+        index.add(
+            "/a",
+            ModSearchEntry.from_mod(_mod("HugsLib", "unlimitedhugs.hugslib"), [], ""),
+        )
+
+        assert index.substring_matches("name", "harm") == set()
+        assert index.substring_matches("name", "hugs") == {"/a"}
+        assert len(index) == 1
+
+    def test_notes_matches_only_considers_mods_with_notes(self) -> None:
+        index = ModSearchIndex()
+        index.add(
+            "/a", ModSearchEntry.from_mod(_mod("A", "a.a"), [], "Load after Core")
+        )
+        index.add("/b", ModSearchEntry.from_mod(_mod("B", "b.b"), [], ""))
+
+        assert index.notes_matches("  LOAD AFTER ") == {"/a"}
+        assert index.notes_matches("   ") == set()
+
+        index.discard("/a")
+        assert index.notes_matches("load after") == set()
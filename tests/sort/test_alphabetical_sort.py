@@ -81,3 +81,40 @@ class TestDoAlphabeticalSort:
         assert len(result) == 2
         assert result[0] == "/mods/b"
         assert result[1] == "/mods/a"
+
+    def test_dependencies_hoisted_in_front_of_first_dependent(self) -> None:
+        mods = {
+            "/mods/a": make_listed_mod("/mods/a", name="Alpha", package_id="mod.a"),
+            "/mods/b": make_listed_mod("/mods/b", name="Beta", package_id="mod.b"),
+            "/mods/z": make_listed_mod("/mods/z", name="Zebra", package_id="mod.z"),
+        }
+        graph: dict[str, set[str]] = {"mod.a": {"mod.z"}, "mod.b": set()}
+        result = do_alphabetical_sort(graph, set(mods), mods)
+        assert result == ["/mods/z", "/mods/a", "/mods/b"]
+
+    def test_deep_dependency_chain(self) -> None:
+        count = 5000
+        mods = {
+            f"/mods/{i}": make_listed_mod(
+                f"/mods/{i}", name=f"Mod {i:05d}", package_id=f"mod.{i}"
+            )
+            for i in range(count)
+        }
+        graph = {f"mod.{i}": {f"mod.{i + 1}"} for i in range(count - 1)}
+        graph[f"mod.{count - 1}"] = set()
+        result = do_alphabetical_sort(graph, set(mods), mods)
+        assert result == [f"/mods/{i}" for i in reversed(range(count))]
+
+    def test_dependency_cycle_keeps_every_mod(self) -> None:
+        mods = {
+            "/mods/a": make_listed_mod("/mods/a", name="Alpha", package_id="mod.a"),
+            "/mods/b": make_listed_mod("/mods/b", name="Beta", package_id="mod.b"),
+            "/mods/c": make_listed_mod("/mods/c", name="Charlie", package_id="mod.c"),
+        }
+        graph: dict[str, set[str]] = {
+            "mod.a": {"mod.b"},
+            "mod.b": {"mod.a"},
+            "mod.c": {"mod.b"},
+        }
+        result = do_alphabetical_sort(graph, set(mods), mods)
+        assert result == ["/mods/a", "/mods/b", "/mods/c"]
@@ -0,0 +1,23 @@
+"""Guards against regressions of the cold import time of the entry points.
+
+Heavy dependencies only needed by rarely used features are bound with
+app.utils.lazy_import. An eager import of one of them, anywhere in the
+modules imported at startup, slows down every start of RimSort.
+Measure with ``python -m tests.benchmarks.import_time``.
+"""
+
+import pytest
+
+from tests.benchmarks.import_time import IMPORT_BUDGETS, LAZY_MODULES, best_import
+
+
+@pytest.mark.parametrize("module", IMPORT_BUDGETS)
+def test_entry_point_import_stays_within_budget(module: str) -> None:
+    timing = best_import(module, runs=3)
+
+    loaded = [name for name in LAZY_MODULES if name in timing.cumulative_times]
+    assert loaded == [], f"{module} eagerly imports {loaded}"
+    assert timing.total <= IMPORT_BUDGETS[module], (
+        f"Importing {module} took {timing.total:.3f} s, "
+        f"the budget is {IMPORT_BUDGETS[module]:.3f} s"
+    )
@@ -6,9 +6,18 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.utils.github import provider
 from app.utils.github.models import CacheBase
 
 
+@pytest.fixture(autouse=True)
+def fresh_github_clients() -> Generator[None, None, None]:
+    """Keep the shared PyGitHub clients from leaking mocks between tests."""
+    provider._github_clients.clear()
+    yield
+    provider._github_clients.clear()
+
+
 @pytest.fixture
 def cache_session() -> Generator[Session, None, None]:
     """Session for the global cache DB (github_release_cache)."""
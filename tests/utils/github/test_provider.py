@@ -217,7 +217,7 @@ def _make_mock_release(
 class TestFetchReleasesFromApi:
     """Tests for GitHubProvider._fetch_releases_from_api with mocked PyGitHub."""
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_successful_fetch_returns_releases(
         self, mock_github_cls: MagicMock
     ) -> None:
@@ -243,7 +243,7 @@ class TestFetchReleasesFromApi:
         assert len(releases[0].assets) == 1
         assert releases[0].assets[0].name == "Mod.zip"
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_successful_fetch_updates_cache(
         self, mock_github_cls: MagicMock, cache_session: Session
     ) -> None:
@@ -264,7 +264,7 @@ class TestFetchReleasesFromApi:
         assert cached is not None
         assert "v1.0.0" in cached.releases_json
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_rate_limit_raises_error(self, mock_github_cls: MagicMock) -> None:
         mock_github_cls.return_value.get_repo.side_effect = GithubException(
             403, {"message": "rate limit"}, None
@@ -274,7 +274,7 @@ class TestFetchReleasesFromApi:
         with pytest.raises(GitHubRateLimitError):
             provider.get_releases("author/Mod", force_refresh=True)
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_429_raises_rate_limit_error(self, mock_github_cls: MagicMock) -> None:
         mock_github_cls.return_value.get_repo.side_effect = GithubException(
             429, {"message": "too many requests"}, None
@@ -284,7 +284,7 @@ class TestFetchReleasesFromApi:
         with pytest.raises(GitHubRateLimitError):
             provider.get_releases("author/Mod", force_refresh=True)
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_404_returns_empty_list(self, mock_github_cls: MagicMock) -> None:
         mock_github_cls.return_value.get_repo.side_effect = GithubException(
             404, {"message": "not found"}, None
@@ -294,7 +294,7 @@ class TestFetchReleasesFromApi:
         releases = provider.get_releases("author/Mod", force_refresh=True)
         assert releases == []
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_other_github_exception_propagates(
         self, mock_github_cls: MagicMock
     ) -> None:
@@ -306,9 +306,9 @@ class TestFetchReleasesFromApi:
         with pytest.raises(GithubException):
             provider.get_releases("author/Mod", force_refresh=True)
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_naive_datetime_gets_utc_timezone(self, mock_github_cls: MagicMock) -> None:
-        naive_dt = datetime(2024, 1, 1, 12, 0, 0)  # noqa: DTZ001
+        naive_dt = datetime(2024, 1, 1, 12, 0, 0)
         mock_release = _make_mock_release(tag="v1.0.0", published_at=naive_dt)
         mock_repo = MagicMock()
         mock_repo.get_releases.return_value = [mock_release]
@@ -320,7 +320,7 @@ class TestFetchReleasesFromApi:
         assert releases[0].published_at.tzinfo is not None
         assert releases[0].published_at.tzinfo == UTC
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_release_with_none_name_uses_tag(self, mock_github_cls: MagicMock) -> None:
         mock_release = _make_mock_release(tag="v1.0.0")
         mock_release.name = None
@@ -333,7 +333,7 @@ class TestFetchReleasesFromApi:
 
         assert releases[0].name == "v1.0.0"
 
-    @patch("app.utils.github.provider.Github")
+    @patch("github.Github")
     def test_release_with_none_body_uses_empty_string(
         self, mock_github_cls: MagicMock
     ) -> None:
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from app.utils.steam.webapi.checkpoint import BuildCheckpoint, checkpoint_path_for
+
+
+def _detail(pfid: str, time_updated: int = 100) -> dict[str, object]:
+    return {"publishedfileid": pfid, "result": 1, "time_updated": time_updated}
+
+
+class TestBuildCheckpoint:
+    """Completed pages and details are kept across runs."""
+
+    def test_checkpoint_is_next_to_the_output(self, tmp_path: Path) -> None:
+        assert checkpoint_path_for(tmp_path / "steamDB.json") == (
+            tmp_path / "steamDB.json.checkpoint.sqlite3"
+        )
+
+    def test_records_survive_reopening(self, tmp_path: Path) -> None:
+        path = tmp_path / "db.checkpoint.sqlite3"
+        checkpoint = BuildCheckpoint(path, 294100)
+        assert checkpoint.begin() is None
+        checkpoint.record_query_page("*", {"response": {"next_cursor": "abc"}})
+        checkpoint.record_details([_detail("1"), _detail("2", 200)])
+        checkpoint.close()
+
+        checkpoint = BuildCheckpoint(path, 294100)
+
+        assert checkpoint.begin() is None
+        assert checkpoint.query_page("*") == {"response": {"next_cursor": "abc"}}
+        assert checkpoint.query_page("abc") is None
+        assert checkpoint.details(["2", "3"]) == {"2": _detail("2", 200)}
+        assert checkpoint.time_updated() == {"1": 100, "2": 200}
+        checkpoint.close()
+
+    def test_checkpoint_of_another_appid_is_discarded(self, tmp_path: Path) -> None:
+        path = tmp_path / "db.checkpoint.sqlite3"
+        checkpoint = BuildCheckpoint(path, 294100)
+        checkpoint.record_details([_detail("1")])
+        checkpoint.close()
+
+        checkpoint = BuildCheckpoint(path, 1)
+
+        assert checkpoint.details_count == 0
+        checkpoint.close()
+
+    def test_build_after_a_completed_one_is_incremental(self, tmp_path: Path) -> None:
+        checkpoint = BuildCheckpoint(tmp_path / "db.checkpoint.sqlite3", 294100)
+        checkpoint.begin()
+        checkpoint.record_query_page("*", {"response": {}})
+        checkpoint.record_details([_detail("1")])
+        checkpoint.complete()
+
+        since = checkpoint.begin()
+
+        assert since is not None
+        assert checkpoint.query_page("*") is None
+        assert checkpoint.details_count == 1
+        # An interrupted incremental build keeps looking for updated mods
+        assert checkpoint.begin() == since
+        checkpoint.complete()
+        assert checkpoint.begin() is not None
+        checkpoint.close()
+
+    def test_reset_and_discard(self, tmp_path: Path) -> None:
+        checkpoint = BuildCheckpoint(tmp_path / "db.checkpoint.sqlite3", 294100)
+        checkpoint.record_details([_detail(str(i)) for i in range(1000)])
+
+        checkpoint.discard_details(["1", "2"])
+        assert len(checkpoint.details(str(i) for i in range(1000))) == 998
+
+        checkpoint.complete()
+        checkpoint.reset()
+        assert checkpoint.details_count == 0
+        assert checkpoint.begin() is None
+        checkpoint.close()
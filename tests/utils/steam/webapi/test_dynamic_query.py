@@ -1,10 +1,21 @@
 """Tests for DynamicQuery caching and re-processing of WebAPI responses."""
 
+import json
+import threading
+import time
+from collections.abc import Callable, Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qsl, urlparse
 
 import pytest
+from steam.webapi import WebAPI
 
+from app.utils import http
+from app.utils.steam.webapi import wrapper
+from app.utils.steam.webapi.checkpoint import BuildCheckpoint
 from app.utils.steam.webapi.wrapper import DynamicQuery
 
 
@@ -18,6 +29,8 @@ def dq() -> DynamicQuery:
         obj.expiry = 0
         obj.get_appid_deps = False
         obj.callback = lambda msg: None
+        obj.concurrency = 1
+        obj.checkpoint = None
         obj.api = MagicMock()  # type: ignore[assignment]
         obj.database = {}
         obj.next_cursor = "*"
@@ -231,3 +244,345 @@ class TestCreateSteamDbCaching:
             pfids = mock_appid.call_args[1]["publishedfileids"]
             assert "A" in pfids
             assert "C" in pfids
+
+
+class _StandInWebAPI(ThreadingHTTPServer):
+    """Local stand-in for IPublishedFileService/GetDetails."""
+
+    def __init__(self, rate_limited: int = 0) -> None:
+        super().__init__(("127.0.0.1", 0), _GetDetailsHandler)
+        self.lock = threading.Lock()
+        self.rate_limited = rate_limited
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+
+class _GetDetailsHandler(BaseHTTPRequestHandler):
+    server: _StandInWebAPI
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            limited = server.rate_limited > 0
+            server.rate_limited -= limited
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if limited:
+                self._reply(429, b"", {"Retry-After": "0"})
+                return
+            # Finish the first chunks last
+            query = dict(parse_qsl(urlparse(self.path).query))
+            pfids = [v for k, v in query.items() if k.startswith("publishedfileids[")]
+            time.sleep(0.05 if pfids[0] == "0" else 0.01)
+            details = [_make_mod(p, f"Mod {p}") for p in pfids]
+            body = json.dumps({"response": {"publishedfiledetails": details}})
+            self._reply(200, body.encode(), {"Content-Type": "application/json"})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _stand_in_api(server: _StandInWebAPI) -> WebAPI:
+    api = WebAPI(
+        "x" * 32,
+        https=False,
+        apihost=f"127.0.0.1:{server.server_address[1]}",
+        auto_load_interfaces=False,
+    )
+    # Mounted as DynamicQuery mounts it on the real WebAPI
+    http.mount_pool(api.session, retry_rate_limits=False)
+    parameters = [
+        {"name": name, "type": "string", "optional": True}
+        for name in (
+            "key",
+            "publishedfileids[0]",
+            "includetags",
+            "includeadditionalpreviews",
+            "includechildren",
+            "includekvtags",
+            "includevotes",
+            "short_description",
+            "includeforsaledata",
+            "includemetadata",
+            "return_playtime_stats",
+            "appid",
+            "strip_description_bbcode",
+            "includereactions",
+            "admin_query",
+        )
+    ]
+    api.load_interfaces(
+        {
+            "apilist": {
+                "interfaces": [
+                    {
+                        "name": "IPublishedFileService",
+                        "methods": [
+                            {
+                                "name": "GetDetails",
+                                "version": 1,
+                                "httpmethod": "GET",
+                                "parameters": parameters,
+                            }
+                        ],
+                    }
+                ]
+            }
+        }
+    )
+    return api
+
+
+@pytest.fixture
+def stand_in() -> Generator[_StandInWebAPI, None, None]:
+    server = _StandInWebAPI()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestConcurrentGetDetails:
+    """GetDetails chunks are fetched concurrently against a stand-in WebAPI."""
+
+    def _fetch(
+        self, dq: DynamicQuery, server: _StandInWebAPI, pfids: list[str]
+    ) -> list[dict[str, Any]]:
+        dq.api = _stand_in_api(server)
+        result = dq.IPublishedFileService_GetDetails({"database": {}}, pfids)
+        assert result is not None
+        return result[2]
+
+    def test_details_keep_request_order(
+        self,
+        dq: DynamicQuery,
+        stand_in: _StandInWebAPI,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(wrapper, "GET_DETAILS_CHUNK_SIZE", 3)
+        pfids = [str(i) for i in range(20)]
+        dq.concurrency = 4
+
+        details = self._fetch(dq, stand_in, pfids)
+
+        assert [d["publishedfileid"] for d in details] == pfids
+        assert stand_in.requests == 7
+        assert 1 < stand_in.max_in_flight <= 4
+
+    def test_sequential_by_default(
+        self,
+        dq: DynamicQuery,
+        stand_in: _StandInWebAPI,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(wrapper, "GET_DETAILS_CHUNK_SIZE", 3)
+
+        self._fetch(dq, stand_in, [str(i) for i in range(9)])
+
+        assert stand_in.max_in_flight == 1
+
+    def test_rate_limited_chunks_are_retried(
+        self,
+        dq: DynamicQuery,
+        stand_in: _StandInWebAPI,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(wrapper, "GET_DETAILS_CHUNK_SIZE", 2)
+        stand_in.rate_limited = 3
+        pfids = [str(i) for i in range(6)]
+        dq.concurrency = 3
+
+        details = self._fetch(dq, stand_in, pfids)
+
+        assert [d["publishedfileid"] for d in details] == pfids
+        assert stand_in.requests == 6
+
+    def test_chunk_is_dropped_when_rate_limit_persists(
+        self,
+        dq: DynamicQuery,
+        stand_in: _StandInWebAPI,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(wrapper, "GET_DETAILS_CHUNK_SIZE", 2)
+        stand_in.rate_limited = wrapper.RATE_LIMIT_ATTEMPTS
+
+        details = self._fetch(dq, stand_in, ["0", "1", "2"])
+
+        assert [d["publishedfileid"] for d in details] == ["2"]
+
+    def test_adapter_does_not_retry_rate_limits(
+        self,
+        dq: DynamicQuery,
+        stand_in: _StandInWebAPI,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(wrapper, "GET_DETAILS_CHUNK_SIZE", 2)
+        stand_in.rate_limited = wrapper.RATE_LIMIT_ATTEMPTS
+
+        self._fetch(dq, stand_in, ["0", "1"])
+
+        # One request per attempt, none added by the mounted adapter
+        assert stand_in.requests == wrapper.RATE_LIMIT_ATTEMPTS
+
+
+def _query_files(
+    pages: dict[str, dict[str, Any]],
+) -> Callable[..., dict[str, Any]]:
+    """Stand-in for QueryFiles, which only returns details when asked to."""
+
+    def call(**kwargs: Any) -> dict[str, Any]:
+        page = pages[kwargs["cursor"]]
+        if kwargs.get("ids_only") or not kwargs.get("return_details"):
+            page = {
+                **page,
+                "publishedfiledetails": [
+                    {
+                        "publishedfileid": item["publishedfileid"],
+                        "result": 1,
+                        "language": 0,
+                    }
+                    for item in page["publishedfiledetails"]
+                ],
+            }
+        return {"response": page}
+
+    return call
+
+
+@pytest.fixture
+def checkpoint(tmp_path: Path) -> Generator[BuildCheckpoint, None, None]:
+    checkpoint = BuildCheckpoint(tmp_path / "db.checkpoint.sqlite3", 294100)
+    checkpoint.begin()
+    yield checkpoint
+    checkpoint.close()
+
+
+class TestCheckpointedQuery:
+    """Checkpointed pages and details are reused instead of requested again."""
+
+    def _details_api(self, dq: DynamicQuery) -> list[list[str]]:
+        queried: list[list[str]] = []
+
+        def mock_call(**kwargs: Any) -> dict[str, Any]:
+            pfids = kwargs["publishedfileids"]
+            queried.append(list(pfids))
+            details = [_make_mod(p, f"Live {p}") for p in pfids]
+            return {"response": {"publishedfiledetails": details}}
+
+        dq.api.call.side_effect = mock_call  # type: ignore[attr-defined]
+        return queried
+
+    def test_only_missing_details_are_requested(
+        self, dq: DynamicQuery, checkpoint: BuildCheckpoint
+    ) -> None:
+        checkpoint.record_details([_make_mod("B", "Recorded B")])
+        dq.checkpoint = checkpoint
+        queried = self._details_api(dq)
+
+        result = dq.IPublishedFileService_GetDetails({"database": {}}, ["A", "B", "C"])
+
+        assert result is not None
+        assert queried == [["A", "C"]]
+        assert [d["title"] for d in result[2]] == ["Live A", "Recorded B", "Live C"]
+        assert set(checkpoint.details(["A", "B", "C"])) == {"A", "B", "C"}
+
+    def test_failed_chunks_are_not_recorded(
+        self, dq: DynamicQuery, checkpoint: BuildCheckpoint
+    ) -> None:
+        dq.checkpoint = checkpoint
+        dq.api.call.side_effect = ConnectionError  # type: ignore[attr-defined]
+
+        result = dq.IPublishedFileService_GetDetails({"database": {}}, ["A"])
+
+        assert result is not None
+        assert result[2] == []
+        assert checkpoint.details_count == 0
+
+    def test_query_pages_are_replayed(
+        self, dq: DynamicQuery, checkpoint: BuildCheckpoint
+    ) -> None:
+        page = {
+            "response": {
+                "total": 2,
+                "publishedfiledetails": [{"publishedfileid": "A"}],
+                "next_cursor": "next",
+            }
+        }
+        checkpoint.record_query_page("*", page)
+        dq.checkpoint = checkpoint
+
+        assert dq.IPublishedFileService_QueryFiles("*") == "next"
+        dq.api.call.assert_not_called()  # type: ignore[attr-defined]
+        assert dq.publishedfileids == ["A"]
+
+        dq.api.call.return_value = {  # type: ignore[attr-defined]
+            "response": {
+                "publishedfiledetails": [{"publishedfileid": "B"}],
+                "next_cursor": "last",
+            }
+        }
+        assert dq.IPublishedFileService_QueryFiles("next") == "last"
+        assert checkpoint.query_page("next") is not None
+        assert dq.publishedfileids == ["A", "B"]
+
+    def test_updated_details_are_discarded(
+        self, dq: DynamicQuery, checkpoint: BuildCheckpoint
+    ) -> None:
+        checkpoint.record_details(
+            [
+                {"publishedfileid": "A", "result": 1, "time_updated": 10},
+                {"publishedfileid": "B", "result": 1, "time_updated": 20},
+                {"publishedfileid": "C", "result": 1, "time_updated": 5},
+            ]
+        )
+        dq.checkpoint = checkpoint
+        pages = {
+            "*": {
+                "publishedfiledetails": [
+                    {"publishedfileid": "B", "time_updated": 9000},
+                    {"publishedfileid": "D", "time_updated": 8000},
+                ],
+                "next_cursor": "2",
+            },
+            "2": {
+                "publishedfiledetails": [
+                    {"publishedfileid": "A", "time_updated": 10},
+                    {"publishedfileid": "C", "time_updated": 4},
+                ],
+                "next_cursor": "3",
+            },
+        }
+        dq.api.call.side_effect = _query_files(pages)  # type: ignore[attr-defined]
+
+        dq.discard_updated_details(10 + wrapper.UPDATED_SINCE_MARGIN)
+
+        assert set(checkpoint.time_updated()) == {"A", "C"}
+        assert dq.api.call.call_count == 2  # type: ignore[attr-defined]
+
+    def test_all_details_are_discarded_when_updates_are_unknown(
+        self, dq: DynamicQuery, checkpoint: BuildCheckpoint
+    ) -> None:
+        checkpoint.record_details([_make_mod("A", "A")])
+        dq.checkpoint = checkpoint
+        dq.api.call.side_effect = ConnectionError  # type: ignore[attr-defined]
+
+        dq.discard_updated_details(0)
+
+        assert checkpoint.details_count == 0
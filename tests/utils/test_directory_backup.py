@@ -0,0 +1,142 @@
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from app.utils import directory_backup
+from app.utils.directory_backup import (
+    MANIFEST_NAME,
+    backup_members,
+    create_directory_backup,
+    read_backup_manifest,
+)
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "instance"
+    (path / "Mods" / "Textures").mkdir(parents=True)
+    (path / "Empty").mkdir()
+    (path / "Mods" / "About.xml").write_text("<ModMetaData>" * 1000)
+    (path / "Mods" / "Textures" / "Thing.png").write_bytes(b"png" * 1000)
+    (path / "Config.xml").write_text("<Config/>")
+    return path
+
+
+def _members(archive_path: Path) -> dict[str, bytes]:
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.testzip() is None
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestCreateDirectoryBackup:
+    def test_compresses_all_files(self, source: Path, tmp_path: Path) -> None:
+        archive_path = tmp_path / "backup.zip"
+        progress: list[tuple[int, int]] = []
+
+        create_directory_backup(
+            source,
+            archive_path,
+            extra_members={"instance.json": b"{}"},
+            max_workers=2,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        members = _members(archive_path)
+        assert members["Mods/About.xml"] == b"<ModMetaData>" * 1000
+        assert members["Config.xml"] == b"<Config/>"
+        assert members["instance.json"] == b"{}"
+        assert "Empty/" in members
+        assert progress[-1] == (3, 3)
+        with zipfile.ZipFile(archive_path) as archive:
+            about = archive.getinfo("Mods/About.xml")
+            png = archive.getinfo("Mods/Textures/Thing.png")
+            assert about.compress_type == zipfile.ZIP_DEFLATED
+            assert about.compress_size < about.file_size
+            assert png.compress_type == zipfile.ZIP_STORED
+
+    def test_stores_compressed_files(self, source: Path, tmp_path: Path) -> None:
+        (source / "Mods" / "Sounds.ogg").write_bytes(os.urandom(4096))
+        archive_path = tmp_path / "backup.zip"
+
+        create_directory_backup(source, archive_path, max_workers=2)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            types = {info.filename: info.compress_type for info in archive.infolist()}
+        assert types["Mods/Sounds.ogg"] == zipfile.ZIP_STORED
+        assert types["Mods/Textures/Thing.png"] == zipfile.ZIP_STORED
+        assert types["Mods/About.xml"] == zipfile.ZIP_DEFLATED
+        assert types["Config.xml"] == zipfile.ZIP_DEFLATED
+
+    def test_streams_large_files(
+        self, source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(directory_backup, "LARGE_FILE_SIZE", 100)
+        archive_path = tmp_path / "backup.zip"
+
+        create_directory_backup(source, archive_path)
+
+        assert _members(archive_path)["Mods/About.xml"] == b"<ModMetaData>" * 1000
+
+    def test_stores_only_changed_files_against_base(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        full = tmp_path / "full.zip"
+        create_directory_backup(source, full)
+        _touch(source / "Config.xml", "<Config changed/>")
+        (source / "Mods" / "About.xml").unlink()
+
+        changes = tmp_path / "changes.zip"
+        manifest = create_directory_backup(source, changes, base_archive=full)
+
+        assert manifest.base == "full.zip"
+        assert "Mods/About.xml" not in manifest.members
+        members = _members(changes)
+        assert members["Config.xml"] == b"<Config changed/>"
+        assert "Mods/Textures/Thing.png" not in members
+        assert read_backup_manifest(changes) == manifest
+
+
+class TestBackupMembers:
+    def test_reads_unchanged_files_from_base(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        full = tmp_path / "full.zip"
+        create_directory_backup(source, full)
+        _touch(source / "Config.xml", "<Config changed/>")
+        (source / "Mods" / "About.xml").unlink()
+        changes = tmp_path / "changes.zip"
+        create_directory_backup(source, changes, base_archive=full)
+
+        chain = backup_members(changes)
+
+        assert [path for path, _ in chain] == [full, changes]
+        assert chain[0][1] == ["Mods/Textures/Thing.png"]
+        assert "Config.xml" in (chain[1][1] or [])
+        assert MANIFEST_NAME not in (chain[1][1] or [])
+
+    def test_missing_base(self, source: Path, tmp_path: Path) -> None:
+        full = tmp_path / "full.zip"
+        create_directory_backup(source, full)
+        changes = tmp_path / "changes.zip"
+        _touch(source / "Config.xml", "<Config changed/>")
+        create_directory_backup(source, changes, base_archive=full)
+        full.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            backup_members(changes)
+
+    def test_archive_without_manifest(self, tmp_path: Path) -> None:
+        archive_path = tmp_path / "old.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("Config.xml", "<Config/>")
+
+        assert backup_members(archive_path) == [(archive_path, None)]
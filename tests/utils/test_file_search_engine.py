@@ -0,0 +1,151 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from app.utils import file_search_engine
+from app.utils.file_search_engine import (
+    FileHit,
+    ParallelFileSearch,
+    SearchQuery,
+    build_preview,
+    search_directory,
+)
+
+
+@pytest.fixture
+def mods_dir(tmp_path: Path) -> Path:
+    for index in range(6):
+        defs = tmp_path / f"Mod{index}" / "Defs"
+        defs.mkdir(parents=True)
+        (defs / "Things.xml").write_text(
+            f"<Defs>\n  <ThingDef>\n    <defName>Thing{index}</defName>\n"
+            "  </ThingDef>\n</Defs>\n"
+        )
+        (defs / "Notes.txt").write_text("no match here\n")
+    languages = tmp_path / "Mod0" / "Languages"
+    languages.mkdir()
+    (languages / "Keys.xml").write_text("<LanguageData>Thing</LanguageData>")
+    return tmp_path
+
+
+def _paths(batches: list[list[FileHit]]) -> set[str]:
+    return {Path(hit.file_path).name for batch in batches for hit in batch}
+
+
+class TestSearchQuery:
+    def test_from_options(self) -> None:
+        query = SearchQuery.from_options(
+            "x",
+            {
+                "file_extensions": [".XML"],
+                "ignore_extensions": [".png"],
+                "exclude_options": {"skip_translations": True, "skip_git": False},
+            },
+        )
+
+        assert query.excluded_dirs == frozenset({"Languages"})
+        assert query.wants_file("About.xml")
+        assert not query.wants_file("About.txt")
+        assert not SearchQuery("x", ignore_extensions=(".png",)).wants_file("a.png")
+
+
+class TestSearchDirectory:
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            (SearchQuery("THING3"), {"Things.xml"}),
+            (SearchQuery("THING3", case_sensitive=True), set()),
+            (SearchQuery(r"Thing\d<", use_regex=True), {"Things.xml"}),
+            (SearchQuery("HERE"), {"Notes.txt"}),
+        ],
+    )
+    def test_matching(
+        self, mods_dir: Path, query: SearchQuery, expected: set[str]
+    ) -> None:
+        hits = search_directory(query, str(mods_dir), str(mods_dir / "Mod3"), True)
+
+        assert {Path(hit.file_path).name for hit in hits} == expected
+
+    def test_non_ascii_pattern(self, tmp_path: Path) -> None:
+        (tmp_path / "Keys.xml").write_text("<Über>Straße</Über>", encoding="utf-8")
+
+        hits = search_directory(
+            SearchQuery("STRASSE"), str(tmp_path), str(tmp_path), True
+        )
+        assert hits == []
+        hits = search_directory(SearchQuery("über"), str(tmp_path), str(tmp_path), True)
+        assert len(hits) == 1
+
+    def test_large_files_are_memory_mapped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(file_search_engine, "MMAP_THRESHOLD", 16)
+        (tmp_path / "Big.xml").write_text("x" * 100 + "needle" + "x" * 100)
+
+        hits = search_directory(
+            SearchQuery("NEEDLE", preview=True), str(tmp_path), str(tmp_path), True
+        )
+
+        assert len(hits) == 1
+        assert "**needle**" in hits[0].preview
+
+    def test_preview_comes_from_the_searched_content(self, mods_dir: Path) -> None:
+        query = SearchQuery("thing2", file_extensions=(".xml",), preview=True)
+        (hit,) = search_directory(query, str(mods_dir), str(mods_dir / "Mod2"), True)
+
+        assert "Matched XML Element:" in hit.preview
+        assert "**Thing2**" in hit.preview
+
+    def test_text_preview_marks_the_matching_line(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "Notes.txt"
+        file_path.write_text("one\ntwo\nthree\n")
+
+        preview = build_preview(SearchQuery("TWO"), str(file_path), "one\ntwo\nthree\n")
+
+        assert "Match at line 2:" in preview
+        assert "→ 2: **two**" in preview
+
+
+class TestParallelFileSearch:
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_fans_out_per_mod_folder(self, mods_dir: Path, use_processes: bool) -> None:
+        engine = ParallelFileSearch(max_workers=4, use_processes=use_processes)
+
+        batches = list(engine.search(SearchQuery("thing"), [str(mods_dir)]))
+
+        assert len(batches) == 6
+        assert all(hit.root_path == str(mods_dir) for batch in batches for hit in batch)
+        assert _paths(batches) == {"Things.xml", "Keys.xml"}
+
+    def test_excluded_folders_are_skipped(self, mods_dir: Path) -> None:
+        query = SearchQuery.from_options(
+            "thing", {"exclude_options": {"skip_translations": True}}
+        )
+
+        batches = list(ParallelFileSearch(max_workers=2).search(query, [str(mods_dir)]))
+
+        assert _paths(batches) == {"Things.xml"}
+
+    def test_invalid_regex_fails_before_searching(self, mods_dir: Path) -> None:
+        search = ParallelFileSearch().search(
+            SearchQuery("[", use_regex=True), [str(mods_dir)]
+        )
+
+        with pytest.raises(re.error):
+            next(search)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_cancel_drops_remaining_work(
+        self, mods_dir: Path, max_workers: int
+    ) -> None:
+        engine = ParallelFileSearch(max_workers=max_workers, use_processes=False)
+        roots = [str(path) for path in sorted(mods_dir.iterdir())]
+
+        batches = []
+        for batch in engine.search(SearchQuery("thing"), roots):
+            batches.append(batch)
+            engine.cancel()
+
+        assert len(batches) == 1
+        assert engine.cancelled
@@ -0,0 +1,186 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils import file_search_index
+from app.utils.file_search import FileSearch
+from app.utils.file_search_engine import SearchQuery
+from app.utils.file_search_index import FileSearchIndex
+from app.utils.ignore_extensions import IGNORE_EXTENSIONS
+
+
+@pytest.fixture
+def mod(tmp_path: Path) -> Path:
+    mod = tmp_path / "mods" / "1234"
+    (mod / "Defs").mkdir(parents=True)
+    (mod / "Defs" / "Walls.xml").write_text(
+        "<Defs>\n  <ThingDef>\n    <defName>Steel_Wall</defName>\n  </ThingDef>\n</Defs>"
+    )
+    (mod / "Languages").mkdir()
+    (mod / "Languages" / "Keys.xml").write_text("<Keys>Steel wall</Keys>")
+    (mod / "About.txt").write_text("A wall of steel")
+    return mod
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> FileSearchIndex:
+    return FileSearchIndex(tmp_path / "index.sqlite3")
+
+
+def _query(pattern: str, **options: object) -> SearchQuery:
+    return SearchQuery.from_options(
+        pattern,
+        {
+            "ignore_extensions": IGNORE_EXTENSIONS,
+            "exclude_options": {"skip_git": True},
+            **options,
+        },
+    )
+
+
+def _names(index: FileSearchIndex, query: SearchQuery, mod: Path) -> set[str]:
+    return {
+        Path(hit.file_path).name
+        for batch in index.search(query, [str(mod)])
+        for hit in batch
+    }
+
+
+class TestFileSearchIndex:
+    def test_covers_only_queries_the_index_can_answer(
+        self, index: FileSearchIndex
+    ) -> None:
+        assert index.covers(_query("steel"))
+        assert index.covers(_query("steel", file_extensions=[".xml"]))
+        assert not index.covers(_query("st"))
+        assert not index.covers(_query("steel", use_regex=True))
+        assert not index.covers(_query("steel", exclude_options={}))
+        assert not index.covers(SearchQuery("steel", excluded_dirs=frozenset({".git"})))
+
+    def test_search_matches_substrings(self, index: FileSearchIndex, mod: Path) -> None:
+        index.update([str(mod)])
+
+        assert _names(index, _query("STEEL"), mod) == {
+            "Walls.xml",
+            "Keys.xml",
+            "About.txt",
+        }
+        assert _names(index, _query("Steel", case_sensitive=True), mod) == {
+            "Walls.xml",
+            "Keys.xml",
+        }
+        assert _names(
+            index,
+            _query(
+                "steel",
+                file_extensions=[".xml"],
+                exclude_options={"skip_git": True, "skip_translations": True},
+            ),
+            mod,
+        ) == {"Walls.xml"}
+
+    def test_search_builds_previews_from_the_index(
+        self, index: FileSearchIndex, mod: Path
+    ) -> None:
+        index.update([str(mod)])
+
+        (batch,) = index.search(_query("of steel", preview=True), [str(mod)])
+
+        assert "→ 1: A wall **of steel**" in batch[0].preview
+
+    def test_large_files_are_searched_on_disk(
+        self, index: FileSearchIndex, mod: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(file_search_index, "MAX_INDEXED_FILE_SIZE", 16)
+        index.update([str(mod)])
+
+        assert _names(index, _query("steel"), mod) == {
+            "Walls.xml",
+            "Keys.xml",
+            "About.txt",
+        }
+
+    def test_changed_folders_are_not_fresh(
+        self, tmp_path: Path, index: FileSearchIndex, mod: Path
+    ) -> None:
+        assert index.fresh_roots([str(mod)]) == []
+        index.update([str(mod)])
+        assert index.fresh_roots([str(mod)]) == [str(mod)]
+
+        # Another session verifies the recorded signature
+        assert FileSearchIndex(index.db_path).fresh_roots([str(mod)]) == [str(mod)]
+
+        (mod / "About.txt").write_text("A wall of plasteel")
+        assert index.fresh_roots([str(mod)]) == []
+
+        index.update([str(mod)])
+        assert _names(index, _query("plasteel"), mod) == {"About.txt"}
+
+    def test_deleted_folders_are_forgotten(
+        self, index: FileSearchIndex, mod: Path
+    ) -> None:
+        index.update([str(mod)])
+        for file_path in sorted(mod.rglob("*"), reverse=True):
+            file_path.rmdir() if file_path.is_dir() else file_path.unlink()
+        mod.rmdir()
+
+        index.update([str(mod)])
+
+        assert index.fresh_roots([str(mod)]) == []
+        assert _names(index, _query("steel"), mod) == set()
+
+
+class TestIndexedFileSearch:
+    def test_scanned_folders_are_indexed_for_the_next_search(
+        self, index: FileSearchIndex, mod: Path
+    ) -> None:
+        searcher = FileSearch(metadata_controller=MagicMock(), index=index)
+        options = {
+            "ignore_extensions": IGNORE_EXTENSIONS,
+            "exclude_options": {"skip_git": True},
+        }
+
+        with patch("app.utils.file_search.get_mod_name_from_pfid", return_value="Mod"):
+            first = list(searcher.batched_search("xml", "steel", [str(mod)], options))
+            updater = index._updater
+            assert updater is not None
+            updater.join(timeout=10)
+
+            with patch("app.utils.file_search.ParallelFileSearch") as engine:
+                second = list(
+                    searcher.batched_search("xml", "steel", [str(mod)], options)
+                )
+        engine.assert_not_called()
+
+        first_results = sorted(result for batch in first for result in batch)
+        second_results = sorted(result for batch in second for result in batch)
+        assert first_results == second_results
+        assert [os.path.basename(path) for _, _, path, _ in second_results] == [
+            "Keys.xml",
+            "Walls.xml",
+        ]
+
+    def test_edited_defs_are_found_after_indexing(
+        self, index: FileSearchIndex, mod: Path
+    ) -> None:
+        index.update([str(mod)])
+        searcher = FileSearch(metadata_controller=MagicMock(), index=index)
+        options = {
+            "ignore_extensions": IGNORE_EXTENSIONS,
+            "exclude_options": {"skip_git": True},
+        }
+        walls = mod / "Defs" / "Walls.xml"
+        walls.write_text(walls.read_text().replace("Steel_Wall", "Plasteel_Wall"))
+
+        with patch("app.utils.file_search.get_mod_name_from_pfid", return_value="Mod"):
+            results = [
+                result
+                for batch in searcher.batched_search(
+                    "xml", "plasteel", [str(mod)], options
+                )
+                for result in batch
+            ]
+
+        assert [os.path.basename(path) for _, _, path, _ in results] == ["Walls.xml"]
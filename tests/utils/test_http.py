@@ -1,5 +1,10 @@
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from unittest import mock
 
+import pytest
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -76,3 +81,98 @@ class TestRetryConfiguration:
         # whether to call response.raise_for_status().
         retry = _get_retry_for_url("https://example.com")
         assert retry.raise_on_status is False
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "visited=1")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool() -> Generator[None, None, None]:
+    http.configure_pool()
+    yield
+    http.configure_pool()
+
+
+class TestSharedPool:
+    """Requests share keep-alive connections through one process-wide pool."""
+
+    def test_connections_are_reused(self, server_url: str) -> None:
+        for _ in range(3):
+            assert http.get(server_url).text == "ok"
+
+        stats = http.pool_stats()
+        assert stats.requests == 3
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 2
+
+    def test_each_thread_has_its_own_session(self) -> None:
+        pool = http._get_pool()
+        sessions: list[requests.Session] = []
+        thread = threading.Thread(target=lambda: sessions.append(pool.session()))
+        thread.start()
+        thread.join()
+
+        assert pool.session() is pool.session()
+        assert sessions[0] is not pool.session()
+        assert sessions[0].get_adapter("https://") is pool.adapter
+
+    def test_cookies_are_not_kept_between_requests(self, server_url: str) -> None:
+        response = http.get(server_url)
+
+        assert response.cookies["visited"] == "1"
+        assert not http._get_pool().session().cookies
+
+    def test_new_session_keeps_cookies_and_shares_connections(
+        self, server_url: str
+    ) -> None:
+        session = http.new_session()
+        session.get(server_url)
+        http.get(server_url)
+
+        assert session.cookies["visited"] == "1"
+        assert session.get_adapter(server_url) is http._get_pool().adapter
+        assert http.pool_stats().connections_opened == 1
+
+    def test_mount_pool_without_rate_limit_retries(self) -> None:
+        session = http.mount_pool(requests.Session(), retry_rate_limits=False)
+
+        adapter = session.get_adapter("https://example.com")
+        assert adapter is http._get_pool().server_error_adapter
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+        assert retry.status_forcelist == http.SERVER_ERROR_STATUS_CODES
+        assert retry.respect_retry_after_header is False
+
+    def test_configure_pool_sets_limits_and_resets_stats(self, server_url: str) -> None:
+        http.get(server_url)
+
+        http.configure_pool(pool_connections=2, pool_maxsize=8, pool_block=True)
+
+        adapter = http._get_pool().adapter
+        assert adapter._pool_maxsize == 8
+        assert adapter._pool_block is True
+        assert http.pool_stats() == http.PoolStats(0, 0)
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import requests
 
+from app.models.metadata.metadata_compact_db import read_compact_steam_db
 from app.utils.http_downloader import (
     HTTP_CACHE_FILENAME,
     DownloadResult,
@@ -149,6 +150,27 @@ class TestHttpDatabaseDownloader200:
         assert extracted.exists()
         assert json.loads(extracted.read_text()) == {"key": "value"}
 
+    @patch("app.utils.http_downloader.http.get")
+    def test_writes_compact_db_sidecars(
+        self, mock_get: MagicMock, tmp_path: Path
+    ) -> None:
+        steam_db = Path("tests/data/dbs/steamDB.json").read_text(encoding="utf-8")
+        zip_bytes = _create_fake_zip(
+            tmp_path,
+            "TestRepo",
+            "main",
+            {"steamDB.json": steam_db, "data.json": '{"key": "value"}'},
+        )
+        mock_get.return_value = _make_200_response(zip_bytes)
+
+        downloader = HttpDatabaseDownloader()
+        downloader.download("https://example.com/test.zip", tmp_path, "TestRepo")
+
+        repo_dir = tmp_path / "TestRepo"
+        assert (repo_dir / "steamDB.rsdb").exists()
+        assert not (repo_dir / "data.rsdb").exists()
+        assert read_compact_steam_db(repo_dir / "steamDB.json") is not None
+
     @patch("app.utils.http_downloader.http.get")
     def test_writes_cache_metadata(self, mock_get: MagicMock, tmp_path: Path) -> None:
         zip_bytes = _create_fake_zip(tmp_path, "TestRepo", "main", {"data.json": "{}"})
@@ -0,0 +1,49 @@
+import sys
+import types
+
+import pytest
+
+from app.utils.lazy_import import LazyModule, lazy_import
+
+MODULE_NAME = "_rimsort_lazy_test_module"
+
+
+@pytest.fixture
+def imported(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Names of the modules imported by the lazy modules of a test."""
+    module = types.ModuleType(MODULE_NAME)
+    module.value = 42  # type: ignore[attr-defined]
+    imported: list[str] = []
+
+    def import_module(name: str) -> types.ModuleType:
+        imported.append(name)
+        return module
+
+    monkeypatch.setattr("app.utils.lazy_import.importlib.import_module", import_module)
+    return imported
+
+
+class TestLazyImport:
+    def test_module_is_imported_on_first_attribute_access(
+        self, imported: list[str]
+    ) -> None:
+        lazy = lazy_import(MODULE_NAME)
+
+        assert isinstance(lazy, LazyModule)
+        assert "not loaded" in repr(lazy)
+        assert imported == []
+
+        assert lazy.value == 42
+        assert lazy.value == 42
+        assert imported == [MODULE_NAME]
+        assert "(loaded)" in repr(lazy)
+        assert "value" in dir(lazy)
+
+    def test_imported_module_is_returned_as_is(self) -> None:
+        assert lazy_import("sys") is sys
+
+    def test_missing_module_raises_on_use(self) -> None:
+        lazy = lazy_import("_rimsort_missing_module")
+
+        with pytest.raises(ModuleNotFoundError):
+            lazy.anything  # noqa: B018
@@ -0,0 +1,216 @@
+import re
+from array import array
+from pathlib import Path
+
+import pytest
+
+from app.utils import player_log
+from app.utils.player_log import (
+    LogStatistics,
+    PlayerLog,
+    line_matches,
+    line_pattern,
+    row_of,
+    scan_log,
+)
+
+LOG = (
+    b"Mono path[0] = 'RimWorld'\n"
+    b"Loaded texture A\n"
+    b"Warning: missing B\n"
+    b"Warning: missing B\n"
+    b"Warning: missing B\n"
+    b"Exception in C\n"
+    b"Loaded texture D\n"
+)
+
+PATTERNS = {
+    "warnings": re.compile(r"warning", re.IGNORECASE),
+    "exceptions": re.compile(r"exception", re.IGNORECASE),
+}
+
+
+def _scan(log: PlayerLog, patterns: dict[str, re.Pattern[str]] | None = None) -> None:
+    for result in log.scan(patterns):
+        if isinstance(result, LogStatistics):
+            log.add_statistics(result)
+        else:
+            log.apply(result)
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    path = tmp_path / "Player.log"
+    path.write_bytes(LOG)
+    return path
+
+
+class TestScan:
+    def test_indexes_lines_and_runs(self, log_file: Path) -> None:
+        log = PlayerLog(log_file)
+        _scan(log, PATTERNS)
+
+        assert log.line_count == 7
+        assert log.size == len(LOG)
+        assert log.repeats == {2: 3}
+        assert log.statistics == {"warnings": 3, "exceptions": 1}
+        assert log.read_lines([0, 5]) == ["Mono path[0] = 'RimWorld'", "Exception in C"]
+
+    def test_steps_match_a_single_step(self) -> None:
+        single = list(scan_log(LOG))
+        steps = list(scan_log(LOG, chunk_size=20))
+
+        assert len(single) == 1
+        assert len(steps) > 1
+        offsets = [0] + [offset for step in steps for offset in step.offsets[1:]]
+        assert offsets == list(single[0].offsets)
+
+    def test_runs_continue_across_steps(self) -> None:
+        log = PlayerLog(content=LOG)
+        for step in scan_log(LOG, chunk_size=20):
+            log.apply(step)
+
+        assert log.repeats == {2: 3}
+
+    def test_appended_lines_are_scanned_from_the_partial_line(
+        self, log_file: Path
+    ) -> None:
+        log_file.write_bytes(LOG + b"Warning: half")
+        log = PlayerLog(log_file)
+        _scan(log, PATTERNS)
+        assert log.partial
+        assert log.line_count == 8
+        assert log.statistics == {"warnings": 4, "exceptions": 1}
+
+        with open(log_file, "ab") as f:
+            f.write(b" a line\nException in E\nException in E\n")
+        _scan(log, PATTERNS)
+
+        assert not log.partial
+        assert log.line_count == 10
+        assert log.read_lines([7]) == ["Warning: half a line"]
+        assert log.repeats == {2: 3, 8: 2}
+        assert log.statistics == {"warnings": 4, "exceptions": 3}
+
+    def test_apply_rejects_scans_out_of_order(self) -> None:
+        log = PlayerLog(content=LOG)
+        step = next(iter(scan_log(LOG, start=17, first_line=1)))
+
+        with pytest.raises(ValueError):
+            log.apply(step)
+
+    def test_detects_replaced_log(self, log_file: Path) -> None:
+        log = PlayerLog(log_file)
+        _scan(log)
+        assert not log.is_replaced()
+
+        log_file.write_bytes(LOG + b"More\n")
+        assert not log.is_replaced()
+
+        log_file.write_bytes(b"Mono path[0] = 'Another'\n" + LOG[26:])
+        assert log.is_replaced()
+
+        log_file.write_bytes(LOG[:30])
+        assert log.is_replaced()
+
+    def test_empty_log(self, tmp_path: Path) -> None:
+        path = tmp_path / "Player.log"
+        path.touch()
+        log = PlayerLog(path)
+        _scan(log, PATTERNS)
+
+        assert log.line_count == 0
+        assert log.statistics == {"warnings": 0, "exceptions": 0}
+
+    def test_cancelled_scan_counts_nothing(self) -> None:
+        log = PlayerLog(content=LOG)
+        results = list(log.scan(PATTERNS, is_cancelled=lambda: True))
+
+        assert not any(isinstance(result, LogStatistics) for result in results)
+
+
+class TestCountLines:
+    def test_counts_on_worker_processes(
+        self, log_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log_file.write_bytes(LOG * 50)
+        log = PlayerLog(log_file)
+        _scan(log)
+        monkeypatch.setattr(player_log, "MATCH_CHUNK_SIZE", 1000)
+        monkeypatch.setattr(player_log, "PROCESS_POOL_MIN_SIZE", 0)
+
+        counts = log.count_lines(PATTERNS, 0, log.size, max_workers=2)
+
+        assert counts == {"warnings": 150, "exceptions": 50}
+
+
+class TestLines:
+    def test_line_matches_each_line_once(self) -> None:
+        pattern = line_pattern(re.compile(r"(?i)^b|c"))
+
+        assert list(line_matches(pattern, "abcb\nnone\nB\n")) == [2, 10]
+
+    def test_matching_lines_of_all_patterns(self) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+        patterns = [re.compile("missing|texture"), re.compile("B|D")]
+
+        lines = [line for _, batch in log.matching_lines(patterns) for line in batch]
+
+        assert lines == [2, 3, 4, 6]
+
+    def test_matching_rows_of_shown_lines(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+        monkeypatch.setattr(player_log, "MATCH_CHUNK_SIZE", 20)
+        rows, _ = log.rows()
+
+        steps = list(log.matching_rows([re.compile("texture|B")], rows[1:], 1))
+
+        assert [row for _, found in steps for row in found] == [1, 2, 4]
+        assert steps[-1][0] == len(rows)
+
+    def test_filtered_rows_continue_runs_across_steps(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+        monkeypatch.setattr(player_log, "MATCH_CHUNK_SIZE", 20)
+
+        steps = list(log.filtered_rows([re.compile("missing|C")]))
+
+        assert [line for rows, _ in steps for line in rows] == [2, 5]
+        assert {k: v for _, counts in steps for k, v in counts.items()} == {2: 3}
+
+    def test_filtered_rows_continue_the_previous_run(self) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+
+        steps = list(log.filtered_rows([re.compile("missing")], 4, 2, 2))
+
+        assert steps == [(array("q"), {2: 3})]
+
+    def test_rows_show_runs_once(self) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+
+        rows, counts = log.rows()
+        assert list(rows) == [0, 1, 2, 5, 6]
+        assert counts == {2: 3}
+        assert row_of(rows, 5) == 3
+        assert row_of(rows, 3) is None
+
+        rows, counts = log.rows(first_line=3)
+        assert list(rows) == [5, 6]
+        assert counts == {2: 3}
+
+    def test_collapse_continues_previous_line(self) -> None:
+        log = PlayerLog(content=LOG)
+        _scan(log)
+
+        rows, counts = log.collapse([3, 4, 6], previous=2)
+
+        assert list(rows) == [6]
+        assert counts == {2: 3}
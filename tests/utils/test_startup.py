@@ -0,0 +1,103 @@
+import threading
+from itertools import count
+
+import pytest
+from PySide6.QtCore import QThreadPool
+from pytestqt.qtbot import QtBot
+
+from app.utils import startup
+from app.utils.startup import BackgroundStage, StartupTimer
+
+
+@pytest.fixture
+def timer() -> StartupTimer:
+    ticks = count()
+    return StartupTimer(clock=lambda: float(next(ticks)))
+
+
+class TestStartupTimer:
+    def test_records_stages(self, timer: StartupTimer) -> None:
+        with timer.stage("Load settings"):
+            pass
+        with timer.stage("Delete orphaned DDS files", background=True):
+            pass
+
+        assert [(s.name, s.start, s.duration, s.background) for s in timer.stages] == [
+            ("Load settings", 1.0, 1.0, False),
+            ("Delete orphaned DDS files", 3.0, 1.0, True),
+        ]
+        report = timer.report()
+        assert report.startswith("Startup finished in 4.000 s")
+        assert "Delete orphaned DDS files (background)" in report
+
+    def test_failed_stages_are_recorded(self, timer: StartupTimer) -> None:
+        with pytest.raises(ValueError), timer.stage("Load settings"):
+            raise ValueError
+
+        assert [s.name for s in timer.stages] == ["Load settings"]
+
+    def test_report_waits_for_background_stages(
+        self,
+        timer: StartupTimer,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setenv(startup.STARTUP_REPORT_ENV, "1")
+        timer.start_background("Check for database updates")
+        with timer.stage("Show main window"):
+            pass
+
+        timer.finish()
+        assert capsys.readouterr().out == ""
+
+        timer.finish_background("Check for database updates")
+        assert "Show main window" in capsys.readouterr().out
+
+        # Stages after the report are not recorded
+        with timer.stage("Refresh metadata"):
+            pass
+        assert [s.name for s in timer.stages] == ["Show main window"]
+
+    def test_report_is_only_printed_with_the_flag(
+        self,
+        timer: StartupTimer,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.delenv(startup.STARTUP_REPORT_ENV, raising=False)
+
+        timer.finish()
+
+        assert capsys.readouterr().out == ""
+
+
+class TestBackgroundStage:
+    def test_runs_off_the_main_thread(self, qtbot: QtBot, timer: StartupTimer) -> None:
+        threads: list[threading.Thread] = []
+
+        def target() -> int:
+            threads.append(threading.current_thread())
+            return 3
+
+        stage = BackgroundStage("Delete orphaned DDS files", target, timer=timer)
+
+        with qtbot.waitSignal(stage.signals.finished) as blocker:
+            QThreadPool.globalInstance().start(stage)
+
+        assert blocker.args == [3]
+        assert threads != [threading.main_thread()]
+        assert [s.name for s in timer.stages] == ["Delete orphaned DDS files"]
+
+    def test_failure_finishes_the_stage(
+        self, qtbot: QtBot, timer: StartupTimer
+    ) -> None:
+        stage = BackgroundStage(
+            "Check for database updates", lambda: 1 / 0, timer=timer
+        )
+        timer.finish()
+
+        with qtbot.waitSignal(stage.signals.finished) as blocker:
+            stage.run()
+
+        assert blocker.args == [None]
+        assert timer.stages[0].name == "Check for database updates"
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from threading import Timer
+import threading
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from PySide6.QtCore import QObject
+from watchdog.events import (
+    DirCreatedEvent,
+    FileModifiedEvent,
+)
+
+from app.utils.watchdog import ModChangeDispatcher
 
 
 def _make_handler(acf_alive: bool = True, mods_alive: bool = True) -> Any:
@@ -21,10 +28,7 @@ def _make_handler(acf_alive: bool = True, mods_alive: bool = True) -> Any:
     handler.watchdog_acf_observer.is_alive.return_value = acf_alive
     handler.watchdog_mods_observer = MagicMock()
     handler.watchdog_mods_observer.is_alive.return_value = mods_alive
-    handler.cooldown_timers = {
-        "t1": MagicMock(spec=Timer),
-        "t2": MagicMock(spec=Timer),
-    }
+    handler.dispatcher = MagicMock(spec=ModChangeDispatcher)
     return handler
 
 
@@ -70,25 +74,15 @@ class TestWatchdogHandlerStop:
         "acf_alive,mods_alive",
         [(True, True), (True, False), (False, True), (False, False)],
     )
-    def test_stop_always_cancels_timers(
+    def test_stop_always_stops_dispatcher(
         self, qapp: object, acf_alive: bool, mods_alive: bool
     ) -> None:
-        """Timers must always be cancelled regardless of which observers were alive."""
+        """The dispatcher must always be stopped regardless of which observers were alive."""
         handler = _make_handler(acf_alive=acf_alive, mods_alive=mods_alive)
-        timers = list(handler.cooldown_timers.values())
-
-        handler.stop()
-
-        for timer in timers:
-            timer.cancel.assert_called_once()
-
-    def test_stop_clears_timers_dict(self, qapp: object) -> None:
-        """Timers dict must be empty after stop."""
-        handler = _make_handler()
 
         handler.stop()
 
-        assert handler.cooldown_timers == {}
+        handler.dispatcher.stop.assert_called_once()
 
     def test_stop_nulls_observers(self, qapp: object) -> None:
         """Observers must be None after stop."""
@@ -104,7 +98,6 @@ class TestWatchdogHandlerStop:
         handler = _make_handler()
         handler.watchdog_acf_observer = None
         handler.watchdog_mods_observer = None
-        handler.cooldown_timers = {}
 
         handler.stop()  # should not raise
 
@@ -127,6 +120,7 @@ class TestWatchdogHandlerStart:
 
         handler.watchdog_acf_observer.start.assert_called_once()
         handler.watchdog_mods_observer.start.assert_called_once()
+        handler.dispatcher.start.assert_called_once()
 
     def test_start_skips_already_alive_with_warning(self, qapp: object) -> None:
         """If an observer is already alive, skip it and log a warning."""
@@ -144,3 +138,117 @@ class TestWatchdogHandlerStart:
         handler.watchdog_mods_observer = None
 
         handler.start()  # should not raise
+
+
+class TestModChangeDispatcher:
+    """Tests for debouncing and batching of mod changes."""
+
+    def test_events_for_a_path_are_coalesced(self) -> None:
+        dispatcher = ModChangeDispatcher(MagicMock(), delay=0)
+
+        dispatcher.schedule("updated", "/mods/a")
+        dispatcher.schedule("deleted", "/mods/a")
+        dispatcher.schedule("created", "/mods/b")
+        dispatcher.schedule("updated", "/mods/b")
+
+        assert dispatcher.pending == {"/mods/a": "deleted", "/mods/b": "created"}
+        assert dispatcher.flush() == (["/mods/b"], ["/mods/a"], [])
+        assert dispatcher.pending == {}
+
+    def test_changes_are_held_back_until_quiet(self) -> None:
+        dispatcher = ModChangeDispatcher(MagicMock(), delay=60)
+
+        dispatcher.schedule("updated", "/mods/a")
+
+        assert dispatcher.flush() == ([], [], [])
+        assert dispatcher.pending == {"/mods/a": "updated"}
+
+    def test_thread_delivers_one_batch(self) -> None:
+        delivered = threading.Event()
+        batches: list[tuple[list[str], list[str], list[str]]] = []
+
+        def callback(
+            created: list[str], deleted: list[str], updated: list[str]
+        ) -> None:
+            batches.append((created, deleted, updated))
+            delivered.set()
+
+        dispatcher = ModChangeDispatcher(callback, delay=0.2)
+        dispatcher.start()
+        try:
+            for i in range(500):
+                dispatcher.schedule("updated", f"/mods/{i % 50}")
+            dispatcher.schedule("created", "/mods/new")
+
+            assert delivered.wait(5)
+        finally:
+            dispatcher.stop()
+
+        created, deleted, updated = batches[0]
+        assert created == ["/mods/new"]
+        assert deleted == []
+        assert sorted(updated) == sorted(f"/mods/{i}" for i in range(50))
+        assert len(batches) == 1
+
+    def test_stop_drops_pending_changes(self) -> None:
+        callback = MagicMock()
+        dispatcher = ModChangeDispatcher(callback, delay=0.1)
+        dispatcher.start()
+        dispatcher.schedule("deleted", "/mods/a")
+
+        dispatcher.stop()
+
+        assert dispatcher.pending == {}
+        callback.assert_not_called()
+
+
+class TestWatchdogHandlerEvents:
+    """Tests for turning filesystem events into mod changes."""
+
+    def _handler(self, tmp_path: Path) -> Any:
+        handler = _make_handler()
+        handler._workshop_acf_resolved = (tmp_path / "appworkshop_294100.acf").resolve()
+        handler._steamcmd_acf_resolved = (tmp_path / "steamcmd.acf").resolve()
+        handler.metadata_controller = MagicMock()
+        handler.metadata_controller.mods_metadata = {}
+        handler._instance = MagicMock()
+        return handler
+
+    def test_acf_change_is_signalled(self, qapp: object, tmp_path: Path) -> None:
+        handler = self._handler(tmp_path)
+        received: list[tuple[bool, bool]] = []
+        handler.acf_changed.connect(lambda *args: received.append(args))
+
+        handler.on_modified(FileModifiedEvent(str(tmp_path / "steamcmd.acf")))
+
+        assert received == [(False, True)]
+        handler.dispatcher.schedule.assert_not_called()
+
+    def test_mod_file_is_not_resolved(
+        self, qapp: object, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        handler = self._handler(tmp_path)
+        mod_path = str(tmp_path / "mod")
+        handler.metadata_controller.resolve_about_xml_to_mod_path.return_value = (
+            mod_path
+        )
+        resolve = MagicMock(side_effect=AssertionError("resolved"))
+        monkeypatch.setattr(Path, "resolve", resolve)
+
+        handler.on_modified(FileModifiedEvent(str(tmp_path / "mod/About/About.xml")))
+
+        handler.dispatcher.schedule.assert_called_once_with("updated", mod_path)
+
+    def test_new_mod_directory_is_scheduled(
+        self, qapp: object, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        handler = self._handler(tmp_path)
+        monkeypatch.setattr(
+            "app.utils.watchdog.resolve_data_source", lambda instance, path: "local"
+        )
+
+        handler.on_created(DirCreatedEvent(str(tmp_path / "mod")))
+
+        handler.dispatcher.schedule.assert_called_once_with(
+            "created", str(tmp_path / "mod")
+        )
@@ -1,14 +1,28 @@
+from itertools import pairwise
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QListWidget, QListWidgetItem
-
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QColor, QImage, QMouseEvent, QPainter
+from PySide6.QtWidgets import QListWidget, QListWidgetItem, QStyleOptionViewItem
+
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    BaseRules,
+    CaseInsensitiveSet,
+    CaseInsensitiveStr,
+    ModType,
+)
 from app.models.settings import Settings
 from app.utils.custom_list_widget_item import CustomListWidgetItem
 from app.utils.custom_list_widget_item_metadata import CustomListWidgetItemMetadata
-from app.views.mods_panel import ModListItemInner, TagEditDialog
+from app.views.mods_panel import (
+    ModListItemDelegate,
+    ModListItemInner,
+    ModListWidget,
+    TagEditDialog,
+)
 
 
 class TestTagEditDialog:
@@ -262,3 +276,274 @@ class TestStartupImpactLabel:
         widget.repolish(self._item(2.34))
 
         assert widget.startup_impact_label.isHidden()
+
+
+class TestModListItemDelegate:
+    """Mod rows painted by ModListItemDelegate instead of ModListItemInner."""
+
+    @pytest.fixture
+    def mod_list(self, qtbot: Any) -> ModListWidget:
+        settings = MagicMock(spec=Settings)
+        settings.mod_list_paint_rows = True
+        settings.mod_type_filter = True
+        settings.show_save_comparison_indicators = False
+        settings.mod_list_updated_indicator = False
+        settings.mod_list_startup_impact = True
+        settings.color_background_instead_of_text_toggle = True
+        mod = AboutXmlMod(name="Test Mod", package_id=CaseInsensitiveStr("test.mod"))
+        mod.mod_type = ModType.LOCAL
+        metadata_controller = MagicMock()
+        metadata_controller.get_mod.return_value = mod
+        mod_list = ModListWidget("Active", settings, metadata_controller)
+        mod_list.resize(400, 200)
+        qtbot.addWidget(mod_list)
+        return mod_list
+
+    @staticmethod
+    def _add_item(mod_list: ModListWidget, **values: Any) -> CustomListWidgetItem:
+        """Add an item whose metadata carries only what the delegate reads."""
+        data = object.__new__(CustomListWidgetItemMetadata)
+        data.path = "/mods/test"
+        data.errors_warnings = ""
+        data.errors = ""
+        data.warnings = ""
+        data.mod_tags = []
+        data.mod_color = None
+        data.filtered = False
+        data.invalid = False
+        data.mismatch = False
+        data.alternative = None
+        data.list_type = "Active"
+        data.__dict__.update(values)
+        item = CustomListWidgetItem(mod_list)
+        item.setData(Qt.ItemDataRole.UserRole, data)
+        mod_list.addItem(item)
+        return item
+
+    @staticmethod
+    def _option(mod_list: ModListWidget, item: CustomListWidgetItem) -> Any:
+        option = QStyleOptionViewItem()
+        option.initFrom(mod_list.viewport())
+        option.rect = mod_list.visualItemRect(item)
+        return option
+
+    def test_row_parts_match_widget_layout(self, mod_list: ModListWidget) -> None:
+        item = self._add_item(
+            mod_list,
+            errors="Missing dependency",
+            warnings="Version mismatch",
+            startup_impact_s=0.42,
+            show_tags=True,
+            mod_tags=["qol"],
+        )
+        delegate = mod_list.row_delegate
+
+        parts = delegate.row_parts(
+            self._option(mod_list, item), item.data(Qt.ItemDataRole.UserRole)
+        )
+
+        assert [part.kind for part in parts] == [
+            "source",
+            "xml",
+            "name",
+            "tags",
+            "warning",
+            "error",
+            "impact",
+        ]
+        by_kind = {part.kind: part for part in parts}
+        assert by_kind["name"].text == "Test Mod"
+        assert by_kind["tags"].text == " [qol]"
+        assert by_kind["warning"].tooltip == "Version mismatch"
+        assert by_kind["error"].tooltip == "Missing dependency"
+        assert by_kind["impact"].text == "420ms"
+        assert all(
+            left.rect.right() < right.rect.left() for left, right in pairwise(parts)
+        )
+
+    def test_no_widget_is_created(self, mod_list: ModListWidget) -> None:
+        item = self._add_item(mod_list)
+
+        mod_list.create_widget_for_item(item)
+
+        assert mod_list.itemWidget(item) is None
+        size = mod_list.row_delegate.sizeHint(
+            self._option(mod_list, item), mod_list.indexFromItem(item)
+        )
+        assert size.height() >= ModListItemDelegate.ICON_SIZE
+
+    def test_setting_applies_when_list_is_rebuilt(
+        self, mod_list: ModListWidget
+    ) -> None:
+        mod_list.settings.mod_list_paint_rows = False
+        item = self._add_item(mod_list)
+
+        assert mod_list.row_delegate._paints(mod_list.indexFromItem(item))
+
+        mod_list.recreate_mod_list("Active", [])
+
+        assert not mod_list.paint_rows
+
+    def test_widget_mode_still_creates_widgets(self, mod_list: ModListWidget) -> None:
+        mod_list.paint_rows = False
+        item = self._add_item(mod_list)
+
+        with patch("app.views.mods_panel.auxdb_get_mod_tags", return_value=[]):
+            mod_list.create_widget_for_item(item)
+
+        assert isinstance(mod_list.itemWidget(item), ModListItemInner)
+
+    def test_paints_mod_color_background(self, mod_list: ModListWidget) -> None:
+        item = self._add_item(mod_list, mod_color=QColor("#123456"))
+        option = self._option(mod_list, item)
+        image = QImage(option.rect.size(), QImage.Format.Format_ARGB32)
+        image.fill(QColor("white"))
+        option.rect = image.rect()
+
+        painter = QPainter(image)
+        mod_list.row_delegate.paint(painter, option, mod_list.indexFromItem(item))
+        painter.end()
+
+        assert image.pixelColor(image.width() - 1, 0) == QColor("#123456")
+
+    def test_click_on_error_badge_toggles_warning(
+        self, mod_list: ModListWidget, qtbot: Any
+    ) -> None:
+        item = self._add_item(mod_list, errors="Missing dependency")
+        option = self._option(mod_list, item)
+        delegate = mod_list.row_delegate
+        delegate.toggle_warning_signal.disconnect(mod_list.toggle_warning)
+        error = next(
+            part
+            for part in delegate.row_parts(option, item.data(Qt.ItemDataRole.UserRole))
+            if part.kind == "error"
+        )
+        pos = QPointF(error.rect.center())
+        event = QMouseEvent(
+            QEvent.Type.MouseButtonRelease,
+            pos,
+            pos,
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.NoButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+
+        with qtbot.waitSignal(delegate.toggle_warning_signal) as blocker:
+            handled = delegate.editorEvent(
+                event, mod_list.model(), option, mod_list.indexFromItem(item)
+            )
+
+        assert handled
+        assert blocker.args == ["test.mod", "/mods/test"]
+
+
+class TestModListSearchIndex:
+    """The search index a ModListWidget keeps for the search bar."""
+
+    def test_item_data_changes_update_tags_and_notes(self, qtbot: Any) -> None:
+        mod = AboutXmlMod(name="Test Mod", package_id=CaseInsensitiveStr("test.mod"))
+        metadata_controller = MagicMock()
+        metadata_controller.get_mod.return_value = mod
+        settings = MagicMock(spec=Settings, mod_list_paint_rows=False)
+        mod_list = ModListWidget("Active", settings, metadata_controller)
+        qtbot.addWidget(mod_list)
+        item = TestModListItemDelegate._add_item(mod_list, user_notes="")
+        data = item.data(Qt.ItemDataRole.UserRole)
+        mod_list.update_search_entry("/mods/test", data)
+        assert mod_list.search_index.substring_matches("tags", "qol") == set()
+
+        data.mod_tags = ["qol"]
+        data.user_notes = "Load after Core"
+        item.setData(Qt.ItemDataRole.UserRole, data)
+
+        assert mod_list.search_index.substring_matches("tags", "qol") == {"/mods/test"}
+        assert mod_list.search_index.notes_matches("load after") == {"/mods/test"}
+
+    def test_mod_moved_to_other_list_leaves_index(self, qtbot: Any) -> None:
+        mod = AboutXmlMod(name="Test Mod", package_id=CaseInsensitiveStr("test.mod"))
+        metadata_controller = MagicMock()
+        metadata_controller.get_mod.return_value = mod
+        settings = MagicMock(spec=Settings, mod_list_paint_rows=False)
+        mod_list = ModListWidget("Active", settings, metadata_controller)
+        qtbot.addWidget(mod_list)
+        item = TestModListItemDelegate._add_item(mod_list)
+        mod_list.update_search_entry("/mods/test", item.data(Qt.ItemDataRole.UserRole))
+
+        mod_list.handle_other_list_row_added("/mods/test")
+
+        assert "/mods/test" not in mod_list.search_index
+
+
+class TestModListErrorsWarnings:
+    """Incremental recalculation of the errors and warnings of a mod list."""
+
+    @pytest.fixture
+    def mod_list(self, qtbot: Any) -> ModListWidget:
+        settings = MagicMock(spec=Settings)
+        settings.mod_list_paint_rows = True
+        settings.show_save_comparison_indicators = False
+        settings.mod_list_updated_indicator = False
+        settings.mod_list_startup_impact = False
+        settings.external_use_this_instead_metadata_source = "None"
+        settings.use_alternative_package_ids_as_satisfying_dependencies = False
+        metadata_controller = MagicMock()
+        metadata_controller.settings = settings
+        metadata_controller.is_version_mismatch.return_value = False
+        metadata_controller.steamdb_packageid_to_name = {}
+        # A chain of 50 mods, each loading after the previous one
+        metadata_controller.mods_metadata = {}
+        for i in range(50):
+            about = BaseRules()
+            if i:
+                about.load_after = CaseInsensitiveSet([f"mod{i - 1}.mod"])
+            metadata_controller.mods_metadata[f"/mods/{i}"] = AboutXmlMod(
+                name=f"Mod {i}",
+                package_id=CaseInsensitiveStr(f"mod{i}.mod"),
+                about_rules=about,
+            )
+        mod_list = ModListWidget("Active", settings, metadata_controller)
+        qtbot.addWidget(mod_list)
+        # Keep the paths in step by hand instead of through the queued slot
+        mod_list.model().rowsInserted.disconnect(mod_list.handle_rows_inserted)
+        for path in metadata_controller.mods_metadata:
+            TestModListItemDelegate._add_item(
+                mod_list, path=path, warning_toggled=False
+            )
+            mod_list.paths.append(path)
+        return mod_list
+
+    @staticmethod
+    def _move(mod_list: ModListWidget, source: int, destination: int) -> None:
+        mod_list.insertItem(destination, mod_list.takeItem(source))
+        mod_list.paths.insert(destination, mod_list.paths.pop(source))
+
+    def test_drag_rechecks_only_affected_mods(self, mod_list: ModListWidget) -> None:
+        assert mod_list.recalculate_internal_errors_warnings()[3] == 0
+
+        self._move(mod_list, 10, 0)
+        with patch.object(
+            mod_list,
+            "_check_load_order_violations",
+            wraps=mod_list._check_load_order_violations,
+        ) as check:
+            result = mod_list.recalculate_internal_errors_warnings()
+
+        # The dragged mod and the mod that loads after it
+        assert check.call_count == 2
+        assert result[3] == 1
+        assert "Mod 10\n" in result[1]
+        assert "Should be Loaded Before:\n  * Mod 9" in result[1]
+        mod_list.validation_index.invalidate()
+        assert mod_list.recalculate_internal_errors_warnings() == result
+
+    def test_toggled_warning_rechecks_the_mod(self, mod_list: ModListWidget) -> None:
+        self._move(mod_list, 10, 0)
+        assert mod_list.recalculate_internal_errors_warnings()[3] == 1
+
+        item = mod_list.item(0)
+        data = item.data(Qt.ItemDataRole.UserRole)
+        data.warning_toggled = True
+        mod_list.ignore_warning_list.append("mod10.mod")
+
+        assert mod_list.recalculate_internal_errors_warnings()[3] == 0
+        assert data.warnings == ""
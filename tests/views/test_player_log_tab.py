@@ -0,0 +1,113 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.views.player_log_tab import PlayerLogTab
+
+LOG = (
+    "Mono path[0] = 'RimWorld'\n"
+    "Loaded texture A\n"
+    "Exception in C\n"
+    "Exception in C\n"
+    "Failed to find D\n"
+    "Loaded texture E\n"
+)
+
+
+@pytest.fixture
+def tab(qtbot: Any, tmp_path: Path) -> PlayerLogTab:
+    settings = MagicMock()
+    settings.auto_load_player_log_on_startup = False
+    widget = PlayerLogTab(settings)
+    qtbot.addWidget(widget)
+    widget.player_log_path = tmp_path / "Player.log"
+    widget.player_log_path.write_text(LOG)
+    return widget
+
+
+def _load(qtbot: Any, tab: PlayerLogTab) -> None:
+    tab.load_log()
+    qtbot.waitUntil(lambda: tab._scan is None, timeout=10000)
+
+
+def test_load_log_shows_lines_and_statistics(qtbot: Any, tab: PlayerLogTab) -> None:
+    _load(qtbot, tab)
+
+    assert tab.log_stats["total_lines"] == 6
+    assert tab.log_stats["exceptions"] == 2
+    assert tab.log_stats["errors"] == 1
+    assert list(tab.log_model.row_texts()) == [
+        "Mono path[0] = 'RimWorld'",
+        "Loaded texture A",
+        "Exception in C (Repeated 2 times)",
+        "Failed to find D",
+        "Loaded texture E",
+    ]
+    assert tab.filter_combo.isEnabled()
+
+
+def test_appended_lines_are_shown(qtbot: Any, tab: PlayerLogTab) -> None:
+    _load(qtbot, tab)
+    assert tab.player_log_path is not None
+    with open(tab.player_log_path, "a") as f:
+        f.write("Loaded texture E\nError in F\n")
+
+    tab._process_file_change()
+    qtbot.waitUntil(lambda: tab._scan is None, timeout=10000)
+
+    assert tab.log_stats["total_lines"] == 8
+    assert list(tab.log_model.row_texts())[-2:] == [
+        "Loaded texture E (Repeated 2 times)",
+        "Error in F",
+    ]
+
+
+def _wait_for_search(qtbot: Any, tab: PlayerLogTab) -> None:
+    qtbot.waitUntil(
+        lambda: (
+            tab._filter is None
+            and (tab._search_index is None or tab._search_index.is_complete)
+        ),
+        timeout=10000,
+    )
+
+
+def test_filter_and_search(qtbot: Any, tab: PlayerLogTab) -> None:
+    _load(qtbot, tab)
+
+    tab.filter_combo.setCurrentText("Errors Only")
+    _wait_for_search(qtbot, tab)
+    assert list(tab.log_model.row_texts()) == ["Failed to find D"]
+
+    tab.filter_combo.setCurrentText("All Entries")
+    tab.search_text_changed("texture")
+    _wait_for_search(qtbot, tab)
+    assert tab.matches == [1, 4]
+    assert tab.log_display.currentIndex().row() == 1
+
+
+def test_search_is_restarted_when_the_text_changes(
+    qtbot: Any, tab: PlayerLogTab
+) -> None:
+    _load(qtbot, tab)
+
+    tab.search_text_changed("texture")
+    tab.search_text_changed("exception")
+    _wait_for_search(qtbot, tab)
+
+    assert tab.matches == [2]
+
+
+def test_quick_navigation_wraps_around(qtbot: Any, tab: PlayerLogTab) -> None:
+    _load(qtbot, tab)
+
+    tab.goto_next_pattern("texture")
+    qtbot.waitUntil(lambda: tab.log_display.currentIndex().row() == 1, timeout=10000)
+    tab.goto_next_pattern("texture")
+    assert tab.log_display.currentIndex().row() == 4
+    tab.goto_next_pattern("texture")
+    assert tab.log_display.currentIndex().row() == 1
+    tab.goto_previous_pattern("texture")
+    assert tab.log_display.currentIndex().row() == 4